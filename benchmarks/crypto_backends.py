@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+"""
+Secp256k1 backends benchmark, compares sign, verify and derive throughput.
+
+    $ python benchmarks/crypto_backends.py --number 200
+"""
+
+from hdwallet.cryptocurrencies import BitcoinTestnet
+from typing import (
+    List, Callable
+)
+
+import argparse
+import hashlib
+import timeit
+
+from swap.crypto import (
+    BACKENDS, Backend, HDWallet, set_backend
+)
+
+PRIVATE_KEY: bytes = hashlib.sha256(b"swap").digest()
+DIGEST: bytes = hashlib.sha256(b"meheret").digest()
+ROOT_XPRIVATE_KEY: str = "tprv8ZgxMBicQKsPeF9n5SreUrY7225YdDLJjZm9micJrCW9hhWCt1QCkSFhrkDoaUSyPT4dq7zPTtva2uR8xTpVnMyFbjxVXCqwMdrDWgrLs6W"
+PATH: str = "m/44'/1'/0'/0/0"
+
+
+def benchmarks(backend: Backend) -> List[tuple]:
+    public_key: bytes = backend.public_key(private_key=PRIVATE_KEY)
+    signature: bytes = backend.sign(private_key=PRIVATE_KEY, digest=DIGEST)
+
+    def derive() -> str:
+        hdwallet: HDWallet = HDWallet(cryptocurrency=BitcoinTestnet, use_default_path=False)
+        hdwallet.from_xprivate_key(xprivate_key=ROOT_XPRIVATE_KEY)
+        return hdwallet.from_path(path=PATH).public_key()
+
+    return [
+        ("sign", lambda: backend.sign(private_key=PRIVATE_KEY, digest=DIGEST)),
+        ("verify", lambda: backend.verify(public_key=public_key, digest=DIGEST, signature=signature)),
+        ("derive", derive)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Secp256k1 backends benchmark.")
+    parser.add_argument("-n", "--number", type=int, default=100, help="Operations per benchmark.")
+    number: int = parser.parse_args().number
+
+    results: dict = {}
+    for name in BACKENDS:
+        try:
+            backend: Backend = set_backend(backend=name)
+        except ImportError as exception:
+            print(f"{name}: skipped, {exception}")
+            continue
+        for operation, function in benchmarks(backend=backend):
+            function: Callable
+            results[(name, operation)] = number / timeit.timeit(function, number=number)
+            print(f"{name:>10} {operation:>7} {results[(name, operation)]:>12,.1f} ops/s")
+
+    for operation in ["sign", "verify", "derive"]:
+        if ("ecdsa", operation) in results and ("coincurve", operation) in results:
+            print(f"{operation:>7} speedup {results[('coincurve', operation)] / results[('ecdsa', operation)]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+"""
+Ethereum HTLC contract versions gas benchmark, on an in-process EVM (eth-tester/py-evm).
+
+    $ pip install "eth-tester[py-evm]"
+    $ swap compile-contracts --provider ethereum --artifacts
+    $ python benchmarks/htlc_gas.py
+"""
+
+from eth_tester import (
+    EthereumTester, PyEVMBackend
+)
+from web3 import (
+    Web3, EthereumTesterProvider
+)
+from web3.contract import Contract
+from typing import (
+    Dict, Optional
+)
+
+from swap.providers.ethereum.htlc import HTLC
+from swap.utils import sha256
+
+SECRET_KEY: str = "Hello Meheret!"
+AMOUNT: int = Web3.toWei(1, "ether")
+
+
+def benchmark(version: str) -> Dict[str, int]:
+    htlc: HTLC = HTLC(network="testnet", version=version)
+
+    ethereum_tester: EthereumTester = EthereumTester(PyEVMBackend())
+    web3: Web3 = Web3(EthereumTesterProvider(ethereum_tester))
+    sender, recipient = web3.eth.accounts[:2]
+
+    def gas_used(transaction_hash: bytes) -> dict:
+        receipt: dict = web3.eth.wait_for_transaction_receipt(transaction_hash)
+        if receipt["status"] != 1:
+            raise RuntimeError(f"HTLC {version} transaction reverted.")
+        return receipt
+
+    deploy: dict = gas_used(web3.eth.contract(
+        abi=htlc.abi(), bytecode=htlc.bytecode()
+    ).constructor().transact({"from": sender}))
+    htlc_contract: Contract = web3.eth.contract(address=deploy["contractAddress"], abi=htlc.abi())
+
+    def fund(endtime: int) -> dict:
+        return gas_used(htlc_contract.functions.fund(
+            bytes.fromhex(sha256(SECRET_KEY)), recipient, sender, endtime
+        ).transact({"from": sender, "value": AMOUNT}))
+
+    def locked_contract_id(receipt: dict) -> bytes:
+        return htlc_contract.events.log_fund().processReceipt(receipt)[0]["args"]["locked_contract_id"]
+
+    timestamp: int = web3.eth.get_block("latest")["timestamp"]
+    withdraw_fund: dict = fund(endtime=timestamp + 3600)
+    withdraw: dict = gas_used(htlc_contract.functions.withdraw(
+        locked_contract_id(withdraw_fund), SECRET_KEY
+    ).transact({"from": recipient}))
+
+    refund_fund: dict = fund(endtime=timestamp + 7200)
+    ethereum_tester.time_travel(timestamp + 7201)
+    refund: dict = gas_used(htlc_contract.functions.refund(
+        locked_contract_id(refund_fund)
+    ).transact({"from": sender}))
+
+    return dict(
+        deploy=deploy["gasUsed"], fund=withdraw_fund["gasUsed"],
+        withdraw=withdraw["gasUsed"], refund=refund["gasUsed"]
+    )
+
+
+def main() -> None:
+    results: Dict[str, Optional[Dict[str, int]]] = {}
+    for version in ["v1", "v2"]:
+        try:
+            results[version] = benchmark(version=version)
+        except Exception as exception:
+            print(f"{version}: skipped, {exception} (needs 'swap compile-contracts --artifacts')")
+            continue
+        for operation, gas in results[version].items():
+            print(f"{version:>3} {operation:>8} {gas:>10,} gas")
+
+    if "v1" in results and "v2" in results:
+        for operation in results["v1"]:
+            saved: int = results["v1"][operation] - results["v2"][operation]
+            print(f"{operation:>8} saves {saved:>10,} gas ({saved / results['v1'][operation]:.1%})")
+
+
+if __name__ == "__main__":
+    main()
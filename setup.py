@@ -34,9 +34,13 @@ setup(
     python_requires=">=3.6,<4",
     install_requires=requirements,
     extras_require={
+        "secp256k1": [
+            "coincurve>=15.0.0,<22"
+        ],
         "tests": [
             "pytest>=6.2.5,<7",
-            "pytest-cov>=3.0.0,<4"
+            "pytest-cov>=3.0.0,<4",
+            "eth-tester[py-evm]>=0.6.0b6,<0.7"
         ],
         "docs": [
             "sphinx>=4.3.1,<5",
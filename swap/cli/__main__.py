@@ -3,6 +3,7 @@
 
 from .. import __version__
 from ..cli import click
+from ..cli.compile import compile_contracts
 
 from ..cli.providers.bitcoin import bitcoin
 from ..cli.providers.bytom import bytom
@@ -55,3 +56,5 @@ main.add_command(ethereum)
 main.add_command(vapor)
 # Add XinFin provider
 main.add_command(xinfin)
+# Add Solidity contracts compiler
+main.add_command(compile_contracts)
@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+import json
+import sys
+
+from ..cli import click
+from ..compiler import (
+    SOLC_VERSION, compile_contracts as _compile_contracts
+)
+
+
+@click.command("compile-contracts", options_metavar="[OPTIONS]",
+               short_help="Pre-build Ethereum/XinFin HTLC contracts artifact cache.")
+@click.option("-p", "--provider", type=str, multiple=True, default=None,
+              help="Set provider, 'ethereum' or 'xinfin'.  [default: all]")
+@click.option("-sv", "--solc-version", type=str, default=SOLC_VERSION,
+              help="Set Solidity compiler version.", show_default=True)
+@click.option("-cd", "--cache-directory", type=str, default=None,
+              help="Set artifact cache directory.  [default: ~/.cache/swap/solc]")
+@click.option("-a", "--artifacts", is_flag=True, default=False,
+              help="Write precompiled json artifacts next to the contract sources.", show_default=True)
+@click.option("-i", "--indent", type=int, default=4, help="Set json indent.", show_default=True)
+def compile_contracts(provider: tuple, solc_version: str, cache_directory: str, artifacts: bool, indent: int):
+    try:
+        click.echo(json.dumps(_compile_contracts(
+            providers=list(provider) or None,
+            solc_version=solc_version,
+            cache_directory=cache_directory,
+            artifacts=artifacts
+        ), indent=indent))
+    except Exception as exception:
+        click.echo(click.style("Error: {}")
+                   .format(str(exception)), err=True)
+        sys.exit()
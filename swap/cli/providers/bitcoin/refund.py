@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # coding=utf-8
 
+from typing import Optional
+
 import sys
 
 from ....cli import click
@@ -12,17 +14,19 @@ from ....providers.config import bitcoin as config
                short_help="Select Bitcoin Refund transaction builder.")
 @click.option("-a", "--address", type=str, required=True, help="Set Bitcoin sender address.")
 @click.option("-th", "--transaction-hash", type=str, required=True, help="Set Bitcoin funded transaction hash/id.")
+@click.option("-b", "--bytecode", type=str, default=None,
+              help="Set Bitcoin HTLC bytecode to locate its output.  [default: None]")
 @click.option("-n", "--network", type=str, default=config["network"],
               help="Set Bitcoin network.", show_default=True)
 @click.option("-v", "--version", type=int, default=config["version"],
               help="Set Bitcoin transaction version.", show_default=True)
-def refund(address: str, transaction_hash: str, network: str, version: int):
+def refund(address: str, transaction_hash: str, bytecode: Optional[str], network: str, version: int):
     try:
         click.echo(
             RefundTransaction(
                 network=network, version=version
             ).build_transaction(
-                address=address, transaction_hash=transaction_hash
+                address=address, transaction_hash=transaction_hash, bytecode=bytecode
             ).transaction_raw()
         )
     except Exception as exception:
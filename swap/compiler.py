@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Optional, List, Dict, Tuple
+)
+
+import hashlib
+import json
+import os
+import re
+
+# Solidity compiler version of the HTLC contracts.
+SOLC_VERSION: str = "0.8.10"
+# Compiled contract output values.
+OUTPUT_VALUES: List[str] = ["abi", "bin", "bin-runtime", "opcodes"]
+# Solidity import statement pattern.
+IMPORT_PATTERN = re.compile(r"^\s*import\s+[\"']([^\"']+)[\"']", re.MULTILINE)
+
+# Contract source files of each provider, relative to the provider package.
+CONTRACTS: Dict[str, List[Tuple[str, str]]] = {
+    "ethereum": [
+        ("contracts/htlc.sol", "HTLC"),
+        ("contracts/htlc-erc20.sol", "HTLC_ERC20"),
+        ("contracts/htlc-v2.sol", "HTLC_V2"),
+        ("contracts/htlc-erc20-v2.sol", "HTLC_ERC20_V2")
+    ],
+    "xinfin": [
+        ("contracts/htlc.sol", "HTLC"),
+        ("contracts/htlc-xrc20.sol", "HTLC_XRC20"),
+        ("contracts/htlc-v2.sol", "HTLC_V2"),
+        ("contracts/htlc-xrc20-v2.sol", "HTLC_XRC20_V2")
+    ]
+}
+
+# Compiled contract artifacts per cache key, loaded once per process.
+_artifacts: Dict[str, dict] = {}
+
+
+def get_cache_directory() -> str:
+    """
+    Get Solidity artifact cache directory.
+
+    :returns: str -- Cache directory path.
+
+    >>> from swap.compiler import get_cache_directory
+    >>> get_cache_directory()
+    "/home/meheret/.cache/swap/solc"
+
+    .. note::
+        Default directory is ``$XDG_CACHE_HOME/swap/solc`` or the ``SWAP_SOLC_CACHE`` environment variable.
+    """
+
+    if os.environ.get("SWAP_SOLC_CACHE"):
+        return os.path.expanduser(os.environ["SWAP_SOLC_CACHE"])
+    return os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "swap", "solc"
+    )
+
+
+def _sources(source_file: str) -> List[str]:
+    # Source file with its imported files, in a stable order
+    sources: List[str] = []
+    pending: List[str] = [os.path.abspath(source_file)]
+    while pending:
+        source: str = pending.pop(0)
+        if source in sources:
+            continue
+        sources.append(source)
+        with open(source, "r") as sol_file:
+            for imported in IMPORT_PATTERN.findall(sol_file.read()):
+                pending.append(os.path.normpath(os.path.join(os.path.dirname(source), imported)))
+    return sources
+
+
+def get_cache_key(source_file: str, solc_version: str = SOLC_VERSION,
+                  output_values: Optional[List[str]] = None) -> str:
+    """
+    Get Solidity artifact cache key.
+
+    :param source_file: Solidity source file path.
+    :type source_file: str
+    :param solc_version: Solidity compiler version, defaults to ``0.8.10``.
+    :type solc_version: str
+    :param output_values: Compiled contract output values, defaults to ``abi``, ``bin``, ``bin-runtime`` and ``opcodes``.
+    :type output_values: list
+
+    :returns: str -- Cache key.
+
+    >>> from swap.compiler import get_cache_key
+    >>> get_cache_key(source_file="swap/providers/ethereum/contracts/htlc.sol")
+    "dfadaad12bdad30f6169a5ead2323b55508b646b5db07c2f32bfee8239fdc821"
+
+    .. note::
+        Key is the hash of the source and imported files contents, compiler version and output values,
+        file paths are not part of it.
+    """
+
+    key = hashlib.sha256()
+    for source in _sources(source_file=source_file):
+        with open(source, "rb") as sol_file:
+            key.update(hashlib.sha256(sol_file.read()).digest())
+    key.update(json.dumps(dict(
+        solc_version=str(solc_version), output_values=sorted(output_values or OUTPUT_VALUES)
+    ), sort_keys=True).encode())
+    return key.hexdigest()
+
+
+def compile_contract(source_file: str, contract_name: str, solc_version: str = SOLC_VERSION,
+                     output_values: Optional[List[str]] = None, cache_directory: Optional[str] = None) -> dict:
+    """
+    Compile Solidity contract once, through the on-disk artifact cache.
+
+    :param source_file: Solidity source file path.
+    :type source_file: str
+    :param contract_name: Solidity contract name.
+    :type contract_name: str
+    :param solc_version: Solidity compiler version, defaults to ``0.8.10``.
+    :type solc_version: str
+    :param output_values: Compiled contract output values, defaults to ``abi``, ``bin``, ``bin-runtime`` and ``opcodes``.
+    :type output_values: list
+    :param cache_directory: Artifact cache directory, defaults to ``get_cache_directory()``.
+    :type cache_directory: str
+
+    :returns: dict -- Compiled contract artifact.
+
+    >>> from swap.compiler import compile_contract
+    >>> compile_contract(source_file="swap/providers/ethereum/contracts/htlc.sol", contract_name="HTLC")["opcodes"]
+    "PUSH1 0x80 PUSH1 0x40 MSTORE CALLVALUE DUP1 ISZERO PUSH2 0x10 JUMPI PUSH1 0x0 DUP1 REVERT ..."
+
+    .. note::
+        Needs the ``py-solc-x`` package and the Solidity compiler only on a cache miss.
+    """
+
+    output_values = output_values or OUTPUT_VALUES
+    cache_directory = cache_directory or get_cache_directory()
+    key: str = get_cache_key(source_file=source_file, solc_version=solc_version, output_values=output_values)
+    cache_file: str = os.path.join(cache_directory, f"{key}.json")
+
+    if cache_file in _artifacts:
+        artifacts: dict = _artifacts[cache_file]
+    elif os.path.isfile(cache_file):
+        with open(cache_file, "r") as json_file:
+            artifacts: dict = json.loads(json_file.read())
+        _artifacts[cache_file] = artifacts
+    else:
+        from semantic_version.base import Version
+        solcx = __import__("solcx")
+        compiled_files: dict = solcx.compile_files(
+            source_files=[os.path.abspath(source_file)],
+            output_values=output_values,
+            solc_version=Version(str(solc_version))
+        )
+        # Strip the absolute source path, artifacts are keyed by contract name only
+        artifacts: dict = {
+            name.rsplit(":", 1)[-1]: compiled_file for name, compiled_file in compiled_files.items()
+        }
+        os.makedirs(cache_directory, exist_ok=True)
+        temporary_file: str = f"{cache_file}.{os.getpid()}.tmp"
+        with open(temporary_file, "w") as json_file:
+            json_file.write(json.dumps(artifacts))
+        # Atomic rename, concurrent workers never read a half written artifact
+        os.replace(temporary_file, cache_file)
+        _artifacts[cache_file] = artifacts
+
+    if contract_name not in artifacts:
+        raise ValueError(f"Invalid '{contract_name}' contract name, not found in '{source_file}' source.")
+    return artifacts[contract_name]
+
+
+def write_artifact(source_file: str, contract_name: str, artifact: dict) -> str:
+    """
+    Write precompiled contract artifact next to its Solidity source.
+
+    :param source_file: Solidity source file path.
+    :type source_file: str
+    :param contract_name: Solidity contract name.
+    :type contract_name: str
+    :param artifact: Compiled contract artifact.
+    :type artifact: dict
+
+    :returns: str -- Precompiled artifact file path.
+
+    >>> from swap.compiler import compile_contract, write_artifact
+    >>> write_artifact(source_file="swap/providers/ethereum/contracts/htlc-v2.sol", contract_name="HTLC_V2", artifact=compile_contract(source_file="swap/providers/ethereum/contracts/htlc-v2.sol", contract_name="HTLC_V2"))
+    "swap/providers/ethereum/contracts/htlc-v2.json"
+
+    .. note::
+        Artifact is keyed by ``<source file name>:<contract name>`` like the shipped ``htlc.json``,
+        HTLC's load it instead of compiling the contract.
+    """
+
+    json_file: str = f"{os.path.splitext(source_file)[0]}.json"
+    with open(json_file, "w") as artifact_file:
+        artifact_file.write(json.dumps({
+            f"{os.path.basename(source_file)}:{contract_name}": {
+                output_value: artifact[output_value] for output_value in OUTPUT_VALUES
+            }
+        }, indent=4))
+    return json_file
+
+
+def compile_contracts(providers: Optional[List[str]] = None, solc_version: str = SOLC_VERSION,
+                      cache_directory: Optional[str] = None, artifacts: bool = False) -> Dict[str, str]:
+    """
+    Pre-build HTLC contracts artifact cache.
+
+    :param providers: Providers, defaults to ``ethereum`` and ``xinfin``.
+    :type providers: list
+    :param solc_version: Solidity compiler version, defaults to ``0.8.10``.
+    :type solc_version: str
+    :param cache_directory: Artifact cache directory, defaults to ``get_cache_directory()``.
+    :type cache_directory: str
+    :param artifacts: Also write the precompiled artifacts next to the sources, defaults to ``False``.
+    :type artifacts: bool
+
+    :returns: dict -- Cache key of each compiled contract.
+
+    >>> from swap.compiler import compile_contracts
+    >>> compile_contracts(providers=["ethereum"])
+    {'ethereum:HTLC': 'dfadaad12bdad30f6169a5ead2323b55508b646b5db07c2f32bfee8239fdc821', 'ethereum:HTLC_ERC20': 'e7abccdc0d8fba43ca6770f519dec6a0dc5f975c11192848626a1418da0ce807'}
+    """
+
+    cache_keys: Dict[str, str] = {}
+    for provider in (providers or list(CONTRACTS)):
+        if provider not in CONTRACTS:
+            raise ValueError(f"Invalid '{provider}' provider, choose only 'ethereum' or 'xinfin' providers.")
+        directory: str = os.path.join(os.path.dirname(__file__), "providers", provider)
+        for source_file, contract_name in CONTRACTS[provider]:
+            artifact: dict = compile_contract(
+                source_file=os.path.join(directory, source_file), contract_name=contract_name,
+                solc_version=solc_version, cache_directory=cache_directory
+            )
+            if artifacts:
+                write_artifact(
+                    source_file=os.path.join(directory, source_file), contract_name=contract_name, artifact=artifact
+                )
+            cache_keys[f"{provider}:{contract_name}"] = get_cache_key(
+                source_file=os.path.join(directory, source_file), solc_version=solc_version
+            )
+    return cache_keys
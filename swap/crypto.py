@@ -0,0 +1,694 @@
+#!/usr/bin/env python3
+
+from ecdsa import (
+    SigningKey, VerifyingKey, SECP256k1, BadSignatureError
+)
+from ecdsa.ellipticcurve import Point
+from ecdsa.der import UnexpectedDER
+from ecdsa.util import (
+    sigencode_der, sigdecode_der
+)
+from hdwallet import HDWallet as _HDWallet
+from mnemonic import Mnemonic
+from hdwallet.exceptions import DerivationError
+from hdwallet.utils import (
+    is_root_xpublic_key, get_semantic
+)
+from binascii import (
+    hexlify, unhexlify
+)
+from hashlib import sha256
+from collections import OrderedDict
+from typing import (
+    Optional, Union, Dict, Type, List, Callable, Tuple
+)
+from abc import (
+    ABC, abstractmethod
+)
+
+import threading
+import hashlib
+import struct
+import hmac
+import time
+import unicodedata
+import os
+
+from .utils import (
+    is_entropy, is_mnemonic, get_entropy_strength, get_mnemonic_strength, get_mnemonic_language,
+    entropy_to_mnemonic, mnemonic_to_entropy
+)
+
+# Secp256k1 curve field prime, order and half order.
+CURVE_P: int = SECP256k1.curve.p()
+CURVE_ORDER: int = SECP256k1.order
+HALF_CURVE_ORDER: int = CURVE_ORDER // 2
+# BIP32 hardened derivation index offset.
+BIP32KEY_HARDEN: int = 0x80000000
+
+
+class Backend(ABC):
+    """
+    Secp256k1 backend interface.
+
+    Private keys are 32 bytes, digests are 32 bytes, public keys are SEC encoded (33 bytes
+    compressed or 65 bytes uncompressed) and signatures are low-S DER encoded.
+
+    .. note::
+        Backend is abstract, a backend missing any of these methods fails on instantiation.
+    """
+
+    # Backend name.
+    name: Optional[str] = None
+    # Equivalent eth_keys backend class.
+    eth_keys_backend: Optional[str] = None
+
+    @abstractmethod
+    def public_key(self, private_key: bytes, compressed: bool = True) -> bytes:
+        """
+        Get public key from private key.
+
+        :param private_key: Private key.
+        :type private_key: bytes
+        :param compressed: Compressed public key, defaults to ``True``.
+        :type compressed: bool
+
+        :returns: bytes -- Public key.
+        """
+
+    @abstractmethod
+    def public_key_add(self, public_key: bytes, tweak: bytes, compressed: bool = True) -> bytes:
+        """
+        Add ``tweak * G`` to public key.
+
+        :param public_key: Public key.
+        :type public_key: bytes
+        :param tweak: Tweak scalar.
+        :type tweak: bytes
+        :param compressed: Compressed public key, defaults to ``True``.
+        :type compressed: bool
+
+        :returns: bytes -- Tweaked public key.
+        """
+
+    @abstractmethod
+    def sign(self, private_key: bytes, digest: bytes) -> bytes:
+        """
+        Sign digest with RFC6979 deterministic nonce.
+
+        :param private_key: Private key.
+        :type private_key: bytes
+        :param digest: Message digest.
+        :type digest: bytes
+
+        :returns: bytes -- Low-S DER encoded signature.
+        """
+
+    @abstractmethod
+    def verify(self, public_key: bytes, digest: bytes, signature: bytes) -> bool:
+        """
+        Verify low-S DER encoded signature.
+
+        :param public_key: Public key.
+        :type public_key: bytes
+        :param digest: Message digest.
+        :type digest: bytes
+        :param signature: Low-S DER encoded signature.
+        :type signature: bytes
+
+        :returns: bool -- Signature verified.
+        """
+
+
+class ECDSABackend(Backend):
+    """
+    Pure-Python secp256k1 backend, on the ecdsa package used by btcpy and hdwallet.
+
+    :returns: ECDSABackend -- ECDSA backend instance.
+
+    >>> from swap.crypto import ECDSABackend
+    >>> ECDSABackend().public_key(private_key=bytes.fromhex("da47c2f450a4f9d538d86d600d55149afd39d6672fdd1f30c68ad5be21cadad8")).hex()
+    "02b31bdddc215175dd3e5858ad58077dc8e57c588b2c1a91e3055d0af11f41f791"
+    """
+
+    name: str = "ecdsa"
+    eth_keys_backend: str = "eth_keys.backends.NativeECCBackend"
+
+    @staticmethod
+    def _point(public_key: bytes) -> Point:
+        if len(public_key) == 65 and public_key[0] == 4:
+            x, y = int.from_bytes(public_key[1:33], "big"), int.from_bytes(public_key[33:], "big")
+        elif len(public_key) == 33 and public_key[0] in (2, 3):
+            x = int.from_bytes(public_key[1:], "big")
+            y = pow((pow(x, 3, CURVE_P) + 7) % CURVE_P, (CURVE_P + 1) // 4, CURVE_P)
+            if y % 2 != public_key[0] % 2:
+                y = CURVE_P - y
+        else:
+            raise ValueError("Invalid public key.")
+        if not SECP256k1.curve.contains_point(x, y):
+            raise ValueError("Invalid public key.")
+        return Point(SECP256k1.curve, x, y, CURVE_ORDER)
+
+    @staticmethod
+    def _encode(point: Point, compressed: bool) -> bytes:
+        x = point.x().to_bytes(32, "big")
+        if compressed:
+            return bytes([2 + (point.y() & 1)]) + x
+        return b"\x04" + x + point.y().to_bytes(32, "big")
+
+    def public_key(self, private_key: bytes, compressed: bool = True) -> bytes:
+        return self._encode(
+            SECP256k1.generator * int.from_bytes(private_key, "big"), compressed
+        )
+
+    def public_key_add(self, public_key: bytes, tweak: bytes, compressed: bool = True) -> bytes:
+        return self._encode(
+            self._point(public_key) + SECP256k1.generator * int.from_bytes(tweak, "big"), compressed
+        )
+
+    def sign(self, private_key: bytes, digest: bytes) -> bytes:
+        r, s, order = SigningKey.from_string(private_key, curve=SECP256k1).sign_digest_deterministic(
+            digest, hashfunc=sha256, sigencode=lambda *x: x
+        )
+        return sigencode_der(r, (order - s) if s > HALF_CURVE_ORDER else s, order)
+
+    def verify(self, public_key: bytes, digest: bytes, signature: bytes) -> bool:
+        try:
+            if sigdecode_der(signature, CURVE_ORDER)[1] > HALF_CURVE_ORDER:
+                return False
+            point: bytes = self._encode(self._point(public_key), False)
+            return VerifyingKey.from_string(point[1:], curve=SECP256k1).verify_digest(
+                signature, digest, sigdecode=sigdecode_der
+            )
+        except (BadSignatureError, UnexpectedDER, ValueError, AssertionError):
+            return False
+
+
+class CoincurveBackend(Backend):
+    """
+    Accelerated secp256k1 backend, on the coincurve libsecp256k1 binding.
+
+    :returns: CoincurveBackend -- Coincurve backend instance.
+
+    >>> from swap.crypto import CoincurveBackend
+    >>> CoincurveBackend().public_key(private_key=bytes.fromhex("da47c2f450a4f9d538d86d600d55149afd39d6672fdd1f30c68ad5be21cadad8")).hex()
+    "02b31bdddc215175dd3e5858ad58077dc8e57c588b2c1a91e3055d0af11f41f791"
+
+    .. note::
+        Needs the optional ``coincurve`` package, ``pip install coincurve``.
+    """
+
+    name: str = "coincurve"
+    eth_keys_backend: str = "eth_keys.backends.CoinCurveECCBackend"
+
+    def __init__(self):
+        try:
+            import coincurve
+        except ImportError:
+            raise ImportError("Coincurve secp256k1 backend needs coincurve, install it by 'pip install coincurve'.")
+        self._coincurve = coincurve
+
+    def public_key(self, private_key: bytes, compressed: bool = True) -> bytes:
+        return self._coincurve.PublicKey.from_secret(private_key).format(compressed=compressed)
+
+    def public_key_add(self, public_key: bytes, tweak: bytes, compressed: bool = True) -> bytes:
+        return self._coincurve.PublicKey(public_key).add(tweak).format(compressed=compressed)
+
+    def sign(self, private_key: bytes, digest: bytes) -> bytes:
+        return self._coincurve.PrivateKey(private_key).sign(digest, hasher=None)
+
+    def verify(self, public_key: bytes, digest: bytes, signature: bytes) -> bool:
+        try:
+            return self._coincurve.PublicKey(public_key).verify(signature, digest, hasher=None)
+        except (ValueError, TypeError):
+            return False
+
+
+# Available secp256k1 backends.
+BACKENDS: Dict[str, Type[Backend]] = {
+    ECDSABackend.name: ECDSABackend,
+    CoincurveBackend.name: CoincurveBackend
+}
+
+# Selected secp256k1 backend.
+_backend: Optional[Backend] = None
+
+
+def set_backend(backend: Union[str, Backend]) -> Backend:
+    """
+    Select secp256k1 backend.
+
+    :param backend: Secp256k1 backend name or instance, ``ecdsa`` or ``coincurve``.
+    :type backend: str, Backend
+
+    :returns: Backend -- Selected secp256k1 backend.
+
+    >>> from swap.crypto import set_backend
+    >>> set_backend(backend="coincurve")
+    <swap.crypto.CoincurveBackend object at 0x0409DAF0>
+
+    .. note::
+        Default backend is ``ecdsa`` or the ``SWAP_SECP256K1_BACKEND`` environment variable.
+    """
+
+    global _backend
+    if isinstance(backend, str):
+        if backend not in BACKENDS:
+            raise ValueError(f"Invalid '{backend}' secp256k1 backend, choose only 'ecdsa' or 'coincurve' backends.")
+        backend = BACKENDS[backend]()
+    elif not isinstance(backend, Backend):
+        raise TypeError(f"Backend must be str or Backend, not {type(backend).__name__} type.")
+    _backend = backend
+    return _backend
+
+
+def get_backend() -> Backend:
+    """
+    Get selected secp256k1 backend.
+
+    :returns: Backend -- Selected secp256k1 backend.
+
+    >>> from swap.crypto import get_backend
+    >>> get_backend()
+    <swap.crypto.ECDSABackend object at 0x0409DAF0>
+    """
+
+    if _backend is None:
+        return set_backend(backend=os.environ.get("SWAP_SECP256K1_BACKEND", ECDSABackend.name))
+    return _backend
+
+
+class KeyCache:
+    """
+    In-process cache of derived secret keys, like BIP39 seeds and solver child private keys.
+
+    :param ttl: Seconds an entry lives after it is stored, defaults to ``300``.
+    :type ttl: float
+    :param max_entries: Maximum number of entries, the least recently used is evicted first, defaults to ``128``.
+    :type max_entries: int
+
+    :returns: KeyCache -- Key cache instance.
+
+    >>> from swap.crypto import KeyCache
+    >>> key_cache: KeyCache = KeyCache(ttl=600, max_entries=16)
+    >>> key_cache.get_or_derive(("seed", "meheret"), lambda: bytes(64))
+    b'\\x00\\x00\\x00...'
+
+    .. note::
+        Entries are keyed by an HMAC-SHA256 of the secret under a random per-cache salt, the secrets
+        themselves are never stored. Values are held in bytearrays and overwritten with zeros on eviction,
+        expiry and clear, returned copies are ordinary bytes.
+    """
+
+    def __init__(self, ttl: float = 300, max_entries: int = 128):
+        if ttl <= 0:
+            raise ValueError(f"Invalid ttl '{ttl}', ttl must be greater than zero.")
+        if max_entries < 1:
+            raise ValueError(f"Invalid max entries '{max_entries}', max entries must be greater than zero.")
+
+        self._ttl: float = ttl
+        self._max_entries: int = max_entries
+        self._salt: bytes = os.urandom(32)
+        self._entries: "OrderedDict[bytes, Tuple[float, bytearray]]" = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire()
+            return len(self._entries)
+
+    def _key(self, parts: Tuple[str, ...]) -> bytes:
+        return hmac.new(self._salt, "\0".join(parts).encode(), hashlib.sha256).digest()
+
+    def _evict(self, key: bytes) -> None:
+        _, value = self._entries.pop(key)
+        value[:] = bytes(len(value))
+
+    def _expire(self) -> None:
+        now: float = time.monotonic()
+        for key in [key for key, (expires, _) in self._entries.items() if expires <= now]:
+            self._evict(key)
+
+    def get(self, parts: Tuple[str, ...]) -> Optional[bytes]:
+        """
+        Get cached key.
+
+        :param parts: Secret and derivation parts of the key, like the xprivate key and the path.
+        :type parts: tuple
+
+        :returns: bytes -- Cached key, ``None`` when missing or expired.
+        """
+
+        key: bytes = self._key(parts=parts)
+        with self._lock:
+            self._expire()
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return bytes(self._entries[key][1])
+
+    def put(self, parts: Tuple[str, ...], value: bytes) -> None:
+        """
+        Put key into the cache.
+
+        :param parts: Secret and derivation parts of the key, like the xprivate key and the path.
+        :type parts: tuple
+        :param value: Derived key.
+        :type value: bytes
+        """
+
+        key: bytes = self._key(parts=parts)
+        with self._lock:
+            if key in self._entries:
+                self._evict(key)
+            self._entries[key] = (time.monotonic() + self._ttl, bytearray(value))
+            self._expire()
+            while len(self._entries) > self._max_entries:
+                self._evict(next(iter(self._entries)))
+
+    def get_or_derive(self, parts: Tuple[str, ...], derive: Callable[[], bytes]) -> bytes:
+        """
+        Get cached key, or derive and cache it.
+
+        :param parts: Secret and derivation parts of the key, like the xprivate key and the path.
+        :type parts: tuple
+        :param derive: Key derivation function, called only on a cache miss.
+        :type derive: callable
+
+        :returns: bytes -- Derived key.
+        """
+
+        value: Optional[bytes] = self.get(parts=parts)
+        if value is None:
+            value = derive()
+            self.put(parts=parts, value=value)
+        return value
+
+    def clear(self) -> None:
+        """
+        Zero and remove all cached keys.
+        """
+
+        with self._lock:
+            for key in list(self._entries):
+                self._evict(key)
+
+
+# Shared key cache, disabled by default.
+_key_cache: Optional[KeyCache] = None
+
+
+def enable_key_cache(ttl: float = 300, max_entries: int = 128) -> KeyCache:
+    """
+    Enable the shared key cache of wallets and solvers.
+
+    :param ttl: Seconds an entry lives after it is stored, defaults to ``300``.
+    :type ttl: float
+    :param max_entries: Maximum number of entries, defaults to ``128``.
+    :type max_entries: int
+
+    :returns: KeyCache -- Shared key cache.
+
+    >>> from swap.crypto import enable_key_cache
+    >>> enable_key_cache(ttl=3600, max_entries=32)
+    <swap.crypto.KeyCache object at 0x0409DAF0>
+
+    .. note::
+        Enabling again replaces and zeros the previous shared key cache.
+    """
+
+    global _key_cache
+    disable_key_cache()
+    _key_cache = KeyCache(ttl=ttl, max_entries=max_entries)
+    return _key_cache
+
+
+def disable_key_cache() -> None:
+    """
+    Disable the shared key cache of wallets and solvers, cached keys are zeroed.
+
+    >>> from swap.crypto import disable_key_cache
+    >>> disable_key_cache()
+    """
+
+    global _key_cache
+    if _key_cache is not None:
+        _key_cache.clear()
+    _key_cache = None
+
+
+def get_key_cache() -> Optional[KeyCache]:
+    """
+    Get the shared key cache of wallets and solvers.
+
+    :returns: KeyCache -- Shared key cache, ``None`` when disabled.
+
+    >>> from swap.crypto import get_key_cache
+    >>> get_key_cache()
+    None
+    """
+
+    return _key_cache
+
+
+def cached_key(parts: Tuple[str, ...], derive: Callable[[], bytes]) -> bytes:
+    """
+    Derive key through the shared key cache, when it is enabled.
+
+    :param parts: Secret and derivation parts of the key, like the xprivate key and the path.
+    :type parts: tuple
+    :param derive: Key derivation function.
+    :type derive: callable
+
+    :returns: bytes -- Derived key.
+
+    >>> from swap.crypto import cached_key
+    >>> cached_key(("seed", "meheret"), lambda: bytes(64))
+    b'\\x00\\x00\\x00...'
+    """
+
+    if _key_cache is None:
+        return derive()
+    return _key_cache.get_or_derive(parts=parts, derive=derive)
+
+
+class _SigningKey:
+
+    def __init__(self, private_key: bytes):
+        self._private_key: bytes = private_key
+
+    def to_string(self) -> bytes:
+        return self._private_key
+
+
+class _VerifyingKey:
+
+    def __init__(self, public_key: bytes):
+        self.pubkey = self
+        self.point = self
+        self._x: int = int.from_bytes(public_key[1:33], "big")
+        self._y: int = int.from_bytes(public_key[33:], "big")
+
+    def x(self) -> int:
+        return self._x
+
+    def y(self) -> int:
+        return self._y
+
+    def to_string(self) -> bytes:
+        return self._x.to_bytes(32, "big") + self._y.to_bytes(32, "big")
+
+
+def derive_public_keys(public_key: str, chain_code: str, start: int = 0, count: int = 1,
+                       compressed: bool = True) -> List[Optional[str]]:
+    """
+    Derive non-hardened child public keys of one parent key (BIP32 public derivation).
+
+    :param public_key: Parent compressed public key.
+    :type public_key: str
+    :param chain_code: Parent chain code.
+    :type chain_code: str
+    :param start: First child index, defaults to ``0``.
+    :type start: int
+    :param count: Number of child public keys, defaults to ``1``.
+    :type count: int
+    :param compressed: Compressed child public keys, defaults to ``True``.
+    :type compressed: bool
+
+    :returns: list -- Child public keys, ``None`` for an invalid child index.
+
+    >>> from swap.crypto import derive_public_keys
+    >>> derive_public_keys(public_key="028e27ea30b8191cd54623a0124a87d7849ac0c70c0bb80421446fd7df5070c2b2", chain_code="0fa10b1ea46f63a7b9614ae1690c7e30ee1122d946491e0281ce130d7a18a514", start=0, count=2)
+    ["03f1d68adead0e18c0bac8c107e83b8eff8066ac423a537caea9a872f0997b6293", "0347dd1a877d88b994332f90a64bbc203e6310fc8f955fd64f463af00a5dbb5724"]
+
+    .. note::
+        The parent key is derived once, each child costs one HMAC and one point addition.
+    """
+
+    if start < 0 or start + count > BIP32KEY_HARDEN:
+        raise DerivationError("Invalid child index range, only non-hardened indexes can be derived from public key.")
+
+    backend: Backend = get_backend()
+    parent_public_key, parent_chain_code = unhexlify(public_key), unhexlify(chain_code)
+    child_public_keys: List[Optional[str]] = []
+    for index in range(start, start + count):
+        i = hmac.new(parent_chain_code, parent_public_key + struct.pack(">L", index), hashlib.sha512).digest()
+        # Invalid child key, BIP32 says to skip this index
+        if int.from_bytes(i[:32], "big") >= CURVE_ORDER:
+            child_public_keys.append(None)
+            continue
+        child_public_keys.append(hexlify(backend.public_key_add(
+            public_key=parent_public_key, tweak=i[:32], compressed=compressed
+        )).decode())
+    return child_public_keys
+
+
+class HDWallet(_HDWallet):
+    """
+    Hierarchical Deterministic Wallet, deriving child keys through the selected secp256k1 backend.
+
+    Takes the same arguments as ``hdwallet.HDWallet``.
+
+    .. note::
+        Overrides private ``hdwallet`` methods and attributes, so ``hdwallet`` is limited to ``2.2.x``
+        in the requirements. ``test_crypto_hdwallet_equivalence`` compares it with stock ``hdwallet``.
+    """
+
+    def _from_mnemonic(self, mnemonic: str, passphrase: Optional[str]) -> "HDWallet":
+        # BIP39 seed through the shared key cache, PBKDF2 runs once per mnemonic and passphrase
+        self._mnemonic = unicodedata.normalize("NFKD", mnemonic)
+        self._passphrase = str(passphrase) if passphrase else str()
+        self._seed = cached_key(
+            parts=("bip39-seed", self._mnemonic, self._passphrase),
+            derive=lambda: Mnemonic.to_seed(mnemonic=self._mnemonic, passphrase=self._passphrase)
+        )
+        if self._semantic is None:
+            self._semantic = "p2pkh"
+        return self.from_seed(seed=hexlify(self._seed).decode())
+
+    def from_entropy(self, entropy: str, language: str = "english", passphrase: Optional[str] = None) -> "HDWallet":
+        if not is_entropy(entropy=entropy):
+            raise ValueError("Invalid entropy.")
+        mnemonic: str = entropy_to_mnemonic(entropy=entropy, language=language)
+
+        self._strength = get_entropy_strength(entropy=entropy)
+        self._entropy, self._language = unhexlify(entropy), language
+        return self._from_mnemonic(mnemonic=mnemonic, passphrase=passphrase)
+
+    def from_mnemonic(self, mnemonic: str, language: Optional[str] = None, passphrase: Optional[str] = None) -> "HDWallet":
+        if not is_mnemonic(mnemonic=mnemonic, language=language):
+            raise ValueError("Invalid mnemonic words.")
+        mnemonic = unicodedata.normalize("NFKD", mnemonic)
+
+        self._strength = get_mnemonic_strength(mnemonic=mnemonic)
+        self._language = language if language else get_mnemonic_language(mnemonic=mnemonic)
+        self._entropy = unhexlify(mnemonic_to_entropy(mnemonic=mnemonic, language=self._language))
+        return self._from_mnemonic(mnemonic=mnemonic, passphrase=passphrase)
+
+    def from_seed(self, seed: str) -> "HDWallet":
+        self._seed = unhexlify(seed)
+        self._i = hmac.new(b"Bitcoin seed", self._seed, hashlib.sha512).digest()
+        il, ir = self._i[:32], self._i[32:]
+        self._root_private_key = (il, ir)
+        parse_il = int.from_bytes(il, "big")
+        if parse_il == 0 or parse_il >= CURVE_ORDER:
+            raise ValueError("Bad seed, resulting in invalid key!")
+
+        self._private_key, self._chain_code = il, ir
+        self._key = _SigningKey(il)
+        self._verified_key = _VerifyingKey(get_backend().public_key(private_key=il, compressed=False))
+        if self._use_default_path:
+            self.from_path(path=self._cryptocurrency.DEFAULT_PATH)
+        self._public_key = self.compressed()
+        if self._from_class:
+            self.from_path(path=self._path_class)
+        if self._semantic is None:
+            self._semantic = "p2pkh"
+        return self
+
+    def from_xpublic_key(self, xpublic_key: str, strict: bool = False) -> "HDWallet":
+        if not is_root_xpublic_key(xpublic_key=xpublic_key, symbol=self._cryptocurrency.SYMBOL):
+            if strict:
+                raise ValueError("Invalid root xpublic key.")
+
+        version, depth, parent_fingerprint, index, chain_code, public_key = (
+            self._deserialize_xpublic_key(xpublic_key=xpublic_key)
+        )
+        self._root_depth, self._root_parent_fingerprint, self._root_index = (
+            int.from_bytes(depth, "big"), parent_fingerprint, struct.unpack(">L", index)[0]
+        )
+        self._depth, self._parent_fingerprint, self._index = (
+            int.from_bytes(depth, "big"), parent_fingerprint, struct.unpack(">L", index)[0]
+        )
+        self._chain_code = chain_code
+        # Compressed key is uncompressed here, ecdsa VerifyingKey only loads raw x and y
+        self._verified_key = _VerifyingKey(ECDSABackend._encode(ECDSABackend._point(public_key), False))
+        self._root_public_key = (public_key, chain_code)
+        if self._use_default_path:
+            self.from_path(path=self._cryptocurrency.DEFAULT_PATH)
+        if self._from_class:
+            self.from_path(path=str(self._path_class).replace("'", ""))
+        self._public_key = self.compressed()
+        self._semantic = get_semantic(
+            _cryptocurrency=self._cryptocurrency, version=version, key_type="public_key"
+        )
+        return self
+
+    def from_private_key(self, private_key: str) -> "HDWallet":
+        self._private_key = unhexlify(private_key)
+        self._key = _SigningKey(self._private_key)
+        self._verified_key = _VerifyingKey(get_backend().public_key(private_key=self._private_key, compressed=False))
+        self._public_key = self.compressed()
+        return self
+
+    def _derive_key_by_index(self, index) -> Optional["HDWallet"]:
+
+        if not self._root_private_key and not self._root_public_key:
+            raise ValueError("You can't drive this master key.")
+
+        backend: Backend = get_backend()
+        i_str = struct.pack(">L", index)
+        if index & BIP32KEY_HARDEN:
+            if self._key is None:
+                raise DerivationError("Hardened derivation path is invalid for xpublic key.")
+            data = b"\0" + self._key.to_string() + i_str
+        else:
+            data = unhexlify(self.compressed()) + i_str
+
+        if not self._chain_code:
+            raise ValueError("You can't drive xprivate_key and private_key.")
+
+        i = hmac.new(self._chain_code, data, hashlib.sha512).digest()
+        il, ir = i[:32], i[32:]
+
+        il_int = int.from_bytes(il, "big")
+        if il_int >= CURVE_ORDER:
+            return None
+
+        parent_fingerprint: bytes = unhexlify(self.finger_print())
+        if self._key:
+            k_int = (il_int + int.from_bytes(self._key.to_string(), "big")) % CURVE_ORDER
+            if k_int == 0:
+                return None
+            secret = k_int.to_bytes(32, "big")
+
+            self._private_key, self._chain_code, self._depth, self._index, self._parent_fingerprint = (
+                secret, ir, (self._depth + 1), index, parent_fingerprint
+            )
+            self._key = _SigningKey(secret)
+            self._verified_key = _VerifyingKey(backend.public_key(private_key=secret, compressed=False))
+        else:
+            self._chain_code, self._depth, self._index, self._parent_fingerprint = (
+                ir, (self._depth + 1), index, parent_fingerprint
+            )
+            self._verified_key = _VerifyingKey(backend.public_key_add(
+                public_key=unhexlify(self.compressed()), tweak=il, compressed=False
+            ))
+        return self
+
+    def public_key(self, compressed: bool = True, private_key: Optional[str] = None) -> str:
+        if private_key:
+            return hexlify(get_backend().public_key(
+                private_key=unhexlify(private_key), compressed=compressed
+            )).decode()
+        return super().public_key(compressed=compressed)
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+
+from btcpy.structs.address import Address
+from typing import (
+    Optional, Callable, List, Tuple, Dict, Any
+)
+
+import threading
+import hashlib
+import queue
+import socket
+import json
+import ssl
+
+from ...exceptions import (
+    APIError, AddressError, NetworkError
+)
+from ..config import bitcoin as config
+from .utils import (
+    is_network, is_address
+)
+
+
+def _get_script(address: str) -> bytes:
+    # Not strict, the address network is checked by is_address instead of btcpy setup
+    return bytes.fromhex(Address.from_string(address, strict=False).to_script().hexlify())
+
+
+def get_scripthash(address: str, network: str = config["network"]) -> str:
+    """
+    Get Electrum script hash of Bitcoin address.
+
+    :param address: Bitcoin address.
+    :type address: str
+    :param network: Bitcoin network, defaults to ``mainnet``.
+    :type network: str
+
+    :returns: str -- Electrum script hash.
+
+    >>> from swap.providers.bitcoin.electrum import get_scripthash
+    >>> get_scripthash(address="1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa", network="mainnet")
+    "8b01df4e368ea28f8dc0423bcf7a4923e3a12d307c875e47a0cfbf90b5c39161"
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Bitcoin '{network}' network",
+                           "choose only 'mainnet' or 'testnet' networks.")
+    if not is_address(address=address, network=network):
+        raise AddressError(f"Invalid Bitcoin '{address}' {network} address.")
+
+    return hashlib.sha256(_get_script(address=address)).digest()[::-1].hex()
+
+
+class ElectrumClient:
+    """
+    Electrum protocol client, over one persistent TCP/TLS connection.
+
+    :param host: Electrum server host.
+    :type host: str
+    :param port: Electrum server port.
+    :type port: int
+    :param use_ssl: Connect with TLS, defaults to ``True``.
+    :type use_ssl: bool
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: ElectrumClient -- Electrum client instance.
+
+    >>> from swap.providers.bitcoin.electrum import ElectrumClient
+    >>> with ElectrumClient(host="electrum.blockstream.info", port=60002) as electrum:
+    ...     electrum.request("blockchain.headers.subscribe")
+    {'hex': '...', 'height': 1906748}
+
+    .. note::
+        Responses and ``blockchain.scripthash.subscribe`` notifications are read by one background thread,
+        subscription callbacks are called in order from another thread, so they can send requests too.
+    """
+
+    def __init__(self, host: str, port: int, use_ssl: bool = True, timeout: int = config["timeout"]):
+        self._host: str = host
+        self._port: int = port
+        self._use_ssl: bool = use_ssl
+        self._timeout: int = timeout
+
+        self._socket: Optional[socket.socket] = None
+        self._reader: Optional[threading.Thread] = None
+        self._notifier: Optional[threading.Thread] = None
+        self._notifications: "queue.Queue[Optional[Tuple[str, Optional[str]]]]" = queue.Queue()
+        self._lock: threading.Lock = threading.Lock()
+        self._id: int = 0
+        self._pending: Dict[int, list] = {}
+        self._subscriptions: Dict[str, Callable[[str, Optional[str]], None]] = {}
+        self._error: Optional[Exception] = None
+
+    def __enter__(self) -> "ElectrumClient":
+        return self.connect()
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def connect(self) -> "ElectrumClient":
+        """
+        Connect to Electrum server and start reading responses.
+
+        :returns: ElectrumClient -- Electrum client instance.
+        """
+
+        if self._socket is not None:
+            return self
+        connection: socket.socket = socket.create_connection((self._host, self._port), timeout=self._timeout)
+        if self._use_ssl:
+            connection = ssl.create_default_context().wrap_socket(connection, server_hostname=self._host)
+        connection.settimeout(None)
+        self._socket, self._error = connection, None
+        self._reader = threading.Thread(target=self._read, args=(connection,), daemon=True)
+        self._reader.start()
+        if self._notifier is None:
+            self._notifier = threading.Thread(target=self._notify, daemon=True)
+            self._notifier.start()
+        return self
+
+    def close(self) -> None:
+        """
+        Close Electrum server connection.
+
+        :returns: None.
+        """
+
+        if self._socket is not None:
+            try:
+                self._socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._socket.close()
+            self._socket = None
+        if self._notifier is not None:
+            self._notifications.put(None)
+            self._notifier = None
+
+    def _read(self, connection: socket.socket) -> None:
+        buffer: bytes = b""
+        try:
+            while True:
+                data: bytes = connection.recv(65536)
+                if not data:
+                    raise ConnectionError("Electrum server closed connection.")
+                buffer += data
+                while b"\n" in buffer:
+                    line, buffer = buffer.split(b"\n", 1)
+                    if line.strip():
+                        message = json.loads(line)
+                        for response in (message if isinstance(message, list) else [message]):
+                            self._dispatch(response)
+        except (OSError, ValueError) as exception:
+            if self._socket is not connection and self._socket is not None:
+                return
+            self._error = exception if isinstance(exception, ConnectionError) else ConnectionError(str(exception))
+            with self._lock:
+                for slot in self._pending.values():
+                    slot[0].set()
+
+    def _notify(self) -> None:
+        # Subscription callbacks off the reader thread, a callback waiting on a response would block it
+        while True:
+            notification: Optional[Tuple[str, Optional[str]]] = self._notifications.get()
+            if notification is None:
+                return
+            scripthash, status = notification
+            if scripthash in self._subscriptions:
+                try:
+                    self._subscriptions[scripthash](scripthash, status)
+                except Exception:
+                    # Keep the next notifications, one failed callback must not stop them
+                    continue
+
+    def _dispatch(self, response: dict) -> None:
+        if response.get("id") is None:
+            # Subscription notification, params are script hash and its new status
+            if response.get("method") == "blockchain.scripthash.subscribe":
+                scripthash, status = response["params"]
+                self._notifications.put((scripthash, status))
+            return
+        with self._lock:
+            slot: Optional[list] = self._pending.get(response["id"])
+        if slot is not None:
+            slot[1] = response
+            slot[0].set()
+
+    def batch(self, calls: List[Tuple[str, list]]) -> list:
+        """
+        Send Electrum JSON-RPC batch request.
+
+        :param calls: Electrum method and params pairs.
+        :type calls: list
+
+        :returns: list -- Electrum results, in calls order.
+
+        >>> from swap.providers.bitcoin.electrum import ElectrumClient
+        >>> electrum: ElectrumClient = ElectrumClient(host="electrum.blockstream.info", port=60002).connect()
+        >>> electrum.batch(calls=[("blockchain.scripthash.get_balance", ["4d5c4e3d7b4a5d9d3b2ea0b0a7a35a7a6e1c0c4de3f3a5d0b9c5b8e2f7e1e2a9"])])
+        [{'confirmed': 0, 'unconfirmed': 0}]
+        """
+
+        if not calls:
+            return []
+        self.connect()
+        slots: List[list] = []
+        with self._lock:
+            data = []
+            for method, params in calls:
+                self._id += 1
+                self._pending[self._id] = [threading.Event(), None]
+                slots.append(self._pending[self._id])
+                data.append(dict(jsonrpc="2.0", id=self._id, method=method, params=params))
+            ids: List[int] = [request["id"] for request in data]
+        try:
+            self._socket.sendall(json.dumps(data if len(data) > 1 else data[0]).encode() + b"\n")
+            results: list = []
+            for slot in slots:
+                if not slot[0].wait(self._timeout):
+                    raise APIError(f"Electrum server '{self._host}:{self._port}' request timeout.")
+                if slot[1] is None:
+                    raise self._error or ConnectionError("Electrum server closed connection.")
+                if slot[1].get("error"):
+                    error: Any = slot[1]["error"]
+                    raise APIError(error["message"], error.get("code")) \
+                        if isinstance(error, dict) else APIError(str(error))
+                results.append(slot[1]["result"])
+            return results
+        finally:
+            with self._lock:
+                for _id in ids:
+                    self._pending.pop(_id, None)
+
+    def request(self, method: str, *params) -> Any:
+        """
+        Send Electrum JSON-RPC request.
+
+        :param method: Electrum method.
+        :type method: str
+        :param params: Electrum method params.
+
+        :returns: Any -- Electrum result.
+
+        >>> from swap.providers.bitcoin.electrum import ElectrumClient
+        >>> electrum: ElectrumClient = ElectrumClient(host="electrum.blockstream.info", port=60002).connect()
+        >>> electrum.request("blockchain.transaction.get", "98c6a3d4e136d32d0848126e08325c94da2e8217593e92236471b11b42ee7999")
+        "0200000001a17d57e7d7f0623935..."
+        """
+
+        return self.batch(calls=[(method, list(params))])[0]
+
+    def subscribe(self, addresses: List[str], callback: Callable[[str, Optional[str]], None],
+                  network: str = config["network"], batch_size: int = 1000) -> Dict[str, Optional[str]]:
+        """
+        Subscribe to Bitcoin addresses status changes, for funding and spend detection.
+
+        :param addresses: Bitcoin addresses.
+        :type addresses: list
+        :param callback: Called with script hash and its new status on every change.
+        :type callback: Callable
+        :param network: Bitcoin network of addresses, defaults to ``mainnet``.
+        :type network: str
+        :param batch_size: Subscriptions per batch request, defaults to ``1000``.
+        :type batch_size: int
+
+        :returns: dict -- Current status of each address, ``None`` for no history.
+
+        >>> from swap.providers.bitcoin.electrum import ElectrumClient
+        >>> electrum: ElectrumClient = ElectrumClient(host="electrum.blockstream.info", port=60002).connect()
+        >>> electrum.subscribe(addresses=["2N729UBGZB3xjsGFRgKivy4bSjkaJGMVSpB"], callback=print, network="testnet")
+        {'2N729UBGZB3xjsGFRgKivy4bSjkaJGMVSpB': None}
+        """
+
+        scripthashes: Dict[str, str] = {
+            address: get_scripthash(address=address, network=network) for address in addresses
+        }
+        for scripthash in scripthashes.values():
+            self._subscriptions[scripthash] = callback
+        statuses: Dict[str, Optional[str]] = {}
+        addresses = list(scripthashes)
+        for index in range(0, len(addresses), batch_size):
+            results: list = self.batch(calls=[
+                ("blockchain.scripthash.subscribe", [scripthashes[address]])
+                for address in addresses[index:index + batch_size]
+            ])
+            statuses.update(zip(addresses[index:index + batch_size], results))
+        return statuses
+
+
+# Electrum clients per network, reuses persistent connections.
+_clients: Dict[str, ElectrumClient] = {}
+
+
+def get_client(network: str = config["network"], timeout: int = config["timeout"]) -> ElectrumClient:
+    """
+    Get connected Electrum client of Bitcoin network.
+
+    :param network: Bitcoin network, defaults to ``mainnet``.
+    :type network: str
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: ElectrumClient -- Connected Electrum client.
+
+    >>> from swap.providers.bitcoin.electrum import get_client
+    >>> get_client(network="testnet")
+    <swap.providers.bitcoin.electrum.ElectrumClient object at 0x0409DAF0>
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Bitcoin '{network}' network",
+                           "choose only 'mainnet' or 'testnet' networks.")
+
+    electrum: dict = config[network]["electrum"]
+    if network not in _clients or _clients[network]._error is not None:
+        if network in _clients:
+            _clients[network].close()
+        _clients[network] = ElectrumClient(
+            host=electrum["host"], port=electrum["port"], use_ssl=electrum["ssl"], timeout=timeout
+        )
+    return _clients[network].connect()
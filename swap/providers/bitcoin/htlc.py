@@ -1,18 +1,18 @@
 #!/usr/bin/env python3
 
 from binascii import unhexlify
+from btcpy.lib.base58 import b58encode_check
+from btcpy.lib.bech32 import encode as bech32_encode
 from btcpy.structs.script import (
-    Script, ScriptBuilder, P2shScript, IfElseScript
+    Script, ScriptBuilder, IfElseScript
 )
-from btcpy.structs.transaction import Locktime
 from datetime import datetime
+from functools import lru_cache
 from typing import (
-    Optional, Union
+    Optional, Union, List, Tuple
 )
 
 import hashlib
-import sys
-import os
 
 from ...exceptions import (
     AddressError, NetworkError, UnitError
@@ -22,7 +22,17 @@ from .rpc import (
     get_balance, get_utxos
 )
 from .utils import (
-    get_address_hash, is_address, is_network, amount_unit_converter
+    get_address_hash, get_address_type, is_address, is_network, amount_unit_converter
+)
+
+# Precompiled HTLC bytecode template of contracts/htlc.script, the fixed opcodes around the
+# secret hash, recipient address hash, endtime and sender address hash pushes.
+_HTLC_TEMPLATE: Tuple[bytes, bytes, bytes, bytes, bytes] = (
+    unhexlify("63aa20"),  # OP_IF OP_HASH256 PUSH(32)
+    unhexlify("8876a914"),  # OP_EQUALVERIFY OP_DUP OP_HASH160 PUSH(20)
+    unhexlify("88ac67"),  # OP_EQUALVERIFY OP_CHECKSIG OP_ELSE
+    unhexlify("b17576a914"),  # OP_CHECKLOCKTIMEVERIFY OP_DROP OP_DUP OP_HASH160 PUSH(20)
+    unhexlify("88ac68")  # OP_EQUALVERIFY OP_CHECKSIG OP_ENDIF
 )
 
 
@@ -46,6 +56,7 @@ class HTLC:
                                "choose only 'mainnet' or 'testnet' networks.")
         self._network: str = network
         self._script: Optional[IfElseScript, ScriptBuilder] = None
+        self._segwit: bool = False
         self._contract_address: Optional[str] = contract_address
         self.agreements: Optional[dict] = None
 
@@ -53,7 +64,12 @@ class HTLC:
     def script(self) -> Union[ScriptBuilder]:
         return self._script
 
-    def build_htlc(self, secret_hash: str, recipient_address: str, sender_address: str, endtime: int) -> "HTLC":
+    @property
+    def segwit(self) -> bool:
+        return self._segwit
+
+    def build_htlc(self, secret_hash: str, recipient_address: str, sender_address: str,
+                   endtime: int, segwit: bool = False) -> "HTLC":
         """
         Build Bitcoin Hash Time Lock Contract (HTLC).
 
@@ -65,6 +81,8 @@ class HTLC:
         :type sender_address: str
         :param endtime: Expiration block time (Seconds).
         :type endtime: int
+        :param segwit: Pay to witness script hash (P2WSH) HTLC, defaults to ``False``.
+        :type segwit: bool
 
         :returns: HTLC -- Bitcoin Hash Time Lock Contract (HTLC) instance.
 
@@ -73,32 +91,19 @@ class HTLC:
         >>> htlc: HTLC = HTLC(network="testnet")
         >>> htlc.build_htlc(secret_hash=sha256("Hello Meheret!"), recipient_address="mgS3WMHp9nvdUPeDJxr5iCF2P5HuFZSR3V", sender_address="n1wgm6kkzMcNfAtJmes8YhpvtDzdNhDY5a", endtime=1624687630)
         <swap.providers.bitcoin.htlc.HTLC object at 0x0409DAF0>
+
+        .. note::
+            With ``segwit`` the same HTLC script is locked by a native segwit P2WSH output and a bech32 contract address,
+            withdraw and refund put the script and signature in the witness and pay smaller fees.
+
+        .. note::
+            Recipient and sender must be public key hash ``p2pkh`` or ``p2wpkh`` addresses, the HTLC script signs
+            with their keys. A P2SH-P2WPKH wallet uses its P2PKH or P2WPKH address here and can still fund the HTLC.
         """
 
-        # Check parameter instances
-        if len(secret_hash) != 64:
-            raise ValueError("Invalid secret hash, length must be 64.")
-        if not is_address(address=recipient_address, network=self._network):
-            raise AddressError(f"Invalid Bitcoin recipient '{recipient_address}' {self._network} address.")
-        if not is_address(address=sender_address, network=self._network):
-            raise AddressError(f"Invalid Bitcoin sender '{sender_address}' {self._network} address.")
-
-        # Get current working directory path (like linux or unix path).
-        cwd: str = os.path.dirname(sys.modules[__package__].__file__)
-
-        with open(f"{cwd}/contracts/htlc.script", "r", encoding="utf-8") as htlc_script:
-            htlc_opcode: str = htlc_script.readlines()[-1]  # HTLC OP_Code script
-            htlc_script.close()
-
-        build_htlc_opcode: str = htlc_opcode.format(
-            secret_hash=hashlib.sha256(unhexlify(secret_hash)).hexdigest(),
-            recipient_address_hash=get_address_hash(
-                address=recipient_address, script=False
-            ),
-            sender_address_hash=get_address_hash(
-                address=sender_address, script=False
-            ),
-            endtime=Locktime(n=endtime).for_script().hexlify()[2:]
+        bytecode: bytes = _build_htlc_bytecode(
+            secret_hash=secret_hash, recipient_address=recipient_address,
+            sender_address=sender_address, endtime=endtime, network=self._network
         )
 
         self.agreements = {
@@ -110,16 +115,17 @@ class HTLC:
                 "timestamp": endtime
             }
         }
-        bytecode: str = Script.compile(build_htlc_opcode)
-        self._script = ScriptBuilder.identify(bytecode)
+        self._script, self._segwit = ScriptBuilder.identify(bytecode.hex()), segwit
         return self
 
-    def from_opcode(self, opcode: str) -> "HTLC":
+    def from_opcode(self, opcode: str, segwit: bool = False) -> "HTLC":
         """
         Initiate Bitcoin Hash Time Lock Contract (HTLC) from opcode script.
 
         :param opcode: Bitcoin opcode script.
         :type opcode: str
+        :param segwit: Pay to witness script hash (P2WSH) HTLC, defaults to ``False``.
+        :type segwit: bool
 
         :returns: HTLC -- Bitcoin Hash Time Lock Contract (HTLC) instance.
 
@@ -131,15 +137,17 @@ class HTLC:
         """
 
         bytecode = Script.compile(opcode)
-        self._script = ScriptBuilder.identify(bytecode)
+        self._script, self._segwit = ScriptBuilder.identify(bytecode), segwit
         return self
 
-    def from_bytecode(self, bytecode: str) -> "HTLC":
+    def from_bytecode(self, bytecode: str, segwit: bool = False) -> "HTLC":
         """
         Initialize Bitcoin Hash Time Lock Contract (HTLC) from bytecode.
 
         :param bytecode: Bitcoin bytecode.
         :type bytecode: str
+        :param segwit: Pay to witness script hash (P2WSH) HTLC, defaults to ``False``.
+        :type segwit: bool
 
         :returns: HTLC -- Bitcoin Hash Time Lock Contract (HTLC) instance.
 
@@ -150,7 +158,7 @@ class HTLC:
         <swap.providers.bitcoin.htlc.HTLC object at 0x0409DAF0>
         """
 
-        self._script = ScriptBuilder.identify(bytecode)
+        self._script, self._segwit = ScriptBuilder.identify(bytecode), segwit
         return self
 
     def bytecode(self) -> str:
@@ -201,11 +209,14 @@ class HTLC:
         >>> htlc.build_htlc(sha256("Hello Meheret!"), "mgS3WMHp9nvdUPeDJxr5iCF2P5HuFZSR3V", "n1wgm6kkzMcNfAtJmes8YhpvtDzdNhDY5a", 1624687630)
         >>> htlc.hash()
         "a914c8c77a9b43ee2bdf1a07c48699833d7668bf264c87"
+
+        .. note::
+            For segwit HTLC it returns the pay to witness script hash (P2WSH) locking script.
         """
 
         if self._script is None:
             raise ValueError("HTLC script is None, first build HTLC.")
-        return str(P2shScript(self._script.p2sh_hash()).hexlify())
+        return _get_script_hash(bytecode=unhexlify(self._script.hexlify()), segwit=self._segwit)[0]
 
     def contract_address(self) -> str:
         """
@@ -219,15 +230,18 @@ class HTLC:
         >>> htlc.build_htlc(sha256("Hello Meheret!"), "mgS3WMHp9nvdUPeDJxr5iCF2P5HuFZSR3V", "n1wgm6kkzMcNfAtJmes8YhpvtDzdNhDY5a", 1624687630)
         >>> htlc.contract_address()
         "2NBYr6gvh4ujsRwKKjDrrRr2vGonazzX6Z6"
+
+        .. note::
+            For segwit HTLC it returns the bech32 pay to witness script hash (P2WSH) address.
         """
 
         if self._contract_address:
             return self._contract_address
         if self._script is None:
             raise ValueError("HTLC script is None, first build HTLC.")
-        return str(P2shScript(self._script.p2sh_hash()).address(
-            mainnet=(True if self._network == "mainnet" else False)
-        ))
+        return _get_script_hash(
+            bytecode=unhexlify(self._script.hexlify()), segwit=self._segwit, network=self._network
+        )[1]
 
     def balance(self, unit: str = config["unit"]) -> Union[int, float]:
         """
@@ -282,3 +296,101 @@ class HTLC:
                 script=utxo["script"]
             ))
         return utxos
+
+
+def build_many(htlcs: List[dict], network: str = config["network"], segwit: bool = False) -> List[dict]:
+    """
+    Build many Bitcoin Hash Time Lock Contracts (HTLC's) from the precompiled HTLC template.
+
+    :param htlcs: Bitcoin HTLC agreements, dicts of secret_hash, recipient_address, sender_address and endtime.
+    :type htlcs: list
+    :param network: Bitcoin network, defaults to ``mainnet``.
+    :type network: str
+    :param segwit: Pay to witness script hash (P2WSH) HTLC's, defaults to ``False``.
+    :type segwit: bool
+
+    :returns: list -- Bitcoin HTLC bytecode, hash and contract address dicts.
+
+    >>> from swap.providers.bitcoin.htlc import build_many
+    >>> from swap.utils import sha256
+    >>> build_many(htlcs=[dict(secret_hash=sha256("Hello Meheret!"), recipient_address="mgS3WMHp9nvdUPeDJxr5iCF2P5HuFZSR3V", sender_address="n1wgm6kkzMcNfAtJmes8YhpvtDzdNhDY5a", endtime=1624687630)], network="testnet")
+    [{'bytecode': '63aa20821124b554d13f247b1e5d10b84e44fb1296f18f38bbaa1bea34a12c843e01588876a9140a0a6590e6ba4b48118d21b86812615219ece76b88ac67040ec4d660b17576a914e00ff2a640b7ce2d336860739169487a57f84b1588ac68', 'hash': 'a914c8c77a9b43ee2bdf1a07c48699833d7668bf264c87', 'contract_address': '2NBYr6gvh4ujsRwKKjDrrRr2vGonazzX6Z6'}]
+
+    .. note::
+        Same HTLC's as ``HTLC.build_htlc``, without compiling the opcode script and with the
+        recipient and sender address hashes cached, for deriving many contract addresses at once.
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Bitcoin '{network}' network",
+                           "choose only 'mainnet' or 'testnet' networks.")
+
+    contracts: List[dict] = []
+    for htlc in htlcs:
+        bytecode: bytes = _build_htlc_bytecode(
+            secret_hash=htlc["secret_hash"], recipient_address=htlc["recipient_address"],
+            sender_address=htlc["sender_address"], endtime=htlc["endtime"], network=network
+        )
+        _hash, contract_address = _get_script_hash(bytecode=bytecode, segwit=segwit, network=network)
+        contracts.append(dict(
+            bytecode=bytecode.hex(), hash=_hash, contract_address=contract_address
+        ))
+    return contracts
+
+
+@lru_cache(maxsize=4096)
+def _get_address_hash(address: str, network: str) -> Optional[bytes]:
+    # 20-byte public key hash, or None for invalid and script hash (P2SH, P2WSH) addresses
+    if not is_address(address=address, network=network) or get_address_type(address=address) not in ["p2pkh", "p2wpkh"]:
+        return None
+    return unhexlify(get_address_hash(address=address, script=False))
+
+
+def _get_script_number(number: int) -> bytes:
+    # Minimal script number push, OP_1 to OP_16 for small numbers else little-endian
+    # bytes with a sign byte when the high bit is set
+    if number <= 16:
+        return bytes([0x50 + number])
+    data: bytes = number.to_bytes((number.bit_length() + 8) // 8, "little").rstrip(b"\x00")
+    if data[-1] & 0x80:
+        data += b"\x00"
+    return bytes([len(data)]) + data
+
+
+def _build_htlc_bytecode(secret_hash: str, recipient_address: str, sender_address: str,
+                         endtime: int, network: str) -> bytes:
+
+    # Check parameter instances
+    if len(secret_hash) != 64:
+        raise ValueError("Invalid secret hash, length must be 64.")
+    if not isinstance(endtime, int) or endtime <= 0:
+        raise ValueError(f"Invalid endtime '{endtime}', must be a positive int.")
+    recipient_address_hash: Optional[bytes] = _get_address_hash(address=recipient_address, network=network)
+    if recipient_address_hash is None:
+        raise AddressError(f"Invalid Bitcoin recipient '{recipient_address}' {network} address",
+                           "choose only public key hash 'p2pkh' or 'p2wpkh' addresses.")
+    sender_address_hash: Optional[bytes] = _get_address_hash(address=sender_address, network=network)
+    if sender_address_hash is None:
+        raise AddressError(f"Invalid Bitcoin sender '{sender_address}' {network} address",
+                           "choose only public key hash 'p2pkh' or 'p2wpkh' addresses.")
+
+    return b"".join([
+        _HTLC_TEMPLATE[0], hashlib.sha256(unhexlify(secret_hash)).digest(),
+        _HTLC_TEMPLATE[1], recipient_address_hash,
+        _HTLC_TEMPLATE[2], _get_script_number(endtime),
+        _HTLC_TEMPLATE[3], sender_address_hash,
+        _HTLC_TEMPLATE[4]
+    ])
+
+
+def _get_script_hash(bytecode: bytes, segwit: bool = False, network: Optional[str] = None) -> Tuple[str, Optional[str]]:
+    # P2SH/P2WSH locking script hex and, with the network, the contract address
+    if segwit:
+        script_hash: bytes = hashlib.sha256(bytecode).digest()
+        return f"0020{script_hash.hex()}", (None if network is None else bech32_encode(
+            ("bc" if network == "mainnet" else "tb"), 0, script_hash
+        ))
+    script_hash: bytes = hashlib.new("ripemd160", hashlib.sha256(bytecode).digest()).digest()
+    return f"a914{script_hash.hex()}87", (None if network is None else b58encode_check(
+        (b"\x05" if network == "mainnet" else b"\xc4") + script_hash
+    ))
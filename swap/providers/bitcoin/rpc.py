@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 
-from btcpy.structs.transaction import MutableTransaction
+from btcpy.structs.transaction import TransactionFactory
 from btcpy.setup import setup as stp
-from typing import Optional
+from decimal import Decimal
+from typing import (
+    Optional, Union, List, Tuple, Dict, Any
+)
 
 import requests
 import json
@@ -11,10 +14,162 @@ from ...exceptions import (
     AddressError, APIError, NetworkError
 )
 from ..config import bitcoin as config
+from .electrum import (
+    get_client, get_scripthash, _get_script
+)
 from .utils import (
     is_network, is_address
 )
 
+# Bitcoind script types to blockcypher script types.
+SCRIPT_TYPES: Dict[str, str] = {
+    "pubkeyhash": "pay-to-pubkey-hash", "p2pkh": "pay-to-pubkey-hash",
+    "scripthash": "pay-to-script-hash", "p2sh": "pay-to-script-hash",
+    "witness_v0_keyhash": "pay-to-witness-pubkey-hash", "p2wpkh": "pay-to-witness-pubkey-hash",
+    "witness_v0_scripthash": "pay-to-witness-script-hash", "p2wsh": "pay-to-witness-script-hash",
+    "pubkey": "pay-to-pubkey", "p2pk": "pay-to-pubkey",
+    "multisig": "pay-to-multi-pubkey-hash", "p2ms": "pay-to-multi-pubkey-hash",
+    "nulldata": "null-data"
+}
+
+# Bitcoind JSON-RPC sessions per url, reuses keep-alive connections.
+_sessions: Dict[str, requests.Session] = {}
+
+
+def _bitcoind(network: str) -> Tuple[str, requests.Session]:
+    bitcoind: dict = config[network]["bitcoind"]
+    url: str = f"{bitcoind['url']}/wallet/{bitcoind['wallet']}" if bitcoind["wallet"] else bitcoind["url"]
+    if url not in _sessions:
+        _sessions[url] = requests.Session()
+        if bitcoind["username"]:
+            _sessions[url].auth = (bitcoind["username"], bitcoind["password"])
+    return url, _sessions[url]
+
+
+def _check_history(network: str) -> None:
+    # Bitcoind has address history only in a watch-only wallet, scantxoutset sees unspent outputs only
+    if config[network]["backend"] == "bitcoind" and not config[network]["bitcoind"]["wallet"]:
+        raise APIError(f"Bitcoind backend has no address history without a watch-only wallet, "
+                       f"set the '{network}' network bitcoind wallet in the config.")
+
+
+def _satoshi(amount: Any) -> int:
+    return int(Decimal(str(amount)) * config["units"]["Satoshi"])
+
+
+def bitcoind_batch(calls: List[Tuple[str, list]], network: str = config["network"],
+                   headers: dict = config["headers"], timeout: int = config["timeout"]) -> list:
+    """
+    Send Bitcoin JSON-RPC batch request to bitcoind.
+
+    :param calls: Bitcoind method and params pairs.
+    :type calls: list
+    :param network: Bitcoin network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common-headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: list -- Bitcoind results, in calls order.
+
+    >>> from swap.providers.bitcoin.rpc import bitcoind_batch
+    >>> bitcoind_batch(calls=[("getblockcount", []), ("getbestblockhash", [])], network="testnet")
+    [1906748, '000000000000002b1e6fd3b0e5a4e7e3e6c2fbc8e0d84ed4eb2a2e60f1bba8f7']
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Bitcoin '{network}' network",
+                           "choose only 'mainnet' or 'testnet' networks.")
+    if not calls:
+        return []
+
+    url, session = _bitcoind(network=network)
+    data = [
+        dict(jsonrpc="1.0", id=index, method=method, params=params)
+        for index, (method, params) in enumerate(calls)
+    ]
+    response = session.post(
+        url=url, data=json.dumps(data), headers=headers, timeout=timeout
+    )
+    if response.status_code == 401:
+        raise APIError("Bitcoind authorization failed, check username and password.", 401)
+    response_json = sorted(response.json(parse_float=Decimal), key=lambda result: result["id"])
+    for result in response_json:
+        if result["error"] is not None:
+            raise APIError(result["error"]["message"], result["error"]["code"])
+    return [result["result"] for result in response_json]
+
+
+def bitcoind_request(method: str, params: Optional[list] = None, network: str = config["network"],
+                     headers: dict = config["headers"], timeout: int = config["timeout"]) -> Any:
+    """
+    Send Bitcoin JSON-RPC request to bitcoind.
+
+    :param method: Bitcoind method.
+    :type method: str
+    :param params: Bitcoind method params, defaults to ``None``.
+    :type params: list
+    :param network: Bitcoin network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common-headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: Any -- Bitcoind result.
+
+    >>> from swap.providers.bitcoin.rpc import bitcoind_request
+    >>> bitcoind_request(method="getblockcount", network="testnet")
+    1906748
+    """
+
+    return bitcoind_batch(
+        calls=[(method, params if params else [])], network=network, headers=headers, timeout=timeout
+    )[0]
+
+
+def normalize_transaction(transaction: dict) -> dict:
+    """
+    Normalize bitcoind verbose transaction to Bitcoin transaction detail.
+
+    :param transaction: Bitcoind verbose or decoded transaction.
+    :type transaction: dict
+
+    :returns: dict -- Bitcoin transaction detail, like blockcypher transaction.
+
+    >>> from swap.providers.bitcoin.rpc import normalize_transaction, decode_raw
+    >>> normalize_transaction(transaction=decode_raw(raw="02000000011823f39a8c5f6f27845dd13a65e03fe2ef5108d235e7a36edb6eb267b0459c5a010000006a47304402207018b7fd1ba6624fe9bb0f16cd65fa243d202e32fdff452699f56465b61ab648022009f0dc1a0a63109246c45e120fc0d34b40e789dfc4d05e64f269602c7d67d9210121027f0dc0894bd690635412af782d05e4f79d3d40bf568978c650f3f1ca1a96cf36ffffffff02102700000000000017a9149418feed4647e156d6663db3e0cef7c050d038678734330100000000001976a91433ecab3d67f0e2bde43e52f41ec1ecbdc73f11f888ac00000000", network="testnet"))["outputs"][0]
+    {'value': 10000, 'script': 'a9149418feed4647e156d6663db3e0cef7c050d0386787', 'addresses': ['2N6kHwQy6Ph5EdKNgzGrcW2WhGHKGfmP5ae'], 'script_type': 'pay-to-script-hash'}
+    """
+
+    def addresses(script_pubkey: dict) -> list:
+        return [script_pubkey["address"]] if "address" in script_pubkey else script_pubkey.get("addresses", [])
+
+    return dict(
+        block_hash=transaction.get("blockhash"),
+        hash=transaction["txid"],
+        size=transaction["size"],
+        ver=transaction["version"],
+        lock_time=transaction["locktime"],
+        confirmations=transaction.get("confirmations", 0),
+        vin_sz=len(transaction["vin"]),
+        vout_sz=len(transaction["vout"]),
+        inputs=[dict(
+            prev_hash=_input.get("txid"),
+            output_index=_input.get("vout", -1),
+            script=_input.get("scriptSig", dict(hex=None))["hex"],
+            witness=_input.get("txinwitness", []),
+            sequence=int(_input["sequence"])
+        ) for _input in transaction["vin"]],
+        outputs=[dict(
+            value=_satoshi(_output["value"]),
+            script=_output["scriptPubKey"]["hex"],
+            addresses=addresses(_output["scriptPubKey"]),
+            script_type=SCRIPT_TYPES.get(_output["scriptPubKey"]["type"], _output["scriptPubKey"]["type"])
+        ) for _output in transaction["vout"]]
+    )
+
 
 def get_balance(address: str, network: str = config["network"],
                 headers: dict = config["headers"], timeout: int = config["timeout"]) -> int:
@@ -43,6 +198,23 @@ def get_balance(address: str, network: str = config["network"],
     if not is_address(address=address, network=network):
         raise AddressError(f"Invalid Bitcoin '{address}' {network} address.")
     
+    if config[network]["backend"] == "electrum":
+        balance: dict = get_client(network=network, timeout=timeout).request(
+            "blockchain.scripthash.get_balance", get_scripthash(address=address, network=network)
+        )
+        return balance["confirmed"] + balance["unconfirmed"]
+    elif config[network]["backend"] == "bitcoind":
+        if config[network]["bitcoind"]["wallet"]:
+            # Watch-only wallet, address must be imported
+            return sum(_satoshi(utxo["amount"]) for utxo in bitcoind_request(
+                method="listunspent", params=[0, 9999999, [address]],
+                network=network, headers=headers, timeout=timeout
+            ))
+        return _satoshi(bitcoind_request(
+            method="scantxoutset", params=["start", [f"addr({address})"]],
+            network=network, headers=headers, timeout=timeout
+        )["total_amount"])
+
     url = f"{config[network]['blockcypher']['url']}/addrs/{address}/balance"
     response = requests.get(
         url=url, headers=headers, timeout=timeout
@@ -51,6 +223,56 @@ def get_balance(address: str, network: str = config["network"],
     return response_json["balance"]
 
 
+def get_transaction_count(address: str, network: str = config["network"],
+                          headers: dict = config["headers"], timeout: int = config["timeout"]) -> int:
+    """
+    Get Bitcoin address transaction count.
+
+    :param address: Bitcoin address.
+    :type address: str
+    :param network: Bitcoin network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common-headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: int -- Bitcoin address transaction count, zero for an unused address.
+
+    >>> from swap.providers.bitcoin.rpc import get_transaction_count
+    >>> get_transaction_count(address="n1wgm6kkzMcNfAtJmes8YhpvtDzdNhDY5a", network="testnet")
+    12
+
+    .. note::
+        Bitcoind backend needs a watch-only wallet with the imported address, without it raises ``APIError``.
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Bitcoin '{network}' network",
+                           "choose only 'mainnet' or 'testnet' networks.")
+    if not is_address(address=address, network=network):
+        raise AddressError(f"Invalid Bitcoin '{address}' {network} address.")
+
+    if config[network]["backend"] == "electrum":
+        return len(get_client(network=network, timeout=timeout).request(
+            "blockchain.scripthash.get_history", get_scripthash(address=address, network=network)
+        ))
+    elif config[network]["backend"] == "bitcoind":
+        _check_history(network=network)
+        # Watch-only wallet, address must be imported
+        return sum(len(received["txids"]) for received in bitcoind_request(
+            method="listreceivedbyaddress", params=[0, True, True, address],
+            network=network, headers=headers, timeout=timeout
+        ))
+
+    url = f"{config[network]['blockcypher']['url']}/addrs/{address}/balance"
+    response = requests.get(
+        url=url, headers=headers, timeout=timeout
+    )
+    response_json = response.json()
+    return response_json["final_n_tx"]
+
+
 def get_utxos(address: str, network: str = config["network"], include_script: bool = True,
               limit: int = 15, headers: dict = config["headers"], timeout: int = config["timeout"]) -> list:
     """
@@ -86,6 +308,25 @@ def get_utxos(address: str, network: str = config["network"], include_script: bo
         includeScript=("true" if include_script else "false"),
         token=config[network]["blockcypher"]["token"]
     )
+    if config[network]["backend"] == "electrum":
+        utxos: list = get_client(network=network, timeout=timeout).request(
+            "blockchain.scripthash.listunspent", get_scripthash(address=address, network=network)
+        )
+        script: str = _get_script(address=address).hex()
+        return [dict(
+            tx_hash=utxo["tx_hash"], tx_output_n=utxo["tx_pos"], value=utxo["value"],
+            block_height=utxo["height"], **(dict(script=script) if include_script else {})
+        ) for utxo in sorted(utxos, key=lambda utxo: utxo["value"], reverse=True)[:limit]]
+    elif config[network]["backend"] == "bitcoind":
+        utxos: list = bitcoind_request(
+            method="listunspent", params=[0, 9999999, [address]],
+            network=network, headers=headers, timeout=timeout
+        )
+        return [dict(
+            tx_hash=utxo["txid"], tx_output_n=utxo["vout"], value=_satoshi(utxo["amount"]),
+            confirmations=utxo["confirmations"], **(dict(script=utxo["scriptPubKey"]) if include_script else {})
+        ) for utxo in sorted(utxos, key=lambda utxo: utxo["amount"], reverse=True)[:limit]]
+
     url = f"{config[network]['blockcypher']['url']}/addrs/{address}"
     response = requests.get(
         url=url, params=parameter, headers=headers, timeout=timeout
@@ -119,6 +360,16 @@ def get_transaction(transaction_hash: str, network: str = config["network"],
         raise NetworkError(f"Invalid Bitcoin '{network}' network",
                            "choose only 'mainnet' or 'testnet' networks.")
 
+    if config[network]["backend"] == "electrum":
+        return get_transactions(
+            transaction_hashes=[transaction_hash], network=network, headers=headers, timeout=timeout
+        )[0]
+    elif config[network]["backend"] == "bitcoind":
+        return normalize_transaction(transaction=bitcoind_request(
+            method="getrawtransaction", params=[transaction_hash, True],
+            network=network, headers=headers, timeout=timeout
+        ))
+
     url = f"{config[network]['blockcypher']['url']}/txs/{transaction_hash}"
     parameter = dict(token=config[network]["blockcypher"]["token"])
     response = requests.get(
@@ -128,27 +379,69 @@ def get_transaction(transaction_hash: str, network: str = config["network"],
     return response_json
 
 
-def find_p2sh_utxo(transaction: dict) -> Optional[dict]:
+def get_transactions(transaction_hashes: List[str], network: str = config["network"],
+                     headers: dict = config["headers"], timeout: int = config["timeout"]) -> List[dict]:
+    """
+    Get Bitcoin transactions detail, in one batch request on bitcoind or electrum backends.
+
+    :param transaction_hashes: Bitcoin transaction hashes/ids.
+    :type transaction_hashes: list
+    :param network: Bitcoin network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common-headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: list -- Bitcoin transactions detail.
+
+    >>> from swap.providers.bitcoin.rpc import get_transactions
+    >>> get_transactions(transaction_hashes=["98c6a3d4e136d32d0848126e08325c94da2e8217593e92236471b11b42ee7999"], network="testnet")
+    [{'block_hash': '000000000000006fb2aec57209181feb54750319e47263c48eca24369bdbee86', 'block_height': 1890810, 'block_index': 37, 'hash': '98c6a3d4e136d32d0848126e08325c94da2e8217593e92236471b11b42ee7999', ...}]
+    """
+
+    if config[network]["backend"] == "electrum":
+        return [normalize_transaction(transaction=decode_raw(
+            raw=raw, network=network, offline=True
+        )) for raw in get_client(network=network, timeout=timeout).batch(calls=[
+            ("blockchain.transaction.get", [transaction_hash]) for transaction_hash in transaction_hashes
+        ])]
+    elif config[network]["backend"] == "bitcoind":
+        return [normalize_transaction(transaction=transaction) for transaction in bitcoind_batch(
+            calls=[("getrawtransaction", [transaction_hash, True]) for transaction_hash in transaction_hashes],
+            network=network, headers=headers, timeout=timeout
+        )]
+    return [get_transaction(
+        transaction_hash=transaction_hash, network=network, headers=headers, timeout=timeout
+    ) for transaction_hash in transaction_hashes]
+
+
+def find_p2sh_utxo(transaction: dict, script: Optional[Union[str, List[str]]] = None) -> Optional[dict]:
     """
     Find Bitcoin pay to script hash UTXO info's.
 
     :param transaction: Bitcoin transaction detail.
     :type transaction: dict
+    :param script: Bitcoin P2SH or P2WSH script (locking script) hex or hexes to match, defaults to ``None``.
+    :type script: str, list
 
     :returns: dict -- Pay to Secript Hash (P2SH) UTXO info's.
 
     >>> from swap.providers.bitcoin.rpc import find_p2sh_utxo, get_transaction
     >>> find_p2sh_utxo(transaction=get_transaction("868f81fd172b8f1d24e0c195af011489c3a7948513521d4b6257b8b5fb2ef409", "testnet"))
-    {'value': 10050780, 'script': 'a9149418feed4647e156d6663db3e0cef7c050d0386787', 'addresses': ['2N6kHwQy6Ph5EdKNgzGrcW2WhGHKGfmP5ae'], 'script_type': 'pay-to-script-hash'}
+    {'position': 0, 'value': 10050780, 'script': 'a9149418feed4647e156d6663db3e0cef7c050d0386787', 'addresses': ['2N6kHwQy6Ph5EdKNgzGrcW2WhGHKGfmP5ae'], 'script_type': 'pay-to-script-hash'}
+
+    .. note::
+        Without script it returns the first P2SH or P2WSH output, with script it returns the output locked by that script.
     """
 
-    transaction_outputs, utxo, position = transaction["outputs"], None, 0
-    for index, transaction_output in enumerate(transaction_outputs):
-        if transaction_output["script_type"] == "pay-to-script-hash":
-            utxo = transaction_output
-            position += index
-            break
-    return dict(position=position, **utxo)
+    scripts: Optional[list] = [script] if isinstance(script, str) else script
+    for position, transaction_output in enumerate(transaction["outputs"]):
+        if transaction_output["script_type"] not in ["pay-to-script-hash", "pay-to-witness-script-hash"]:
+            continue
+        if scripts is None or transaction_output["script"] in scripts:
+            return dict(position=position, **transaction_output)
+    return None
 
 
 def decode_raw(raw: str, network: str = config["network"], offline: bool = True,
@@ -180,9 +473,14 @@ def decode_raw(raw: str, network: str = config["network"], offline: bool = True,
 
     if offline:
         stp(network, strict=True, force=True)
-        tx = MutableTransaction.unhexlify(raw)
+        tx = TransactionFactory.unhexlify(raw)
         return tx.to_json()
 
+    if config[network]["backend"] == "bitcoind":
+        return bitcoind_request(
+            method="decoderawtransaction", params=[raw], network=network, headers=headers, timeout=timeout
+        )
+
     url = f"{config[network]['blockcypher']['url']}/txs/decode"
     parameter = dict(token=config[network]["blockcypher"]["token"])
     data = dict(tx=raw)
@@ -214,13 +512,25 @@ def submit_raw(raw: str, network: str = config["network"], endpoint: str = "soch
     >>> from swap.providers.bitcoin.rpc import submit_raw
     >>> submit_raw(raw="02000000011823f39a8c5f6f27845dd13a65e03fe2ef5108d235e7a36edb6eb267b0459c5a010000006a47304402207018b7fd1ba6624fe9bb0f16cd65fa243d202e32fdff452699f56465b61ab648022009f0dc1a0a63109246c45e120fc0d34b40e789dfc4d05e64f269602c7d67d9210121027f0dc0894bd690635412af782d05e4f79d3d40bf568978c650f3f1ca1a96cf36ffffffff02102700000000000017a9149418feed4647e156d6663db3e0cef7c050d038678734330100000000001976a91433ecab3d67f0e2bde43e52f41ec1ecbdc73f11f888ac00000000", network="testnet")
     "167faa4043ff622e7860ee5228d1ad6d763c5a6cfce79dbc3b9b5fc7bded6394"
+
+    .. note::
+        Submits through bitcoind or electrum when endpoint or configured network backend is ``bitcoind`` or ``electrum``.
     """
 
     if not is_network(network=network):
         raise NetworkError(f"Invalid Bitcoin '{network}' network",
                            "choose only 'mainnet' or 'testnet' networks.")
 
-    if endpoint == "smartbit":
+    if config[network]["backend"] in ["bitcoind", "electrum"] and endpoint not in ["bitcoind", "electrum"]:
+        endpoint = config[network]["backend"]
+
+    if endpoint == "electrum":
+        return get_client(network=network, timeout=timeout).request("blockchain.transaction.broadcast", raw)
+    elif endpoint == "bitcoind":
+        return bitcoind_request(
+            method="sendrawtransaction", params=[raw], network=network, headers=headers, timeout=timeout
+        )
+    elif endpoint == "smartbit":
         url = f"{config[network]['smartbit']}/pushtx"
         data = dict(hex=raw)
         response = requests.post(
@@ -247,4 +557,4 @@ def submit_raw(raw: str, network: str = config["network"], endpoint: str = "soch
         else:
             raise APIError("Unknown Bitcoin submit payment error.")
     else:
-        raise TypeError("Invalid Bitcoin endpoint api name, please choose only smartbit or sochain only.")
+        raise TypeError("Invalid Bitcoin endpoint api name, please choose only smartbit, sochain, bitcoind or electrum only.")
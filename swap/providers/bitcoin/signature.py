@@ -1,21 +1,17 @@
 #!/usr/bin/env python3
 
-from base64 import b64encode, b64decode
-from btcpy.structs.script import (
-    Script, P2shScript
-)
+from btcpy.structs.script import ScriptBuilder
 from btcpy.structs.transaction import (
     MutableTransaction, TxOut
 )
-from btcpy.structs.sig import P2shSolver
 from btcpy.setup import setup
 from typing import (
-    Optional, Union
+    Optional, Union, List, Callable
 )
 
-import json
-
-from ...utils import clean_transaction_raw
+from ...utils import (
+    TransactionEnvelope, clean_transaction_raw, encode_transaction_raw, load_transaction_raw, _sign_many
+)
 from ...exceptions import (
     TransactionRawError, NetworkError, UnitError
 )
@@ -24,7 +20,8 @@ from .solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
 )
 from .utils import (
-    is_transaction_raw, is_network, amount_unit_converter
+    is_transaction_raw, is_network, amount_unit_converter, _build_solvers, _build_sweep_solvers,
+    _build_htlc_txout, _build_htlc_solver, _spend
 )
 
 
@@ -167,17 +164,19 @@ class Signature:
             raise ValueError("Type is none, sign unsigned transaction raw first.")
         return self._type
 
-    def sign(self, transaction_raw: str, solver: Union[NormalSolver, FundSolver, WithdrawSolver, RefundSolver]) \
-            -> Union["NormalSignature", "FundSignature", "WithdrawSignature", "RefundSignature"]:
+    def sign(self, transaction_raw: Union[str, TransactionEnvelope],
+             solver: Union[NormalSolver, FundSolver, WithdrawSolver, RefundSolver,
+                           List[Union[WithdrawSolver, RefundSolver]]]) \
+            -> Union["NormalSignature", "FundSignature", "WithdrawSignature", "RefundSignature", "SweepSignature"]:
         """
         Sign unsigned transaction raw.
 
-        :param transaction_raw: Bitcoin unsigned transaction raw.
-        :type transaction_raw: str
-        :param solver: Bitcoin solver
-        :type solver: bitcoin.solver.NormalSolver, bitcoin.solver.FundSolver, bitcoin.solver.WithdrawSolver, bitcoin.solver.RefundSolver
+        :param transaction_raw: Bitcoin unsigned transaction raw or transaction envelope.
+        :type transaction_raw: str, swap.utils.TransactionEnvelope
+        :param solver: Bitcoin solver, or list of withdraw/refund solvers for sweep transaction raw.
+        :type solver: bitcoin.solver.NormalSolver, bitcoin.solver.FundSolver, bitcoin.solver.WithdrawSolver, bitcoin.solver.RefundSolver, list
 
-        :returns: NormalSignature, FundSignature, WithdrawSignature, RefundSignature -- Bitcoin signature instance.
+        :returns: NormalSignature, FundSignature, WithdrawSignature, RefundSignature, SweepSignature -- Bitcoin signature instance.
 
         >>> from swap.providers.bitcoin.signature import Signature
         >>> from swap.providers.bitcoin.solver import FundSolver
@@ -188,37 +187,40 @@ class Signature:
         <swap.providers.bitcoin.signature.FundSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Bitcoin unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         self._type = loaded_transaction_raw["type"]
         if loaded_transaction_raw["type"] == "bitcoin_normal_unsigned":
             return NormalSignature(
                 network=self._network, version=self._version
             ).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "bitcoin_fund_unsigned":
             return FundSignature(
                 network=self._network, version=self._version
             ).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "bitcoin_withdraw_unsigned":
             return WithdrawSignature(
                 network=self._network, version=self._version
             ).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "bitcoin_refund_unsigned":
             return RefundSignature(
                 network=self._network, version=self._version
             ).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
+            )
+        elif loaded_transaction_raw["type"] == "bitcoin_sweep_unsigned":
+            return SweepSignature(
+                network=self._network, version=self._version
+            ).sign(
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
 
     def transaction_raw(self) -> str:
@@ -257,12 +259,12 @@ class NormalSignature(Signature):
     def __init__(self, network: str = config["network"], version: int = config["version"]):
         super().__init__(network=network, version=version)
 
-    def sign(self, transaction_raw: str, solver: NormalSolver) -> "NormalSignature":
+    def sign(self, transaction_raw: Union[str, TransactionEnvelope], solver: NormalSolver) -> "NormalSignature":
         """
         Sign unsigned normal transaction raw.
 
-        :param transaction_raw: Bitcoin unsigned normal transaction raw.
-        :type transaction_raw: str
+        :param transaction_raw: Bitcoin unsigned normal transaction raw or transaction envelope.
+        :type transaction_raw: str, swap.utils.TransactionEnvelope
         :param solver: Bitcoin normal solver.
         :type solver: bitcoin.solver.NormalSolver
 
@@ -277,13 +279,10 @@ class NormalSignature(Signature):
         <swap.providers.bitcoin.signature.NormalSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Bitcoin unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if not loaded_transaction_raw["type"] == "bitcoin_normal_unsigned":
             raise TypeError(f"Invalid Bitcoin normal unsigned transaction raw type, "
                             f"you can't sign {loaded_transaction_raw['type']} type by using normal signature.")
@@ -304,25 +303,27 @@ class NormalSignature(Signature):
             outputs.append(TxOut(
                 value=output["value"],
                 n=output["tx_output_n"],
-                script_pubkey=Script.unhexlify(
-                    hex_string=output["script"]
+                script_pubkey=ScriptBuilder.identify(
+                    output["script"]
                 )
             ))
 
-        # Sign normal transaction
-        self._transaction.spend(
-            txouts=outputs,
-            solvers=[solver.solve(network=self._network) for _ in outputs]
+        # Sign normal transaction, P2WPKH and P2SH wrapped P2WPKH inputs sign BIP143 digests
+        self._transaction = _spend(
+            transaction=self._transaction, txouts=outputs, solvers=_build_solvers(
+                solver=solver.solve(network=self._network),
+                scripts=[output["script"] for output in loaded_transaction_raw["outputs"]]
+            )
         )
 
         # Encode normal transaction raw
         self._type = "bitcoin_normal_signed"
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = encode_transaction_raw(transaction=dict(
             raw=self._transaction.hexlify(),
             fee=self._fee,
             network=self._network,
             type=self._type
-        ))).encode()).decode()
+        ), binary=loaded_transaction_raw.binary)
         return self
 
 
@@ -341,12 +342,12 @@ class FundSignature(Signature):
     def __init__(self, network: str = config["network"], version: int = config["version"]):
         super().__init__(network=network, version=version)
 
-    def sign(self, transaction_raw: str, solver: FundSolver) -> "FundSignature":
+    def sign(self, transaction_raw: Union[str, TransactionEnvelope], solver: FundSolver) -> "FundSignature":
         """
         Sign unsigned fund transaction raw.
 
-        :param transaction_raw: Bitcoin unsigned fund transaction raw.
-        :type transaction_raw: str
+        :param transaction_raw: Bitcoin unsigned fund transaction raw or transaction envelope.
+        :type transaction_raw: str, swap.utils.TransactionEnvelope
         :param solver: Bitcoin fund solver.
         :type solver: bitcoin.solver.FundSolver
 
@@ -361,13 +362,10 @@ class FundSignature(Signature):
         <swap.providers.bitcoin.signature.FundSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Bitcoin unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if not loaded_transaction_raw["type"] == "bitcoin_fund_unsigned":
             raise TypeError(f"Invalid Bitcoin fund unsigned transaction raw type, "
                             f"you can't sign {loaded_transaction_raw['type']} type by using fund signature.")
@@ -388,25 +386,27 @@ class FundSignature(Signature):
             outputs.append(TxOut(
                 value=output["value"],
                 n=output["tx_output_n"],
-                script_pubkey=Script.unhexlify(
-                    hex_string=output["script"]
+                script_pubkey=ScriptBuilder.identify(
+                    output["script"]
                 )
             ))
 
-        # Sign fund transaction
-        self._transaction.spend(
-            txouts=outputs,
-            solvers=[solver.solve(network=self._network) for _ in outputs]
+        # Sign fund transaction, P2WPKH and P2SH wrapped P2WPKH inputs sign BIP143 digests
+        self._transaction = _spend(
+            transaction=self._transaction, txouts=outputs, solvers=_build_solvers(
+                solver=solver.solve(network=self._network),
+                scripts=[output["script"] for output in loaded_transaction_raw["outputs"]]
+            )
         )
 
         # Encode fund transaction raw
         self._type = "bitcoin_fund_signed"
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = encode_transaction_raw(transaction=dict(
             raw=self._transaction.hexlify(),
             fee=self._fee,
             network=self._network,
             type=self._type
-        ))).encode()).decode()
+        ), binary=loaded_transaction_raw.binary)
         return self
 
 
@@ -425,12 +425,12 @@ class WithdrawSignature(Signature):
     def __init__(self, network: str = config["network"], version: int = config["version"]):
         super().__init__(network=network, version=version)
 
-    def sign(self, transaction_raw: str, solver: WithdrawSolver) -> "WithdrawSignature":
+    def sign(self, transaction_raw: Union[str, TransactionEnvelope], solver: WithdrawSolver) -> "WithdrawSignature":
         """
         Sign unsigned withdraw transaction raw.
 
-        :param transaction_raw: Bitcoin unsigned withdraw transaction raw.
-        :type transaction_raw: str
+        :param transaction_raw: Bitcoin unsigned withdraw transaction raw or transaction envelope.
+        :type transaction_raw: str, swap.utils.TransactionEnvelope
         :param solver: Bitcoin withdraw solver.
         :type solver: bitcoin.solver.WithdrawSolver
 
@@ -446,13 +446,10 @@ class WithdrawSignature(Signature):
         <swap.providers.bitcoin.signature.WithdrawSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Bitcoin unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if not loaded_transaction_raw["type"] == "bitcoin_withdraw_unsigned":
             raise TypeError(f"Invalid Bitcoin withdraw unsigned transaction raw type, "
                             f"you can't sign {loaded_transaction_raw['type']} type by using withdraw signature.")
@@ -467,30 +464,25 @@ class WithdrawSignature(Signature):
             loaded_transaction_raw["network"], MutableTransaction.unhexlify(loaded_transaction_raw["raw"])
         )
 
-        # Sign withdraw transaction
-        self._transaction.spend([TxOut(
-            value=loaded_transaction_raw["outputs"]["value"],
-            n=loaded_transaction_raw["outputs"]["tx_output_n"],
-            script_pubkey=P2shScript.unhexlify(
-                hex_string=loaded_transaction_raw["outputs"]["script"]
-            )
-        )], [P2shSolver(
-            redeem_script=solver.witness(
-                network=self._network
-            ),
-            redeem_script_solver=solver.solve(
-                network=self._network
-            )
-        )])
+        # Sign withdraw transaction, segwit spend of P2WSH HTLC returns a new witness transaction
+        self._transaction = _spend(
+            transaction=self._transaction, txouts=[_build_htlc_txout(
+                value=loaded_transaction_raw["outputs"]["value"],
+                n=loaded_transaction_raw["outputs"]["tx_output_n"],
+                script=loaded_transaction_raw["outputs"]["script"]
+            )], solvers=[_build_htlc_solver(
+                solver=solver, script=loaded_transaction_raw["outputs"]["script"], network=self._network
+            )]
+        )
 
         # Encode withdraw transaction raw
         self._type = "bitcoin_withdraw_signed"
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = encode_transaction_raw(transaction=dict(
             raw=self._transaction.hexlify(),
             fee=self._fee,
             network=self._network,
             type=self._type,
-        ))).encode()).decode()
+        ), binary=loaded_transaction_raw.binary)
         return self
 
 
@@ -509,12 +501,12 @@ class RefundSignature(Signature):
     def __init__(self, network: str = config["network"], version: int = config["version"]):
         super().__init__(network=network, version=version)
 
-    def sign(self, transaction_raw: str, solver: RefundSolver) -> "RefundSignature":
+    def sign(self, transaction_raw: Union[str, TransactionEnvelope], solver: RefundSolver) -> "RefundSignature":
         """
         Sign unsigned refund transaction raw.
 
-        :param transaction_raw: Bitcoin unsigned refund transaction raw.
-        :type transaction_raw: str
+        :param transaction_raw: Bitcoin unsigned refund transaction raw or transaction envelope.
+        :type transaction_raw: str, swap.utils.TransactionEnvelope
         :param solver: Bitcoin refund solver.
         :type solver: bitcoin.solver.RefundSolver
         :returns:  RefundSignature -- Bitcoin refund signature instance.
@@ -529,13 +521,10 @@ class RefundSignature(Signature):
         <swap.providers.bitcoin.signature.RefundSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Bitcoin unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if not loaded_transaction_raw["type"] == "bitcoin_refund_unsigned":
             raise TypeError(f"Invalid Bitcoin refund unsigned transaction raw type, "
                             f"you can't sign {loaded_transaction_raw['type']} type by using refund signature.")
@@ -550,28 +539,144 @@ class RefundSignature(Signature):
             loaded_transaction_raw["network"], MutableTransaction.unhexlify(loaded_transaction_raw["raw"])
         )
 
-        # Sign refund transaction
-        self._transaction.spend([TxOut(
-            value=loaded_transaction_raw["outputs"]["value"],
-            n=loaded_transaction_raw["outputs"]["tx_output_n"],
-            script_pubkey=P2shScript.unhexlify(
-                hex_string=loaded_transaction_raw["outputs"]["script"]
-            )
-        )], [P2shSolver(
-            redeem_script=solver.witness(
-                network=self._network
-            ),
-            redeem_script_solver=solver.solve(
-                network=self._network
-            )
-        )])
+        # Sign refund transaction, segwit spend of P2WSH HTLC returns a new witness transaction
+        self._transaction = _spend(
+            transaction=self._transaction, txouts=[_build_htlc_txout(
+                value=loaded_transaction_raw["outputs"]["value"],
+                n=loaded_transaction_raw["outputs"]["tx_output_n"],
+                script=loaded_transaction_raw["outputs"]["script"]
+            )], solvers=[_build_htlc_solver(
+                solver=solver, script=loaded_transaction_raw["outputs"]["script"], network=self._network
+            )]
+        )
 
         # Encode refund transaction raw
         self._type = "bitcoin_refund_signed"
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = encode_transaction_raw(transaction=dict(
             raw=self._transaction.hexlify(),
             fee=self._fee,
             network=self._network,
             type=self._type,
-        ))).encode()).decode()
+        ), binary=loaded_transaction_raw.binary)
         return self
+
+
+class SweepSignature(Signature):
+    """
+    Bitcoin Sweep signature.
+
+    :param network: Bitcoin network, defaults to mainnet.
+    :type network: str
+    :param version: Bitcoin transaction version, defaults to 2.
+    :type version: int
+
+    :returns: SweepSignature -- Bitcoin sweep signature instance.
+    """
+
+    def __init__(self, network: str = config["network"], version: int = config["version"]):
+        super().__init__(network=network, version=version)
+
+    def sign(self, transaction_raw: Union[str, TransactionEnvelope],
+             solver: List[Union[WithdrawSolver, RefundSolver]]) -> "SweepSignature":
+        """
+        Sign unsigned sweep transaction raw.
+
+        :param transaction_raw: Bitcoin unsigned sweep transaction raw or transaction envelope.
+        :type transaction_raw: str, swap.utils.TransactionEnvelope
+        :param solver: Bitcoin withdraw or refund solvers, one per HTLC in build order.
+        :type solver: list
+
+        :returns: SweepSignature -- Bitcoin sweep signature instance.
+
+        >>> from swap.providers.bitcoin.signature import SweepSignature
+        >>> from swap.providers.bitcoin.solver import RefundSolver
+        >>> unsigned_sweep_transaction_raw: str = "eyJmZWUiOiA1NzYsICJyYXciOiAiMDIwMDAwMDAwMTMxZmI3NmEwYzM4ZDU3MzgxYjMxMTBlNGY1ZWU5YjUyODFkY2YyZmJlMmZlMjU2OTI2NmI3NTEwMTFkMjExYTIwMDAwMDAwMDAwZmZmZmZmZmYwMTYwODQwMTAwMDAwMDAwMDAxOTc2YTkxNGUwMGZmMmE2NDBiN2NlMmQzMzY4NjA3MzkxNjk0ODdhNTdmODRiMTU4OGFjMGVjNGQ2NjAiLCAib3V0cHV0cyI6IFt7InZhbHVlIjogMTAwMDAwLCAidHhfb3V0cHV0X24iOiAwLCAic2NyaXB0IjogImE5MTRjOGM3N2E5YjQzZWUyYmRmMWEwN2M0ODY5OTgzM2Q3NjY4YmYyNjRjODcifV0sICJuZXR3b3JrIjogInRlc3RuZXQiLCAidHlwZSI6ICJiaXRjb2luX3N3ZWVwX3Vuc2lnbmVkIn0"
+        >>> bytecode: str = "63aa20821124b554d13f247b1e5d10b84e44fb1296f18f38bbaa1bea34a12c843e01588876a9140a0a6590e6ba4b48118d21b86812615219ece76b88ac67040ec4d660b17576a914e00ff2a640b7ce2d336860739169487a57f84b1588ac68"
+        >>> refund_solver: RefundSolver = RefundSolver(xprivate_key="tprv8ZgxMBicQKsPeMHMJAc6uWGYiGqi1MVM2ybmzXL2TAoDpQe85uyDpdT7mv7Nhdu5rTCBEKLZsd9KyP2LQZJzZTvgVQvENArgU8e6DoYBiXf", bytecode=bytecode, endtime=1624687630)
+        >>> sweep_signature: SweepSignature = SweepSignature(network="testnet")
+        >>> sweep_signature.sign(transaction_raw=unsigned_sweep_transaction_raw, solver=[refund_solver])
+        <swap.providers.bitcoin.signature.SweepSignature object at 0x0409DAF0>
+        """
+
+        loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
+            raise TransactionRawError("Invalid Bitcoin unsigned transaction raw.")
+
+        if not loaded_transaction_raw["type"] == "bitcoin_sweep_unsigned":
+            raise TypeError(f"Invalid Bitcoin sweep unsigned transaction raw type, "
+                            f"you can't sign {loaded_transaction_raw['type']} type by using sweep signature.")
+
+        # Check parameter instances
+        if not isinstance(solver, list) or len(solver) != len(loaded_transaction_raw["outputs"]):
+            raise ValueError(f"Invalid Bitcoin solvers, {len(loaded_transaction_raw['outputs'])} "
+                             f"solvers are required one per HTLC.")
+        for _solver in solver:
+            if not isinstance(_solver, (WithdrawSolver, RefundSolver)):
+                raise TypeError(f"Solver must be Bitcoin WithdrawSolver or RefundSolver, "
+                                f"not {type(_solver).__name__} type.")
+
+        # Set transaction fee, type, network and transaction
+        self._fee, self._type, self._network, self._transaction = (
+            loaded_transaction_raw["fee"], loaded_transaction_raw["type"],
+            loaded_transaction_raw["network"], MutableTransaction.unhexlify(loaded_transaction_raw["raw"])
+        )
+
+        # Sign sweep transaction, segwit spend of P2WSH HTLC's returns a new witness transaction
+        self._transaction = _spend(
+            transaction=self._transaction,
+            txouts=[_build_htlc_txout(
+                value=output["value"],
+                n=output["tx_output_n"],
+                script=output["script"]
+            ) for output in loaded_transaction_raw["outputs"]],
+            solvers=_build_sweep_solvers(
+                solvers=solver, scripts=[output["script"] for output in loaded_transaction_raw["outputs"]],
+                network=self._network
+            )
+        )
+
+        # Encode sweep transaction raw
+        self._type = "bitcoin_sweep_signed"
+        self._signed_raw = encode_transaction_raw(transaction=dict(
+            raw=self._transaction.hexlify(),
+            fee=self._fee,
+            network=self._network,
+            type=self._type,
+        ), binary=loaded_transaction_raw.binary)
+        return self
+
+
+def sign_many(transaction_raws: List[Union[str, TransactionEnvelope]], solver_factory: Callable,
+              workers: Optional[int] = None, network: str = config["network"],
+              version: int = config["version"]) -> List[dict]:
+    """
+    Sign many Bitcoin unsigned transaction raws over a process pool.
+
+    :param transaction_raws: Bitcoin unsigned transaction raws or transaction envelopes.
+    :type transaction_raws: list
+    :param solver_factory: Picklable callable, called once per worker, returning a Bitcoin solver or a callable that takes the transaction envelope and returns its solver.
+    :type solver_factory: callable
+    :param workers: Number of worker processes, defaults to CPU count (``1`` signs in this process).
+    :type workers: int
+    :param network: Bitcoin network, defaults to ``mainnet``.
+    :type network: str
+    :param version: Bitcoin transaction version, defaults to ``2``.
+    :type version: int
+
+    :returns: list -- Bitcoin signed transaction raw and error per transaction raw, in input order.
+
+    >>> from functools import partial
+    >>> from swap.providers.bitcoin.signature import sign_many
+    >>> from swap.providers.bitcoin.solver import FundSolver
+    >>> unsigned_fund_transaction_raw: str = "eyJmZWUiOiAxMTIyLCAicmF3IjogIjAyMDAwMDAwMDIzMWZiNzZhMGMzOGQ1NzM4MWIzMTEwZTRmNWVlOWI1MjgxZGNmMmZiZTJmZTI1NjkyNjZiNzUxMDExZDIxMWEyMDEwMDAwMDAwMGZmZmZmZmZmMDgwYjgyZWVjMzMyOTk2YTQyMmFlNGYwODBmNzRlNTNmZDJjYTRmMDcwMTFkNDdjNTkwODUzZTFlMzA1ZmUxMTAxMDAwMDAwMDBmZmZmZmZmZjAyYTA4NjAxMDAwMDAwMDAwMDE3YTkxNGM4Yzc3YTliNDNlZTJiZGYxYTA3YzQ4Njk5ODMzZDc2NjhiZjI2NGM4NzMyOWMwZDAwMDAwMDAwMDAxOTc2YTkxNGUwMGZmMmE2NDBiN2NlMmQzMzY4NjA3MzkxNjk0ODdhNTdmODRiMTU4OGFjMDAwMDAwMDAiLCAib3V0cHV0cyI6IFt7InZhbHVlIjogOTQzMzAsICJ0eF9vdXRwdXRfbiI6IDEsICJzY3JpcHQiOiAiNzZhOTE0ZTAwZmYyYTY0MGI3Y2UyZDMzNjg2MDczOTE2OTQ4N2E1N2Y4NGIxNTg4YWMifSwgeyJ2YWx1ZSI6IDg5ODc0NiwgInR4X291dHB1dF9uIjogMSwgInNjcmlwdCI6ICI3NmE5MTRlMDBmZjJhNjQwYjdjZTJkMzM2ODYwNzM5MTY5NDg3YTU3Zjg0YjE1ODhhYyJ9XSwgIm5ldHdvcmsiOiAidGVzdG5ldCIsICJ0eXBlIjogImJpdGNvaW5fZnVuZF91bnNpZ25lZCJ9"
+    >>> sign_many(transaction_raws=[unsigned_fund_transaction_raw, "meheret"], solver_factory=partial(FundSolver, xprivate_key="tprv8ZgxMBicQKsPeMHMJAc6uWGYiGqi1MVM2ybmzXL2TAoDpQe85uyDpdT7mv7Nhdu5rTCBEKLZsd9KyP2LQZJzZTvgVQvENArgU8e6DoYBiXf"), workers=2, network="testnet")
+    [{'transaction_raw': '...', 'error': None}, {'transaction_raw': None, 'error': 'TransactionRawError: Invalid transaction raw., ...'}]
+
+    .. note::
+        One failing transaction raw doesn't fail the batch, its error is reported with ``transaction_raw`` as ``None``.
+    """
+
+    return _sign_many(
+        signature=Signature, signature_kwargs=dict(network=network, version=version),
+        transaction_raws=transaction_raws, solver_factory=solver_factory, workers=workers
+    )
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 
-from btcpy.structs.crypto import PrivateKey
+from btcpy.structs.crypto import (
+    PrivateKey, PublicKey
+)
 from btcpy.structs.sig import (
     P2pkhSolver, IfElseSolver, HashlockSolver, Branch, AbsoluteTimelockSolver
 )
@@ -8,13 +10,57 @@ from btcpy.structs.script import (
     ScriptBuilder, IfElseScript
 )
 from btcpy.structs.transaction import Locktime
+from binascii import (
+    hexlify, unhexlify
+)
 from typing import Optional, Union
 
+from ...crypto import (
+    get_backend, cached_key
+)
 from ..config import bitcoin as config
 from .wallet import Wallet
 from .htlc import HTLC
 
 
+class _PrivateKey(PrivateKey):
+    """
+    Bitcoin private key, signing through the selected secp256k1 backend.
+    """
+
+    @staticmethod
+    def unhexlify(hexa: str) -> "_PrivateKey":
+        return _PrivateKey(bytearray(unhexlify(hexa)))
+
+    def pub(self, compressed: Optional[bool] = None) -> PublicKey:
+        # Solvers ask the public key once per signed input, it is derived once per form
+        compressed = self.public_compressed if compressed is None else compressed
+        public_keys: dict = self.__dict__.setdefault("_public_keys", {})
+        if compressed not in public_keys:
+            public_keys[compressed] = PublicKey(bytearray(get_backend().public_key(
+                private_key=bytes(self.key), compressed=compressed
+            )))
+        return public_keys[compressed]
+
+    def sign(self, data: bytes, deterministic: bool = True) -> bytes:
+        if not deterministic:
+            return super().sign(data=data, deterministic=deterministic)
+        return get_backend().sign(private_key=bytes(self.key), digest=bytes(data))
+
+
+def _private_key(network: str, xprivate_key: str, strict: bool, path: str) -> str:
+    # Child private key through the shared key cache, the path is derived once per xprivate key
+    return hexlify(cached_key(
+        parts=("bitcoin", network, xprivate_key, str(strict), path), derive=lambda: unhexlify(
+            Wallet(network=network).from_xprivate_key(
+                xprivate_key=xprivate_key, strict=strict
+            ).from_path(
+                path=path
+            ).private_key()
+        )
+    )).decode()
+
+
 class NormalSolver:
     """
     Bitcoin Normal solver.
@@ -59,12 +105,10 @@ class NormalSolver:
             )
 
         return P2pkhSolver(
-            privk=PrivateKey.unhexlify(
-                hexa=Wallet(network=network).from_xprivate_key(
-                    xprivate_key=self._xprivate_key, strict=self._strict
-                ).from_path(
-                    path=self._path
-                ).private_key()
+            privk=_PrivateKey.unhexlify(
+                hexa=_private_key(
+                    network=network, xprivate_key=self._xprivate_key, strict=self._strict, path=self._path
+                )
             )
         )
 
@@ -113,12 +157,10 @@ class FundSolver:
             )
 
         return P2pkhSolver(
-            privk=PrivateKey.unhexlify(
-                hexa=Wallet(network=network).from_xprivate_key(
-                    xprivate_key=self._xprivate_key, strict=self._strict
-                ).from_path(
-                    path=self._path
-                ).private_key()
+            privk=_PrivateKey.unhexlify(
+                hexa=_private_key(
+                    network=network, xprivate_key=self._xprivate_key, strict=self._strict, path=self._path
+                )
             )
         )
 
@@ -178,12 +220,10 @@ class WithdrawSolver:
             inner_solver=HashlockSolver(
                 preimage=self._secret_key.encode(),
                 inner_solver=P2pkhSolver(
-                    privk=PrivateKey.unhexlify(
-                        hexa=Wallet(network=network).from_xprivate_key(
-                            xprivate_key=self._xprivate_key, strict=self._strict
-                        ).from_path(
-                            path=self._path
-                        ).private_key()
+                    privk=_PrivateKey.unhexlify(
+                        hexa=_private_key(
+                            network=network, xprivate_key=self._xprivate_key, strict=self._strict, path=self._path
+                        )
                     )
                 )
             )
@@ -252,12 +292,10 @@ class RefundSolver:
                     n=self._endtime
                 ),
                 inner_solver=P2pkhSolver(
-                    privk=PrivateKey.unhexlify(
-                        hexa=Wallet(network=network).from_xprivate_key(
-                            xprivate_key=self._xprivate_key, strict=self._strict
-                        ).from_path(
-                            path=self._path
-                        ).private_key()
+                    privk=_PrivateKey.unhexlify(
+                        hexa=_private_key(
+                            network=network, xprivate_key=self._xprivate_key, strict=self._strict, path=self._path
+                        )
                     )
                 )
             )
@@ -1,35 +1,30 @@
 #!/usr/bin/env python3
 
-from base64 import b64encode
-from btcpy.structs.script import (
-    ScriptSig, P2shScript
-)
+from btcpy.structs.script import ScriptSig
 from btcpy.structs.transaction import (
     Locktime, MutableTransaction, TxOut, Sequence, TxIn
 )
-from btcpy.structs.sig import P2shSolver
 from btcpy.setup import setup
 from typing import (
-    Optional, Union
+    Optional, Union, List, Tuple
 )
 
-import json
-
-from ...utils import clean_transaction_raw
+from ...utils import encode_transaction_raw
 from ...exceptions import (
     BalanceError, AddressError, NetworkError, UnitError
 )
 from ..config import bitcoin as config
 from .htlc import HTLC
 from .utils import (
-    fee_calculator, is_address, is_network, _get_previous_transaction_indexes,
-    _build_inputs, _build_outputs, get_address_hash, amount_unit_converter
+    fee_calculator, is_address, is_network, _get_previous_transaction_indexes, _get_spent_address_type,
+    _is_sender_address, _build_inputs, _build_outputs, _build_solvers, _build_sweep_solvers, _build_htlc_txout,
+    _build_htlc_solver, _is_p2wsh_script, _spend, get_address_hash, amount_unit_converter
 )
 from .solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
 )
 from .rpc import (
-    get_transaction, get_utxos, find_p2sh_utxo
+    get_transaction, get_transactions, get_utxos, find_p2sh_utxo
 )
 
 
@@ -189,7 +184,7 @@ class NormalTransaction(Transaction):
         self._interest: Optional[int] = None
 
     def build_transaction(self, address: str, recipients: dict, unit: str = config["unit"],
-                          locktime: int = config["locktime"]) -> "NormalTransaction":
+                          locktime: int = config["locktime"], utxos: Optional[list] = None) -> "NormalTransaction":
         """
         Build Bitcoin normal transaction.
 
@@ -201,6 +196,8 @@ class NormalTransaction(Transaction):
         :type unit: str
         :param locktime: Bitcoin transaction lock time, defaults to ``0``.
         :type locktime: int
+        :param utxos: Sender UTXO's, defaults to ``get_utxos`` of sender address.
+        :type utxos: list
 
         :returns: NormalTransaction -- Bitcoin normal transaction instance.
 
@@ -225,7 +222,7 @@ class NormalTransaction(Transaction):
             )
         )
         # Get Sender UTXO's
-        self._utxos = get_utxos(
+        self._utxos = utxos if utxos is not None else get_utxos(
             address=self._address, network=self._network
         )
         # Outputs action
@@ -239,15 +236,16 @@ class NormalTransaction(Transaction):
                 )
             ))
         # Get previous transaction indexes
+        address_type: str = _get_spent_address_type(address=self._address)
         self._previous_transaction_indexes, max_amount = _get_previous_transaction_indexes(
-            utxos=self._utxos, amount=self._amount, transaction_output=len(outputs)
+            utxos=self._utxos, amount=self._amount, transaction_output=len(outputs), address_type=address_type
         )
         # Build transaction inputs
         inputs, amount = _build_inputs(
             utxos=self._utxos, previous_transaction_indexes=self._previous_transaction_indexes
         )
         # Calculate the fee
-        self._fee = fee_calculator(len(inputs), len(outputs))
+        self._fee = fee_calculator(len(inputs), len(outputs), address_type=address_type)
 
         if amount < self._amount:
             raise BalanceError(
@@ -305,19 +303,24 @@ class NormalTransaction(Transaction):
         outputs = _build_outputs(
             utxos=self._utxos, previous_transaction_indexes=self._previous_transaction_indexes
         )
-        # Sign normal transaction
-        self._transaction.spend(
-            txouts=outputs,
-            solvers=[solver.solve(network=self._network) for _ in outputs]
+        # Sign normal transaction, P2WPKH and P2SH wrapped P2WPKH inputs sign BIP143 digests
+        self._transaction = _spend(
+            transaction=self._transaction, txouts=outputs, solvers=_build_solvers(
+                solver=solver.solve(network=self._network),
+                scripts=[str(output.script_pubkey.hexlify()) for output in outputs]
+            )
         )
         # Set transaction type
         self._type = "bitcoin_normal_signed"
         return self
 
-    def transaction_raw(self) -> str:
+    def transaction_raw(self, binary: bool = False) -> str:
         """
         Get Bitcoin normal transaction raw.
 
+        :param binary: Encode as compact binary envelope, defaults to ``False``.
+        :type binary: bool
+
         :returns: str -- Bitcoin normal transaction raw.
 
         >>> from swap.providers.bitcoin.transaction import NormalTransaction
@@ -333,13 +336,13 @@ class NormalTransaction(Transaction):
 
         # Encode normal transaction raw
         if self._type == "bitcoin_normal_signed":
-            return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            return encode_transaction_raw(transaction=dict(
                 raw=self._transaction.hexlify(),
                 fee=self._fee,
                 network=self._network,
                 type=self._type
-            ))).encode()).decode())
-        return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            ), binary=binary)
+        return encode_transaction_raw(transaction=dict(
             fee=self._fee,
             raw=self._transaction.hexlify(),
             outputs=_build_outputs(
@@ -349,7 +352,7 @@ class NormalTransaction(Transaction):
             ),
             network=self._network,
             type=self._type
-        ))).encode()).decode())
+        ), binary=binary)
 
 
 class FundTransaction(Transaction):
@@ -371,25 +374,29 @@ class FundTransaction(Transaction):
         super().__init__(network=network, version=version)
 
         self._htlc: Optional[HTLC] = None
+        self._htlcs: List[Tuple[HTLC, int]] = []
         self._utxos: Optional[list] = None
         self._previous_transaction_indexes: Optional[list] = None
         self._interest: Optional[int] = None
 
-    def build_transaction(self, address: str, htlc: HTLC, amount: Optional[Union[int, float]],
-                          unit: str = config["unit"], locktime: int = config["locktime"]) -> "FundTransaction":
+    def build_transaction(self, address: str, htlc: Union[HTLC, List[Tuple[HTLC, Union[int, float]]]],
+                          amount: Optional[Union[int, float]] = None, unit: str = config["unit"],
+                          locktime: int = config["locktime"], utxos: Optional[list] = None) -> "FundTransaction":
         """
         Build Bitcoin fund transaction.
 
         :param address: Bitcoin sender address.
         :type address: str
-        :param htlc: Bitcoin HTLC instance.
-        :type htlc: bitcoin.htlc.HTLC
+        :param htlc: Bitcoin HTLC instance or list of (HTLC, amount) pairs.
+        :type htlc: bitcoin.htlc.HTLC, list
         :param amount: Bitcoin amount, default to ``None``.
         :type amount: int, float
         :param unit: Bitcoin unit, default to ``Satoshi``.
         :type unit: str
         :param locktime: Bitcoin transaction lock time, defaults to ``0``.
         :type locktime: int
+        :param utxos: Sender UTXO's, defaults to ``get_utxos`` of sender address.
+        :type utxos: list
 
         :returns: FundTransaction -- Bitcoin fund transaction instance.
 
@@ -401,49 +408,73 @@ class FundTransaction(Transaction):
         >>> fund_transaction: FundTransaction = FundTransaction(network="testnet")
         >>> fund_transaction.build_transaction(address="n1wgm6kkzMcNfAtJmes8YhpvtDzdNhDY5a", htlc=htlc, amount=0.001, unit="BTC")
         <swap.providers.bitcoin.transaction.FundTransaction object at 0x0409DAF0>
+
+        .. note::
+            To fund many HTLC's in one transaction, pass a list of (HTLC, amount) pairs as ``htlc``
+            and leave ``amount`` as ``None``. One P2SH output is created per HTLC plus a single change output.
+            Pass ``utxos`` of a ``WatchOnlyWallet`` to skip the ``get_utxos`` request.
         """
 
         # Check parameter instances
         if not is_address(address, self._network):
             raise AddressError(f"Invalid Bitcoin sender '{address}' {self._network} address.")
-        if not isinstance(htlc, HTLC):
-            raise TypeError("Invalid Bitcoin HTLC instance, only takes xinfin HTLC class")
-        if htlc.agreements and address != htlc.agreements["sender_address"]:
-            raise AddressError(f"Wrong Bitcoin sender '{address}' address",
-                               "address must be equal with HTLC agreements sender address.")
         if unit not in ["BTC", "mBTC", "Satoshi"]:
             raise UnitError("Invalid Bitcoin unit, choose only 'BTC', 'mBTC' or 'Satoshi' units.")
 
-        self._address, outputs, self._htlc, self._amount = (
-            address, [], htlc, (
-                amount if unit == "Satoshi" else
+        htlcs: List[Tuple[HTLC, Union[int, float]]] = (
+            htlc if isinstance(htlc, list) else [(htlc, amount)]
+        )
+        if not htlcs:
+            raise ValueError("Invalid Bitcoin HTLC's, at least one HTLC is required.")
+        if isinstance(htlc, list) and amount is not None:
+            raise ValueError("Amount must be None when funding multiple HTLC's, set amount on each HTLC pair.")
+
+        self._address, outputs, self._htlcs, contract_addresses = address, [], [], []
+        for _htlc, _amount in htlcs:
+            if not isinstance(_htlc, HTLC):
+                raise TypeError("Invalid Bitcoin HTLC instance, only takes Bitcoin HTLC class")
+            if _htlc.agreements and not _is_sender_address(
+                address=address, sender_address=_htlc.agreements["sender_address"]
+            ):
+                raise AddressError(f"Wrong Bitcoin sender '{address}' address",
+                                   "address must be of HTLC agreements sender address public key hash.")
+            if _amount is None:
+                raise ValueError("Invalid Bitcoin amount, amount is required for each HTLC.")
+            contract_address: str = _htlc.contract_address()
+            if contract_address in contract_addresses:
+                raise ValueError(f"Duplicate Bitcoin HTLC '{contract_address}' contract address.")
+            contract_addresses.append(contract_address)
+            _amount = (
+                int(_amount) if unit == "Satoshi" else
                 amount_unit_converter(
-                    amount=amount, unit_from=f"{unit}2Satoshi"
+                    amount=_amount, unit_from=f"{unit}2Satoshi"
                 )
             )
-        )
+            self._htlcs.append((_htlc, _amount))
+            # Outputs action
+            outputs.append(TxOut(
+                value=_amount, n=len(outputs),
+                script_pubkey=get_address_hash(
+                    address=contract_address, script=True
+                )
+            ))
+        self._htlc, self._amount = self._htlcs[0][0], sum(_amount for _, _amount in self._htlcs)
 
         # Get Sender UTXO's
-        self._utxos = get_utxos(
+        self._utxos = utxos if utxos is not None else get_utxos(
             address=self._address, network=self._network
         )
-        # Outputs action
-        outputs.append(TxOut(
-            value=self._amount, n=0,
-            script_pubkey=get_address_hash(
-                address=self._htlc.contract_address(), script=True
-            )
-        ))
         # Get previous transaction indexes
+        address_type: str = _get_spent_address_type(address=self._address)
         self._previous_transaction_indexes, max_amount = _get_previous_transaction_indexes(
-            utxos=self._utxos, amount=self._amount, transaction_output=2
+            utxos=self._utxos, amount=self._amount, transaction_output=(len(outputs) + 1), address_type=address_type
         )
         # Build transaction inputs
         inputs, amount = _build_inputs(
             utxos=self._utxos, previous_transaction_indexes=self._previous_transaction_indexes
         )
         # Calculate the fee
-        self._fee = fee_calculator(len(inputs), 2)
+        self._fee = fee_calculator(len(inputs), (len(outputs) + 1), address_type=address_type)
 
         if amount < self._amount:
             raise BalanceError(
@@ -472,6 +503,31 @@ class FundTransaction(Transaction):
         self._type = "bitcoin_fund_unsigned"
         return self
 
+    def htlcs(self) -> List[dict]:
+        """
+        Get Bitcoin funded HTLC's with their output index.
+
+        :returns: list -- Bitcoin funded HTLC's contract address, amount and output index.
+
+        >>> from swap.providers.bitcoin.htlc import HTLC
+        >>> from swap.providers.bitcoin.transaction import FundTransaction
+        >>> from swap.utils import sha256
+        >>> htlc: HTLC = HTLC(network="testnet")
+        >>> htlc.build_htlc(secret_hash=sha256("Hello Meheret!"), recipient_address="mgS3WMHp9nvdUPeDJxr5iCF2P5HuFZSR3V", sender_address="n1wgm6kkzMcNfAtJmes8YhpvtDzdNhDY5a", endtime=1624687630)
+        >>> fund_transaction: FundTransaction = FundTransaction(network="testnet")
+        >>> fund_transaction.build_transaction(address="n1wgm6kkzMcNfAtJmes8YhpvtDzdNhDY5a", htlc=[(htlc, 0.001)], unit="BTC")
+        >>> fund_transaction.htlcs()
+        [{'contract_address': '2NBYr6gvh4ujsRwKKjDrrRr2vGonazzX6Z6', 'amount': 100000, 'position': 0}]
+        """
+
+        # Check transaction
+        if self._transaction is None:
+            raise ValueError("Transaction is none, build transaction first.")
+        return [
+            dict(contract_address=_htlc.contract_address(), amount=_amount, position=position)
+            for position, (_htlc, _amount) in enumerate(self._htlcs)
+        ]
+
     def sign(self, solver: FundSolver) -> "FundTransaction":
         """
         Sign Bitcoin fund transaction.
@@ -504,19 +560,24 @@ class FundTransaction(Transaction):
         outputs = _build_outputs(
             utxos=self._utxos, previous_transaction_indexes=self._previous_transaction_indexes
         )
-        # Sign fund transaction
-        self._transaction.spend(
-            txouts=outputs,
-            solvers=[solver.solve(network=self._network) for _ in outputs]
+        # Sign fund transaction, P2WPKH and P2SH wrapped P2WPKH inputs sign BIP143 digests
+        self._transaction = _spend(
+            transaction=self._transaction, txouts=outputs, solvers=_build_solvers(
+                solver=solver.solve(network=self._network),
+                scripts=[str(output.script_pubkey.hexlify()) for output in outputs]
+            )
         )
         # Set transaction type
         self._type = "bitcoin_fund_signed"
         return self
 
-    def transaction_raw(self) -> str:
+    def transaction_raw(self, binary: bool = False) -> str:
         """
         Get Bitcoin fund transaction raw.
 
+        :param binary: Encode as compact binary envelope, defaults to ``False``.
+        :type binary: bool
+
         :returns: str -- Bitcoin fund transaction raw.
 
         >>> from swap.providers.bitcoin.htlc import HTLC
@@ -536,13 +597,13 @@ class FundTransaction(Transaction):
 
         # Encode fund transaction raw
         if self._type == "bitcoin_fund_signed":
-            return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            return encode_transaction_raw(transaction=dict(
                 raw=self._transaction.hexlify(),
                 fee=self._fee,
                 network=self._network,
                 type=self._type,
-            ))).encode()).decode())
-        return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            ), binary=binary)
+        return encode_transaction_raw(transaction=dict(
             fee=self._fee,
             raw=self._transaction.hexlify(),
             outputs=_build_outputs(
@@ -552,7 +613,7 @@ class FundTransaction(Transaction):
             ),
             network=self._network,
             type=self._type,
-        ))).encode()).decode())
+        ), binary=binary)
 
 
 class WithdrawTransaction(Transaction):
@@ -578,7 +639,7 @@ class WithdrawTransaction(Transaction):
         self._htlc_utxo: Optional[dict] = None
         self._interest: Optional[int] = None
 
-    def build_transaction(self, address: str, transaction_hash: str,
+    def build_transaction(self, address: str, transaction_hash: str, bytecode: Optional[str] = None,
                           locktime: int = config["locktime"]) -> "WithdrawTransaction":
         """
         Build Bitcoin withdraw transaction.
@@ -587,6 +648,8 @@ class WithdrawTransaction(Transaction):
         :type address: str
         :param transaction_hash: Bitcoin funded transaction hash/id.
         :type transaction_hash: str
+        :param bytecode: Bitcoin HTLC bytecode to locate its output, defaults to ``None``.
+        :type bytecode: str
         :param locktime: Bitcoin transaction lock time, defaults to ``0``.
         :type locktime: int
 
@@ -608,15 +671,20 @@ class WithdrawTransaction(Transaction):
         self._transaction_detail = get_transaction(
             transaction_hash=self._transaction_hash, network=self._network
         )
-        # Find HTLC UTXO
-        self._htlc_utxo = find_p2sh_utxo(transaction=self._transaction_detail)
+        # Find HTLC UTXO, by P2SH or P2WSH script when bytecode is given (batch funded transactions)
+        self._htlc_utxo = find_p2sh_utxo(
+            transaction=self._transaction_detail, script=([
+                HTLC(network=self._network).from_bytecode(bytecode=bytecode, segwit=segwit).hash()
+                for segwit in [False, True]
+            ] if bytecode else None)
+        )
 
         if self._htlc_utxo is None:
             raise ValueError("Invalid transaction hash, there is no pay to script hash (P2SH) address.")
 
         self._amount = self._htlc_utxo["value"]
-        # Calculate the fee
-        self._fee = fee_calculator(1, 1)
+        # Calculate the fee, witness spend of P2WSH HTLC is discounted
+        self._fee = fee_calculator(1, 1, witness_input=int(_is_p2wsh_script(script=self._htlc_utxo["script"])))
 
         outputs: list = [TxOut(
             value=(self._amount - self._fee), n=0, script_pubkey=get_address_hash(
@@ -665,29 +733,28 @@ class WithdrawTransaction(Transaction):
         if self._transaction is None:
             raise ValueError("Transaction is none, build transaction first.")
 
-        self._transaction.spend([TxOut(
-            value=self._htlc_utxo["value"],
-            n=0,
-            script_pubkey=P2shScript.unhexlify(
-                hex_string=self._htlc_utxo["script"]
-            )
-        )], [P2shSolver(
-            redeem_script=solver.witness(
-                network=self._network
-            ),
-            redeem_script_solver=solver.solve(
-                network=self._network
-            )
-        )])
+        # Spent transaction is returned, segwit spend of P2WSH HTLC builds a new witness transaction
+        self._transaction = _spend(
+            transaction=self._transaction, txouts=[_build_htlc_txout(
+                value=self._htlc_utxo["value"],
+                n=self._htlc_utxo["position"],
+                script=self._htlc_utxo["script"]
+            )], solvers=[_build_htlc_solver(
+                solver=solver, script=self._htlc_utxo["script"], network=self._network
+            )]
+        )
 
         # Set transaction type
         self._type = "bitcoin_withdraw_signed"
         return self
 
-    def transaction_raw(self) -> str:
+    def transaction_raw(self, binary: bool = False) -> str:
         """
         Get Bitcoin withdraw transaction raw.
 
+        :param binary: Encode as compact binary envelope, defaults to ``False``.
+        :type binary: bool
+
         :returns: str -- Bitcoin withdraw transaction raw.
 
         >>> from swap.providers.bitcoin.transaction import WithdrawTransaction
@@ -703,23 +770,23 @@ class WithdrawTransaction(Transaction):
 
         # Encode withdraw transaction raw
         if self._type == "bitcoin_withdraw_signed":
-            return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            return encode_transaction_raw(transaction=dict(
                 raw=self._transaction.hexlify(),
                 fee=self._fee,
                 network=self._network,
                 type=self._type,
-            ))).encode()).decode())
-        return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            ), binary=binary)
+        return encode_transaction_raw(transaction=dict(
             fee=self._fee,
             raw=self._transaction.hexlify(),
             outputs=dict(
                 value=self._htlc_utxo["value"],
-                tx_output_n=0,
+                tx_output_n=self._htlc_utxo["position"],
                 script=self._htlc_utxo["script"]
             ),
             network=self._network,
             type=self._type,
-        ))).encode()).decode())
+        ), binary=binary)
 
 
 class RefundTransaction(Transaction):
@@ -745,7 +812,7 @@ class RefundTransaction(Transaction):
         self._htlc_utxo: Optional[dict] = None
         self._interest: Optional[int] = None
 
-    def build_transaction(self, address: str, transaction_hash: str,
+    def build_transaction(self, address: str, transaction_hash: str, bytecode: Optional[str] = None,
                           locktime: int = config["locktime"]) -> "RefundTransaction":
         """
         Build Bitcoin refund transaction.
@@ -754,6 +821,8 @@ class RefundTransaction(Transaction):
         :type address: str
         :param transaction_hash: Bitcoin funded transaction hash/id.
         :type transaction_hash: str
+        :param bytecode: Bitcoin HTLC bytecode to locate its output, defaults to ``None``.
+        :type bytecode: str
         :param locktime: Bitcoin transaction lock time, defaults to ``0``.
         :type locktime: int
 
@@ -775,15 +844,20 @@ class RefundTransaction(Transaction):
         self._transaction_detail = get_transaction(
             transaction_hash=self._transaction_hash, network=self._network
         )
-        # Find HTLC UTXO
-        self._htlc_utxo = find_p2sh_utxo(transaction=self._transaction_detail)
+        # Find HTLC UTXO, by P2SH or P2WSH script when bytecode is given (batch funded transactions)
+        self._htlc_utxo = find_p2sh_utxo(
+            transaction=self._transaction_detail, script=([
+                HTLC(network=self._network).from_bytecode(bytecode=bytecode, segwit=segwit).hash()
+                for segwit in [False, True]
+            ] if bytecode else None)
+        )
 
         if self._htlc_utxo is None:
             raise ValueError("Invalid transaction id, there is no pay to script hash (P2SH) address.")
 
         self._amount = self._htlc_utxo["value"]
-        # Calculate the fee
-        self._fee = fee_calculator(1, 1)
+        # Calculate the fee, witness spend of P2WSH HTLC is discounted
+        self._fee = fee_calculator(1, 1, witness_input=int(_is_p2wsh_script(script=self._htlc_utxo["script"])))
 
         outputs: list = [TxOut(
             value=(self._amount - self._fee), n=0, script_pubkey=get_address_hash(
@@ -831,29 +905,28 @@ class RefundTransaction(Transaction):
         if self._transaction is None:
             raise ValueError("Transaction is none, build transaction first.")
 
-        self._transaction.spend([TxOut(
-            value=self._htlc_utxo["value"],
-            n=0,
-            script_pubkey=P2shScript.unhexlify(
-                hex_string=self._htlc_utxo["script"]
-            )
-        )], [P2shSolver(
-            redeem_script=solver.witness(
-                network=self._network
-            ),
-            redeem_script_solver=solver.solve(
-                network=self._network
-            )
-        )])
+        # Spent transaction is returned, segwit spend of P2WSH HTLC builds a new witness transaction
+        self._transaction = _spend(
+            transaction=self._transaction, txouts=[_build_htlc_txout(
+                value=self._htlc_utxo["value"],
+                n=self._htlc_utxo["position"],
+                script=self._htlc_utxo["script"]
+            )], solvers=[_build_htlc_solver(
+                solver=solver, script=self._htlc_utxo["script"], network=self._network
+            )]
+        )
 
         # Set transaction type
         self._type = "bitcoin_refund_signed"
         return self
 
-    def transaction_raw(self) -> str:
+    def transaction_raw(self, binary: bool = False) -> str:
         """
         Get Bitcoin refund transaction raw.
 
+        :param binary: Encode as compact binary envelope, defaults to ``False``.
+        :type binary: bool
+
         :returns: str -- Bitcoin refund transaction raw.
 
         >>> from swap.providers.bitcoin.transaction import RefundTransaction
@@ -869,20 +942,281 @@ class RefundTransaction(Transaction):
 
         # Encode refund transaction raw
         if self._type == "bitcoin_refund_signed":
-            return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            return encode_transaction_raw(transaction=dict(
                 raw=self._transaction.hexlify(),
                 fee=self._fee,
                 network=self._network,
                 type=self._type,
-            ))).encode()).decode())
-        return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            ), binary=binary)
+        return encode_transaction_raw(transaction=dict(
             fee=self._fee,
             raw=self._transaction.hexlify(),
             outputs=dict(
                 value=self._htlc_utxo["value"],
-                tx_output_n=0,
+                tx_output_n=self._htlc_utxo["position"],
                 script=self._htlc_utxo["script"]
             ),
             network=self._network,
             type=self._type,
-        ))).encode()).decode())
+        ), binary=binary)
+
+
+class SweepTransaction(Transaction):
+    """
+    Bitcoin Sweep transaction.
+
+    :param network: Bitcoin network, defaults to ``mainnet``.
+    :type network: str
+    :param version: Bitcoin transaction version, defaults to ``2``.
+    :type version: int
+
+    :returns: SweepTransaction -- Bitcoin sweep transaction instance.
+
+    .. warning::
+        Do not forget to build transaction after initialize sweep transaction.
+
+    .. note::
+        Sweep transaction spends many funded HTLC's to one address, use :func:`build_sweep_transactions`
+        to split them automatically under the standard transaction size limit.
+    """
+
+    def __init__(self, network: str = config["network"], version: int = config["version"]):
+        super().__init__(network=network, version=version)
+
+        self._htlc_utxos: List[dict] = []
+        self._interest: Optional[int] = None
+
+    def build_transaction(self, address: str, htlcs: List[Tuple[Union[str, Tuple[str, int]], str]],
+                          locktime: Optional[int] = None) -> "SweepTransaction":
+        """
+        Build Bitcoin sweep transaction.
+
+        :param address: Bitcoin recipient or sender address.
+        :type address: str
+        :param htlcs: Bitcoin funded transaction hash/id or (transaction hash/id, output index) outpoint with HTLC bytecode pairs.
+        :type htlcs: list
+        :param locktime: Bitcoin transaction lock time, defaults to the max HTLC endtime.
+        :type locktime: int
+
+        :returns: SweepTransaction -- Bitcoin sweep transaction instance.
+
+        >>> from swap.providers.bitcoin.transaction import SweepTransaction
+        >>> sweep_transaction: SweepTransaction = SweepTransaction("testnet")
+        >>> sweep_transaction.build_transaction(address="n1wgm6kkzMcNfAtJmes8YhpvtDzdNhDY5a", htlcs=[("a211d21110756b266925fee2fbf2dc81529beef5e410311b38578dc3a076fb31", "63aa20821124b554d13f247b1e5d10b84e44fb1296f18f38bbaa1bea34a12c843e01588876a9140a0a6590e6ba4b48118d21b86812615219ece76b88ac67040ec4d660b17576a914e00ff2a640b7ce2d336860739169487a57f84b1588ac68")])
+        <swap.providers.bitcoin.transaction.SweepTransaction object at 0x0409DAF0>
+        """
+
+        # Check parameter instances
+        if not is_address(address, self._network):
+            raise AddressError(f"Invalid Bitcoin recipient '{address}' {self._network} address.")
+        if not htlcs:
+            raise ValueError("Invalid Bitcoin HTLC's, at least one HTLC is required.")
+
+        self._address, self._htlc_utxos, endtimes = address, [], []
+        outpoints: list = [
+            (tuple(outpoint) if isinstance(outpoint, (tuple, list)) else (outpoint, None)) for outpoint, _ in htlcs
+        ]
+        # Get each funded transaction only once, in one batch request on bitcoind backend
+        transaction_hashes: list = list(dict.fromkeys(transaction_hash for transaction_hash, _ in outpoints))
+        transactions_detail: dict = dict(zip(transaction_hashes, get_transactions(
+            transaction_hashes=transaction_hashes, network=self._network
+        )))
+        for (transaction_hash, position), (_, bytecode) in zip(outpoints, htlcs):
+            htlc: HTLC = HTLC(network=self._network).from_bytecode(bytecode=bytecode)
+            # P2SH or P2WSH locking scripts of the HTLC
+            scripts: list = [htlc.hash(), HTLC(network=self._network).from_bytecode(
+                bytecode=bytecode, segwit=True
+            ).hash()]
+            # Find HTLC UTXO, by output index when outpoint is given otherwise by script
+            if position is None:
+                htlc_utxo = find_p2sh_utxo(
+                    transaction=transactions_detail[transaction_hash], script=scripts
+                )
+            else:
+                outputs: list = transactions_detail[transaction_hash]["outputs"]
+                htlc_utxo = (
+                    dict(position=position, **outputs[position])
+                    if position < len(outputs) and outputs[position]["script"] in scripts else None
+                )
+            if htlc_utxo is None:
+                raise ValueError(f"Invalid transaction hash '{transaction_hash}', "
+                                 f"there is no '{htlc.contract_address()}' HTLC pay to script hash (P2SH) output.")
+            if any(utxo["transaction_hash"] == transaction_hash and utxo["position"] == htlc_utxo["position"]
+                   for utxo in self._htlc_utxos):
+                raise ValueError(f"Duplicate Bitcoin HTLC '{transaction_hash}:{htlc_utxo['position']}' outpoint.")
+            self._htlc_utxos.append(dict(transaction_hash=transaction_hash, **htlc_utxo))
+            endtimes.append(htlc.script.else_script.locktime.n)
+
+        self._amount = sum(htlc_utxo["value"] for htlc_utxo in self._htlc_utxos)
+        # Calculate the fee, witness spends of P2WSH HTLC's are discounted
+        self._fee = fee_calculator(len(self._htlc_utxos), 1, witness_input=sum(
+            _is_p2wsh_script(script=htlc_utxo["script"]) for htlc_utxo in self._htlc_utxos
+        ))
+
+        if self._amount <= self._fee:
+            raise BalanceError(
+                f"You don't have enough amount to pay '{self._fee}' Satoshi fee",
+                f"you can sweep only '{self._amount}' Satoshi amount."
+            )
+
+        outputs: list = [TxOut(
+            value=(self._amount - self._fee), n=0, script_pubkey=get_address_hash(
+                address=self._address, script=True
+            )
+        )]
+        # Build mutable transaction
+        self._transaction = MutableTransaction(
+            version=self._version,
+            ins=[TxIn(
+                txid=htlc_utxo["transaction_hash"],
+                txout=htlc_utxo["position"],
+                script_sig=ScriptSig.empty(),
+                sequence=Sequence.max()
+            ) for htlc_utxo in self._htlc_utxos],
+            outs=outputs,
+            locktime=Locktime(max(endtimes) if locktime is None else locktime)
+        )
+
+        # Set transaction type
+        self._type = "bitcoin_sweep_unsigned"
+        return self
+
+    def sign(self, solver: List[Union[WithdrawSolver, RefundSolver]]) -> "SweepTransaction":
+        """
+        Sign Bitcoin sweep transaction.
+
+        :param solver: Bitcoin withdraw or refund solvers, one per HTLC in build order.
+        :type solver: list
+
+        :returns: SweepTransaction -- Bitcoin sweep transaction instance.
+
+        >>> from swap.providers.bitcoin.transaction import SweepTransaction
+        >>> from swap.providers.bitcoin.solver import RefundSolver
+        >>> bytecode: str = "63aa20821124b554d13f247b1e5d10b84e44fb1296f18f38bbaa1bea34a12c843e01588876a9140a0a6590e6ba4b48118d21b86812615219ece76b88ac67040ec4d660b17576a914e00ff2a640b7ce2d336860739169487a57f84b1588ac68"
+        >>> sweep_transaction: SweepTransaction = SweepTransaction("testnet")
+        >>> sweep_transaction.build_transaction(address="n1wgm6kkzMcNfAtJmes8YhpvtDzdNhDY5a", htlcs=[("a211d21110756b266925fee2fbf2dc81529beef5e410311b38578dc3a076fb31", bytecode)])
+        >>> refund_solver: RefundSolver = RefundSolver(xprivate_key="tprv8ZgxMBicQKsPeMHMJAc6uWGYiGqi1MVM2ybmzXL2TAoDpQe85uyDpdT7mv7Nhdu5rTCBEKLZsd9KyP2LQZJzZTvgVQvENArgU8e6DoYBiXf", bytecode=bytecode, endtime=1624687630)
+        >>> sweep_transaction.sign(solver=[refund_solver])
+        <swap.providers.bitcoin.transaction.SweepTransaction object at 0x0409DAF0>
+        """
+
+        # Check parameter instances
+        if self._transaction is None:
+            raise ValueError("Transaction is none, build transaction first.")
+        if not isinstance(solver, list) or len(solver) != len(self._htlc_utxos):
+            raise ValueError(f"Invalid Bitcoin solvers, {len(self._htlc_utxos)} solvers are required one per HTLC.")
+        for _solver in solver:
+            if not isinstance(_solver, (WithdrawSolver, RefundSolver)):
+                raise TypeError(f"Solver must be Bitcoin WithdrawSolver or RefundSolver, "
+                                f"not {type(_solver).__name__} type.")
+
+        # Spent transaction is returned, segwit spend of P2WSH HTLC's builds a new witness transaction
+        self._transaction = _spend(
+            transaction=self._transaction,
+            txouts=[_build_htlc_txout(
+                value=htlc_utxo["value"],
+                n=htlc_utxo["position"],
+                script=htlc_utxo["script"]
+            ) for htlc_utxo in self._htlc_utxos],
+            solvers=_build_sweep_solvers(
+                solvers=solver, scripts=[htlc_utxo["script"] for htlc_utxo in self._htlc_utxos],
+                network=self._network
+            )
+        )
+
+        # Set transaction type
+        self._type = "bitcoin_sweep_signed"
+        return self
+
+    def transaction_raw(self, binary: bool = False) -> str:
+        """
+        Get Bitcoin sweep transaction raw.
+
+        :param binary: Encode as compact binary envelope, defaults to ``False``.
+        :type binary: bool
+
+        :returns: str -- Bitcoin sweep transaction raw.
+
+        >>> from swap.providers.bitcoin.transaction import SweepTransaction
+        >>> sweep_transaction: SweepTransaction = SweepTransaction("testnet")
+        >>> sweep_transaction.build_transaction(address="n1wgm6kkzMcNfAtJmes8YhpvtDzdNhDY5a", htlcs=[("a211d21110756b266925fee2fbf2dc81529beef5e410311b38578dc3a076fb31", "63aa20821124b554d13f247b1e5d10b84e44fb1296f18f38bbaa1bea34a12c843e01588876a9140a0a6590e6ba4b48118d21b86812615219ece76b88ac67040ec4d660b17576a914e00ff2a640b7ce2d336860739169487a57f84b1588ac68")])
+        >>> sweep_transaction.transaction_raw()
+        "eyJmZWUiOiA1NzYsICJyYXciOiAiMDIwMDAwMDAwMTMxZmI3NmEwYzM4ZDU3MzgxYjMxMTBlNGY1ZWU5YjUyODFkY2YyZmJlMmZlMjU2OTI2NmI3NTEwMTFkMjExYTIwMDAwMDAwMDAwZmZmZmZmZmYwMTYwODQwMTAwMDAwMDAwMDAxOTc2YTkxNGUwMGZmMmE2NDBiN2NlMmQzMzY4NjA3MzkxNjk0ODdhNTdmODRiMTU4OGFjMGVjNGQ2NjAiLCAib3V0cHV0cyI6IFt7InZhbHVlIjogMTAwMDAwLCAidHhfb3V0cHV0X24iOiAwLCAic2NyaXB0IjogImE5MTRjOGM3N2E5YjQzZWUyYmRmMWEwN2M0ODY5OTgzM2Q3NjY4YmYyNjRjODcifV0sICJuZXR3b3JrIjogInRlc3RuZXQiLCAidHlwZSI6ICJiaXRjb2luX3N3ZWVwX3Vuc2lnbmVkIn0"
+        """
+
+        # Check transaction
+        if self._transaction is None:
+            raise ValueError("Transaction is none, build transaction first.")
+
+        # Encode sweep transaction raw
+        if self._type == "bitcoin_sweep_signed":
+            return encode_transaction_raw(transaction=dict(
+                raw=self._transaction.hexlify(),
+                fee=self._fee,
+                network=self._network,
+                type=self._type,
+            ), binary=binary)
+        return encode_transaction_raw(transaction=dict(
+            fee=self._fee,
+            raw=self._transaction.hexlify(),
+            outputs=[dict(
+                value=htlc_utxo["value"],
+                tx_output_n=htlc_utxo["position"],
+                script=htlc_utxo["script"]
+            ) for htlc_utxo in self._htlc_utxos],
+            network=self._network,
+            type=self._type,
+        ), binary=binary)
+
+
+def build_sweep_transactions(address: str, htlcs: List[Tuple[Union[str, Tuple[str, int]], str]],
+                             network: str = config["network"], version: int = config["version"],
+                             locktime: Optional[int] = None,
+                             max_size: int = config["max_transaction_size"]) -> List[SweepTransaction]:
+    """
+    Build Bitcoin sweep transactions, split to stay under the standard transaction size limit.
+
+    :param address: Bitcoin recipient or sender address.
+    :type address: str
+    :param htlcs: Bitcoin funded transaction hash/id or (transaction hash/id, output index) outpoint with HTLC bytecode pairs.
+    :type htlcs: list
+    :param network: Bitcoin network, defaults to ``mainnet``.
+    :type network: str
+    :param version: Bitcoin transaction version, defaults to ``2``.
+    :type version: int
+    :param locktime: Bitcoin transaction lock time, defaults to the max HTLC endtime of each transaction.
+    :type locktime: int
+    :param max_size: Bitcoin max signed transaction size in bytes, defaults to ``100000``.
+    :type max_size: int
+
+    :returns: list -- Bitcoin sweep transaction instances.
+
+    >>> from swap.providers.bitcoin.transaction import build_sweep_transactions
+    >>> build_sweep_transactions(address="n1wgm6kkzMcNfAtJmes8YhpvtDzdNhDY5a", htlcs=[("a211d21110756b266925fee2fbf2dc81529beef5e410311b38578dc3a076fb31", "63aa20821124b554d13f247b1e5d10b84e44fb1296f18f38bbaa1bea34a12c843e01588876a9140a0a6590e6ba4b48118d21b86812615219ece76b88ac67040ec4d660b17576a914e00ff2a640b7ce2d336860739169487a57f84b1588ac68")], network="testnet")
+    [<swap.providers.bitcoin.transaction.SweepTransaction object at 0x0409DAF0>]
+    """
+
+    # Version, input and output counts, one P2PKH output and lock time
+    base_size: int = 4 + 3 + 1 + 34 + 4
+    if not htlcs:
+        raise ValueError("Invalid Bitcoin HTLC's, at least one HTLC is required.")
+
+    chunks, chunk, size = [], [], base_size
+    for outpoint, bytecode in htlcs:
+        # Outpoint, sequence and the worst case signed script sig (signature, public key,
+        # up to 75 bytes secret key, branch selector and redeem script)
+        input_size: int = 36 + 4 + 3 + 74 + 34 + 76 + 1 + 3 + (len(bytecode) // 2)
+        if base_size + input_size > max_size:
+            raise ValueError(f"Invalid max size, '{max_size}' bytes can't fit a single Bitcoin HTLC input.")
+        if chunk and size + input_size > max_size:
+            chunks.append(chunk)
+            chunk, size = [], base_size
+        chunk.append((outpoint, bytecode))
+        size += input_size
+    chunks.append(chunk)
+
+    return [
+        SweepTransaction(network=network, version=version).build_transaction(
+            address=address, htlcs=_htlcs, locktime=locktime
+        ) for _htlcs in chunks
+    ]
@@ -1,34 +1,48 @@
 #!/usr/bin/env python3
 
+from binascii import unhexlify
 from btcpy.structs.script import (
-    ScriptSig, Script
+    ScriptSig, ScriptBuilder
 )
 from btcpy.structs.transaction import (
-    MutableTransaction, Sequence, TxIn, TxOut
+    MutableTransaction, MutableSegWitTransaction, TransactionFactory, Sequence, TxIn, TxOut
+)
+from btcpy.structs.address import (
+    Address, SegWitAddress
+)
+from btcpy.structs.sig import (
+    P2pkhSolver, P2shSolver, P2wpkhV0Solver, P2wshV0Solver
 )
-from btcpy.structs.address import Address
 from btcpy.setup import setup as stp
 from btcpy.structs.script import (
-    P2pkhScript, P2shScript
+    P2pkhScript, P2shScript, P2wpkhV0Script, P2wshV0Script
 )
-from base64 import b64decode
 from typing import (
-    Union, Optional, Tuple
+    Union, Optional, Tuple, List
 )
 
 import requests
+import hashlib
 import cryptos
 import json
 import datetime
 
-from ...utils import clean_transaction_raw
+from ...utils import (
+    TransactionEnvelope, load_transaction_raw
+)
 from ...exceptions import (
     AddressError, NetworkError, APIError, UnitError, TransactionRawError
 )
 from ..config import bitcoin as config
 
+# Input fees of spent address types
+INPUT_FEES: dict = {
+    "p2pkh": 444, "p2wpkh": 204, "p2wpkh-in-p2sh": 274
+}
 
-def fee_calculator(transaction_input: int = 1, transaction_output: int = 1) -> int:
+
+def fee_calculator(transaction_input: int = 1, transaction_output: int = 1, witness_input: int = 0,
+                   address_type: str = "p2pkh") -> int:
     """
     Bitcoin fee calculator.
 
@@ -36,16 +50,33 @@ def fee_calculator(transaction_input: int = 1, transaction_output: int = 1) -> i
     :type transaction_input: int
     :param transaction_output: transaction output numbers, defaults to ``1``.
     :type transaction_output: int
+    :param witness_input: transaction input numbers spent by witness (P2WSH HTLC), defaults to ``0``.
+    :type witness_input: int
+    :param address_type: Spent address type of the inputs, defaults to ``p2pkh``.
+    :type address_type: str
 
     :returns: int -- Bitcoin fee (Satoshi amount).
 
     >>> from swap.providers.bitcoin.utils import fee_calculator
     >>> fee_calculator(transaction_input=2, transaction_output=9)
     1836
+    >>> fee_calculator(transaction_input=1, transaction_output=1, witness_input=1)
+    398
+    >>> fee_calculator(transaction_input=2, transaction_output=9, address_type="p2wpkh")
+    1356
+
+    .. note::
+        Witness data is discounted by a factor of four, each witness input costs 266 instead of 444,
+        each ``p2wpkh`` input 204 and each ``p2wpkh-in-p2sh`` input 274.
     """
 
-    # 444 input 102 output
-    transaction_input = ((transaction_input - 1) * 444) + 576
+    if not 0 <= witness_input <= transaction_input:
+        raise ValueError("Invalid witness input numbers, must be between zero and transaction input numbers.")
+    if address_type not in INPUT_FEES:
+        raise TypeError("Address type must be str and choose only 'p2pkh', 'p2wpkh' or 'p2wpkh-in-p2sh' types.")
+
+    # Input fee by address type (witness HTLC input 178 less), 132 transaction overhead, 102 output
+    transaction_input = (transaction_input * INPUT_FEES[address_type]) + 132 - (witness_input * 178)
     transaction_output = ((transaction_output - 1) * 102)
     return transaction_input + transaction_output
 
@@ -57,7 +88,7 @@ def get_address_type(address: str) -> str:
     :param address: Bitcoin address.
     :type address: str
 
-    :returns: str -- Bitcoin address type (P2PKH, P2SH).
+    :returns: str -- Bitcoin address type (P2PKH, P2SH, P2WPKH, P2WSH).
 
     >>> from swap.providers.bitcoin.utils import get_address_type
     >>> get_address_type(address="mrmtGq2HMmqAogSsGDjCtXUpxrb7rHThFH")
@@ -107,12 +138,14 @@ def is_address(address: str, network: Optional[str] = None, address_type: Option
     >>> from swap.providers.bitcoin.utils import is_address
     >>> is_address(address="mrmtGq2HMmqAogSsGDjCtXUpxrb7rHThFH", network="testnet")
     True
+    >>> is_address(address="tb1qrxtdn5757y2g2eaetjz7h2zdgylgqjwy0mn2rmvqd9uzdryjewzs6ys9hf", network="testnet")
+    True
     """
 
     if not isinstance(address, str):
         raise TypeError(f"Address must be str, not '{type(address)}' type.")
-    if address_type and address_type not in ["p2pkh", "p2sh"]:
-        raise TypeError("Address type must be str and choose only 'p2pkh' or 'p2sh' types.")
+    if address_type and address_type not in ["p2pkh", "p2sh", "p2wpkh", "p2wsh"]:
+        raise TypeError("Address type must be str and choose only 'p2pkh', 'p2sh', 'p2wpkh' or 'p2wsh' types.")
 
     if network is None:
         for boolean in [True, False]:
@@ -120,6 +153,8 @@ def is_address(address: str, network: Optional[str] = None, address_type: Option
             if cryptos.Bitcoin(testnet=boolean).is_address(address):
                 valid = True
                 break
+        if not valid:
+            valid = _is_segwit_address(address=address)
         if address_type:
             valid = True if valid and (get_address_type(address=address) == address_type) else False
         return valid
@@ -130,22 +165,24 @@ def is_address(address: str, network: Optional[str] = None, address_type: Option
 
     valid: bool = False
     if network == "mainnet":
-        valid = cryptos.Bitcoin(testnet=False).is_address(address)
+        valid = cryptos.Bitcoin(testnet=False).is_address(address) or \
+            _is_segwit_address(address=address, network=network)
         if address_type:
             valid = True if valid and (get_address_type(address=address) == address_type) else False
     elif network == "testnet":
-        valid = cryptos.Bitcoin(testnet=True).is_address(address)
+        valid = cryptos.Bitcoin(testnet=True).is_address(address) or \
+            _is_segwit_address(address=address, network=network)
         if address_type:
             valid = True if valid and (get_address_type(address=address) == address_type) else False
     return valid
 
 
-def is_transaction_raw(transaction_raw: str) -> bool:
+def is_transaction_raw(transaction_raw: Union[str, TransactionEnvelope]) -> bool:
     """
     Check Bitcoin transaction raw.
 
-    :param transaction_raw: Bitcoin transaction raw.
-    :type transaction_raw: str
+    :param transaction_raw: Bitcoin transaction raw or transaction envelope.
+    :type transaction_raw: str, swap.utils.TransactionEnvelope
 
     :returns: bool -- Bitcoin valid/invalid transaction raw.
 
@@ -155,18 +192,17 @@ def is_transaction_raw(transaction_raw: str) -> bool:
     True
     """
 
-    if not isinstance(transaction_raw, str):
+    if not isinstance(transaction_raw, (str, TransactionEnvelope)):
         raise TypeError(f"Transaction raw must be str, not '{type(transaction_raw)}' type.")
 
     try:
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loads_transaction_raw = json.loads(decoded_transaction_raw.decode())
+        loads_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
         return loads_transaction_raw["type"] in [
             "bitcoin_normal_unsigned", "bitcoin_normal_signed",
             "bitcoin_fund_unsigned", "bitcoin_fund_signed",
             "bitcoin_withdraw_unsigned", "bitcoin_withdraw_signed",
-            "bitcoin_refund_unsigned", "bitcoin_refund_signed"
+            "bitcoin_refund_unsigned", "bitcoin_refund_signed",
+            "bitcoin_sweep_unsigned", "bitcoin_sweep_signed"
         ]
     except:
         return False
@@ -236,18 +272,15 @@ def decode_transaction_raw(transaction_raw: str, offline: bool = True,
     {'fee': 678, 'type': 'bitcoin_fund_unsigned', 'tx': {'hex': '0200000001888be7ec065097d95664763f276d425552d735fb1d974ae78bf72106dca0f3910100000000ffffffff02102700000000000017a9142bb013c3e4beb08421dedcf815cb65a5c388178b87bcdd0e00000000001976a91464a8390b0b1685fcbf2d4b457118dc8da92d553488ac00000000', 'txid': 'abc70fd3466aec9478ea3115200a84f993204ad1f614fe08e92ecc5997a0d3ba', 'hash': 'abc70fd3466aec9478ea3115200a84f993204ad1f614fe08e92ecc5997a0d3ba', 'size': 117, 'vsize': 117, 'version': 2, 'locktime': 0, 'vin': [{'txid': '91f3a0dc0621f78be74a971dfb35d75255426d273f766456d9975006ece78b88', 'vout': 1, 'scriptSig': {'asm': '', 'hex': ''}, 'sequence': '4294967295'}], 'vout': [{'value': '0.00010000', 'n': 0, 'scriptPubKey': {'asm': 'OP_HASH160 2bb013c3e4beb08421dedcf815cb65a5c388178b OP_EQUAL', 'hex': 'a9142bb013c3e4beb08421dedcf815cb65a5c388178b87', 'type': 'p2sh', 'address': '2MwEDybGC34949zgzWX4M9FHmE3crDSUydP'}}, {'value': '0.00974268', 'n': 1, 'scriptPubKey': {'asm': 'OP_DUP OP_HASH160 64a8390b0b1685fcbf2d4b457118dc8da92d5534 OP_EQUALVERIFY OP_CHECKSIG', 'hex': '76a91464a8390b0b1685fcbf2d4b457118dc8da92d553488ac', 'type': 'p2pkh', 'address': 'mphBPZf15cRFcL5tUq6mCbE84XobZ1vg7Q'}}]}, 'network': 'testnet'}
     """
 
-    if not is_transaction_raw(transaction_raw=transaction_raw):
+    loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+    if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
         raise TransactionRawError("Invalid Bitcoin transaction raw.")
 
-    transaction_raw = clean_transaction_raw(transaction_raw)
-    decoded_transaction_raw = b64decode(transaction_raw.encode())
-    loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
     decoded_transaction: Optional[dict] = None
 
     if offline:
         stp(loaded_transaction_raw["network"], strict=True, force=True)
-        tx = MutableTransaction.unhexlify(loaded_transaction_raw["raw"])
+        tx = TransactionFactory.unhexlify(loaded_transaction_raw["raw"])
         decoded_transaction = tx.to_json()
     else:
         url = f"{config[loaded_transaction_raw['network']]['blockcypher']['url']}/txs/decode"
@@ -282,20 +315,33 @@ def submit_transaction_raw(transaction_raw: str, endpoint: str = "sochain", head
 
     :returns: dict -- Bitcoin submitted transaction id, fee, type and date.
 
+    .. note::
+        Submits through bitcoind or electrum when endpoint or configured network backend is ``bitcoind`` or ``electrum``.
+
     >>> from swap.providers.bitcoin.utils import submit_transaction_raw
     >>> transaction_raw = "eyJmZWUiOiA2NzgsICJyYXciOiAiMDIwMDAwMDAwMTg4OGJlN2VjMDY1MDk3ZDk1NjY0NzYzZjI3NmQ0MjU1NTJkNzM1ZmIxZDk3NGFlNzhiZjcyMTA2ZGNhMGYzOTEwMTAwMDAwMDAwZmZmZmZmZmYwMjEwMjcwMDAwMDAwMDAwMDAxN2E5MTQyYmIwMTNjM2U0YmViMDg0MjFkZWRjZjgxNWNiNjVhNWMzODgxNzhiODdiY2RkMGUwMDAwMDAwMDAwMTk3NmE5MTQ2NGE4MzkwYjBiMTY4NWZjYmYyZDRiNDU3MTE4ZGM4ZGE5MmQ1NTM0ODhhYzAwMDAwMDAwIiwgIm91dHB1dHMiOiBbeyJhbW91bnQiOiA5ODQ5NDYsICJuIjogMSwgInNjcmlwdCI6ICI3NmE5MTQ2NGE4MzkwYjBiMTY4NWZjYmYyZDRiNDU3MTE4ZGM4ZGE5MmQ1NTM0ODhhYyJ9XSwgIm5ldHdvcmsiOiAidGVzdG5ldCIsICJ0eXBlIjogImJpdGNvaW5fZnVuZF91bnNpZ25lZCJ9"
     >>> submit_transaction_raw(transaction_raw=transaction_raw)
     {'fee': '...', 'type': '...', 'transaction_id': '...', 'network': '...', 'date': '...'}
     """
 
-    if not is_transaction_raw(transaction_raw=transaction_raw):
+    loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+    if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
         raise TransactionRawError("Invalid Bitcoin transaction raw.")
 
-    transaction_raw = clean_transaction_raw(transaction_raw)
-    decoded_transaction_raw = b64decode(transaction_raw.encode())
-    loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
-    if endpoint == "smartbit":
+    if endpoint in ["bitcoind", "electrum"] or \
+            config[loaded_transaction_raw["network"]]["backend"] in ["bitcoind", "electrum"]:
+        from .rpc import submit_raw
+        return dict(
+            fee=loaded_transaction_raw["fee"],
+            type=loaded_transaction_raw["type"],
+            transaction_hash=submit_raw(
+                raw=loaded_transaction_raw["raw"], network=loaded_transaction_raw["network"],
+                endpoint=endpoint, headers=headers, timeout=timeout
+            ),
+            network=loaded_transaction_raw["network"],
+            date=str(datetime.datetime.now())
+        )
+    elif endpoint == "smartbit":
         url = f"{config[loaded_transaction_raw['network']]['smartbit']}/pushtx"
         data = dict(hex=loaded_transaction_raw["raw"])
         response = requests.post(
@@ -334,16 +380,16 @@ def submit_transaction_raw(transaction_raw: str, endpoint: str = "sochain", head
         else:
             raise APIError("Unknown Bitcoin submit payment error.")
     else:
-        raise TypeError("Invalid Bitcoin endpoint api name, please choose only smartbit or sochain only.")
+        raise TypeError("Invalid Bitcoin endpoint api name, please choose only smartbit, sochain, bitcoind or electrum only.")
 
 
-def get_address_hash(address: str, script: bool = False) -> Union[str, P2pkhScript, P2shScript]:
+def get_address_hash(address: str, script: bool = False) -> Union[str, P2pkhScript, P2shScript, P2wpkhV0Script, P2wshV0Script]:
     """
     Get Bitcoin address hash.
 
     :param address: Bitcoin address.
     :type address: str
-    :param script: Return script (P2pkhScript, P2shScript), default to ``False``.
+    :param script: Return script (P2pkhScript, P2shScript, P2wpkhV0Script, P2wshV0Script), default to ``False``.
     :type script: bool
 
     :returns: str -- Bitcoin address hash.
@@ -364,14 +410,54 @@ def get_address_hash(address: str, script: bool = False) -> Union[str, P2pkhScri
         return P2pkhScript(loaded_address)
     elif str(get_type) == "p2sh":
         return P2shScript(loaded_address)
+    elif str(get_type) == "p2wpkh":
+        return P2wpkhV0Script(loaded_address)
+    elif str(get_type) == "p2wsh":
+        return P2wshV0Script(loaded_address)
 
 
-def _get_previous_transaction_indexes(utxos: list, amount: int, transaction_output: int = 2) -> Tuple[list, int]:
+def _is_segwit_address(address: str, network: Optional[str] = None) -> bool:
+    try:
+        # Not strict, the bech32 human readable part is checked against the network instead of btcpy setup
+        loaded_address = SegWitAddress.decode(address, strict=False)
+    except ValueError:
+        return False
+    return network is None or loaded_address.network == network
+
+
+def _get_spent_address_type(address: str) -> str:
+    # Fee address type of sender address inputs, P2SH sender address is P2SH wrapped P2WPKH
+    address_type: str = get_address_type(address=address)
+    if address_type == "p2sh":
+        return "p2wpkh-in-p2sh"
+    if address_type not in INPUT_FEES:
+        raise AddressError(f"Invalid Bitcoin sender '{address}' address",
+                           "choose only 'p2pkh', 'p2wpkh' or P2SH wrapped 'p2wpkh' addresses.")
+    return address_type
+
+
+def _is_sender_address(address: str, sender_address: str) -> bool:
+    # HTLC sender address, or the other P2PKH, P2WPKH or P2SH-P2WPKH address of its public key hash
+    if address == sender_address:
+        return True
+    public_key_hash: bytes = unhexlify(get_address_hash(address=sender_address, script=False))
+    address_type: str = get_address_type(address=address)
+    address_hash: bytes = unhexlify(get_address_hash(address=address, script=False))
+    if address_type == "p2sh":
+        # P2SH-P2WPKH redeem script is OP_0 PUSH(20) <public key hash>
+        return address_hash == hashlib.new(
+            "ripemd160", hashlib.sha256(b"\x00\x14" + public_key_hash).digest()
+        ).digest()
+    return address_type in ["p2pkh", "p2wpkh"] and address_hash == public_key_hash
+
+
+def _get_previous_transaction_indexes(utxos: list, amount: int, transaction_output: int = 2,
+                                      address_type: str = "p2pkh") -> Tuple[list, int]:
     temp_amount, max_amount = 0, 0
     previous_transaction_indexes: list = []
     for index, utxo in enumerate(utxos):
         temp_amount += utxo["value"]
-        if temp_amount > (amount + fee_calculator((index + 1), transaction_output)):
+        if temp_amount > (amount + fee_calculator((index + 1), transaction_output, address_type=address_type)):
             previous_transaction_indexes.append(index)
             break
         previous_transaction_indexes.append(index)
@@ -404,8 +490,8 @@ def _build_outputs(utxos: list, previous_transaction_indexes: Optional[list] = N
                 TxOut(
                     value=utxo["value"],
                     n=utxo["tx_output_n"],
-                    script_pubkey=Script.unhexlify(
-                        hex_string=utxo["script"]
+                    script_pubkey=ScriptBuilder.identify(
+                        utxo["script"]
                     )
                 )
                 if not only_dict else
@@ -416,3 +502,95 @@ def _build_outputs(utxos: list, previous_transaction_indexes: Optional[list] = N
                 )
             )
     return outputs
+
+
+def _build_solvers(solver: P2pkhSolver, scripts: List[str]) -> List[Union[P2pkhSolver, P2wpkhV0Solver, P2shSolver]]:
+    # Same private key spends P2PKH, P2WPKH and P2SH wrapped P2WPKH outputs
+    solvers, redeem_script = [], None
+    for script in scripts:
+        if len(script) == 44 and script.startswith("0014"):
+            solvers.append(P2wpkhV0Solver(privk=solver.privk))
+        elif len(script) == 46 and script.startswith("a914") and script.endswith("87"):
+            if redeem_script is None:
+                redeem_script = P2wpkhV0Script(solver.privk.pub())
+            solvers.append(P2shSolver(
+                redeem_script=redeem_script, redeem_script_solver=P2wpkhV0Solver(privk=solver.privk)
+            ))
+        else:
+            solvers.append(solver)
+    return solvers
+
+
+class _MutableSegWitTransaction(MutableSegWitTransaction):
+    # BIP143 hash prevouts, sequence and outputs are computed once per spend instead of once per input
+
+    def spend(self, txouts, solvers):
+        self._bip143 = {}
+        try:
+            return super().spend(txouts, solvers)
+        finally:
+            self._bip143 = None
+
+    def _cached(self, name: str, compute):
+        if getattr(self, "_bip143", None) is None:
+            return compute()
+        if name not in self._bip143:
+            self._bip143[name] = compute()
+        return self._bip143[name]
+
+    def _hash_prevouts(self):
+        return self._cached("prevouts", super()._hash_prevouts)
+
+    def _hash_sequence(self):
+        return self._cached("sequence", super()._hash_sequence)
+
+    def _hash_outputs(self):
+        return self._cached("outputs", super()._hash_outputs)
+
+
+def _spend(transaction: MutableTransaction, txouts: list, solvers: list):
+    # Signed transaction, witness spends sign BIP143 digests on a segwit copy
+    if any(solver.solves_segwit() for solver in solvers):
+        transaction = _MutableSegWitTransaction(
+            transaction.version, transaction.ins, transaction.outs, transaction.locktime
+        )
+    return transaction.spend(txouts, solvers)
+
+
+def _is_p2wsh_script(script: str) -> bool:
+    # OP_0 and 32 bytes sha256 witness script hash
+    return len(script) == 68 and script.startswith("0020")
+
+
+def _build_htlc_txout(value: int, n: int, script: str) -> TxOut:
+    return TxOut(
+        value=value, n=n, script_pubkey=(
+            P2wshV0Script.unhexlify(hex_string=script)
+            if _is_p2wsh_script(script=script) else
+            P2shScript.unhexlify(hex_string=script)
+        )
+    )
+
+
+def _build_htlc_solver(solver, script: str, network: str = config["network"]) -> Union[P2shSolver, P2wshV0Solver]:
+    if _is_p2wsh_script(script=script):
+        return P2wshV0Solver(
+            witness_script=solver.witness(network=network),
+            witness_script_solver=solver.solve(network=network)
+        )
+    return P2shSolver(
+        redeem_script=solver.witness(network=network),
+        redeem_script_solver=solver.solve(network=network)
+    )
+
+
+def _build_sweep_solvers(solvers: list, scripts: List[str],
+                         network: str = config["network"]) -> List[Union[P2shSolver, P2wshV0Solver]]:
+    htlc_solvers: List[Union[P2shSolver, P2wshV0Solver]] = []
+    for index, (solver, script) in enumerate(zip(solvers, scripts)):
+        redeem_script = solver.witness(network=network)
+        if script not in [str(P2shScript(redeem_script).hexlify()), str(P2wshV0Script(redeem_script).hexlify())]:
+            raise ValueError(f"Wrong Bitcoin solver at '{index}' index, "
+                             f"solver HTLC bytecode must be equal with the spent HTLC output script.")
+        htlc_solvers.append(_build_htlc_solver(solver=solver, script=script, network=network))
+    return htlc_solvers
@@ -1,29 +1,73 @@
 #!/usr/bin/env python3
 
 from hdwallet import HDWallet
+from ...crypto import HDWallet as Secp256k1HDWallet
 from hdwallet.cryptocurrencies import (
     BitcoinMainnet, BitcoinTestnet
 )
+from btcpy.structs.crypto import PublicKey
+from btcpy.structs.script import (
+    P2shScript, P2wpkhV0Script
+)
+from binascii import unhexlify
+from functools import partial
 from typing import (
-    Optional, Any, Union
+    Optional, Any, Union, List, Dict, Tuple
 )
 
-from ...utils import is_mnemonic
+import cryptos
+
+from ...crypto import derive_public_keys
+from ...utils import (
+    is_mnemonic, sha256, _derive_range, _scan_addresses
+)
 from ...exceptions import (
-    NetworkError, UnitError
+    AddressError, NetworkError, UnitError
 )
 from ..config import bitcoin as config
 from .utils import (
     is_network, amount_unit_converter
 )
 from .rpc import (
-    get_balance, get_utxos
+    get_balance, get_utxos, get_transaction_count, _check_history
 )
 
 # Default derivation path
 DEFAULT_PATH: str = config["path"]
 
 
+def _public_key_to_address(network: str, public_key: str, address_type: str = "p2pkh") -> str:
+    # P2PKH, P2WPKH or P2SH wrapped P2WPKH address of compressed public key
+    if address_type == "p2pkh":
+        return cryptos.Bitcoin(testnet=(network == "testnet")).pubtoaddr(public_key)
+    script: P2wpkhV0Script = P2wpkhV0Script(PublicKey(bytearray(unhexlify(public_key))))
+    return str((script if address_type == "p2wpkh" else P2shScript(script)).address(
+        mainnet=(network == "mainnet")
+    ))
+
+
+def _derive_addresses(network: str, public_key: str, chain_code: str, start: int, count: int,
+                      address_type: str = "p2pkh") -> List[dict]:
+    # Address records of account change node children
+    return [
+        dict(index=index, address=_public_key_to_address(
+            network=network, public_key=child_public_key, address_type=address_type
+        ), public_key=child_public_key)
+        for index, child_public_key in enumerate(derive_public_keys(
+            public_key=public_key, chain_code=chain_code, start=start, count=count
+        ), start) if child_public_key is not None
+    ]
+
+
+def _address_activity(network: str, limit: int, record: dict) -> dict:
+    # Used flag, balance and UTXO's of one address record, unused addresses cost one request
+    if get_transaction_count(address=record["address"], network=network) == 0:
+        return dict(used=False, balance=0, utxos=[])
+    return dict(used=True, balance=get_balance(address=record["address"], network=network), utxos=[dict(
+        hash=utxo["tx_hash"], output_index=utxo["tx_output_n"], amount=utxo["value"], script=utxo["script"]
+    ) for utxo in get_utxos(address=record["address"], network=network, limit=limit)])
+
+
 class Wallet(HDWallet):
     """
     Bitcoin hierarchical deterministic wallet.
@@ -32,27 +76,38 @@ class Wallet(HDWallet):
     :type network: str
     :param use_default_path: Use default derivation path, defaults to ``False``.
     :type use_default_path: bool
+    :param address_type: Bitcoin address type, defaults to ``p2pkh``.
+    :type address_type: str
 
     :returns: Wallet -- Bitcoin wallet instance.
 
     .. note::
         Bitcoin has only two networks, ``mainnet`` and ``mainnet``.
+        Address type is ``p2pkh``, native segwit ``p2wpkh`` or P2SH wrapped segwit ``p2wpkh-in-p2sh``,
+        segwit addresses are spent with BIP143 signatures and smaller fees.
     """
 
-    def __init__(self, network: str = config["network"], use_default_path: bool = False):
+    def __init__(self, network: str = config["network"], use_default_path: bool = False,
+                 address_type: str = "p2pkh"):
 
         # Check parameter instances
         if not is_network(network=network):
             raise NetworkError(f"Invalid Bitcoin '{network}' network",
                                "choose only 'mainnet' or 'testnet' networks.")
+        if address_type not in ["p2pkh", "p2wpkh", "p2wpkh-in-p2sh"]:
+            raise AddressError(f"Invalid Bitcoin '{address_type}' address type",
+                               "choose only 'p2pkh', 'p2wpkh' or 'p2wpkh-in-p2sh' types.")
 
         self._network: str = network
+        self._address_type: str = address_type
         self._cryptocurrency: Any = (
             BitcoinMainnet if self._network == "mainnet" else BitcoinTestnet
         )
-        self._hdwallet: HDWallet = HDWallet(
+        self._hdwallet: HDWallet = Secp256k1HDWallet(
             cryptocurrency=self._cryptocurrency, use_default_path=use_default_path
         )
+        # Account change node public key and chain code per root key, account and change
+        self._account_nodes: Dict[Tuple[str, int, bool], Tuple[str, str]] = {}
 
         super().__init__(cryptocurrency=self._cryptocurrency)
 
@@ -264,6 +319,106 @@ class Wallet(HDWallet):
         self._hdwallet.clean_derivation()
         return self
 
+    def derive_range(self, account: int = 0, change: bool = False, start: int = 0, count: int = 1,
+                     workers: Optional[int] = None) -> List[dict]:
+        """
+        Derive a range of Bitcoin addresses.
+
+        :param account: Bitcoin derivation account, defaults to ``0``.
+        :type account: int
+        :param change: Bitcoin derivation change, defaults to ``False``.
+        :type change: bool
+        :param start: First address index, defaults to ``0``.
+        :type start: int
+        :param count: Number of addresses, defaults to ``1``.
+        :type count: int
+        :param workers: Number of worker processes, defaults to CPU count (``1`` derives in this process).
+        :type workers: int
+
+        :returns: list -- Bitcoin address records of index, address and public key.
+
+        >>> from swap.providers.bitcoin.wallet import Wallet
+        >>> wallet: Wallet = Wallet(network="testnet")
+        >>> wallet.from_entropy("ed0802d701a033776811601dd6c5c4a9")
+        >>> wallet.derive_range(account=0, change=False, start=0, count=2)
+        [{'index': 0, 'address': 'mtvgBj3LTrdD4KxMzHFN4pwCEg1WC6kzQ2', 'public_key': '03f1d68adead0e18c0bac8c107e83b8eff8066ac423a537caea9a872f0997b6293'}, {'index': 1, 'address': 'myERP3A5hLsi6WLuQptgcp9sxjQSxX8QDs', 'public_key': '0347dd1a877d88b994332f90a64bbc203e6310fc8f955fd64f463af00a5dbb5724'}]
+
+        .. note::
+            The account change node is derived once from the root key and cached, addresses are derived
+            from its public key. Ranges over 1000 addresses are split across ``workers`` processes.
+            A watch-only wallet from an account xpublic key (like of ``m/44'/0'/0'``, use ``strict=False``)
+            derives from it as the account node, only account ``0``, other depths raise ``ValueError``.
+            Each address costs one point addition, use ``swap.crypto.set_backend("coincurve")`` for large ranges.
+        """
+
+        root_xprivate_key: Optional[str] = self._hdwallet.root_xprivate_key()
+        root_xpublic_key: Optional[str] = self._hdwallet.root_xpublic_key()
+        if root_xprivate_key is None and root_xpublic_key is None:
+            raise ValueError("Bitcoin wallet has no root key, initialize wallet first.")
+        if root_xprivate_key is None and int(self._hdwallet.root_xpublic_key(encoded=False)[8:10], 16) != 3:
+            # Serialized depth byte, after the four version bytes
+            raise ValueError(f"Invalid Bitcoin '{root_xpublic_key}' xpublic key, "
+                             f"choose only account xpublic key of depth 3 like of m/44'/0'/0' path.")
+        if root_xprivate_key is None and account != 0:
+            raise ValueError(f"Invalid Bitcoin '{account}' account, wallet from xpublic key has only account 0.")
+
+        # Cached by the root key hash, the root xprivate key itself is not kept in the cache
+        key: Tuple[str, int, bool] = (sha256(root_xprivate_key or root_xpublic_key), account, change)
+        if key not in self._account_nodes:
+            if root_xprivate_key is not None:
+                account_node: HDWallet = Secp256k1HDWallet(cryptocurrency=self._cryptocurrency).from_xprivate_key(
+                    xprivate_key=root_xprivate_key
+                ).from_path(
+                    path=config["bip44_path"].format(
+                        account=account, change=(1 if change else 0), address=0
+                    ).rsplit("/", 1)[0]
+                )
+            else:
+                # Hardened account path needs the private key, the xpublic key is the account node itself
+                account_node: HDWallet = Secp256k1HDWallet(cryptocurrency=self._cryptocurrency).from_xpublic_key(
+                    xpublic_key=root_xpublic_key, strict=False
+                ).from_path(path=f"m/{1 if change else 0}")
+            self._account_nodes[key] = (account_node.compressed(), account_node.chain_code())
+
+        public_key, chain_code = self._account_nodes[key]
+        return _derive_range(
+            derive=partial(_derive_addresses, self._network, public_key, chain_code, address_type=self._address_type),
+            start=start, count=count, workers=workers
+        )
+
+    def scan(self, account: int = 0, gap: int = 20, limit: int = 15, workers: Optional[int] = None) -> dict:
+        """
+        Scan Bitcoin account receive and change addresses (BIP44 account discovery).
+
+        :param account: Bitcoin derivation account, defaults to ``0``.
+        :type account: int
+        :param gap: Number of consecutive unused addresses that ends a chain, defaults to ``20``.
+        :type gap: int
+        :param limit: Limit of UTXO's per address, default is 15.
+        :type limit: int
+        :param workers: Number of concurrent requests, defaults to ``gap`` (at most ``32``).
+        :type workers: int
+
+        :returns: dict -- Bitcoin account balance, UTXO's, used addresses and next unused receive and change indexes.
+
+        >>> from swap.providers.bitcoin.wallet import Wallet
+        >>> wallet: Wallet = Wallet(network="testnet")
+        >>> wallet.from_entropy("ed0802d701a033776811601dd6c5c4a9")
+        >>> wallet.scan(account=0, gap=20)
+        {'balance': 100000, 'utxos': [{'hash': '9d60a8b4dd16d4bf02835a21a3e9154e636ba06ad55368f36114eb7e930b35e8', 'output_index': 1, 'amount': 100000, 'script': '76a914e00ff2a640b7ce2d336860739169487a57f84b1588ac', 'address': 'mtvgBj3LTrdD4KxMzHFN4pwCEg1WC6kzQ2', 'address_index': 0, 'change': False}], 'addresses': [{'index': 0, 'address': 'mtvgBj3LTrdD4KxMzHFN4pwCEg1WC6kzQ2', 'public_key': '03f1d68adead0e18c0bac8c107e83b8eff8066ac423a537caea9a872f0997b6293', 'change': False, 'balance': 100000, 'utxos': [...]}], 'receive_index': 1, 'change_index': 0}
+
+        .. note::
+            Addresses are derived with ``derive_range`` and queried ``gap`` at a time, an address is used
+            when it has any transaction. Each chain stops after ``gap`` consecutive unused addresses.
+            Bitcoind backend needs a watch-only wallet with the imported addresses, without it raises ``APIError``.
+        """
+
+        _check_history(network=self._network)
+        return _scan_addresses(
+            derive=partial(self.derive_range, account), activity=partial(_address_activity, self._network, limit),
+            gap=gap, workers=workers
+        )
+
     def strength(self) -> Optional[int]:
         """
         Get Bitcoin strength.
@@ -581,7 +736,9 @@ class Wallet(HDWallet):
         "n1wgm6kkzMcNfAtJmes8YhpvtDzdNhDY5a"
         """
 
-        return self._hdwallet.p2pkh_address()
+        return _public_key_to_address(
+            network=self._network, public_key=self._hdwallet.compressed(), address_type=self._address_type
+        )
 
     def balance(self, unit: str = config["unit"]) -> Union[int, float]:
         """
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+
+from hdwallet.cryptocurrencies import (
+    BitcoinMainnet, BitcoinTestnet
+)
+from typing import (
+    Optional, Union, List, Dict, Tuple
+)
+
+import threading
+import sqlite3
+
+from ...crypto import HDWallet as Secp256k1HDWallet
+from ...utils import _scan_addresses
+from ...exceptions import (
+    NetworkError, UnitError
+)
+from ..config import bitcoin as config
+from .utils import (
+    is_network, amount_unit_converter
+)
+from .rpc import (
+    get_utxos, get_transaction_count, _check_history
+)
+from .wallet import _derive_addresses
+
+# Watch-only wallet SQLite schema.
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS addresses (
+    address TEXT PRIMARY KEY,
+    change INTEGER NOT NULL,
+    address_index INTEGER NOT NULL,
+    public_key TEXT NOT NULL,
+    transaction_count INTEGER,
+    UNIQUE (change, address_index)
+);
+CREATE TABLE IF NOT EXISTS utxos (
+    tx_hash TEXT NOT NULL,
+    tx_output_n INTEGER NOT NULL,
+    address TEXT NOT NULL,
+    value INTEGER NOT NULL,
+    script TEXT NOT NULL,
+    confirmed INTEGER NOT NULL,
+    PRIMARY KEY (tx_hash, tx_output_n)
+);
+CREATE INDEX IF NOT EXISTS utxos_address ON utxos (address);
+"""
+
+
+def _is_confirmed(utxo: dict) -> bool:
+    # Electrum and blockcypher UTXO's have block height, bitcoind UTXO's have confirmations
+    if "confirmations" in utxo:
+        return utxo["confirmations"] > 0
+    return (utxo.get("block_height") or 0) > 0
+
+
+class WatchOnlyWallet:
+    """
+    Bitcoin watch-only wallet, tracks account addresses of a xpublic key with a local UTXO set.
+
+    :param xpublic_key: Bitcoin account xpublic key, at ``m/44'/0'/{account}'`` path.
+    :type xpublic_key: str
+    :param network: Bitcoin network, defaults to ``mainnet``.
+    :type network: str
+    :param database: SQLite database path, defaults to ``:memory:``.
+    :type database: str
+
+    :returns: WatchOnlyWallet -- Bitcoin watch-only wallet instance.
+
+    >>> from swap.providers.bitcoin.watch import WatchOnlyWallet
+    >>> WatchOnlyWallet(xpublic_key="tpubDD6EtPJs9fNuExsbNQaGcjpvYxY5bkF3L3FVYuDFcZHPdUF5UxbhrxDcAWmZyEhq63UXFcGZbWv8At345E16fXBdU2syeff3skPMDDjTy4c", network="testnet", database="watch.sqlite")
+    <swap.providers.bitcoin.watch.WatchOnlyWallet object at 0x040DA268>
+
+    .. note::
+        No private key is needed, addresses are derived from the xpublic key by public derivation.
+        Balance and UTXO's are answered from the SQLite database, call ``sync`` to update it.
+    """
+
+    def __init__(self, xpublic_key: str, network: str = config["network"], database: str = ":memory:"):
+
+        # Check parameter instances
+        if not is_network(network=network):
+            raise NetworkError(f"Invalid Bitcoin '{network}' network",
+                               "choose only 'mainnet' or 'testnet' networks.")
+
+        self._xpublic_key: str = xpublic_key
+        self._network: str = network
+        # Change node public key and chain code of receive and change chains
+        self._change_nodes: Dict[bool, Tuple[str, str]] = {}
+        for change in [False, True]:
+            try:
+                change_node: Secp256k1HDWallet = Secp256k1HDWallet(
+                    cryptocurrency=(BitcoinMainnet if network == "mainnet" else BitcoinTestnet)
+                ).from_xpublic_key(xpublic_key=xpublic_key).from_index(1 if change else 0)
+            except Exception:
+                raise ValueError(f"Invalid Bitcoin '{xpublic_key}' xpublic key.")
+            # Serialized depth byte, after the four version bytes
+            if int(change_node.root_xpublic_key(encoded=False)[8:10], 16) != 3:
+                raise ValueError(f"Invalid Bitcoin '{xpublic_key}' xpublic key, "
+                                 f"choose only account xpublic key of depth 3 like of m/44'/0'/0' path.")
+            self._change_nodes[change] = (change_node.compressed(), change_node.chain_code())
+
+        self._lock: threading.Lock = threading.Lock()
+        self._connection: sqlite3.Connection = sqlite3.connect(database, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.executescript(SCHEMA)
+            meta: Dict[str, str] = dict(self._connection.execute("SELECT key, value FROM meta"))
+            if meta and (meta["xpublic_key"], meta["network"]) != (xpublic_key, network):
+                raise ValueError(f"Invalid '{database}' database, it tracks another xpublic key or network.")
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES (?, ?)",
+                [("xpublic_key", xpublic_key), ("network", network)]
+            )
+
+    def __enter__(self) -> "WatchOnlyWallet":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close SQLite database connection.
+
+        :returns: None.
+        """
+
+        self._connection.close()
+
+    def derive_range(self, change: bool = False, start: int = 0, count: int = 1) -> List[dict]:
+        """
+        Derive a range of Bitcoin addresses, tracked addresses are read from the database.
+
+        :param change: Bitcoin derivation change, defaults to ``False``.
+        :type change: bool
+        :param start: First address index, defaults to ``0``.
+        :type start: int
+        :param count: Number of addresses, defaults to ``1``.
+        :type count: int
+
+        :returns: list -- Bitcoin address records of index, address and public key.
+
+        >>> from swap.providers.bitcoin.watch import WatchOnlyWallet
+        >>> watch_only_wallet: WatchOnlyWallet = WatchOnlyWallet(xpublic_key="tpubDD6EtPJs9fNuExsbNQaGcjpvYxY5bkF3L3FVYuDFcZHPdUF5UxbhrxDcAWmZyEhq63UXFcGZbWv8At345E16fXBdU2syeff3skPMDDjTy4c", network="testnet")
+        >>> watch_only_wallet.derive_range(change=False, start=0, count=1)
+        [{'index': 0, 'address': 'mtvgBj3LTrdD4KxMzHFN4pwCEg1WC6kzQ2', 'public_key': '03f1d68adead0e18c0bac8c107e83b8eff8066ac423a537caea9a872f0997b6293'}]
+
+        .. note::
+            Newly derived addresses are tracked from now on, ``sync`` queries every tracked address.
+        """
+
+        with self._lock:
+            records: Dict[int, dict] = {
+                index: dict(index=index, address=address, public_key=public_key)
+                for index, address, public_key in self._connection.execute(
+                    "SELECT address_index, address, public_key FROM addresses "
+                    "WHERE change = ? AND address_index >= ? AND address_index < ?",
+                    (int(change), start, start + count)
+                )
+            }
+        if len(records) < count:
+            public_key, chain_code = self._change_nodes[change]
+            # Tracked addresses are contiguous from zero, derive from the first missing index
+            first: int = min(set(range(start, start + count)) - set(records))
+            derived: List[dict] = [
+                record for record in _derive_addresses(
+                    self._network, public_key, chain_code, first, (start + count - first)
+                ) if record["index"] not in records
+            ]
+            with self._lock, self._connection:
+                self._connection.executemany(
+                    "INSERT OR IGNORE INTO addresses (address, change, address_index, public_key) VALUES (?, ?, ?, ?)",
+                    [(record["address"], int(change), record["index"], record["public_key"]) for record in derived]
+                )
+            records.update({record["index"]: record for record in derived})
+        return [records[index] for index in sorted(records)]
+
+    def sync(self, gap: int = 20, limit: int = 100, workers: Optional[int] = None) -> dict:
+        """
+        Sync local UTXO set with Bitcoin network.
+
+        :param gap: Number of consecutive unused addresses that ends a chain, defaults to ``20``.
+        :type gap: int
+        :param limit: Limit of UTXO's per address, default is 100.
+        :type limit: int
+        :param workers: Number of concurrent requests, defaults to ``gap`` (at most ``32``).
+        :type workers: int
+
+        :returns: dict -- Bitcoin balance, next unused receive and change indexes and updated addresses.
+
+        >>> from swap.providers.bitcoin.watch import WatchOnlyWallet
+        >>> watch_only_wallet: WatchOnlyWallet = WatchOnlyWallet(xpublic_key="tpubDD6EtPJs9fNuExsbNQaGcjpvYxY5bkF3L3FVYuDFcZHPdUF5UxbhrxDcAWmZyEhq63UXFcGZbWv8At345E16fXBdU2syeff3skPMDDjTy4c", network="testnet")
+        >>> watch_only_wallet.sync(gap=20)
+        {'balance': 100000, 'receive_index': 1, 'change_index': 0, 'updated': ['mtvgBj3LTrdD4KxMzHFN4pwCEg1WC6kzQ2']}
+
+        .. note::
+            Each address costs one transaction count request, UTXO's are fetched again only for addresses
+            with new transactions since the last sync or with unconfirmed UTXO's.
+            Bitcoind backend needs a watch-only wallet with the imported addresses, without it raises ``APIError``.
+        """
+
+        _check_history(network=self._network)
+        with self._lock:
+            known: Dict[str, Tuple[Optional[int], bool]] = {
+                address: (transaction_count, bool(unconfirmed))
+                for address, transaction_count, unconfirmed in self._connection.execute(
+                    "SELECT addresses.address, addresses.transaction_count, "
+                    "SUM(utxos.confirmed = 0) FROM addresses "
+                    "LEFT JOIN utxos ON utxos.address = addresses.address GROUP BY addresses.address"
+                )
+            }
+        updates: Dict[str, Tuple[int, Optional[List[dict]]]] = {}
+
+        def activity(record: dict) -> dict:
+            transaction_count: int = get_transaction_count(address=record["address"], network=self._network)
+            _transaction_count, unconfirmed = known.get(record["address"], (None, False))
+            if transaction_count != _transaction_count or unconfirmed:
+                updates[record["address"]] = (transaction_count, [
+                    dict(
+                        tx_hash=utxo["tx_hash"], tx_output_n=utxo["tx_output_n"], value=utxo["value"],
+                        script=utxo["script"], confirmed=_is_confirmed(utxo)
+                    ) for utxo in get_utxos(
+                        address=record["address"], network=self._network, limit=limit
+                    )
+                ] if transaction_count else [])
+            return dict(used=(transaction_count > 0), balance=0)
+
+        scan: dict = _scan_addresses(
+            derive=self.derive_range, activity=activity, gap=gap, workers=workers
+        )
+        with self._lock, self._connection:
+            for address, (transaction_count, utxos) in updates.items():
+                self._connection.execute(
+                    "UPDATE addresses SET transaction_count = ? WHERE address = ?", (transaction_count, address)
+                )
+                self._connection.execute("DELETE FROM utxos WHERE address = ?", (address,))
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO utxos (tx_hash, tx_output_n, address, value, script, confirmed) "
+                    "VALUES (?, ?, ?, ?, ?, ?)", [(
+                        utxo["tx_hash"], utxo["tx_output_n"], address,
+                        utxo["value"], utxo["script"], int(utxo["confirmed"])
+                    ) for utxo in utxos]
+                )
+        return dict(
+            balance=self.balance(), receive_index=scan["receive_index"],
+            change_index=scan["change_index"], updated=sorted(
+                address for address, (transaction_count, _) in updates.items() if transaction_count
+            )
+        )
+
+    def addresses(self, change: Optional[bool] = None, used: Optional[bool] = None) -> List[dict]:
+        """
+        Get tracked Bitcoin addresses.
+
+        :param change: Only receive (``False``) or change (``True``) addresses, defaults to both.
+        :type change: bool
+        :param used: Only used or unused addresses, defaults to both.
+        :type used: bool
+
+        :returns: list -- Bitcoin address records of index, address, public key, change and transaction count.
+
+        >>> from swap.providers.bitcoin.watch import WatchOnlyWallet
+        >>> watch_only_wallet: WatchOnlyWallet = WatchOnlyWallet(xpublic_key="tpubDD6EtPJs9fNuExsbNQaGcjpvYxY5bkF3L3FVYuDFcZHPdUF5UxbhrxDcAWmZyEhq63UXFcGZbWv8At345E16fXBdU2syeff3skPMDDjTy4c", network="testnet", database="watch.sqlite")
+        >>> watch_only_wallet.addresses(used=True)
+        [{'index': 0, 'address': 'mtvgBj3LTrdD4KxMzHFN4pwCEg1WC6kzQ2', 'public_key': '03f1d68adead0e18c0bac8c107e83b8eff8066ac423a537caea9a872f0997b6293', 'change': False, 'transaction_count': 1}]
+        """
+
+        query, parameters = "SELECT address_index, address, public_key, change, transaction_count FROM addresses", []
+        conditions: List[str] = []
+        if change is not None:
+            conditions.append("change = ?")
+            parameters.append(int(change))
+        if used is not None:
+            conditions.append("transaction_count > 0" if used else "COALESCE(transaction_count, 0) = 0")
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        with self._lock:
+            return [
+                dict(
+                    index=index, address=address, public_key=public_key,
+                    change=bool(_change), transaction_count=transaction_count
+                ) for index, address, public_key, _change, transaction_count in self._connection.execute(
+                    query + " ORDER BY change, address_index", parameters
+                )
+            ]
+
+    def balance(self, address: Optional[str] = None, unit: str = config["unit"]) -> Union[int, float]:
+        """
+        Get Bitcoin balance from the local UTXO set.
+
+        :param address: Only UTXO's of this tracked address, defaults to all addresses.
+        :type address: str
+        :param unit: Bitcoin unit, default to ``Satoshi``.
+        :type unit: str
+
+        :return: int, float -- Bitcoin balance.
+
+        >>> from swap.providers.bitcoin.watch import WatchOnlyWallet
+        >>> watch_only_wallet: WatchOnlyWallet = WatchOnlyWallet(xpublic_key="tpubDD6EtPJs9fNuExsbNQaGcjpvYxY5bkF3L3FVYuDFcZHPdUF5UxbhrxDcAWmZyEhq63UXFcGZbWv8At345E16fXBdU2syeff3skPMDDjTy4c", network="testnet", database="watch.sqlite")
+        >>> watch_only_wallet.balance(unit="BTC")
+        0.001
+        """
+
+        if unit not in ["BTC", "mBTC", "Satoshi"]:
+            raise UnitError("Invalid Bitcoin unit, choose only 'BTC', 'mBTC' or 'Satoshi' units.")
+        with self._lock:
+            balance: int = self._connection.execute(
+                "SELECT COALESCE(SUM(value), 0) FROM utxos" + (" WHERE address = ?" if address else ""),
+                ((address,) if address else ())
+            ).fetchone()[0]
+        return balance if unit == "Satoshi" else \
+            amount_unit_converter(amount=balance, unit_from=f"Satoshi2{unit}")
+
+    def utxos(self, address: Optional[str] = None, limit: Optional[int] = None) -> List[dict]:
+        """
+        Get Bitcoin unspent transaction outputs (UTXO's) from the local UTXO set.
+
+        :param address: Only UTXO's of this tracked address, defaults to all addresses.
+        :type address: str
+        :param limit: Limit of UTXO's, defaults to all.
+        :type limit: int
+
+        :returns: list -- Bitcoin UTXO's, largest value first.
+
+        >>> from swap.providers.bitcoin.watch import WatchOnlyWallet
+        >>> from swap.providers.bitcoin.transaction import NormalTransaction
+        >>> watch_only_wallet: WatchOnlyWallet = WatchOnlyWallet(xpublic_key="tpubDD6EtPJs9fNuExsbNQaGcjpvYxY5bkF3L3FVYuDFcZHPdUF5UxbhrxDcAWmZyEhq63UXFcGZbWv8At345E16fXBdU2syeff3skPMDDjTy4c", network="testnet", database="watch.sqlite")
+        >>> watch_only_wallet.utxos(address="mtvgBj3LTrdD4KxMzHFN4pwCEg1WC6kzQ2")
+        [{'tx_hash': '9d60a8b4dd16d4bf02835a21a3e9154e636ba06ad55368f36114eb7e930b35e8', 'tx_output_n': 1, 'value': 100000, 'script': '76a91493162bcadf4406af6429b59958964f625d550fcd88ac', 'address': 'mtvgBj3LTrdD4KxMzHFN4pwCEg1WC6kzQ2', 'confirmed': True}]
+        >>> normal_transaction: NormalTransaction = NormalTransaction(network="testnet")
+        >>> normal_transaction.build_transaction(address="mtvgBj3LTrdD4KxMzHFN4pwCEg1WC6kzQ2", recipients={"2N6kHwQy6Ph5EdKNgzGrcW2WhGHKGfmP5ae": 10000}, utxos=watch_only_wallet.utxos(address="mtvgBj3LTrdD4KxMzHFN4pwCEg1WC6kzQ2"))
+        <swap.providers.bitcoin.transaction.NormalTransaction object at 0x0409DAF0>
+
+        .. note::
+            UTXO's have the ``get_utxos`` keys, pass them as ``utxos`` of transaction builders.
+        """
+
+        with self._lock:
+            return [
+                dict(
+                    tx_hash=tx_hash, tx_output_n=tx_output_n, value=value,
+                    script=script, address=_address, confirmed=bool(confirmed)
+                ) for tx_hash, tx_output_n, value, script, _address, confirmed in self._connection.execute(
+                    "SELECT tx_hash, tx_output_n, value, script, address, confirmed FROM utxos" +
+                    (" WHERE address = ?" if address else "") + " ORDER BY value DESC, tx_hash, tx_output_n" +
+                    (" LIMIT ?" if limit is not None else ""),
+                    ((address,) if address else ()) + ((limit,) if limit is not None else ())
+                )
+            ]
@@ -1,15 +1,12 @@
 #!/usr/bin/env python3
 
-from base64 import (
-    b64encode, b64decode
-)
 from typing import (
-    Optional, Union, List
+    Optional, Union, List, Callable
 )
 
-import json
-
-from ...utils import clean_transaction_raw
+from ...utils import (
+    TransactionEnvelope, clean_transaction_raw, encode_transaction_raw, load_transaction_raw, _sign_many
+)
 from ...exceptions import (
     TransactionRawError, NetworkError, UnitError
 )
@@ -20,7 +17,7 @@ from .solver import (
 )
 from .rpc import decode_raw
 from .utils import (
-    is_network, is_transaction_raw, amount_unit_converter
+    is_network, is_transaction_raw, amount_unit_converter, sign_unsigned_datas
 )
 
 
@@ -160,13 +157,14 @@ class Signature(Transaction):
             raise ValueError("Type is none, sign unsigned transaction raw first.")
         return self._type
 
-    def sign(self, transaction_raw: str, solver: Union[NormalSolver, FundSolver, WithdrawSolver, RefundSolver]) \
+    def sign(self, transaction_raw: Union[str, TransactionEnvelope],
+             solver: Union[NormalSolver, FundSolver, WithdrawSolver, RefundSolver]) \
             -> Union["NormalSignature", "FundSignature", "WithdrawSignature", "RefundSignature"]:
         """
         Sign unsigned transaction raw.
 
-        :param transaction_raw: Bytom unsigned transaction raw.
-        :type transaction_raw: str
+        :param transaction_raw: Bytom unsigned transaction raw or transaction envelope.
+        :type transaction_raw: str, swap.utils.TransactionEnvelope
         :param solver: Bytom solver
         :type solver: bytom.solver.NormalSolver, bytom.solver.FundSolver, bytom.solver.WithdrawSolver, bytom.solver.RefundSolver
 
@@ -181,29 +179,26 @@ class Signature(Transaction):
         <swap.providers.bytom.signature.FundSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Bytom unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         self._type = loaded_transaction_raw["type"]
         if loaded_transaction_raw["type"] == "bytom_normal_unsigned":
             return NormalSignature(network=self._network).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "bytom_fund_unsigned":
             return FundSignature(network=self._network).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "bytom_withdraw_unsigned":
             return WithdrawSignature(network=self._network).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "bytom_refund_unsigned":
             return RefundSignature(network=self._network).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
 
     def unsigned_datas(self) -> List[dict]:
@@ -282,12 +277,12 @@ class NormalSignature(Signature):
     def __init__(self, network: str = config["network"]):
         super().__init__(network=network)
 
-    def sign(self, transaction_raw: str, solver: NormalSolver) -> "NormalSignature":
+    def sign(self, transaction_raw: Union[str, TransactionEnvelope], solver: NormalSolver) -> "NormalSignature":
         """
         Sign unsigned normal transaction raw.
 
-        :param transaction_raw: Bytom unsigned normal transaction raw.
-        :type transaction_raw: str
+        :param transaction_raw: Bytom unsigned normal transaction raw or transaction envelope.
+        :type transaction_raw: str, swap.utils.TransactionEnvelope
         :param solver: Bytom normal solver.
         :type solver: bytom.solver.NormalSolver
 
@@ -303,13 +298,10 @@ class NormalSignature(Signature):
         <swap.providers.bytom.signature.NormalSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Bytom unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if not loaded_transaction_raw["type"] == "bytom_normal_unsigned":
             raise TypeError(f"Invalid Bytom normal unsigned transaction raw type, "
                             f"you can't sign {loaded_transaction_raw['type']} type by using normal signature.")
@@ -326,27 +318,16 @@ class NormalSignature(Signature):
 
         # Set recipient wallet
         wallet, path, indexes = solver.solve()
-        # Clean derivation indexes/path
-        wallet.clean_derivation()
-        # Sign normal transaction
-        for unsigned in self.unsigned_datas():
-            signed_data = list()
-            unsigned_datas = unsigned["datas"]
-            if unsigned["path"]:
-                wallet.from_path(unsigned["path"])
-            elif path:
-                wallet.from_path(path)
-            elif indexes:
-                wallet.from_indexes(indexes)
-            for unsigned_data in unsigned_datas:
-                signed_data.append(wallet.sign(unsigned_data))
-            self._signatures.append(signed_data)
-            wallet.clean_derivation()
+        # Sign normal transaction, deriving each path once
+        for signed_datas in sign_unsigned_datas(
+            xprivate_key=wallet.xprivate_key(), unsigned_datas=self.unsigned_datas(), path=path, indexes=indexes
+        ):
+            self._signatures.append(signed_datas)
 
         # Set transaction type
         self._type = "bytom_normal_signed"
         # Encode normal transaction raw
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = encode_transaction_raw(transaction=dict(
             fee=self._fee,
             address=self._transaction["address"],
             raw=self.raw(),
@@ -355,7 +336,7 @@ class NormalSignature(Signature):
             signatures=self.signatures(),
             network=self._network,
             type=self._type
-        ))).encode()).decode()
+        ), binary=loaded_transaction_raw.binary)
         return self
 
 
@@ -372,12 +353,12 @@ class FundSignature(Signature):
     def __init__(self, network: str = config["network"]):
         super().__init__(network=network)
 
-    def sign(self, transaction_raw: str, solver: FundSolver) -> "FundSignature":
+    def sign(self, transaction_raw: Union[str, TransactionEnvelope], solver: FundSolver) -> "FundSignature":
         """
         Sign unsigned fund transaction raw.
 
-        :param transaction_raw: Bytom unsigned fund transaction raw.
-        :type transaction_raw: str
+        :param transaction_raw: Bytom unsigned fund transaction raw or transaction envelope.
+        :type transaction_raw: str, swap.utils.TransactionEnvelope
         :param solver: Bytom fund solver.
         :type solver: bytom.solver.FundSolver
 
@@ -392,13 +373,10 @@ class FundSignature(Signature):
         <swap.providers.bytom.signature.FundSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Bytom unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if not loaded_transaction_raw["type"] == "bytom_fund_unsigned":
             raise TypeError(f"Invalid Bytom fund unsigned transaction raw type, "
                             f"you can't sign {loaded_transaction_raw['type']} type by using fund signature.")
@@ -415,27 +393,16 @@ class FundSignature(Signature):
 
         # Set recipient wallet
         wallet, path, indexes = solver.solve()
-        # Clean derivation indexes/path
-        wallet.clean_derivation()
-        # Sign fund transaction
-        for unsigned in self.unsigned_datas():
-            signed_data = list()
-            unsigned_datas = unsigned["datas"]
-            if unsigned["path"]:
-                wallet.from_path(unsigned["path"])
-            elif path:
-                wallet.from_path(path)
-            elif indexes:
-                wallet.from_indexes(indexes)
-            for unsigned_data in unsigned_datas:
-                signed_data.append(wallet.sign(unsigned_data))
-            self._signatures.append(signed_data)
-            wallet.clean_derivation()
+        # Sign fund transaction, deriving each path once
+        for signed_datas in sign_unsigned_datas(
+            xprivate_key=wallet.xprivate_key(), unsigned_datas=self.unsigned_datas(), path=path, indexes=indexes
+        ):
+            self._signatures.append(signed_datas)
 
         # Set transaction type
         self._type = "bytom_fund_signed"
         # Encode fund transaction raw
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = encode_transaction_raw(transaction=dict(
             fee=self._fee,
             address=self._transaction["address"],
             raw=self.raw(),
@@ -444,7 +411,7 @@ class FundSignature(Signature):
             signatures=self.signatures(),
             network=self._network,
             type=self._type,
-        ))).encode()).decode()
+        ), binary=loaded_transaction_raw.binary)
         return self
 
 
@@ -461,12 +428,12 @@ class WithdrawSignature(Signature):
     def __init__(self, network: str = config["network"]):
         super().__init__(network=network)
 
-    def sign(self, transaction_raw: str, solver: WithdrawSolver) -> "WithdrawSignature":
+    def sign(self, transaction_raw: Union[str, TransactionEnvelope], solver: WithdrawSolver) -> "WithdrawSignature":
         """
         Sign unsigned withdraw transaction raw.
 
-        :param transaction_raw: Bytom unsigned withdraw transaction raw.
-        :type transaction_raw: str
+        :param transaction_raw: Bytom unsigned withdraw transaction raw or transaction envelope.
+        :type transaction_raw: str, swap.utils.TransactionEnvelope
         :param solver: Bytom withdraw solver.
         :type solver: bytom.solver.WithdrawSolver
 
@@ -482,13 +449,10 @@ class WithdrawSignature(Signature):
         <swap.providers.bytom.signature.WithdrawSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Bytom unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if not loaded_transaction_raw["type"] == "bytom_withdraw_unsigned":
             raise TypeError(f"Invalid Bytom withdraw unsigned transaction raw type, "
                             f"you can't sign {loaded_transaction_raw['type']} type by using withdraw signature.")
@@ -505,30 +469,20 @@ class WithdrawSignature(Signature):
 
         # Set recipient wallet
         wallet, secret, path, indexes = solver.solve()
-        # Clean derivation indexes/path
-        wallet.clean_derivation()
-        # Sign withdraw transaction
-        for index, unsigned in enumerate(self.unsigned_datas()):
-            signed_data = list()
-            unsigned_datas = unsigned["datas"]
-            if unsigned["path"]:
-                wallet.from_path(unsigned["path"])
-            elif path:
-                wallet.from_path(path)
-            elif indexes:
-                wallet.from_indexes(indexes)
-            for unsigned_data in unsigned_datas:
-                signed_data.append(bytearray(secret.encode()).hex())
-                signed_data.append(wallet.sign(unsigned_data))
-                signed_data.append(str("00"))
-                signed_data.append(solver.witness(self._network))
+        witness: str = solver.witness(self._network)
+        # Sign withdraw transaction, deriving each path once
+        for signed_datas in sign_unsigned_datas(
+            xprivate_key=wallet.xprivate_key(), unsigned_datas=self.unsigned_datas(), path=path, indexes=indexes
+        ):
+            signed_data = []
+            for signature in signed_datas:
+                signed_data.extend([bytearray(secret.encode()).hex(), signature, str("00"), witness])
             self._signatures.append(signed_data)
-            wallet.clean_derivation()
 
         # Set transaction type
         self._type = "bytom_withdraw_signed"
         # Encode withdraw transaction raw
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = encode_transaction_raw(transaction=dict(
             fee=self._fee,
             address=self._transaction["address"],
             raw=self.raw(),
@@ -537,7 +491,7 @@ class WithdrawSignature(Signature):
             signatures=self.signatures(),
             network=self._network,
             type=self._type
-        ))).encode()).decode()
+        ), binary=loaded_transaction_raw.binary)
         return self
 
 
@@ -554,12 +508,12 @@ class RefundSignature(Signature):
     def __init__(self, network: str = config["network"]):
         super().__init__(network=network)
 
-    def sign(self, transaction_raw: str, solver: RefundSolver) -> "RefundSignature":
+    def sign(self, transaction_raw: Union[str, TransactionEnvelope], solver: RefundSolver) -> "RefundSignature":
         """
         Sign unsigned refund transaction raw.
 
-        :param transaction_raw: Bytom unsigned refund transaction raw.
-        :type transaction_raw: str
+        :param transaction_raw: Bytom unsigned refund transaction raw or transaction envelope.
+        :type transaction_raw: str, swap.utils.TransactionEnvelope
         :param solver: Bytom refund solver.
         :type solver: bytom.solver.RefundSolver
         
@@ -575,13 +529,10 @@ class RefundSignature(Signature):
         <swap.providers.bytom.signature.RefundSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Bytom unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if not loaded_transaction_raw["type"] == "bytom_refund_unsigned":
             raise TypeError(f"Invalid Bytom refund unsigned transaction raw type, "
                             f"you can't sign {loaded_transaction_raw['type']} type by using refund signature.")
@@ -598,28 +549,19 @@ class RefundSignature(Signature):
 
         # Set recipient wallet
         wallet, path, indexes = solver.solve()
-        # Clean derivation indexes/path
-        wallet.clean_derivation()
-        # Sign refund transaction
-        for index, unsigned in enumerate(self.unsigned_datas()):
-            signed_data = list()
-            unsigned_datas = unsigned["datas"]
-            if unsigned["path"]:
-                wallet.from_path(unsigned["path"])
-            elif path:
-                wallet.from_path(path)
-            elif indexes:
-                wallet.from_indexes(indexes)
-            for unsigned_data in unsigned_datas:
-                signed_data.append(wallet.sign(unsigned_data))
-                signed_data.append(str("01"))
-                signed_data.append(solver.witness(self._network))
+        witness: str = solver.witness(self._network)
+        # Sign refund transaction, deriving each path once
+        for signed_datas in sign_unsigned_datas(
+            xprivate_key=wallet.xprivate_key(), unsigned_datas=self.unsigned_datas(), path=path, indexes=indexes
+        ):
+            signed_data = []
+            for signature in signed_datas:
+                signed_data.extend([signature, str("01"), witness])
             self._signatures.append(signed_data)
-            wallet.clean_derivation()
 
         # Encode refund transaction raw
         self._type = "bytom_refund_signed"
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = encode_transaction_raw(transaction=dict(
             fee=self._fee,
             address=self._transaction["address"],
             raw=self.raw(),
@@ -628,5 +570,38 @@ class RefundSignature(Signature):
             signatures=self.signatures(),
             network=self._network,
             type=self._type
-        ))).encode()).decode()
+        ), binary=loaded_transaction_raw.binary)
         return self
+
+
+def sign_many(transaction_raws: List[Union[str, TransactionEnvelope]], solver_factory: Callable,
+              workers: Optional[int] = None, network: str = config["network"]) -> List[dict]:
+    """
+    Sign many Bytom unsigned transaction raws over a process pool.
+
+    :param transaction_raws: Bytom unsigned transaction raws or transaction envelopes.
+    :type transaction_raws: list
+    :param solver_factory: Picklable callable, called once per worker, returning a Bytom solver or a callable that takes the transaction envelope and returns its solver.
+    :type solver_factory: callable
+    :param workers: Number of worker processes, defaults to CPU count (``1`` signs in this process).
+    :type workers: int
+    :param network: Bytom network, defaults to ``mainnet``.
+    :type network: str
+
+    :returns: list -- Bytom signed transaction raw and error per transaction raw, in input order.
+
+    >>> from functools import partial
+    >>> from swap.providers.bytom.signature import sign_many
+    >>> from swap.providers.bytom.solver import FundSolver
+    >>> unsigned_fund_transaction_raw: str = "eyJmZWUiOiA0NDkwMDAsICJhZGRyZXNzIjogImJtMXFrOXZqNGphZXpsY25qZGNrZHM0ZmttOGZ3djVrYXdtcTlxcnVmeCIsICJyYXciOiAiMDcwMTAwMDEwMTVmMDE1ZGY3ZGY0ZDA2YTNmZTNjOGFjNjQzOGYyNWY5Yzk3NzQ0YTEwNDU1MzU3ODU3Nzc1NTI2YzNlNmM3NTJmYjY5ZWFmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmOThhM2IxNWEwMTAxMTYwMDE0YjE1OTJhY2JiOTE3ZjEzOTM3MTY2YzJhOWI2Y2U5NzMyOTZlYmI2MDIyMDEyMGZlNmIzZmQ0NDU4MjkxYjE5NjA1ZDkyODM3YWUxMDYwY2MwMjM3ZTY4MDIyYjJlYjlmYWYwMWExMTgyMjYyMTIwMjAxNDhmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmODBhZGUyMDQwMTIyMDAyMGU3ZjRhOTgxNWYzYTM2YzYxNmM1NjY2Yjk3ZmI3ZmRhY2QzNzIwYzExN2QwNzhjNDI5NDk0ZDFiNjE3ZmU3ZDQwMDAxM2NmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmYjBjMmIzNTUwMTE2MDAxNGIxNTkyYWNiYjkxN2YxMzkzNzE2NmMyYTliNmNlOTczMjk2ZWJiNjAwMCIsICJoYXNoIjogImEzMDc4YWYwODEwYzY4YTdiYjZmMmY0MmNkNjdkY2U5ZGVhM2Q3NzAyOGNhMGM1MjcyMjRlNDUyNDAzOGFiYzQiLCAidW5zaWduZWRfZGF0YXMiOiBbeyJkYXRhcyI6IFsiZjQyYTJiNmUxNTU4NWI4OGRhOGIzNDIzN2M3YTZmZDgzYWYxMmVlNjk3MTgxM2Q2NmNmNzk0YTYzZWJjYzE2ZiJdLCAicHVibGljX2tleSI6ICJmZTZiM2ZkNDQ1ODI5MWIxOTYwNWQ5MjgzN2FlMTA2MGNjMDIzN2U2ODAyMmIyZWI5ZmFmMDFhMTE4MjI2MjEyIiwgIm5ldHdvcmsiOiAibWFpbm5ldCIsICJwYXRoIjogIm0vNDQvMTUzLzEvMC8xIn1dLCAic2lnbmF0dXJlcyI6IFtdLCAibmV0d29yayI6ICJtYWlubmV0IiwgInR5cGUiOiAiYnl0b21fZnVuZF91bnNpZ25lZCJ9"
+    >>> sign_many(transaction_raws=[unsigned_fund_transaction_raw, "meheret"], solver_factory=partial(FundSolver, xprivate_key="58775359b7b3588dcdc1bcf373489fa1272cacc03909f78469657b0208e66e46daedfdd0fd8f8df14e2084c7e8df4701db3062dded1c713e0aae734ac09c4afd"), workers=2, network="mainnet")
+    [{'transaction_raw': '...', 'error': None}, {'transaction_raw': None, 'error': 'TransactionRawError: Invalid transaction raw., ...'}]
+
+    .. note::
+        One failing transaction raw doesn't fail the batch, its error is reported with ``transaction_raw`` as ``None``.
+    """
+
+    return _sign_many(
+        signature=Signature, signature_kwargs=dict(network=network),
+        transaction_raws=transaction_raws, solver_factory=solver_factory, workers=workers
+    )
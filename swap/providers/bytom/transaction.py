@@ -7,14 +7,11 @@ from pybytom.transaction.actions import (
 from pybytom.wallet.tools import (
     indexes_to_path, get_program, get_address
 )
-from base64 import b64encode
 from typing import (
     Optional, Union, List
 )
 
-import json
-
-from ...utils import clean_transaction_raw
+from ...utils import encode_transaction_raw
 from ...exceptions import (
     AddressError, BalanceError, NetworkError, UnitError
 )
@@ -28,7 +25,7 @@ from .solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
 )
 from .utils import (
-    amount_unit_converter, is_network, is_address
+    amount_unit_converter, is_network, is_address, sign_unsigned_datas, build_local_transaction
 )
 
 
@@ -255,7 +252,7 @@ class NormalTransaction(Transaction):
         super().__init__(network)
 
     def build_transaction(self, address: str, recipients: dict, asset: Union[str, AssetNamespace] = config["asset"],
-                          unit: str = config["unit"]) -> "NormalTransaction":
+                          unit: str = config["unit"], utxos: Optional[List[dict]] = None) -> "NormalTransaction":
         """
         Build Bytom normal transaction.
 
@@ -267,6 +264,8 @@ class NormalTransaction(Transaction):
         :type asset: str, bytom.assets.AssetNamespace
         :param unit: Bytom unit, default to ``NEU``.
         :type unit: str
+        :param utxos: Bytom sender UTXO's to build transaction locally, defaults to ``None``.
+        :type utxos: list
 
         :returns: NormalTransaction -- Bytom normal transaction instance.
 
@@ -293,6 +292,18 @@ class NormalTransaction(Transaction):
             )
         )
 
+        # Build transaction locally from sender UTXO's
+        if utxos is not None:
+            self._transaction = build_local_transaction(
+                address=self._address, utxos=utxos, recipients={
+                    _address: (_amount if unit == "NEU" else amount_unit_converter(
+                        amount=_amount, unit_from=f"{unit}2NEU"
+                    )) for _address, _amount in recipients.items()
+                }, asset=self._asset, network=self._network
+            )
+            self._fee, self._type = self._transaction["tx"]["fee"], "bytom_normal_unsigned"
+            return self
+
         amount: int = get_balance(self._address, self._asset)
         if amount < self._amount:
             raise BalanceError(
@@ -367,31 +378,23 @@ class NormalTransaction(Transaction):
 
         # Setting sender wallet
         wallet, path, indexes = solver.solve()
-        # Clean derivation indexes/path
-        wallet.clean_derivation()
-        # Signing normal transaction
-        for unsigned in self.unsigned_datas(detail=True):
-            signed_data = []
-            unsigned_datas = unsigned["datas"]
-            if unsigned["path"]:
-                wallet.from_path(unsigned["path"])
-            elif path:
-                wallet.from_path(path)
-            elif indexes:
-                wallet.from_indexes(indexes)
-            for unsigned_data in unsigned_datas:
-                signed_data.append(wallet.sign(unsigned_data))
-            self._signatures.append(signed_data)
-            wallet.clean_derivation()
+        # Signing normal transaction, deriving each path once
+        for signed_datas in sign_unsigned_datas(
+            xprivate_key=wallet.xprivate_key(), unsigned_datas=self.unsigned_datas(), path=path, indexes=indexes
+        ):
+            self._signatures.append(signed_datas)
 
         # Set transaction type
         self._type = "bytom_normal_signed"
         return self
 
-    def transaction_raw(self) -> str:
+    def transaction_raw(self, binary: bool = False) -> str:
         """
         Get Bytom normal transaction raw.
 
+        :param binary: Encode as compact binary envelope, defaults to ``False``.
+        :type binary: bool
+
         :returns: str -- Bytom normal transaction raw.
 
         >>> from swap.providers.bytom.transaction import NormalTransaction
@@ -407,7 +410,7 @@ class NormalTransaction(Transaction):
 
         # Encode normal transaction raw
         if self._type == "bytom_normal_signed":
-            return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            return encode_transaction_raw(transaction=dict(
                 fee=self._fee,
                 address=self._address,
                 raw=self.raw(),
@@ -418,8 +421,8 @@ class NormalTransaction(Transaction):
                 signatures=self.signatures(),
                 network=self._network,
                 type=self._type,
-            ))).encode()).decode())
-        return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            ), binary=binary)
+        return encode_transaction_raw(transaction=dict(
             fee=self._fee,
             address=self._address,
             raw=self.raw(),
@@ -430,7 +433,7 @@ class NormalTransaction(Transaction):
             signatures=[],
             network=self._network,
             type=self._type,
-        ))).encode()).decode())
+        ), binary=binary)
 
 
 class FundTransaction(Transaction):
@@ -452,7 +455,7 @@ class FundTransaction(Transaction):
         self._contract_address: Optional[str] = None
 
     def build_transaction(self, address: str, htlc: HTLC, amount: Union[int, float], asset: Union[str, AssetNamespace] = config["asset"],
-                          unit: str = config["unit"]) -> "FundTransaction":
+                          unit: str = config["unit"], utxos: Optional[List[dict]] = None) -> "FundTransaction":
         """
         Build Bytom fund transaction.
 
@@ -466,6 +469,8 @@ class FundTransaction(Transaction):
         :type asset: str, bytom.assets.AssetNamespace
         :param unit: Bytom unit, default to ``NEU``.
         :type unit: str
+        :param utxos: Bytom sender UTXO's to build transaction locally, defaults to ``None``.
+        :type utxos: list
 
         :returns: FundTransaction -- Bytom fund transaction instance.
 
@@ -496,6 +501,16 @@ class FundTransaction(Transaction):
             )
         )
 
+        # Build transaction locally from sender UTXO's
+        if utxos is not None:
+            self._transaction = build_local_transaction(
+                address=self._address, utxos=utxos, recipients={
+                    self._contract_address: self._amount
+                }, asset=self._asset, network=self._network
+            )
+            self._fee, self._type = self._transaction["tx"]["fee"], "bytom_fund_unsigned"
+            return self
+
         amount: int = get_balance(self._address, self._asset)
         if amount < self._amount:
             raise BalanceError(
@@ -567,31 +582,23 @@ class FundTransaction(Transaction):
 
         # Setting sender wallet
         wallet, path, indexes = solver.solve()
-        # Clean derivation indexes/path
-        wallet.clean_derivation()
-        # Signing fund transaction
-        for unsigned in self.unsigned_datas(detail=True):
-            signed_data = []
-            unsigned_datas = unsigned["datas"]
-            if unsigned["path"]:
-                wallet.from_path(unsigned["path"])
-            elif path:
-                wallet.from_path(path)
-            elif indexes:
-                wallet.from_indexes(indexes)
-            for unsigned_data in unsigned_datas:
-                signed_data.append(wallet.sign(unsigned_data))
-            self._signatures.append(signed_data)
-            wallet.clean_derivation()
+        # Signing fund transaction, deriving each path once
+        for signed_datas in sign_unsigned_datas(
+            xprivate_key=wallet.xprivate_key(), unsigned_datas=self.unsigned_datas(), path=path, indexes=indexes
+        ):
+            self._signatures.append(signed_datas)
 
         # Set transaction type
         self._type = "bytom_fund_signed"
         return self
 
-    def transaction_raw(self) -> str:
+    def transaction_raw(self, binary: bool = False) -> str:
         """
         Get Bytom fund transaction raw.
 
+        :param binary: Encode as compact binary envelope, defaults to ``False``.
+        :type binary: bool
+
         :returns: str -- Bytom fund transaction raw.
 
         >>> from swap.providers.bytom.htlc import HTLC
@@ -610,7 +617,7 @@ class FundTransaction(Transaction):
 
         # Encode fund transaction raw
         if self._type == "bytom_fund_signed":
-            return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            return encode_transaction_raw(transaction=dict(
                 fee=self._fee,
                 address=self._address,
                 raw=self.raw(),
@@ -621,8 +628,8 @@ class FundTransaction(Transaction):
                 signatures=self.signatures(),
                 network=self._network,
                 type=self._type,
-            ))).encode()).decode())
-        return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            ), binary=binary)
+        return encode_transaction_raw(transaction=dict(
             fee=self._fee,
             address=self._address,
             raw=self.raw(),
@@ -633,7 +640,7 @@ class FundTransaction(Transaction):
             signatures=[],
             network=self._network,
             type=self._type,
-        ))).encode()).decode())
+        ), binary=binary)
 
 
 class WithdrawTransaction(Transaction):
@@ -657,7 +664,8 @@ class WithdrawTransaction(Transaction):
         self._htlc_utxo: Optional[dict] = None
 
     def build_transaction(self, address: str, transaction_hash: str,
-                          asset: Union[str, AssetNamespace] = config["asset"]) -> "WithdrawTransaction":
+                          asset: Union[str, AssetNamespace] = config["asset"],
+                          utxo: Optional[dict] = None) -> "WithdrawTransaction":
         """
         Build Bytom withdraw transaction.
 
@@ -667,6 +675,8 @@ class WithdrawTransaction(Transaction):
         :type transaction_hash: str
         :param asset: Bytom asset id, defaults to ``BTM``.
         :type asset: str, bytom.assets.AssetNamespace
+        :param utxo: Bytom funded HTLC UTXO to build transaction locally, defaults to ``None``.
+        :type utxo: dict
 
         :returns: WithdrawTransaction -- Bytom withdraw transaction instance.
 
@@ -685,6 +695,19 @@ class WithdrawTransaction(Transaction):
             address, (str(asset.ID) if isinstance(asset, AssetNamespace) else asset),
             config["confirmations"], transaction_hash
         )
+        # Build transaction locally from funded HTLC UTXO
+        if utxo is not None:
+            self._htlc_utxo = dict(utxo, address=get_address(
+                program=utxo.get("program", utxo.get("control_program")), network=self._network, vapor=False
+            ))
+            self._transaction = build_local_transaction(
+                address=self._address, utxos=[utxo], network=self._network
+            )
+            self._amount, self._fee, self._type = (
+                int(self._htlc_utxo["amount"]), self._transaction["tx"]["fee"], "bytom_withdraw_unsigned"
+            )
+            return self
+
         # Get transaction
         self._transaction_detail = get_transaction(
             transaction_hash=self._transaction_hash, network=self._network
@@ -753,34 +776,27 @@ class WithdrawTransaction(Transaction):
 
         # Set recipient wallet
         wallet, secret, path, indexes = solver.solve()
-        # Clean derivation indexes/path
-        wallet.clean_derivation()
-        # Sign withdraw transaction
-        for index, unsigned in enumerate(self.unsigned_datas(detail=True)):
+        witness: str = solver.witness(self._network)
+        # Sign withdraw transaction, deriving each path once
+        for signed_datas in sign_unsigned_datas(
+            xprivate_key=wallet.xprivate_key(), unsigned_datas=self.unsigned_datas(), path=path, indexes=indexes
+        ):
             signed_data = []
-            unsigned_datas = unsigned["datas"]
-            if unsigned["path"]:
-                wallet.from_path(unsigned["path"])
-            elif path:
-                wallet.from_path(path)
-            elif indexes:
-                wallet.from_indexes(indexes)
-            for unsigned_data in unsigned_datas:
-                signed_data.append(bytearray(secret.encode()).hex())
-                signed_data.append(wallet.sign(unsigned_data))
-                signed_data.append(str("00"))
-                signed_data.append(solver.witness(self._network))
+            for signature in signed_datas:
+                signed_data.extend([bytearray(secret.encode()).hex(), signature, str("00"), witness])
             self._signatures.append(signed_data)
-            wallet.clean_derivation()
 
         # Set transaction type
         self._type = "bytom_withdraw_signed"
         return self
 
-    def transaction_raw(self) -> str:
+    def transaction_raw(self, binary: bool = False) -> str:
         """
         Get Bytom withdraw transaction raw.
 
+        :param binary: Encode as compact binary envelope, defaults to ``False``.
+        :type binary: bool
+
         :returns: str -- Bytom withdraw transaction raw.
 
         >>> from swap.providers.bytom.transaction import WithdrawTransaction
@@ -796,7 +812,7 @@ class WithdrawTransaction(Transaction):
 
         # Encode withdraw transaction raw
         if self._type == "bytom_withdraw_signed":
-            return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            return encode_transaction_raw(transaction=dict(
                 fee=self._fee,
                 address=self._htlc_utxo["address"],
                 raw=self.raw(),
@@ -807,8 +823,8 @@ class WithdrawTransaction(Transaction):
                 signatures=self.signatures(),
                 network=self._network,
                 type=self._type
-            ))).encode()).decode())
-        return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            ), binary=binary)
+        return encode_transaction_raw(transaction=dict(
             fee=self._fee,
             address=self._htlc_utxo["address"],
             raw=self.raw(),
@@ -819,7 +835,7 @@ class WithdrawTransaction(Transaction):
             signatures=[],
             network=self._network,
             type=self._type
-        ))).encode()).decode())
+        ), binary=binary)
 
 
 class RefundTransaction(Transaction):
@@ -843,7 +859,8 @@ class RefundTransaction(Transaction):
         self._htlc_utxo: Optional[dict] = None
 
     def build_transaction(self, address: str, transaction_hash: str,
-                          asset: Union[str, AssetNamespace] = config["asset"]) -> "RefundTransaction":
+                          asset: Union[str, AssetNamespace] = config["asset"],
+                          utxo: Optional[dict] = None) -> "RefundTransaction":
         """
         Build Bytom refund transaction.
 
@@ -853,6 +870,8 @@ class RefundTransaction(Transaction):
         :type transaction_hash: str
         :param asset: Bytom asset id, defaults to ``BTM``.
         :type asset: str, bytom.assets.AssetNamespace
+        :param utxo: Bytom funded HTLC UTXO to build transaction locally, defaults to ``None``.
+        :type utxo: dict
 
         :returns: RefundTransaction -- Bytom refund transaction instance.
 
@@ -871,6 +890,19 @@ class RefundTransaction(Transaction):
             address, (str(asset.ID) if isinstance(asset, AssetNamespace) else asset),
             config["confirmations"], transaction_hash
         )
+        # Build transaction locally from funded HTLC UTXO
+        if utxo is not None:
+            self._htlc_utxo = dict(utxo, address=get_address(
+                program=utxo.get("program", utxo.get("control_program")), network=self._network, vapor=False
+            ))
+            self._transaction = build_local_transaction(
+                address=self._address, utxos=[utxo], network=self._network
+            )
+            self._amount, self._fee, self._type = (
+                int(self._htlc_utxo["amount"]), self._transaction["tx"]["fee"], "bytom_refund_unsigned"
+            )
+            return self
+
         # Get transaction
         self._transaction_detail = get_transaction(
             transaction_hash=self._transaction_hash, network=self._network
@@ -939,33 +971,27 @@ class RefundTransaction(Transaction):
 
         # Set recipient wallet
         wallet, path, indexes = solver.solve()
-        # Clean derivation indexes/path
-        wallet.clean_derivation()
-        # Sign withdraw transaction
-        for index, unsigned in enumerate(self.unsigned_datas(detail=True)):
+        witness: str = solver.witness(self._network)
+        # Sign refund transaction, deriving each path once
+        for signed_datas in sign_unsigned_datas(
+            xprivate_key=wallet.xprivate_key(), unsigned_datas=self.unsigned_datas(), path=path, indexes=indexes
+        ):
             signed_data = []
-            unsigned_datas = unsigned["datas"]
-            if unsigned["path"]:
-                wallet.from_path(unsigned["path"])
-            elif path:
-                wallet.from_path(path)
-            elif indexes:
-                wallet.from_indexes(indexes)
-            for unsigned_data in unsigned_datas:
-                signed_data.append(wallet.sign(unsigned_data))
-                signed_data.append(str("01"))
-                signed_data.append(solver.witness(self._network))
+            for signature in signed_datas:
+                signed_data.extend([signature, str("01"), witness])
             self._signatures.append(signed_data)
-            wallet.clean_derivation()
 
         # Set transaction type
         self._type = "bytom_refund_signed"
         return self
 
-    def transaction_raw(self) -> str:
+    def transaction_raw(self, binary: bool = False) -> str:
         """
         Get Bytom refund transaction raw.
 
+        :param binary: Encode as compact binary envelope, defaults to ``False``.
+        :type binary: bool
+
         :returns: str -- Bytom refund transaction raw.
 
         >>> from swap.providers.bytom.transaction import RefundTransaction
@@ -981,7 +1007,7 @@ class RefundTransaction(Transaction):
 
         # Encode refund transaction raw
         if self._type == "bytom_refund_signed":
-            return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            return encode_transaction_raw(transaction=dict(
                 fee=self._fee,
                 address=self._htlc_utxo["address"],
                 raw=self.raw(),
@@ -992,8 +1018,8 @@ class RefundTransaction(Transaction):
                 signatures=self.signatures(),
                 network=self._network,
                 type=self._type
-            ))).encode()).decode())
-        return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            ), binary=binary)
+        return encode_transaction_raw(transaction=dict(
             fee=self._fee,
             address=self._htlc_utxo["address"],
             hash=self.hash(),
@@ -1004,4 +1030,4 @@ class RefundTransaction(Transaction):
             signatures=[],
             network=self._network,
             type=self._type
-        ))).encode()).decode())
+        ), binary=binary)
@@ -1,21 +1,37 @@
 #!/usr/bin/env python3
 
-from base64 import b64decode
 from pybytom.utils import is_address as btm_is_address
-from typing import Optional, Union
+from pybytom.wallet.tools import (
+    get_child_xprivate_key, get_xpublic_key, path_to_indexes
+)
+from pybytom.libs.ed25519 import (
+    sc_reduce32, decodeint, scalarmultbase, encodepoint, sc_muladd
+)
+from pybytom.libs.segwit import decode as segwit_decode
+from typing import (
+    Optional, Union, List, Dict, Tuple
+)
 
 import requests
+import hashlib
 import json
+import hmac
 import datetime
 
 from ...utils import (
-    clean_transaction_raw, get_current_timestamp
+    get_current_timestamp, TransactionEnvelope, load_transaction_raw
 )
 from ...exceptions import (
-    NetworkError, APIError, TransactionRawError, UnitError, AddressError
+    NetworkError, APIError, TransactionRawError, UnitError, AddressError, BalanceError
 )
 from ..config import bytom as config
 
+# Signed witness sizes (bytes) added to each input by its program type.
+WITNESS_SIZES: Dict[str, int] = {
+    "p2wpkh": 98,  # Signature and public key
+    "p2wsh": 256  # Secret or selector, signature and HTLC bytecode
+}
+
 
 def get_address_type(address: str) -> Optional[str]:
     """
@@ -96,12 +112,12 @@ def is_address(address: str, network: Optional[str] = None, address_type: Option
     return valid
 
 
-def is_transaction_raw(transaction_raw: str) -> bool:
+def is_transaction_raw(transaction_raw: Union[str, TransactionEnvelope]) -> bool:
     """
     Check Bytom transaction raw.
 
-    :param transaction_raw: Bytom transaction raw.
-    :type transaction_raw: str
+    :param transaction_raw: Bytom transaction raw or transaction envelope.
+    :type transaction_raw: str, swap.utils.TransactionEnvelope
 
     :returns: bool -- Bytom valid/invalid transaction raw.
 
@@ -111,13 +127,11 @@ def is_transaction_raw(transaction_raw: str) -> bool:
     True
     """
 
-    if not isinstance(transaction_raw, str):
+    if not isinstance(transaction_raw, (str, TransactionEnvelope)):
         raise TypeError(f"Transaction raw must be str, not '{type(transaction_raw)}' type.")
 
     try:
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
+        loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
         return loaded_transaction_raw["type"] in [
             "bytom_normal_unsigned", "bytom_normal_signed",
             "bytom_fund_unsigned", "bytom_fund_signed",
@@ -229,13 +243,10 @@ def decode_transaction_raw(transaction_raw: str, headers: dict = config["headers
     {'fee': ..., 'type': '...', 'address': '...', 'transaction': {...}, 'unsigned_datas': [...], 'signatures': [...], 'network': '...'}
     """
 
-    if not is_transaction_raw(transaction_raw=transaction_raw):
+    loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+    if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
         raise TransactionRawError("Invalid Bytom transaction raw.")
 
-    transaction_raw = clean_transaction_raw(transaction_raw)
-    decoded_transaction_raw = b64decode(transaction_raw.encode())
-    loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
     url = f"{config[loaded_transaction_raw['network']]['bytom-core']}/decode-raw-transaction"
     data = dict(raw_transaction=loaded_transaction_raw["raw"])
     response = requests.post(
@@ -276,27 +287,395 @@ def submit_transaction_raw(transaction_raw: str, headers: dict = config["headers
     {'fee': ..., 'type': '...', 'transaction_hash': '...', 'network': '...', 'date': '...'}
     """
 
-    if not is_transaction_raw(transaction_raw=transaction_raw):
+    loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+    if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
         raise TransactionRawError("Invalid Bytom transaction raw.")
 
-    transaction_raw = clean_transaction_raw(transaction_raw)
-    decoded_transaction_raw = b64decode(transaction_raw.encode())
-    loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
-    url = f"{config[loaded_transaction_raw['network']]['blockcenter']}/merchant/submit-payment"
-    data = dict(raw_transaction=loaded_transaction_raw["raw"], signatures=loaded_transaction_raw["signatures"])
-    params = dict(address=loaded_transaction_raw["address"])
-    response = requests.post(
-        url=url, data=json.dumps(data), params=params, headers=headers, timeout=timeout
-    )
-    response_json = response.json()
-    if response_json["code"] != 200 and response_json["code"] != 200:
-        raise APIError(response_json["msg"], response_json["code"])
+    if config[loaded_transaction_raw["network"]]["backend"] == "bytom-core":
+        url = f"{config[loaded_transaction_raw['network']]['bytom-core']}/submit-transaction"
+        data = dict(raw_transaction=assemble_raw(
+            raw=loaded_transaction_raw["raw"], signatures=loaded_transaction_raw["signatures"]
+        ))
+        response = requests.post(
+            url=url, data=json.dumps(data), headers=headers, timeout=timeout
+        )
+        response_json = response.json()
+        if response_json["status"] == "fail":
+            raise APIError(response_json["msg"], response_json["code"])
+        transaction_hash: str = response_json["data"]["tx_id"]
+    else:
+        url = f"{config[loaded_transaction_raw['network']]['blockcenter']}/merchant/submit-payment"
+        data = dict(raw_transaction=loaded_transaction_raw["raw"], signatures=loaded_transaction_raw["signatures"])
+        params = dict(address=loaded_transaction_raw["address"])
+        response = requests.post(
+            url=url, data=json.dumps(data), params=params, headers=headers, timeout=timeout
+        )
+        response_json = response.json()
+        if response_json["code"] != 200 and response_json["code"] != 200:
+            raise APIError(response_json["msg"], response_json["code"])
+        transaction_hash: str = response_json["data"]["tx_hash"]
 
     return dict(
         fee=loaded_transaction_raw["fee"],
         type=loaded_transaction_raw["type"],
-        transaction_hash=response_json["data"]["tx_hash"],
+        transaction_hash=transaction_hash,
         network=loaded_transaction_raw["network"],
         date=str(datetime.datetime.now())
     )
+
+
+def _sign_datas(private_key: str, datas: List[str]) -> List[str]:
+    # Expand private key and compute its public key once for all datas
+    expand_private_key: str = private_key[:64] + hmac.HMAC(
+        b"Expand", bytes.fromhex(private_key), digestmod=hashlib.sha512
+    ).hexdigest()[64:]
+    private_bytes: bytes = bytes.fromhex(expand_private_key)
+    public_bytes: bytes = bytes.fromhex(get_xpublic_key(xprivate_key=expand_private_key))[:32]
+    secret_key: bytes = private_bytes[:32].hex().encode()
+
+    signatures: List[str] = []
+    for data in datas:
+        message_bytes: bytes = bytes.fromhex(data)
+        message_digest: bytes = bytes.fromhex(sc_reduce32(
+            hashlib.sha512(private_bytes[32:64] + message_bytes).digest().hex().encode()
+        ).decode())[:32]
+        encoded_r: bytes = encodepoint(scalarmultbase(decodeint(message_digest)))
+        hram_digest: bytes = bytes.fromhex(sc_reduce32(
+            hashlib.sha512(encoded_r + public_bytes + message_bytes).digest().hex().encode()
+        ).decode())[:32]
+        signatures.append((encoded_r + bytes.fromhex(sc_muladd(
+            hram_digest.hex().encode(), secret_key, message_digest.hex().encode()
+        ).decode())).hex())
+    return signatures
+
+
+def sign_unsigned_datas(xprivate_key: str, unsigned_datas: List[dict], path: Optional[str] = None,
+                        indexes: Optional[List[str]] = None) -> List[List[str]]:
+    """
+    Sign Bytom transaction unsigned datas, grouped by derivation path.
+
+    :param xprivate_key: Bytom root xprivate key.
+    :type xprivate_key: str
+    :param unsigned_datas: Bytom transaction unsigned datas.
+    :type unsigned_datas: list
+    :param path: Bytom derivation path for unsigned datas without path, defaults to ``None``.
+    :type path: str
+    :param indexes: Bytom derivation indexes for unsigned datas without path, defaults to ``None``.
+    :type indexes: list
+
+    :returns: list -- Bytom signatures per unsigned data, in unsigned datas order.
+
+    >>> from swap.providers.bytom.utils import sign_unsigned_datas
+    >>> sign_unsigned_datas(xprivate_key="58775359b7b3588dcdc1bcf373489fa1272cacc03909f78469657b0208e66e46daedfdd0fd8f8df14e2084c7e8df4701db3062dded1c713e0aae734ac09c4afd", unsigned_datas=[{"datas": ["f42a2b6e15585b88da8b34237c7a6fd83af12ee6971813d66cf794a63ebcc16f"], "path": "m/44/153/1/0/1"}])
+    [['b82e97abc4b70f7ffe7f783254c63e61436d6a7ad15da89b1fb791f91d1d6aa0bab7ff86328eabd2959f5475dde443e613ce7dfe70411be5b469b02069164a06']]
+
+    .. note::
+        Each child xprivate key is derived once from its longest already derived parent,
+        and all datas sharing a derivation path are signed in one batch.
+    """
+
+    default_indexes: Tuple[str, ...] = tuple(
+        path_to_indexes(path=path) if path else (indexes if indexes else [])
+    )
+    derivations: Dict[Tuple[str, ...], str] = {(): xprivate_key}
+
+    def derive(_indexes: Tuple[str, ...]) -> str:
+        if _indexes not in derivations:
+            derivations[_indexes] = get_child_xprivate_key(
+                xprivate_key=derive(_indexes[:-1]), indexes=[_indexes[-1]]
+            )
+        return derivations[_indexes]
+
+    groups: Dict[Tuple[str, ...], List[Tuple[int, int]]] = {}
+    for index, unsigned in enumerate(unsigned_datas):
+        _indexes = tuple(path_to_indexes(path=unsigned["path"])) if unsigned["path"] else default_indexes
+        for position in range(len(unsigned["datas"])):
+            groups.setdefault(_indexes, []).append((index, position))
+
+    signatures: List[List[Optional[str]]] = [[None] * len(unsigned["datas"]) for unsigned in unsigned_datas]
+    for _indexes, positions in groups.items():
+        for (index, position), signature in zip(positions, _sign_datas(
+            private_key=derive(_indexes), datas=[
+                unsigned_datas[index]["datas"][position] for index, position in positions
+            ]
+        )):
+            signatures[index][position] = signature
+    return signatures
+
+
+def _uvarint(value: int) -> bytes:
+    encoded: bytes = b""
+    while value >= 0x80:
+        encoded += bytes([(value & 0x7f) | 0x80])
+        value >>= 7
+    return encoded + bytes([value])
+
+
+def _varstr(value: bytes) -> bytes:
+    return _uvarint(len(value)) + value
+
+
+def _entry_id(entry_type: bytes, body: bytes) -> bytes:
+    return hashlib.sha3_256(
+        b"entryid:" + entry_type + b":" + hashlib.sha3_256(body).digest()
+    ).digest()
+
+
+def _output_id(source_id: bytes, asset: bytes, amount: int, position: int, program: bytes) -> bytes:
+    return _entry_id(b"output1", (
+        source_id + asset + amount.to_bytes(8, "little") + position.to_bytes(8, "little") +
+        (1).to_bytes(8, "little") + _varstr(program)
+    ))
+
+
+def _read_uvarint(raw: bytes, offset: int) -> Tuple[int, int]:
+    value, shift = 0, 0
+    while True:
+        value |= (raw[offset] & 0x7f) << shift
+        offset, shift = (offset + 1), (shift + 7)
+        if raw[offset - 1] < 0x80:
+            return value, offset
+
+
+def _program_type(program: bytes) -> str:
+    return "p2wpkh" if len(program) == 22 else "p2wsh"
+
+
+def _load_utxo(utxo: dict) -> dict:
+    try:
+        loaded_utxo: dict = dict(
+            source_id=bytes.fromhex(utxo["source_id"]),
+            source_position=int(utxo["source_position"] if "source_position" in utxo else utxo["source_pos"]),
+            amount=int(utxo["amount"]),
+            asset=bytes.fromhex(utxo["asset"] if "asset" in utxo else utxo["asset_id"]),
+            program=bytes.fromhex(utxo["program"] if "program" in utxo else utxo["control_program"]),
+            public_key=utxo.get("public_key"),
+            path=utxo.get("path")
+        )
+    except KeyError as key:
+        raise ValueError(f"Invalid Bytom UTXO, {key} key is required.")
+    loaded_utxo["hash"] = _output_id(
+        loaded_utxo["source_id"], loaded_utxo["asset"], loaded_utxo["amount"],
+        loaded_utxo["source_position"], loaded_utxo["program"]
+    )
+    _hash: Optional[str] = utxo.get("hash", utxo.get("id"))
+    if _hash and _hash != loaded_utxo["hash"].hex():
+        raise ValueError(f"Invalid Bytom UTXO, '{_hash}' hash doesn't match with its source.")
+    return loaded_utxo
+
+
+def _serialize(inputs: List[dict], outputs: List[Tuple[bytes, int, bytes]], witness: bool = True) -> bytes:
+    raw: bytes = b"\x07" + _uvarint(1) + _uvarint(0) + _uvarint(len(inputs))
+    for _input in inputs:
+        arguments: List[bytes] = [bytes.fromhex(_input["public_key"])] \
+            if witness and _input["public_key"] and _program_type(_input["program"]) == "p2wpkh" else []
+        raw += _uvarint(1) + _varstr(b"\x01" + _varstr(
+            _input["source_id"] + _input["asset"] + _uvarint(_input["amount"]) +
+            _uvarint(_input["source_position"]) + _uvarint(1) + _varstr(_input["program"])
+        )) + _varstr(_uvarint(len(arguments)) + b"".join(_varstr(argument) for argument in arguments))
+    raw += _uvarint(len(outputs))
+    for asset, amount, program in outputs:
+        raw += _uvarint(1) + _varstr(
+            asset + _uvarint(amount) + _uvarint(1) + _varstr(program)
+        ) + _varstr(b"")
+    return raw
+
+
+def _estimate_fee(inputs: List[dict], outputs: List[Tuple[bytes, int, bytes]], fee_rate: int) -> int:
+    gas: int = len(_serialize(inputs=inputs, outputs=outputs, witness=False))
+    for _input in inputs:
+        gas += WITNESS_SIZES[_program_type(_input["program"])] + \
+            config["input_gas"][_program_type(_input["program"])]
+    return gas * fee_rate
+
+
+def address_to_program(address: str) -> str:
+    """
+    Get Bytom control program from address.
+
+    :param address: Bytom address.
+    :type address: str
+
+    :returns: str -- Bytom control program.
+
+    >>> from swap.providers.bytom.utils import address_to_program
+    >>> address_to_program(address="bm1qk9vj4jaezlcnjdckds4fkm8fwv5kawmq9qrufx")
+    "0014b1592acbb917f13937166c2a9b6ce973296ebb60"
+    """
+
+    if not is_address(address=address):
+        raise AddressError(f"Invalid Bytom '{address}' address.")
+
+    version, witness_program = segwit_decode(address[:address.rfind("1")], address)
+    return bytes([version, len(witness_program)] + witness_program).hex()
+
+
+def assemble_raw(raw: str, signatures: List[List[str]]) -> str:
+    """
+    Assemble Bytom signed transaction raw, prepending signatures to each input witness arguments.
+
+    :param raw: Bytom unsigned transaction raw.
+    :type raw: str
+    :param signatures: Bytom signatures per input.
+    :type signatures: list
+
+    :returns: str -- Bytom signed transaction raw.
+
+    >>> from swap.providers.bytom.utils import assemble_raw
+    >>> assemble_raw(raw="07010001015f015d76f97e257a5db097a4039ebf908e6d103d425c1eaaeddc3ddc359f2f67ee1ccbffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffc88ed740010116001428e2128fdd6fb72cf460e148d86b3f4f3f34eb4e2201205de733cf5e089ad6a0d18bdee58611ed63f77897aa35299c59b68378868e05b5020139ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff0001160014c95e092caeaece35c573e71e1105556d929cfc9000013cffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffe0dabb400116001428e2128fdd6fb72cf460e148d86b3f4f3f34eb4e00", signatures=[["6dd185736cf4f4177ec7c57d597b5db9886d5aaf1573e24048ff06c488ce9423a1fcba6b266fffc89308d411c0c00345c31e3b2f7f3c92dfb8f5a4cc78e88004"]])
+    "07010001015f015d76f97e257a5db097a4039ebf908e6d103d425c1eaaeddc3ddc359f2f67ee1ccbffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffc88ed740010116001428e2128fdd6fb72cf460e148d86b3f4f3f34eb4e6302406dd185736cf4f4177ec7c57d597b5db9886d5aaf1573e24048ff06c488ce9423a1fcba6b266fffc89308d411c0c00345c31e3b2f7f3c92dfb8f5a4cc78e88004205de733cf5e089ad6a0d18bdee58611ed63f77897aa35299c59b68378868e05b5020139ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff0001160014c95e092caeaece35c573e71e1105556d929cfc9000013cffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffe0dabb400116001428e2128fdd6fb72cf460e148d86b3f4f3f34eb4e00"
+    """
+
+    raw_bytes: bytes = bytes.fromhex(raw)
+    offset: int = _read_uvarint(raw_bytes, _read_uvarint(raw_bytes, 1)[1])[1]
+    inputs, offset = _read_uvarint(raw_bytes, offset)
+    if inputs != len(signatures):
+        raise ValueError(f"Invalid Bytom signatures, transaction raw has {inputs} inputs, not {len(signatures)}.")
+
+    assembled_raw: bytes = raw_bytes[:offset]
+    for signed_datas in signatures:
+        # Asset version and input commitment
+        start: int = offset
+        offset = _read_uvarint(raw_bytes, offset)[1]
+        length, offset = _read_uvarint(raw_bytes, offset)
+        assembled_raw += raw_bytes[start:(offset + length)]
+        # Witness arguments
+        offset = _read_uvarint(raw_bytes, offset + length)[1]
+        count, offset = _read_uvarint(raw_bytes, offset)
+        arguments: List[bytes] = [bytes.fromhex(signed_data) for signed_data in signed_datas]
+        for _ in range(count):
+            length, offset = _read_uvarint(raw_bytes, offset)
+            arguments.append(raw_bytes[offset:(offset + length)])
+            offset += length
+        assembled_raw += _varstr(_uvarint(len(arguments)) + b"".join(_varstr(argument) for argument in arguments))
+    return (assembled_raw + raw_bytes[offset:]).hex()
+
+
+def build_local_transaction(address: str, utxos: List[dict], recipients: Optional[Dict[str, int]] = None,
+                            asset: str = config["asset"], fee: Optional[int] = None,
+                            fee_rate: int = config["fee_rate"], network: str = config["network"]) -> dict:
+    """
+    Build Bytom transaction locally from UTXO's, without blockcenter.
+
+    :param address: Bytom sender or recipient address, takes the change.
+    :type address: str
+    :param utxos: Bytom UTXO's with source_id, source_position, amount, asset and program.
+    :type utxos: list
+    :param recipients: Recipients Bytom address and NEU amount, defaults to ``None`` (spend all UTXO's to address).
+    :type recipients: dict
+    :param asset: Bytom asset id, defaults to ``BTM``.
+    :type asset: str
+    :param fee: Bytom fixed fee (NEU amount), defaults to ``None`` (estimate with fee rate).
+    :type fee: int
+    :param fee_rate: Bytom fee rate (NEU per gas), defaults to ``200``.
+    :type fee_rate: int
+    :param network: Bytom network, defaults to ``mainnet``.
+    :type network: str
+
+    :returns: dict -- Bytom built transaction, same as blockcenter build transaction.
+
+    >>> from swap.providers.bytom.utils import build_local_transaction
+    >>> build_local_transaction(address="bm1qe90qjt9w4m8rt3tnuu0pzp24dkffelys8zcwye", utxos=[{"source_id": "077d3ff001e3efe9ab6664061f47f1893bf1fdf3cfa7f4cea1ad3f65b3ce6d79", "source_position": 0, "amount": 10000000, "asset": "ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff", "program": "0020a86adea55bbabf278295c8777abdc63216063cc15fb9569a3c1a4847ac174c10"}])["tx"]
+    {'hash': 'eee73b6d97de9b957b8eac5280a8b26a95832f501f5d02a1eae96f25f0ea0c6c', 'fee': 509000}
+
+    .. note::
+        UTXO's are selected largest first, the fee is estimated from the signed transaction size plus
+        each input program gas, and any change goes back to the address.
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Bytom '{network}' network",
+                           "choose only 'mainnet', 'solonet' or 'testnet' networks.")
+    if not is_address(address=address, network=network):
+        raise AddressError(f"Invalid Bytom '{address}' {network} address.")
+
+    def program(_address: str) -> bytes:
+        return bytes.fromhex(address_to_program(address=_address))
+
+    btm: bytes = bytes.fromhex(config["asset"])
+    loaded_utxos: List[dict] = sorted(
+        [_load_utxo(utxo=utxo) for utxo in utxos], key=lambda utxo: utxo["amount"], reverse=True
+    )
+    inputs: List[dict] = []
+    outputs: List[Tuple[bytes, int, bytes]] = []
+    if recipients is None:
+        # Spend all UTXO's to the address, fee is paid from its BTM amount
+        inputs, totals = loaded_utxos, {}
+        for utxo in inputs:
+            totals[utxo["asset"]] = totals.get(utxo["asset"], 0) + utxo["amount"]
+        outputs = [(_asset, amount, program(address)) for _asset, amount in totals.items()]
+        if fee is None:
+            fee = _estimate_fee(inputs=inputs, outputs=outputs, fee_rate=fee_rate)
+        if totals.get(btm, 0) <= fee:
+            raise BalanceError(
+                f"You don't have enough amount to pay '{fee}' NEU fee",
+                f"you can spend maximum '{totals.get(btm, 0)}' NEU amount."
+            )
+        outputs = [
+            (_asset, (amount - fee) if _asset == btm else amount, _program)
+            for _asset, amount, _program in outputs
+        ]
+    else:
+        for _address, amount in recipients.items():
+            if not is_address(address=_address, network=network):
+                raise AddressError(f"Invalid Bytom recipients '{_address}' {network} address.")
+            outputs.append((bytes.fromhex(asset), int(amount), program(_address)))
+        required: Dict[bytes, int] = {bytes.fromhex(asset): sum(amount for _, amount, _ in outputs)}
+        # Select largest UTXO's first, until they cover amount and fee
+        while True:
+            totals: Dict[bytes, int] = {_asset: sum(
+                utxo["amount"] for utxo in inputs if utxo["asset"] == _asset
+            ) for _asset in set(required) | {btm}}
+            _fee: int = _estimate_fee(inputs=inputs, outputs=outputs + [
+                (_asset, totals[_asset], program(address)) for _asset in totals
+            ], fee_rate=fee_rate) if fee is None else fee
+            needs: Dict[bytes, int] = dict(required)
+            needs[btm] = needs.get(btm, 0) + _fee
+            shortages: List[bytes] = [_asset for _asset in needs if totals[_asset] < needs[_asset]]
+            if not shortages:
+                break
+            selectable: List[dict] = [utxo for utxo in loaded_utxos if utxo["asset"] == shortages[0]]
+            if not selectable:
+                raise BalanceError(
+                    "Insufficient spend UTXO's", "you don't have enough amount."
+                )
+            inputs.append(selectable[0])
+            loaded_utxos.remove(selectable[0])
+        for _asset in needs:
+            if totals[_asset] > needs[_asset]:
+                outputs.append((_asset, totals[_asset] - needs[_asset], program(address)))
+        fee = _fee
+
+    raw: bytes = _serialize(inputs=inputs, outputs=outputs)
+    # Compute mux, output and transaction ids
+    mux: bytes = _uvarint(len(inputs))
+    input_ids: List[bytes] = []
+    for utxo in inputs:
+        input_ids.append(_entry_id(b"spend1", utxo["hash"]))
+        mux += input_ids[-1] + utxo["asset"] + utxo["amount"].to_bytes(8, "little") + bytes(8)
+    mux_id: bytes = _entry_id(b"mux1", mux + (1).to_bytes(8, "little") + _varstr(b"\x51"))
+    output_ids: List[bytes] = [
+        _output_id(mux_id, _asset, amount, position, _program)
+        for position, (_asset, amount, _program) in enumerate(outputs)
+    ]
+    transaction_id: bytes = _entry_id(b"txheader", (
+        (1).to_bytes(8, "little") + (0).to_bytes(8, "little") + _uvarint(len(output_ids)) + b"".join(output_ids)
+    ))
+
+    return dict(
+        tx=dict(hash=transaction_id.hex(), fee=fee),
+        raw_transaction=raw.hex(),
+        signing_instructions=[
+            dict(
+                derivation_path=(path_to_indexes(path=utxo["path"]) if utxo["path"] else None),
+                sign_data=[hashlib.sha3_256(input_id + transaction_id).hexdigest()],
+                pubkey=utxo["public_key"]
+            ) for utxo, input_id in zip(inputs, input_ids)
+        ],
+        utxos=[
+            dict(
+                hash=output_id.hex(), source_id=mux_id.hex(), source_position=position,
+                amount=amount, asset=_asset.hex(), program=_program.hex()
+            ) for position, (output_id, (_asset, amount, _program)) in enumerate(zip(output_ids, outputs))
+        ]
+    )
@@ -11,7 +11,19 @@ bitcoin: dict = {
         "blockcypher": {
             "url": "https://api.blockcypher.com/v1/btc/main",
             "token": "c6ef693d3c024088810e6fac2a1494ee"
-        }
+        },
+        "bitcoind": {
+            "url": "http://localhost:8332",
+            "username": None,
+            "password": None,
+            "wallet": None
+        },
+        "electrum": {
+            "host": "electrum.blockstream.info",
+            "port": 50002,
+            "ssl": True
+        },
+        "backend": "blockcypher"
     },
     "testnet": {
         "blockchain": "https://testnet.blockchain.info",
@@ -20,12 +32,25 @@ bitcoin: dict = {
         "blockcypher": {
             "url": "https://api.blockcypher.com/v1/btc/test3",
             "token": "c6ef693d3c024088810e6fac2a1494ee"
-        }
+        },
+        "bitcoind": {
+            "url": "http://localhost:18332",
+            "username": None,
+            "password": None,
+            "wallet": None
+        },
+        "electrum": {
+            "host": "electrum.blockstream.info",
+            "port": 60002,
+            "ssl": True
+        },
+        "backend": "blockcypher"
     },
     "path": "m/44'/0'/0'/0/0",
     "bip44_path": "m/44'/0'/{account}'/{change}/{address}",
     "locktime": 0,
     "version": 2,
+    "max_transaction_size": 100_000,
     "network": "mainnet",
     "units": {
         "BTC": 1,
@@ -46,17 +71,20 @@ bytom: dict = {
     "mainnet": {
         "bytom-core": "http://localhost:9888",
         "blockmeta": "https://classic.blockmeta.com/api/v3",
-        "blockcenter": "https://ex.movapi.com/bytom/v3"
+        "blockcenter": "https://ex.movapi.com/bytom/v3",
+        "backend": "blockcenter"
     },
     "solonet": {
         "bytom-core": "http://localhost:9888",
         "blockmeta": None,
-        "blockcenter": None
+        "blockcenter": None,
+        "backend": "bytom-core"
     },
     "testnet": {
         "bytom-core": "http://localhost:9888",
         "blockmeta": None,
-        "blockcenter": None
+        "blockcenter": None,
+        "backend": "bytom-core"
     },
     "path": "m/44/153/1/0/1",
     "bip44_path": "m/44/153/{account}/{change}/{address}",
@@ -72,6 +100,11 @@ bytom: dict = {
         "NEU": 100_000_000
     },
     "confirmations": 1,
+    "fee_rate": 200,  # NEU per gas
+    "input_gas": {
+        "p2wpkh": 1920,
+        "p2wsh": 2110
+    },
     "network": "mainnet",
     "forbid_chain_tx": False,
     "headers": {
@@ -89,9 +122,17 @@ ethereum: dict = {
             "websocket": "wss://mainnet.infura.io/ws/v3",
             "token": "4414fea5f7454211956b1627621450b4"
         },
+        "ipc": "~/.ethereum/geth.ipc",
+        "providers": [
+            "~/.ethereum/geth.ipc",
+            "http://localhost:8545",
+            "https://mainnet.infura.io/v3/{token}"
+        ],
         "contract_addresses": {
             "htlc": None,
-            "htlc_erc20": None
+            "htlc_erc20": None,
+            "htlc_v2": None,
+            "htlc_erc20_v2": None
         }
     },
     "ropsten": {
@@ -100,9 +141,17 @@ ethereum: dict = {
             "websocket": "wss://ropsten.infura.io/ws/v3",
             "token": "4414fea5f7454211956b1627621450b4"
         },
+        "ipc": "~/.ethereum/ropsten/geth.ipc",
+        "providers": [
+            "~/.ethereum/ropsten/geth.ipc",
+            "http://localhost:8545",
+            "https://ropsten.infura.io/v3/{token}"
+        ],
         "contract_addresses": {
             "htlc": "0x0cc7C744f96729B7f60B12B36A4B9504191CD458",
-            "htlc_erc20": "0x761c47A8dc8178d55aE14b661abf26cc0B599bc6"
+            "htlc_erc20": "0x761c47A8dc8178d55aE14b661abf26cc0B599bc6",
+            "htlc_v2": None,
+            "htlc_erc20_v2": None
         }
     },
     "kovan": {
@@ -111,9 +160,17 @@ ethereum: dict = {
             "websocket": "wss://kovan.infura.io/ws/v3",
             "token": "4414fea5f7454211956b1627621450b4"
         },
+        "ipc": "~/.ethereum/kovan/geth.ipc",
+        "providers": [
+            "~/.ethereum/kovan/geth.ipc",
+            "http://localhost:8545",
+            "https://kovan.infura.io/v3/{token}"
+        ],
         "contract_addresses": {
             "htlc": "0xf3c7CD43F2f87958E708E00780EBDf87292Ad37E",
-            "htlc_erc20": "0x32a05649778bc96958bF804835C9e8eC9678e283"
+            "htlc_erc20": "0x32a05649778bc96958bF804835C9e8eC9678e283",
+            "htlc_v2": None,
+            "htlc_erc20_v2": None
         }
     },
     "rinkeby": {
@@ -122,9 +179,17 @@ ethereum: dict = {
             "websocket": "wss://rinkeby.infura.io/ws/v3",
             "token": "4414fea5f7454211956b1627621450b4"
         },
+        "ipc": "~/.ethereum/rinkeby/geth.ipc",
+        "providers": [
+            "~/.ethereum/rinkeby/geth.ipc",
+            "http://localhost:8545",
+            "https://rinkeby.infura.io/v3/{token}"
+        ],
         "contract_addresses": {
             "htlc": "0xB00370e1F88C86Ef6Fc81B380E0c7fC1dcbceD17",
-            "htlc_erc20": "0xe0d3155c9DC0ADdCDA71E7ef15c689AeCC8Dfc28"
+            "htlc_erc20": "0xe0d3155c9DC0ADdCDA71E7ef15c689AeCC8Dfc28",
+            "htlc_v2": None,
+            "htlc_erc20_v2": None
         }
     },
     "testnet": {
@@ -133,9 +198,15 @@ ethereum: dict = {
             "websocket": "wss://localhost:8545",
             "token": None
         },
+        "ipc": None,
+        "providers": [
+            "http://localhost:8545"
+        ],
         "contract_addresses": {
             "htlc": None,
-            "htlc_erc20": None
+            "htlc_erc20": None,
+            "htlc_v2": None,
+            "htlc_erc20_v2": None
         }
     },
     "path": "m/44'/60'/0'/0/0",
@@ -146,6 +217,7 @@ ethereum: dict = {
         "Wei": 1_000_000_000_000_000_000
     },
     "provider": "http",
+    "health_check_interval": 30,
     "network": "mainnet",
     "unit": "Wei",
     "timeout": 60,
@@ -161,17 +233,20 @@ vapor: dict = {
     "mainnet": {
         "vapor-core": "http://localhost:9889",
         "blockmeta": "https://vapor.blockmeta.com/api/v1",
-        "blockcenter": "https://ex.movapi.com/vapor/v3"
+        "blockcenter": "https://ex.movapi.com/vapor/v3",
+        "backend": "blockcenter"
     },
     "solonet": {
         "vapor-core": "http://localhost:9889",
         "blockmeta": None,
-        "blockcenter": None
+        "blockcenter": None,
+        "backend": "vapor-core"
     },
     "testnet": {
         "vapor-core": "http://localhost:9889",
         "blockmeta": None,
-        "blockcenter": None
+        "blockcenter": None,
+        "backend": "vapor-core"
     },
     "path": "m/44/153/1/0/1",
     "bip44_path": "m/44/153/{account}/{change}/{address}",
@@ -187,6 +262,11 @@ vapor: dict = {
         "NEU": 100_000_000
     },
     "confirmations": 1,
+    "fee_rate": 200,  # NEU per gas
+    "input_gas": {
+        "p2wpkh": 1916,
+        "p2wsh": 2108
+    },
     "network": "mainnet",
     "forbid_chain_tx": False,
     "headers": {
@@ -201,25 +281,47 @@ xinfin: dict = {
     "mainnet": {
         "http": "https://rpc.xinfin.network",
         "websocket": "wss://ws.xinfin.network",
+        "ipc": "~/.XDC/XDC.ipc",
+        "providers": [
+            "~/.XDC/XDC.ipc",
+            "http://localhost:8545",
+            "https://rpc.xinfin.network"
+        ],
         "contract_addresses": {
             "htlc": "xdc1C2F24F4E2427aD43df9c20521B88C78A32Bafb2",
-            "htlc_xrc20": "xdcC8E8De7999D74bdD71e1cDC00025867F34c50b89"
+            "htlc_xrc20": "xdcC8E8De7999D74bdD71e1cDC00025867F34c50b89",
+            "htlc_v2": None,
+            "htlc_xrc20_v2": None
         }
     },
     "apothem": {
         "http": "https://rpc.apothem.network",
         "websocket": "wss://ws.apothem.network",
+        "ipc": "~/.XDC/apothem/XDC.ipc",
+        "providers": [
+            "~/.XDC/apothem/XDC.ipc",
+            "http://localhost:8545",
+            "https://rpc.apothem.network"
+        ],
         "contract_addresses": {
             "htlc": "xdc959c04329fa6B45d0250A2315673e4F952218BdE",
-            "htlc_xrc20": "xdc4C909fdd6c30f5B4c4d48938C161637B2767d714"
+            "htlc_xrc20": "xdc4C909fdd6c30f5B4c4d48938C161637B2767d714",
+            "htlc_v2": None,
+            "htlc_xrc20_v2": None
         }
     },
     "testnet": {
         "http": "http://localhost:8545",
         "websocket": "wss://localhost:8545",
+        "ipc": None,
+        "providers": [
+            "http://localhost:8545"
+        ],
         "contract_addresses": {
             "htlc": None,
-            "htlc_xrc20": None
+            "htlc_xrc20": None,
+            "htlc_v2": None,
+            "htlc_xrc20_v2": None
         }
     },
     "path": "m/44'/550'/0'/0/0",
@@ -230,6 +332,7 @@ xinfin: dict = {
         "Wei": 1_000_000_000_000_000_000
     },
     "provider": "http",
+    "health_check_interval": 30,
     "network": "mainnet",
     "unit": "Wei",
     "timeout": 60,
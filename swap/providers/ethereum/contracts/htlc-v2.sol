@@ -0,0 +1,262 @@
+// SPDX-License-Identifier: AGPL-3.0
+
+pragma solidity ^0.8.10;
+
+/**
+ * @title Gas Optimized Hash Time Lock Contract (HTLC)
+ *
+ * @author Meheret Tesfaye Batu <meherett@zoho.com>
+ *
+ * Same fund, withdraw and refund interface as HTLC, with a smaller storage footprint:
+ *
+ * - The locked contract is packed in three storage slots, endtime is uint64, amount is uint96
+ *   and the withdrawn/refunded flags are one status enum next to the recipient address.
+ * - The preimage is emitted in the log_withdraw event instead of being written to storage.
+ * - Failed checks revert with custom errors instead of revert strings.
+ * - fund_batch, withdraw_batch and refund_batch handle many locked contracts in one transaction,
+ *   withdraw and refund amounts are sent to msg.sender in one transfer.
+ */
+contract HTLC_V2 {
+
+    enum Status { INVALID, FUNDED, WITHDRAWN, REFUNDED }
+
+    struct LockedContract {
+        bytes32 secret_hash;
+        address payable recipient;
+        uint64 endtime;
+        Status status;
+        address payable sender;
+        uint96 amount;
+    }
+
+    mapping (bytes32 => LockedContract) locked_contracts;
+
+    event log_fund (
+        bytes32 indexed locked_contract_id,
+        bytes32 secret_hash,
+        address indexed recipient,
+        address indexed sender,
+        uint endtime,
+        uint amount
+    );
+    event log_withdraw (
+        bytes32 indexed locked_contract_id,
+        string preimage
+    );
+    event log_refund (
+        bytes32 indexed locked_contract_id
+    );
+
+    error InvalidAmount ();
+    error InvalidEndtime ();
+    error InvalidSender ();
+    error InvalidBatch ();
+    error LockedContractExists (bytes32 locked_contract_id);
+    error LockedContractNotFunded (bytes32 locked_contract_id);
+    error SecretHashMismatch ();
+    error NotRecipient ();
+    error NotSender ();
+    error EndtimeNotPassed ();
+
+    /**
+     * @dev Sender sets up a new Hash Time Lock Contract (HTLC) and depositing the ETH coin.
+     *
+     * @param secret_hash A sha256 secret hash.
+     * @param recipient Recipient account of the ETH coin.
+     * @param sender Sender account of the ETH coin.
+     * @param endtime The timestamp that the lock expires at.
+     *
+     * @return locked_contract_id of the new HTLC.
+     */
+    function fund (bytes32 secret_hash, address payable recipient, address payable sender, uint endtime) external payable returns (bytes32 locked_contract_id) {
+
+        if (msg.sender != sender)
+            revert InvalidSender();
+
+        return _fund(secret_hash, recipient, endtime, msg.value);
+    }
+
+    /**
+     * @dev Sender sets up many Hash Time Lock Contracts (HTLC's) in one transaction, msg.value must be the sum of amounts.
+     *
+     * @param secret_hashes sha256 secret hashes.
+     * @param recipients Recipient accounts of the ETH coin.
+     * @param sender Sender account of the ETH coin.
+     * @param endtimes The timestamps that the locks expire at.
+     * @param amounts ETH coin amounts of each HTLC.
+     *
+     * @return locked_contract_ids of the new HTLC's.
+     */
+    function fund_batch (bytes32[] calldata secret_hashes, address payable[] calldata recipients, address payable sender, uint[] calldata endtimes, uint[] calldata amounts) external payable returns (bytes32[] memory locked_contract_ids) {
+
+        if (msg.sender != sender)
+            revert InvalidSender();
+        if (recipients.length != secret_hashes.length || endtimes.length != secret_hashes.length || amounts.length != secret_hashes.length)
+            revert InvalidBatch();
+
+        uint total;
+        locked_contract_ids = new bytes32[](secret_hashes.length);
+        for (uint index = 0; index < secret_hashes.length; index++) {
+            locked_contract_ids[index] = _fund(secret_hashes[index], recipients[index], endtimes[index], amounts[index]);
+            total += amounts[index];
+        }
+        if (total != msg.value)
+            revert InvalidAmount();
+        return locked_contract_ids;
+    }
+
+    /**
+     * @dev Called by the recipient once they know the preimage (secret key) of the secret hash.
+     *
+     * @param locked_contract_id of HTLC to withdraw.
+     * @param preimage sha256(preimage) hash should equal the contract secret hash.
+     *
+     * @return bool true on success or false on failure.
+     */
+    function withdraw (bytes32 locked_contract_id, string calldata preimage) external returns (bool) {
+
+        payable(msg.sender).transfer(
+            _withdraw(locked_contract_id, preimage)
+        );
+        return true;
+    }
+
+    /**
+     * @dev Called by the recipient to withdraw many HTLC's, the amounts are sent in one transfer.
+     *
+     * @param locked_contract_ids of HTLC's to withdraw.
+     * @param preimages sha256(preimage) hashes should equal the contracts secret hashes.
+     *
+     * @return bool true on success or false on failure.
+     */
+    function withdraw_batch (bytes32[] calldata locked_contract_ids, string[] calldata preimages) external returns (bool) {
+
+        if (preimages.length != locked_contract_ids.length)
+            revert InvalidBatch();
+
+        uint total;
+        for (uint index = 0; index < locked_contract_ids.length; index++)
+            total += _withdraw(locked_contract_ids[index], preimages[index]);
+        payable(msg.sender).transfer(total);
+        return true;
+    }
+
+    /**
+     * @dev Called by the sender if there was no withdraw and the time lock has expired.
+     *
+     * @param locked_contract_id of HTLC to refund.
+     *
+     * @return bool true on success or false on failure.
+     */
+    function refund (bytes32 locked_contract_id) external returns (bool) {
+
+        payable(msg.sender).transfer(
+            _refund(locked_contract_id)
+        );
+        return true;
+    }
+
+    /**
+     * @dev Called by the sender to refund many expired HTLC's, the amounts are sent in one transfer.
+     *
+     * @param locked_contract_ids of HTLC's to refund.
+     *
+     * @return bool true on success or false on failure.
+     */
+    function refund_batch (bytes32[] calldata locked_contract_ids) external returns (bool) {
+
+        uint total;
+        for (uint index = 0; index < locked_contract_ids.length; index++)
+            total += _refund(locked_contract_ids[index]);
+        payable(msg.sender).transfer(total);
+        return true;
+    }
+
+    /**
+     * @dev Get HTLC contract details.
+     *
+     * @param locked_contract_id of HTLC to get details.
+     *
+     * @return id secret_hash recipient sender endtime amount withdrawn refunded locked HTLC contract datas.
+     */
+    function get_locked_contract (bytes32 locked_contract_id) public view returns (
+        bytes32 id, bytes32 secret_hash, address recipient, address sender, uint endtime, uint amount, bool withdrawn, bool refunded
+    ) {
+        LockedContract storage locked_contract = locked_contracts[locked_contract_id];
+
+        if (locked_contract.status == Status.INVALID)
+            return (0, 0, address(0), address(0), 0, 0, false, false);
+
+        return (
+            locked_contract_id,
+            locked_contract.secret_hash,
+            locked_contract.recipient,
+            locked_contract.sender,
+            locked_contract.endtime,
+            locked_contract.amount,
+            locked_contract.status == Status.WITHDRAWN,
+            locked_contract.status == Status.REFUNDED
+        );
+    }
+
+    function _fund (bytes32 secret_hash, address payable recipient, uint endtime, uint amount) internal returns (bytes32 locked_contract_id) {
+
+        if (amount == 0 || amount > type(uint96).max)
+            revert InvalidAmount();
+        if (endtime <= block.timestamp || endtime > type(uint64).max)
+            revert InvalidEndtime();
+
+        locked_contract_id = sha256(abi.encodePacked(
+            secret_hash, recipient, msg.sender, endtime, amount
+        ));
+
+        if (locked_contracts[locked_contract_id].status != Status.INVALID)
+            revert LockedContractExists(locked_contract_id);
+
+        locked_contracts[locked_contract_id] = LockedContract(
+            secret_hash, recipient, uint64(endtime), Status.FUNDED, payable(msg.sender), uint96(amount)
+        );
+
+        emit log_fund (
+            locked_contract_id, secret_hash, recipient, msg.sender, endtime, amount
+        );
+    }
+
+    function _withdraw (bytes32 locked_contract_id, string calldata preimage) internal returns (uint amount) {
+
+        LockedContract storage locked_contract = locked_contracts[locked_contract_id];
+
+        if (locked_contract.status != Status.FUNDED)
+            revert LockedContractNotFunded(locked_contract_id);
+        if (locked_contract.recipient != msg.sender)
+            revert NotRecipient();
+        if (locked_contract.secret_hash != sha256(bytes(preimage)))
+            revert SecretHashMismatch();
+
+        locked_contract.status = Status.WITHDRAWN;
+
+        emit log_withdraw (
+            locked_contract_id, preimage
+        );
+        return locked_contract.amount;
+    }
+
+    function _refund (bytes32 locked_contract_id) internal returns (uint amount) {
+
+        LockedContract storage locked_contract = locked_contracts[locked_contract_id];
+
+        if (locked_contract.status != Status.FUNDED)
+            revert LockedContractNotFunded(locked_contract_id);
+        if (locked_contract.sender != msg.sender)
+            revert NotSender();
+        if (locked_contract.endtime > block.timestamp)
+            revert EndtimeNotPassed();
+
+        locked_contract.status = Status.REFUNDED;
+
+        emit log_refund (
+            locked_contract_id
+        );
+        return locked_contract.amount;
+    }
+}
@@ -4,7 +4,6 @@ from eth_account.datastructures import SignedTransaction
 from web3.contract import (
     ContractConstructor, Contract
 )
-from semantic_version.base import Version
 from datetime import datetime
 from typing import (
     Optional, Type, Union, Tuple
@@ -17,6 +16,7 @@ import json
 import sys
 import os
 
+from ...compiler import compile_contract
 from ...exceptions import (
     AddressError, NetworkError, TransactionError, UnitError
 )
@@ -29,6 +29,14 @@ from .utils import (
 )
 
 
+def _is_released(version: str, erc20: bool = False) -> bool:
+    # HTLC v2 is released only with its precompiled contract artifact
+    if version != "v2":
+        return True
+    contract_key: str = "htlc-erc20-v2" if erc20 else "htlc-v2"
+    return os.path.isfile(os.path.join(os.path.dirname(__file__), "contracts", f"{contract_key}.json"))
+
+
 class HTLC:
     """
     Ethereum Hash Time Lock Contract (HTLC).
@@ -45,24 +53,42 @@ class HTLC:
     :type token: str
     :param use_script: Initialize HTLC by using script, default to ``False``.
     :type use_script: bool
+    :param version: HTLC contract version, ``v1`` or gas optimized ``v2``, defaults to ``v1``.
+    :type version: str
 
     :returns: HTLC -- Ethereum HTLC instance.
 
     .. note::
         Ethereum has only five networks, ``mainnet``, ``ropsten``, ``kovan``, ``rinkeby`` and ``testnet``.
+
+    .. note::
+        HTLC ``v2`` is not released until its precompiled artifact is shipped in the package (written by
+        ``swap compile-contracts --artifacts``), it raises ``ValueError`` and is never compiled at runtime.
+        Only ``v2`` has batch fund, withdraw and refund functions.
     """
 
     def __init__(self, contract_address: Optional[str] = None, network: str = config["network"], erc20: bool = False,
-                 provider: str = config["provider"], token: Optional[str] = None, use_script: bool = False):
+                 provider: str = config["provider"], token: Optional[str] = None, use_script: bool = False,
+                 version: str = "v1"):
 
         # Check parameter instances
         if not is_network(network=network):
             raise NetworkError(f"Invalid Ethereum '{network}' network",
                                "choose only 'mainnet', 'ropsten', 'kovan', 'rinkeby' or 'testnet' networks.")
+        if version not in ["v1", "v2"]:
+            raise ValueError(f"Invalid Ethereum HTLC '{version}' version, choose only 'v1' or 'v2' versions.")
+        if not _is_released(version=version, erc20=erc20):
+            raise ValueError(f"Ethereum HTLC '{version}' version is not released yet, "
+                             "its precompiled contract artifact is not shipped.")
 
         self._contract_address: Optional[str, ChecksumAddress] = None
         self._network: str = network
         self._erc20: bool = erc20
+        self._version: str = version
+        # HTLC contract key, like htlc, htlc_erc20, htlc_v2 or htlc_erc20_v2
+        contract_key: str = ("htlc_erc20" if self._erc20 else "htlc") + (
+            "_v2" if self._version == "v2" else ""
+        )
 
         if contract_address:
             if not is_address(address=contract_address):
@@ -70,9 +96,9 @@ class HTLC:
             self._contract_address: ChecksumAddress = to_checksum_address(
                 address=contract_address
             )
-        elif config[self._network]["contract_addresses"]["htlc_erc20" if self._erc20 else "htlc"]:
+        elif config[self._network]["contract_addresses"][contract_key]:
             self._contract_address: ChecksumAddress = to_checksum_address(
-                address=config[self._network]["contract_addresses"]["htlc_erc20" if self._erc20 else "htlc"]
+                address=config[self._network]["contract_addresses"][contract_key]
             )
 
         self.agreements: Optional[dict] = None
@@ -82,22 +108,19 @@ class HTLC:
 
         # Get current working directory path (like linux or unix path).
         cwd: str = os.path.dirname(sys.modules[__package__].__file__)
-        sol_source_name: str = "htlc-erc20.sol" if self._erc20 else "htlc.sol"
-        sol_source_with_class_name: str = "htlc-erc20.sol:HTLC_ERC20" if self._erc20 else "htlc.sol:HTLC"
-        json_source_name: str = "htlc-erc20.json" if self._erc20 else "htlc.json"
-
-        if use_script:
-            solcx = __import__("solcx")
-            compiled_files: dict = solcx.compile_files(
-                source_files=[f"{cwd}/contracts/{sol_source_name}"],
-                output_values=["abi", "bin", "bin-runtime", "opcodes"],
-                solc_version=Version("0.8.6")
+        sol_source_name: str = f"{contract_key.replace('_', '-')}.sol"
+        sol_source_with_class_name: str = f"{sol_source_name}:{contract_key.upper()}"
+        json_source_name: str = f"{contract_key.replace('_', '-')}.json"
+
+        if use_script or not os.path.isfile(f"{cwd}/contracts/{json_source_name}"):
+            compiled_file: dict = compile_contract(
+                source_file=f"{cwd}/contracts/{sol_source_name}",
+                contract_name=sol_source_with_class_name.split(":")[1]
             )
-
-            self._abi: list = compiled_files[f"{cwd}/contracts/{sol_source_with_class_name}"]["abi"]
-            self._bytecode: str = compiled_files[f"{cwd}/contracts/{sol_source_with_class_name}"]["bin"]
-            self._bytecode_runtime: str = compiled_files[f"{cwd}/contracts/{sol_source_with_class_name}"]["bin-runtime"]
-            self._opcodes: str = compiled_files[f"{cwd}/contracts/{sol_source_with_class_name}"]["opcodes"]
+            self._abi: list = compiled_file["abi"]
+            self._bytecode: str = compiled_file["bin"]
+            self._bytecode_runtime: str = compiled_file["bin-runtime"]
+            self._opcodes: str = compiled_file["opcodes"]
         else:
             with open(f"{cwd}/contracts/{json_source_name}", "r") as htlc_json_file:
                 compiled_file: dict = json.loads(htlc_json_file.read())[sol_source_with_class_name]
@@ -3,23 +3,24 @@
 from web3 import Web3
 from web3.types import Wei
 from web3.providers import (
-    HTTPProvider, WebsocketProvider
+    HTTPProvider, WebsocketProvider, IPCProvider, BaseProvider
 )
 from web3.contract import Contract
 from pyxdc.utils import decode_transaction_raw as dtr
 from hexbytes.main import HexBytes
 from eth_typing import URI
 from typing import (
-    Optional, Tuple
+    Optional, Tuple, Dict
 )
 
 import web3 as _web3
 import json
+import time
 import sys
 import os
 
 from ...exceptions import (
-    AddressError, NetworkError
+    AddressError, NetworkError, APIError
 )
 from ..config import ethereum as config
 from .utils import (
@@ -27,6 +28,98 @@ from .utils import (
 )
 
 
+# Ethereum Web3 instances per provider uri, keeps connections open across calls.
+_web3s: Dict[str, Web3] = {}
+# Selected Ethereum provider uri and its last health check time per network.
+_selected: Dict[str, Tuple[str, float]] = {}
+# Ethereum failover Web3 instances per network and providers list.
+_failovers: Dict[Tuple[str, ...], Web3] = {}
+
+
+def _get_web3(uri: str) -> Web3:
+    if uri not in _web3s:
+        if uri.startswith("http://") or uri.startswith("https://"):
+            _provider: BaseProvider = HTTPProvider(
+                endpoint_uri=URI(uri), request_kwargs={
+                    "timeout": config["timeout"]
+                }
+            )
+        elif uri.startswith("ws://") or uri.startswith("wss://"):
+            _provider: BaseProvider = WebsocketProvider(endpoint_uri=URI(uri))
+        else:
+            _provider: BaseProvider = IPCProvider(
+                ipc_path=os.path.expanduser(uri), timeout=config["timeout"]
+            )
+        _web3s[uri] = Web3(_provider)
+    return _web3s[uri]
+
+
+def _latency(web3: Web3) -> Optional[float]:
+    start: float = time.perf_counter()
+    try:
+        web3.eth.block_number
+    except Exception:
+        return None
+    return time.perf_counter() - start
+
+
+def _select_uri(network: str, uris: list) -> str:
+    if network in _selected and _selected[network][0] in uris and \
+            (time.monotonic() - _selected[network][1]) < config["health_check_interval"]:
+        return _selected[network][0]
+    # Health check every provider, select the lowest latency one by providers order
+    latencies: Dict[str, float] = {}
+    for uri in uris:
+        latency: Optional[float] = _latency(web3=_get_web3(uri=uri))
+        if latency is not None:
+            latencies[uri] = latency
+    if not latencies:
+        _selected.pop(network, None)
+        raise APIError(f"There is no healthy Ethereum provider on '{network}' network.")
+    uri: str = min(latencies, key=lambda _uri: latencies[_uri])
+    _selected[network] = (uri, time.monotonic())
+    return uri
+
+
+class _FailoverProvider(BaseProvider):
+    # Sends each request to the selected provider, a failed request drops the selection
+    # and is retried on the next healthy provider until none is left.
+
+    def __init__(self, network: str, uris: list):
+        super().__init__()
+        self.network: str = network
+        self.uris: list = uris
+
+    def make_request(self, method, params):
+        failed: list = []
+        while True:
+            uri: str = _select_uri(network=self.network, uris=[
+                _uri for _uri in self.uris if _uri not in failed
+            ])
+            try:
+                return _get_web3(uri=uri).provider.make_request(method, params)
+            except Exception:
+                failed.append(uri)
+                if _selected.get(self.network, (None,))[0] == uri:
+                    _selected.pop(self.network, None)
+
+    def isConnected(self) -> bool:
+        try:
+            _select_uri(network=self.network, uris=self.uris)
+        except APIError:
+            return False
+        return True
+
+
+def _select_web3(network: str, uris: list) -> Web3:
+    # Fails early when there is no healthy provider
+    _select_uri(network=network, uris=uris)
+    key: Tuple[str, ...] = (network, *uris)
+    if key not in _failovers:
+        _failovers[key] = Web3(_FailoverProvider(network=network, uris=uris))
+    return _failovers[key]
+
+
 def get_web3(network: str = config["network"], provider: str = config["provider"],
              token: Optional[str] = None) -> Web3:
     """
@@ -44,6 +137,11 @@ def get_web3(network: str = config["network"], provider: str = config["provider"
     >>> from swap.providers.ethereum.rpc import get_web3
     >>> get_web3(network="testnet", provider="http", token="infura endpoint token ...")
     <web3.main.Web3 object at 0x000001DDECCD0640>
+
+    .. note::
+        Web3 instances are kept per provider uri, ``ipc`` connects to the co-located node IPC path and
+        ``auto`` fails over between the network providers list, selecting the healthy one with lowest latency
+        and moving to the next one as soon as a request to the selected provider fails.
     """
 
     # Check parameter instances
@@ -54,30 +152,23 @@ def get_web3(network: str = config["network"], provider: str = config["provider"
     endpoint: str = "ganache-cli" if network == "testnet" else "infura"
     token: str = token if token else config[network][endpoint]["token"]
 
-    if provider == "http":
-        web3: Web3 = Web3(HTTPProvider(
-                URI(
-                    f"{config[network]['infura']['http']}/{token}"
-                    if token else config[network][endpoint]["http"]
-                ),
-                request_kwargs={
-                    "timeout": config["timeout"]
-                }
-            )
-        )
-        return web3
+    if provider == "auto":
+        return _select_web3(network=network, uris=[
+            uri.format(token=token) for uri in config[network]["providers"]
+        ])
+    elif provider == "http":
+        uri: str = f"{config[network]['infura']['http']}/{token}" if token else config[network][endpoint]["http"]
     elif provider == "websocket":
-        web3: Web3 = Web3(WebsocketProvider(
-                URI(
-                    f"{config[network]['infura']['websocket']}/{token}"
-                    if token else config[network][endpoint]["websocket"]
-                )
-            )
-        )
-        return web3
+        uri: str = f"{config[network]['infura']['websocket']}/{token}" \
+            if token else config[network][endpoint]["websocket"]
+    elif provider == "ipc":
+        if not config[network]["ipc"]:
+            raise ValueError(f"There is no Ethereum IPC path on '{network}' network.")
+        uri: str = config[network]["ipc"]
     else:
         raise ValueError(f"Invalid Ethereum '{provider}' provider",
-                         "choose only 'http' or 'websocket' providers.")
+                         "choose only 'http', 'websocket', 'ipc' or 'auto' providers.")
+    return _get_web3(uri=uri)
 
 
 def get_balance(address: str, network: str = config["network"], provider: str = config["provider"],
@@ -112,6 +203,37 @@ def get_balance(address: str, network: str = config["network"], provider: str =
     return Wei(balance)
 
 
+def get_transaction_count(address: str, network: str = config["network"], provider: str = config["provider"],
+                          token: Optional[str] = None) -> int:
+    """
+    Get Ethereum address transaction count (nonce).
+
+    :param address: Ethereum address.
+    :type address: str
+    :param network: Ethereum network, defaults to ``mainnet``.
+    :type network: str
+    :param provider: Ethereum network provider, defaults to ``http``.
+    :type provider: str
+    :param token: Infura API endpoint token, defaults to ``4414fea5f7454211956b1627621450b4``.
+    :type token: str
+
+    :returns: int -- Ethereum address sent transaction count.
+
+    >>> from swap.providers.ethereum.rpc import get_transaction_count
+    >>> get_transaction_count(address="0xbaF2Fc3829B6D25739BeDC18a5A83bF519c6Fe8c", network="testnet")
+    7
+    """
+
+    # Check parameter instances
+    if not is_address(address=address):
+        raise AddressError(f"Invalid Ethereum '{address}' address.")
+
+    web3: Web3 = get_web3(network=network, provider=provider, token=token)
+    return web3.eth.get_transaction_count(
+        to_checksum_address(address=address)
+    )
+
+
 def get_erc20_balance(address: str, token_address: str, network: str = config["network"],
                       provider: str = config["provider"], token: Optional[str] = None) -> Tuple[int, str, str, int, str]:
     """
@@ -1,15 +1,17 @@
 #!/usr/bin/env python3
 
-from base64 import b64encode, b64decode
 from eth_account.datastructures import SignedTransaction
+from eth_keys.datatypes import PrivateKey
 from web3.types import Wei
+from binascii import unhexlify
 from typing import (
-    Optional, Union
+    Optional, Union, List, Callable
 )
 
-import json
-
-from ...utils import clean_transaction_raw
+from ...utils import (
+    TransactionEnvelope, clean_transaction_raw, encode_transaction_raw, load_transaction_raw, _sign_many
+)
+from ...crypto import get_backend
 from ...exceptions import (
     TransactionRawError, UnitError
 )
@@ -24,6 +26,13 @@ from .utils import (
 )
 
 
+def _private_key(wallet: Wallet) -> PrivateKey:
+    # Ethereum private key, signing through the selected secp256k1 backend
+    return PrivateKey(
+        private_key_bytes=unhexlify(wallet.private_key()), backend=get_backend().eth_keys_backend
+    )
+
+
 class Signature(Transaction):
     """
     Ethereum Signature.
@@ -162,13 +171,14 @@ class Signature(Transaction):
 
         return self._type
 
-    def sign(self, transaction_raw: str, solver: Union[NormalSolver, FundSolver, WithdrawSolver, RefundSolver]) -> \
+    def sign(self, transaction_raw: Union[str, TransactionEnvelope],
+             solver: Union[NormalSolver, FundSolver, WithdrawSolver, RefundSolver]) -> \
             Union["NormalSignature", "FundSignature", "WithdrawSignature", "RefundSignature"]:
         """
         Sign Ethereum unsigned transaction raw.
 
-        :param transaction_raw: Ethereum unsigned transaction raw.
-        :type transaction_raw: str
+        :param transaction_raw: Ethereum unsigned transaction raw or transaction envelope.
+        :type transaction_raw: str, swap.utils.TransactionEnvelope
         :param solver: Ethereum solver.
         :type solver: ethereum.solver.NormalSolver, ethereum.solver.FundSolver, ethereum.solver.WithdrawSolver, ethereum.solver.RefundSolver
 
@@ -182,45 +192,42 @@ class Signature(Transaction):
         <swap.providers.ethereum.signature.FundSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Bytom unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         self._type = loaded_transaction_raw["type"]
         if loaded_transaction_raw["type"] == "ethereum_normal_unsigned":
             return NormalSignature(network=self._network, erc20=False).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "ethereum_erc20_normal_unsigned":
             return NormalSignature(network=self._network, erc20=True).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "ethereum_fund_unsigned":
             return FundSignature(network=self._network, erc20=False).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "ethereum_erc20_fund_unsigned":
             return FundSignature(network=self._network, erc20=True).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "ethereum_withdraw_unsigned":
             return WithdrawSignature(network=self._network, erc20=False).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "ethereum_erc20_withdraw_unsigned":
             return WithdrawSignature(network=self._network, erc20=True).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "ethereum_refund_unsigned":
             return RefundSignature(network=self._network, erc20=False).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "ethereum_erc20_refund_unsigned":
             return RefundSignature(network=self._network, erc20=True).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
 
     def signature(self) -> dict:
@@ -289,12 +296,12 @@ class NormalSignature(Signature):
             network=network, erc20=erc20, provider=provider, token=token
         )
 
-    def sign(self, transaction_raw: str, solver: NormalSolver) -> "NormalSignature":
+    def sign(self, transaction_raw: Union[str, TransactionEnvelope], solver: NormalSolver) -> "NormalSignature":
         """
         Sign Ethereum unsigned normal transaction raw.
 
-        :param transaction_raw: Ethereum unsigned normal transaction raw.
-        :type transaction_raw: str
+        :param transaction_raw: Ethereum unsigned normal transaction raw or transaction envelope.
+        :type transaction_raw: str, swap.utils.TransactionEnvelope
         :param solver: Ethereum solver.
         :type solver: ethereum.solver.NormalSolver
 
@@ -309,13 +316,10 @@ class NormalSignature(Signature):
         """
 
         # Check parameter instances
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Ethereum unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if loaded_transaction_raw["type"] not in ["ethereum_normal_unsigned", "ethereum_erc20_normal_unsigned"]:
             raise TypeError(f"Invalid Ethereum normal unsigned transaction raw type, "
                             f"you can't sign '{loaded_transaction_raw['type']}' type by using normal signature.")
@@ -333,7 +337,7 @@ class NormalSignature(Signature):
         wallet: Wallet = solver.solve()
         signed_normal_transaction: SignedTransaction = self.web3.eth.account.sign_transaction(
             transaction_dict=self._transaction,
-            private_key=wallet.private_key()
+            private_key=_private_key(wallet=wallet)
         )
 
         self._signature = dict(
@@ -345,14 +349,14 @@ class NormalSignature(Signature):
         )
         self._type = "ethereum_erc20_normal_signed" if self._erc20 else "ethereum_normal_signed"
 
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = encode_transaction_raw(transaction=dict(
             fee=self._fee,
             type=self._type,
             transaction=self._transaction,
             signature=self._signature,
             network=self._network,
             erc20=self._erc20
-        ))).encode()).decode()
+        ), binary=loaded_transaction_raw.binary)
         return self
 
 
@@ -381,12 +385,12 @@ class FundSignature(Signature):
             network=network, erc20=erc20, provider=provider, token=token
         )
 
-    def sign(self, transaction_raw: str, solver: FundSolver) -> "FundSignature":
+    def sign(self, transaction_raw: Union[str, TransactionEnvelope], solver: FundSolver) -> "FundSignature":
         """
         Sign Ethereum unsigned fund transaction raw.
 
-        :param transaction_raw: Ethereum unsigned fund transaction raw.
-        :type transaction_raw: str
+        :param transaction_raw: Ethereum unsigned fund transaction raw or transaction envelope.
+        :type transaction_raw: str, swap.utils.TransactionEnvelope
         :param solver: Ethereum solver.
         :type solver: ethereum.solver.FundSolver
 
@@ -401,13 +405,10 @@ class FundSignature(Signature):
         """
 
         # Check parameter instances
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Ethereum unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if loaded_transaction_raw["type"] not in ["ethereum_fund_unsigned", "ethereum_erc20_fund_unsigned"]:
             raise TypeError(f"Invalid Ethereum fund unsigned transaction raw type, "
                             f"you can't sign '{loaded_transaction_raw['type']}' type by using fund signature.")
@@ -425,7 +426,7 @@ class FundSignature(Signature):
         wallet: Wallet = solver.solve()
         signed_fund_transaction: SignedTransaction = self.web3.eth.account.sign_transaction(
             transaction_dict=self._transaction,
-            private_key=wallet.private_key()
+            private_key=_private_key(wallet=wallet)
         )
 
         self._signature = dict(
@@ -437,14 +438,14 @@ class FundSignature(Signature):
         )
         self._type = "ethereum_erc20_fund_signed" if self._erc20 else "ethereum_fund_signed"
 
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = encode_transaction_raw(transaction=dict(
             fee=self._fee,
             type=self._type,
             transaction=self._transaction,
             signature=self._signature,
             network=self._network,
             erc20=self._erc20
-        ))).encode()).decode()
+        ), binary=loaded_transaction_raw.binary)
         return self
 
 
@@ -473,12 +474,12 @@ class WithdrawSignature(Signature):
             network=network, erc20=erc20, provider=provider, token=token
         )
 
-    def sign(self, transaction_raw: str, solver: WithdrawSolver) -> "WithdrawSignature":
+    def sign(self, transaction_raw: Union[str, TransactionEnvelope], solver: WithdrawSolver) -> "WithdrawSignature":
         """
         Sign Ethereum unsigned withdraw transaction raw.
 
-        :param transaction_raw: Ethereum unsigned withdraw transaction raw.
-        :type transaction_raw: str
+        :param transaction_raw: Ethereum unsigned withdraw transaction raw or transaction envelope.
+        :type transaction_raw: str, swap.utils.TransactionEnvelope
         :param solver: Ethereum withdraw solver.
         :type solver: ethereum.solver.WithdrawSolver
 
@@ -493,13 +494,10 @@ class WithdrawSignature(Signature):
         """
 
         # Check parameter instances
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Ethereum unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if loaded_transaction_raw["type"] not in ["ethereum_withdraw_unsigned", "ethereum_erc20_withdraw_unsigned"]:
             raise TypeError(f"Invalid Ethereum withdraw unsigned transaction raw type, "
                             f"you can't sign '{loaded_transaction_raw['type']}' type by using withdraw signature.")
@@ -517,7 +515,7 @@ class WithdrawSignature(Signature):
         wallet: Wallet = solver.solve()
         signed_fund_transaction: SignedTransaction = self.web3.eth.account.sign_transaction(
             transaction_dict=self._transaction,
-            private_key=wallet.private_key()
+            private_key=_private_key(wallet=wallet)
         )
 
         self._signature = dict(
@@ -529,14 +527,14 @@ class WithdrawSignature(Signature):
         )
         self._type = "ethereum_erc20_withdraw_signed" if self._erc20 else "ethereum_withdraw_signed"
 
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = encode_transaction_raw(transaction=dict(
             fee=self._fee,
             type=self._type,
             transaction=self._transaction,
             signature=self._signature,
             network=self._network,
             erc20=self._erc20
-        ))).encode()).decode()
+        ), binary=loaded_transaction_raw.binary)
         return self
 
 
@@ -565,12 +563,12 @@ class RefundSignature(Signature):
             network=network, erc20=erc20, provider=provider, token=token
         )
 
-    def sign(self, transaction_raw: str, solver: RefundSolver) -> "RefundSignature":
+    def sign(self, transaction_raw: Union[str, TransactionEnvelope], solver: RefundSolver) -> "RefundSignature":
         """
         Sign Ethereum unsigned refund transaction raw.
 
-        :param transaction_raw: Ethereum unsigned refund transaction raw.
-        :type transaction_raw: str
+        :param transaction_raw: Ethereum unsigned refund transaction raw or transaction envelope.
+        :type transaction_raw: str, swap.utils.TransactionEnvelope
         :param solver: Ethereum refund solver.
         :type solver: ethereum.solver.RefundSolver
 
@@ -585,13 +583,10 @@ class RefundSignature(Signature):
         """
 
         # Check parameter instances
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Ethereum unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if loaded_transaction_raw["type"] not in ["ethereum_refund_unsigned", "ethereum_erc20_refund_unsigned"]:
             raise TypeError(f"Invalid Ethereum refund unsigned transaction raw type, "
                             f"you can't sign '{loaded_transaction_raw['type']}' type by using refund signature.")
@@ -609,7 +604,7 @@ class RefundSignature(Signature):
         wallet: Wallet = solver.solve()
         signed_fund_transaction: SignedTransaction = self.web3.eth.account.sign_transaction(
             transaction_dict=self._transaction,
-            private_key=wallet.private_key()
+            private_key=_private_key(wallet=wallet)
         )
 
         self._signature = dict(
@@ -621,12 +616,49 @@ class RefundSignature(Signature):
         )
         self._type = "ethereum_erc20_refund_signed" if self._erc20 else "ethereum_refund_signed"
 
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = encode_transaction_raw(transaction=dict(
             fee=self._fee,
             type=self._type,
             transaction=self._transaction,
             signature=self._signature,
             network=self._network,
             erc20=self._erc20
-        ))).encode()).decode()
+        ), binary=loaded_transaction_raw.binary)
         return self
+
+
+def sign_many(transaction_raws: List[Union[str, TransactionEnvelope]], solver_factory: Callable,
+              workers: Optional[int] = None, network: str = config["network"],
+              provider: str = config["provider"], token: Optional[str] = None) -> List[dict]:
+    """
+    Sign many Ethereum unsigned transaction raws over a process pool.
+
+    :param transaction_raws: Ethereum unsigned transaction raws or transaction envelopes.
+    :type transaction_raws: list
+    :param solver_factory: Picklable callable, called once per worker, returning an Ethereum solver or a callable that takes the transaction envelope and returns its solver.
+    :type solver_factory: callable
+    :param workers: Number of worker processes, defaults to CPU count (``1`` signs in this process).
+    :type workers: int
+    :param network: Ethereum network, defaults to ``mainnet``.
+    :type network: str
+    :param provider: Ethereum network provider, defaults to ``http``.
+    :type provider: str
+    :param token: Infura API endpoint token, defaults to ``None``.
+    :type token: str
+
+    :returns: list -- Ethereum signed transaction raw and error per transaction raw, in input order.
+
+    >>> from functools import partial
+    >>> from swap.providers.ethereum.signature import sign_many
+    >>> from swap.providers.ethereum.solver import FundSolver
+    >>> sign_many(transaction_raws=["eyJmZWUiOiAxMzg0NDgsICJ0cmFuc2FjdGlvbiI6IHsiY2hhaW5JZCI6IDEzMzcsICJmcm9tIjogIjB4NjllMDRmZTE2YzlBNkE4MzA3NkIzYzJkYzRiNEJjMjFiNWQ5QTIwQyIsICJ2YWx1ZSI6IDMwMDAwMDAwMDAwMDAwMDAwMDAsICJub25jZSI6IDEsICJnYXMiOiAxMzg0NDgsICJnYXNQcmljZSI6IDIwMDAwMDAwMDAwLCAidG8iOiAiMHhlYUVhQzgxZGE1RTM4NkU4Q2E0RGUxZTY0ZDQwYTEwRTQ2OEE1YjQwIiwgImRhdGEiOiAiMHhmNGZkMzA2MjNhMjZkYTgyZWFkMTVhODA1MzNhMDI2OTY2NTZiMTRiNWRiZmQ4NGViMTQ3OTBmMmUxYmU1ZTllNDU4MjBlZWIwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDBkNzdlMGQyZWVmOTA1Y2ZiMzljM2M0Yjk1MmVkMjc4ZDU4Zjk2ZTFmMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwNjllMDRmZTE2YzlhNmE4MzA3NmIzYzJkYzRiNGJjMjFiNWQ5YTIwYzAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwNjBjZTRiNzIifSwgInNpZ25hdHVyZSI6IG51bGwsICJuZXR3b3JrIjogInRlc3RuZXQiLCAidHlwZSI6ICJldGhlcmV1bV9mdW5kX3Vuc2lnbmVkIn0", "meheret"], solver_factory=partial(FundSolver, xprivate_key="xprv9s21ZrQH143K3Y3pdbkbjreZQ9RVmqTLhRgf86uZyCJk2ou36YdUJt5frjwihGWmV1fQEDioiGZXWXUbHLy3kQf5xmhvhp8dZ2tfn6tgGUj"), workers=2, network="testnet")
+    [{'transaction_raw': '...', 'error': None}, {'transaction_raw': None, 'error': 'TransactionRawError: Invalid transaction raw., ...'}]
+
+    .. note::
+        One failing transaction raw doesn't fail the batch, its error is reported with ``transaction_raw`` as ``None``.
+    """
+
+    return _sign_many(
+        signature=Signature, signature_kwargs=dict(network=network, provider=provider, token=token),
+        transaction_raws=transaction_raws, solver_factory=solver_factory, workers=workers
+    )
@@ -2,14 +2,18 @@
 
 from binascii import unhexlify
 from eth_account.datastructures import SignedTransaction
+from eth_account import Account
 from web3.datastructures import AttributeDict
 from web3.contract import Contract
+from web3.logs import DISCARD
+from web3.exceptions import (
+    BadFunctionCallOutput, ContractLogicError
+)
 from web3 import Web3
 from web3.types import Wei
 from typing import (
-    Optional, Union
+    Optional, Union, List, Tuple, Set
 )
-from base64 import b64encode
 
 import json
 import sys
@@ -18,19 +22,57 @@ import os
 from ...exceptions import (
     AddressError, NetworkError, UnitError
 )
-from ...utils import clean_transaction_raw
+from ...utils import (
+    encode_transaction_raw, sha256
+)
 from ..config import ethereum as config
 from .wallet import Wallet
-from .htlc import HTLC
+from .htlc import (
+    HTLC, _is_released
+)
 from .rpc import get_web3
 from .utils import (
-    is_network, is_address, to_checksum_address, amount_unit_converter
+    is_network, is_address, to_checksum_address, amount_unit_converter, get_permit_hash
 )
 from .solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
 )
 
 
+# EIP-2612 permit functions of the ERC20 token.
+_PERMIT_ABI: list = [
+    {
+        "inputs": [{"name": "owner", "type": "address"}], "name": "nonces",
+        "outputs": [{"name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"
+    },
+    {
+        "inputs": [], "name": "DOMAIN_SEPARATOR",
+        "outputs": [{"name": "", "type": "bytes32"}], "stateMutability": "view", "type": "function"
+    }
+]
+
+
+def _locked_contracts(web3: Web3, htlc_contract: Contract, transaction_hashes: List[str]) -> List[AttributeDict]:
+    # HTLC log_fund event arguments of funded transactions, a batch fund transaction has many
+    locked_contracts: List[AttributeDict] = []
+    locked_contract_ids: Set[bytes] = set()
+    # Drop duplicate transaction hashes and locked contract ids, spending one twice reverts the batch
+    for transaction_hash in dict.fromkeys(transaction_hashes):
+        transaction_receipt: AttributeDict = web3.eth.get_transaction_receipt(transaction_hash)
+        for log_fund in htlc_contract.events.log_fund().processReceipt(transaction_receipt, errors=DISCARD):
+            if log_fund["address"] != htlc_contract.address \
+                    or log_fund["args"]["locked_contract_id"] in locked_contract_ids:
+                continue
+            locked_contract_ids.add(log_fund["args"]["locked_contract_id"])
+            # Skip already withdrawn or refunded locked contracts, spending them again reverts
+            withdrawn, refunded = htlc_contract.functions.get_locked_contract(
+                log_fund["args"]["locked_contract_id"]
+            ).call()[-2:]
+            if not withdrawn and not refunded:
+                locked_contracts.append(log_fund["args"])
+    return locked_contracts
+
+
 class Transaction:
     """
     Ethereum Transaction.
@@ -43,6 +85,8 @@ class Transaction:
     :type provider: str
     :param token: Infura API endpoint token, defaults to ``4414fea5f7454211956b1627621450b4``.
     :type token: str
+    :param version: HTLC contract version, ``v1`` or ``v2``, defaults to ``v1``.
+    :type version: str
 
     :returns: Transaction -- Ethereum transaction instance.
 
@@ -51,15 +95,22 @@ class Transaction:
     """
 
     def __init__(self, network: str = config["network"], erc20: bool = False,
-                 provider: str = config["provider"], token: Optional[str] = None):
+                 provider: str = config["provider"], token: Optional[str] = None, version: str = "v1"):
 
         # Check parameter instances
         if not is_network(network=network):
             raise NetworkError(f"Invalid Ethereum '{network}' network",
                                "choose only 'mainnet', 'ropsten', 'kovan', 'rinkeby' or 'testnet' networks.")
 
+        if version not in ["v1", "v2"]:
+            raise ValueError(f"Invalid Ethereum HTLC '{version}' version, choose only 'v1' or 'v2' versions.")
+        if not _is_released(version=version, erc20=erc20):
+            raise ValueError(f"Ethereum HTLC '{version}' version is not released yet, "
+                             "its precompiled contract artifact is not shipped.")
+
         self._erc20: bool = erc20
         self._network: str = network
+        self._version: str = version
         self.web3: Web3 = get_web3(
             network=network, provider=provider, token=token
         )
@@ -207,10 +258,13 @@ class Transaction:
 
         return self._signature
 
-    def transaction_raw(self) -> str:
+    def transaction_raw(self, binary: bool = False) -> str:
         """
         Get Ethereum fund transaction raw.
 
+        :param binary: Encode as compact binary envelope, defaults to ``False``.
+        :type binary: bool
+
         :returns: str -- Ethereum fund transaction raw.
 
         >>> from swap.providers.ethereum.htlc import HTLC
@@ -228,14 +282,14 @@ class Transaction:
         if not self._transaction:
             raise ValueError("Transaction is none, build transaction first.")
 
-        return clean_transaction_raw(b64encode(str(json.dumps(dict(
+        return encode_transaction_raw(transaction=dict(
             fee=self._fee,
             type=self._type,
             transaction=self._transaction,
             signature=self._signature,
             network=self._network,
             erc20=self._erc20
-        ))).encode()).decode())
+        ), binary=binary)
 
 
 class NormalTransaction(Transaction):
@@ -411,19 +465,25 @@ class FundTransaction(Transaction):
             network=network, erc20=erc20, provider=provider, token=token
         )
 
-    def build_transaction(self, address: str, htlc: HTLC, amount: Union[Wei, int],
-                          unit: str = config["unit"]) -> "FundTransaction":
+    def build_transaction(self, address: str, htlc: Union[HTLC, List[Tuple[HTLC, Union[Wei, int, float]]]],
+                          amount: Optional[Union[Wei, int, float]] = None, unit: str = config["unit"],
+                          permit_solver: Optional[FundSolver] = None,
+                          deadline: Optional[int] = None) -> "FundTransaction":
         """
         Build Ethereum fund transaction.
 
         :param address: Ethereum sender address.
         :type address: str
-        :param htlc: Ethereum HTLC instance.
-        :type htlc: ethereum.htlc.HTLC
-        :param amount: Ethereum amount or ERC20 amount.
+        :param htlc: Ethereum HTLC instance or list of (HTLC, amount) pairs.
+        :type htlc: ethereum.htlc.HTLC, list
+        :param amount: Ethereum amount or ERC20 amount, default to ``None``.
         :type amount: Wei, int, float
         :param unit: Ethereum unit, default to ``Wei``.
         :type unit: str
+        :param permit_solver: Ethereum fund solver to sign an ERC20 EIP-2612 permit, defaults to ``None``.
+        :type permit_solver: ethereum.solver.FundSolver
+        :param deadline: ERC20 permit expiry timestamp, defaults to HTLC endtime.
+        :type deadline: int
 
         :returns: FundTransaction -- Ethereum fund transaction instance.
 
@@ -435,28 +495,90 @@ class FundTransaction(Transaction):
         >>> fund_transaction: FundTransaction = FundTransaction(network="mainnet")
         >>> fund_transaction.build_transaction(address="0x69e04fe16c9A6A83076B3c2dc4b4Bc21b5d9A20C", htlc=htlc, amount=100_000_000)
         <swap.providers.ethereum.transaction.FundTransaction object at 0x0409DAF0>
+
+        .. note::
+            To fund many HTLC's in one transaction, pass a list of (HTLC, amount) pairs as ``htlc``
+            and leave ``amount`` as ``None``. All HTLC's must be ``v2`` version on the same contract address.
+
+        .. note::
+            With ``permit_solver``, an ERC20 ``v2`` HTLC is funded by ``fund_with_permit`` and no approve
+            transaction is needed. Tokens without EIP-2612 permit and ``v1`` HTLC's fall back to ``fund``,
+            which needs the HTLC contract to be approved first.
         """
 
         # Check parameter instances
         if not is_address(address=address):
             raise AddressError(f"Invalid Ethereum sender '{address}' address.")
-        if not isinstance(htlc, HTLC):
-            raise TypeError("Invalid Ethereum HTLC instance, only takes Ethereum HTLC class")
-        if to_checksum_address(address=address) != htlc.agreements["sender_address"]:
-            raise AddressError(f"Wrong Ethereum sender '{address}' address",
-                               "address must be match with HTLC agreements sender address.")
         if unit not in ["Ether", "Gwei", "Wei"]:
             raise UnitError("Invalid Ethereum unit, choose only 'Ether', 'Gwei' or 'Wei' units.")
 
-        _amount: Union[Wei, int, float] = Wei(
-            amount if unit == "Wei" else amount_unit_converter(amount=amount, unit_from=f"{unit}2Wei")
-        ) if not self._erc20 else amount
+        htlcs: List[Tuple[HTLC, Union[Wei, int, float]]] = (
+            htlc if isinstance(htlc, list) else [(htlc, amount)]
+        )
+        if not htlcs:
+            raise ValueError("Invalid Ethereum HTLC's, at least one HTLC is required.")
+        if isinstance(htlc, list) and amount is not None:
+            raise ValueError("Amount must be None when funding multiple HTLC's, set amount on each HTLC pair.")
+
+        amounts: List[Union[Wei, int, float]] = []
+        for _htlc, _amount in htlcs:
+            if not isinstance(_htlc, HTLC):
+                raise TypeError("Invalid Ethereum HTLC instance, only takes Ethereum HTLC class")
+            if to_checksum_address(address=address) != _htlc.agreements["sender_address"]:
+                raise AddressError(f"Wrong Ethereum sender '{address}' address",
+                                   "address must be match with HTLC agreements sender address.")
+            if _htlc.contract_address() != htlcs[0][0].contract_address():
+                raise ValueError("Invalid Ethereum HTLC's, all HTLC's must be on the same contract address.")
+            if _amount is None:
+                raise ValueError("Invalid Ethereum amount, amount is required for each HTLC.")
+            amounts.append(Wei(
+                _amount if unit == "Wei" else amount_unit_converter(amount=_amount, unit_from=f"{unit}2Wei")
+            ) if not self._erc20 else _amount)
+        htlc = htlcs[0][0]
+        _amount: Union[Wei, int, float] = sum(amounts)
 
         htlc_contract: Contract = self.web3.eth.contract(
             address=htlc.contract_address(), abi=htlc.abi()
         )
 
-        if self._erc20:
+        permit: Optional[tuple] = self._permit(
+            address=address, htlc=htlc, amount=_amount, permit_solver=permit_solver, deadline=deadline
+        ) if self._erc20 and permit_solver is not None and len(htlcs) == 1 else None
+
+        if len(htlcs) > 1:
+            if "fund_batch" not in [function.get("name") for function in htlc.abi()]:
+                raise ValueError("Ethereum HTLC 'v1' version has no batch functions, use 'v2' version.")
+            secret_hashes: List[bytes] = [unhexlify(_htlc.agreements["secret_hash"]) for _htlc, _ in htlcs]
+            recipient_addresses: List[str] = [_htlc.agreements["recipient_address"] for _htlc, _ in htlcs]
+            endtimes: List[int] = [_htlc.agreements["endtime"]["timestamp"] for _htlc, _ in htlcs]
+            if self._erc20:
+                htlc_fund_function = htlc_contract.functions.fund_batch(
+                    [_htlc.agreements["token_address"] for _htlc, _ in htlcs],  # Token Addresses
+                    secret_hashes,  # Secret Hashes
+                    recipient_addresses,  # Recipient Addresses
+                    htlc.agreements["sender_address"],  # Sender Address
+                    endtimes,  # Locktime Seconds
+                    amounts  # Amounts
+                )
+            else:
+                htlc_fund_function = htlc_contract.functions.fund_batch(
+                    secret_hashes,  # Secret Hashes
+                    recipient_addresses,  # Recipient Addresses
+                    htlc.agreements["sender_address"],  # Sender Address
+                    endtimes,  # Locktime Seconds
+                    amounts  # Amounts
+                )
+        elif permit:
+            htlc_fund_function = htlc_contract.functions.fund_with_permit(
+                htlc.agreements["token_address"],  # Token address
+                unhexlify(htlc.agreements["secret_hash"]),  # Secret Hash
+                htlc.agreements["recipient_address"],  # Recipient Address
+                htlc.agreements["sender_address"],  # Sender Address
+                htlc.agreements["endtime"]["timestamp"],  # Locktime Seconds
+                _amount,  # Amount
+                *permit  # Permit Deadline, V, R and S
+            )
+        elif self._erc20:
             htlc_fund_function = htlc_contract.functions.fund(
                 htlc.agreements["token_address"],  # Token address
                 unhexlify(htlc.agreements["secret_hash"]),  # Secret Hash
@@ -494,6 +616,37 @@ class FundTransaction(Transaction):
         self._type = "ethereum_erc20_fund_unsigned" if self._erc20 else "ethereum_fund_unsigned"
         return self
 
+    def _permit(self, address: str, htlc: HTLC, amount: int, permit_solver: FundSolver,
+                deadline: Optional[int] = None) -> Optional[tuple]:
+        # Signed EIP-2612 permit arguments, or None when the HTLC or the token has no permit
+        if not isinstance(permit_solver, FundSolver):
+            raise TypeError(f"Solver must be Ethereum FundSolver, not {type(permit_solver).__name__} type.")
+        if "fund_with_permit" not in [function.get("name") for function in htlc.abi()]:
+            return None
+
+        token_contract: Contract = self.web3.eth.contract(
+            address=htlc.agreements["token_address"], abi=_PERMIT_ABI
+        )
+        try:
+            nonce: int = token_contract.functions.nonces(to_checksum_address(address=address)).call()
+            domain_separator: bytes = token_contract.functions.DOMAIN_SEPARATOR().call()
+        except (BadFunctionCallOutput, ContractLogicError, ValueError):
+            return None
+
+        wallet: Wallet = permit_solver.solve(network=self._network)
+        if wallet.address() != to_checksum_address(address=address):
+            raise AddressError(f"Wrong Ethereum permit solver '{wallet.address()}' address",
+                               "address must be match with HTLC agreements sender address.")
+
+        deadline = deadline if deadline is not None else htlc.agreements["endtime"]["timestamp"]
+        signed_permit = Account.signHash(get_permit_hash(
+            domain_separator=domain_separator, owner=address, spender=htlc.contract_address(),
+            value=amount, nonce=nonce, deadline=deadline
+        ), private_key=wallet.private_key())
+        return (
+            deadline, signed_permit["v"], signed_permit["r"].to_bytes(32, "big"), signed_permit["s"].to_bytes(32, "big")
+        )
+
     def sign(self, solver: FundSolver) -> "FundTransaction":
         """
         Sign Ethereum fund transaction.
@@ -549,6 +702,8 @@ class WithdrawTransaction(Transaction):
     :type provider: str
     :param token: Infura API endpoint token, defaults to ``4414fea5f7454211956b1627621450b4``.
     :type token: str
+    :param version: HTLC contract version, ``v1`` or ``v2``, defaults to ``v1``.
+    :type version: str
 
     :returns: WithdrawTransaction -- Ethereum withdraw transaction instance.
 
@@ -557,22 +712,22 @@ class WithdrawTransaction(Transaction):
     """
 
     def __init__(self, network: str = config["network"], erc20: bool = False, provider: str = config["provider"],
-                 token: Optional[str] = None):
+                 token: Optional[str] = None, version: str = "v1"):
         super().__init__(
-            network=network, erc20=erc20, provider=provider, token=token
+            network=network, erc20=erc20, provider=provider, token=token, version=version
         )
 
-    def build_transaction(self, transaction_hash: str, address: str, secret_key: str,
+    def build_transaction(self, transaction_hash: Union[str, List[str]], address: str, secret_key: Union[str, List[str]],
                           contract_address: Optional[str] = None) -> "WithdrawTransaction":
         """
         Build Ethereum withdraw transaction.
 
-        :param transaction_hash: Ethereum HTLC funded transaction hash.
-        :type transaction_hash: str
+        :param transaction_hash: Ethereum HTLC funded transaction hash or hashes.
+        :type transaction_hash: str, list
         :param address: Ethereum recipient address.
         :type address: str
-        :param secret_key: Secret password/passphrase.
-        :type secret_key: str
+        :param secret_key: Secret password/passphrase or passphrases.
+        :type secret_key: str, list
         :param contract_address: Ethereum HTLC contract address, defaults to ``None``.
         :type contract_address: str
 
@@ -582,6 +737,10 @@ class WithdrawTransaction(Transaction):
         >>> withdraw_transaction: WithdrawTransaction = WithdrawTransaction(network="mainnet")
         >>> withdraw_transaction.build_transaction(transaction_hash="0xe49ff507739f8d916ae2c9fd51dd63764658ffa42a5288a49d93bc70a933edc4", secret_key="Hello Meheret!", address="0x69e04fe16c9A6A83076B3c2dc4b4Bc21b5d9A20C", contract_address="0x67324d402ffc103d061dAfA9096ff639f0676378")
         <swap.providers.ethereum.transaction.WithdrawTransaction object at 0x0409DAF0>
+
+        .. note::
+            On ``v2`` version, every locked contract of the funded transactions with this recipient address
+            and a secret hash of the secret keys is withdrawn, many of them by one ``withdraw_batch`` call.
         """
 
         # Check parameter instances
@@ -590,23 +749,51 @@ class WithdrawTransaction(Transaction):
         if contract_address and not is_address(address=contract_address):
             raise AddressError(f"Invalid Ethereum HTLC contract '{contract_address}' address.")
 
+        transaction_hashes: List[str] = transaction_hash if isinstance(transaction_hash, list) else [transaction_hash]
+        secret_keys: List[str] = secret_key if isinstance(secret_key, list) else [secret_key]
+        if self._version == "v1" and (len(transaction_hashes) != 1 or len(secret_keys) != 1):
+            raise ValueError("Ethereum HTLC 'v1' version has no batch functions, use 'v2' version.")
+
         htlc: HTLC = HTLC(
-            contract_address=contract_address, network=self._network, erc20=self._erc20
+            contract_address=contract_address, network=self._network, erc20=self._erc20, version=self._version
         )
         htlc_contract: Contract = self.web3.eth.contract(
             address=htlc.contract_address(), abi=htlc.abi()
         )
 
-        transaction_receipt: AttributeDict = self.web3.eth.get_transaction_receipt(transaction_hash)
-        log_fund: AttributeDict = htlc_contract.events.log_fund().processLog(
-            log=transaction_receipt["logs"][2 if self._erc20 else 0]
-        )
+        if self._version == "v1":
+            transaction_receipt: AttributeDict = self.web3.eth.get_transaction_receipt(transaction_hashes[0])
+            log_fund: AttributeDict = htlc_contract.events.log_fund().processLog(
+                log=transaction_receipt["logs"][2 if self._erc20 else 0]
+            )
 
-        locked_contract_id: str = log_fund["args"]["locked_contract_id"]
-        htlc_withdraw_function = htlc_contract.functions.withdraw(
-            locked_contract_id,  # Locked Contract ID
-            secret_key  # Secret Key
-        )
+            locked_contract_id: str = log_fund["args"]["locked_contract_id"]
+            htlc_withdraw_function = htlc_contract.functions.withdraw(
+                locked_contract_id,  # Locked Contract ID
+                secret_keys[0]  # Secret Key
+            )
+        else:
+            # Match locked contracts of this recipient with the secret keys by secret hash
+            secret_hashes: dict = {sha256(_secret_key): _secret_key for _secret_key in secret_keys}
+            locked_contract_ids, preimages = [], []
+            for locked_contract in _locked_contracts(
+                web3=self.web3, htlc_contract=htlc_contract, transaction_hashes=transaction_hashes
+            ):
+                if locked_contract["recipient"] == to_checksum_address(address=address) \
+                        and locked_contract["secret_hash"].hex() in secret_hashes:
+                    locked_contract_ids.append(locked_contract["locked_contract_id"])
+                    preimages.append(secret_hashes[locked_contract["secret_hash"].hex()])
+            if not locked_contract_ids:
+                raise ValueError(f"There is no Ethereum HTLC locked contract of '{address}' recipient address "
+                                 f"with these secret keys on funded transactions.")
+
+            htlc_withdraw_function = htlc_contract.functions.withdraw(
+                locked_contract_ids[0],  # Locked Contract ID
+                preimages[0]  # Secret Key
+            ) if len(locked_contract_ids) == 1 else htlc_contract.functions.withdraw_batch(
+                locked_contract_ids,  # Locked Contract ID's
+                preimages  # Secret Keys
+            )
 
         self._fee = htlc_withdraw_function.estimateGas({
             "from": to_checksum_address(address=address),
@@ -680,6 +867,8 @@ class RefundTransaction(Transaction):
     :type provider: str
     :param token: Infura API endpoint token, defaults to ``4414fea5f7454211956b1627621450b4``.
     :type token: str
+    :param version: HTLC contract version, ``v1`` or ``v2``, defaults to ``v1``.
+    :type version: str
 
     :returns: RefundTransaction -- Ethereum refund transaction instance.
 
@@ -688,18 +877,18 @@ class RefundTransaction(Transaction):
     """
 
     def __init__(self, network: str = config["network"], erc20: bool = False,
-                 provider: str = config["provider"], token: Optional[str] = None):
+                 provider: str = config["provider"], token: Optional[str] = None, version: str = "v1"):
         super().__init__(
-            network=network, erc20=erc20, provider=provider, token=token
+            network=network, erc20=erc20, provider=provider, token=token, version=version
         )
 
-    def build_transaction(self, transaction_hash: str, address: str,
+    def build_transaction(self, transaction_hash: Union[str, List[str]], address: str,
                           contract_address: Optional[str] = None) -> "RefundTransaction":
         """
         Build Ethereum refund transaction.
 
-        :param transaction_hash: Ethereum HTLC funded transaction hash.
-        :type transaction_hash: str
+        :param transaction_hash: Ethereum HTLC funded transaction hash or hashes.
+        :type transaction_hash: str, list
         :param address: Ethereum sender address.
         :type address: str
         :param contract_address: Ethereum HTLC contract address, defaults to ``None``.
@@ -711,6 +900,10 @@ class RefundTransaction(Transaction):
         >>> refund_transaction: RefundTransaction = RefundTransaction(network="mainnet")
         >>> refund_transaction.build_transaction(transaction_hash="0xe49ff507739f8d916ae2c9fd51dd63764658ffa42a5288a49d93bc70a933edc4", address="0x69e04fe16c9A6A83076B3c2dc4b4Bc21b5d9A20C", contract_address="0x67324d402ffc103d061dAfA9096ff639f0676378")
         <swap.providers.ethereum.transaction.RefundTransaction object at 0x0409DAF0>
+
+        .. note::
+            On ``v2`` version, every locked contract of the funded transactions with this sender address
+            is refunded, many of them by one ``refund_batch`` call.
         """
 
         # Check parameter instances
@@ -719,22 +912,42 @@ class RefundTransaction(Transaction):
         if contract_address and not is_address(address=contract_address):
             raise AddressError(f"Invalid Ethereum HTLC contract '{contract_address}' address.")
 
+        transaction_hashes: List[str] = transaction_hash if isinstance(transaction_hash, list) else [transaction_hash]
+        if self._version == "v1" and len(transaction_hashes) != 1:
+            raise ValueError("Ethereum HTLC 'v1' version has no batch functions, use 'v2' version.")
+
         htlc: HTLC = HTLC(
-            contract_address=contract_address, network=self._network, erc20=self._erc20
+            contract_address=contract_address, network=self._network, erc20=self._erc20, version=self._version
         )
         htlc_contract: Contract = self.web3.eth.contract(
             address=htlc.contract_address(), abi=htlc.abi()
         )
 
-        transaction_receipt: AttributeDict = self.web3.eth.get_transaction_receipt(transaction_hash)
-        log_fund: AttributeDict = htlc_contract.events.log_fund().processLog(
-            log=transaction_receipt["logs"][2 if self._erc20 else 0]
-        )
+        if self._version == "v1":
+            transaction_receipt: AttributeDict = self.web3.eth.get_transaction_receipt(transaction_hashes[0])
+            log_fund: AttributeDict = htlc_contract.events.log_fund().processLog(
+                log=transaction_receipt["logs"][2 if self._erc20 else 0]
+            )
 
-        locked_contract_id: str = log_fund["args"]["locked_contract_id"]
-        htlc_refund_function = htlc_contract.functions.refund(
-            locked_contract_id  # Locked Contract ID
-        )
+            locked_contract_id: str = log_fund["args"]["locked_contract_id"]
+            htlc_refund_function = htlc_contract.functions.refund(
+                locked_contract_id  # Locked Contract ID
+            )
+        else:
+            locked_contract_ids: List[bytes] = [
+                locked_contract["locked_contract_id"] for locked_contract in _locked_contracts(
+                    web3=self.web3, htlc_contract=htlc_contract, transaction_hashes=transaction_hashes
+                ) if locked_contract["sender"] == to_checksum_address(address=address)
+            ]
+            if not locked_contract_ids:
+                raise ValueError(f"There is no Ethereum HTLC locked contract of '{address}' sender address "
+                                 f"on funded transactions.")
+
+            htlc_refund_function = htlc_contract.functions.refund(
+                locked_contract_ids[0]  # Locked Contract ID
+            ) if len(locked_contract_ids) == 1 else htlc_contract.functions.refund_batch(
+                locked_contract_ids  # Locked Contract ID's
+            )
 
         self._fee = htlc_refund_function.estimateGas({
             "from": to_checksum_address(address=address),
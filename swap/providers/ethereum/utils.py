@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 
-from base64 import b64decode
 from datetime import datetime
 from web3.types import ChecksumAddress
 from hexbytes.main import HexBytes
+from eth_abi import encode_abi
 from web3 import Web3
 from typing import (
     Union, Optional
@@ -13,12 +13,19 @@ import json
 import sys
 import os
 
-from ...utils import clean_transaction_raw
+from ...utils import (
+    TransactionEnvelope, load_transaction_raw
+)
 from ...exceptions import (
     AddressError, UnitError, TransactionRawError
 )
 from ..config import ethereum as config
 
+# EIP-2612 permit struct type hash.
+PERMIT_TYPEHASH: bytes = Web3.keccak(
+    text="Permit(address owner,address spender,uint256 value,uint256 nonce,uint256 deadline)"
+)
+
 
 def is_network(network: str) -> bool:
     """
@@ -106,12 +113,12 @@ def to_checksum_address(address: str) -> ChecksumAddress:
     return Web3.toChecksumAddress(address)
 
 
-def is_transaction_raw(transaction_raw: str) -> bool:
+def is_transaction_raw(transaction_raw: Union[str, TransactionEnvelope]) -> bool:
     """
     Check Ethereum transaction raw.
 
-    :param transaction_raw: Ethereum transaction raw.
-    :type transaction_raw: str
+    :param transaction_raw: Ethereum transaction raw or transaction envelope.
+    :type transaction_raw: str, swap.utils.TransactionEnvelope
 
     :returns: bool -- Ethereum valid/invalid transaction raw.
 
@@ -122,13 +129,11 @@ def is_transaction_raw(transaction_raw: str) -> bool:
     """
 
     # Check parameter instances
-    if not isinstance(transaction_raw, str):
+    if not isinstance(transaction_raw, (str, TransactionEnvelope)):
         raise TypeError(f"Transaction raw must be str, not '{type(transaction_raw)}' type.")
 
     try:
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
+        loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
         return loaded_transaction_raw["type"] in [
             "ethereum_normal_unsigned", "ethereum_normal_signed", "ethereum_erc20_normal_unsigned", "ethereum_erc20_normal_signed",
             "ethereum_fund_unsigned", "ethereum_fund_signed", "ethereum_erc20_fund_unsigned", "ethereum_erc20_fund_signed",
@@ -139,6 +144,49 @@ def is_transaction_raw(transaction_raw: str) -> bool:
         return False
 
 
+def get_permit_hash(domain_separator: Union[str, bytes], owner: str, spender: str,
+                    value: int, nonce: int, deadline: int) -> str:
+    """
+    Get Ethereum ERC20 EIP-2612 permit hash.
+
+    :param domain_separator: ERC20 token EIP-712 domain separator.
+    :type domain_separator: str, bytes
+    :param owner: Ethereum token owner address.
+    :type owner: str
+    :param spender: Ethereum token spender address.
+    :type spender: str
+    :param value: ERC20 token amount.
+    :type value: int
+    :param nonce: Owner permit nonce of the ERC20 token.
+    :type nonce: int
+    :param deadline: Permit expiry timestamp.
+    :type deadline: int
+
+    :returns: str -- EIP-712 permit hash to sign.
+
+    >>> from swap.providers.ethereum.utils import get_permit_hash
+    >>> get_permit_hash(domain_separator="0xa9d4dda5e981ed5d43141828071f56563b795e7c11af56e694b599e697460be3", owner="0x69e04fe16c9A6A83076B3c2dc4b4Bc21b5d9A20C", spender="0x0cc7C744f96729B7f60B12B36A4B9504191CD458", value=25, nonce=0, deadline=1624687630)
+    "0x89d1a6beda2b3ae247945ef50590c5ea275c825198b36cf171ee9a75b8ab1d46"
+
+    .. note::
+        The domain separator is read from the token contract, token name and version are not needed.
+    """
+
+    # Check parameter instances
+    if not is_address(owner):
+        raise AddressError(f"Invalid Ethereum owner '{owner}' address.")
+    if not is_address(spender):
+        raise AddressError(f"Invalid Ethereum spender '{spender}' address.")
+
+    struct_hash: bytes = Web3.keccak(encode_abi(
+        ["bytes32", "address", "address", "uint256", "uint256", "uint256"],
+        [PERMIT_TYPEHASH, to_checksum_address(owner), to_checksum_address(spender), value, nonce, deadline]
+    ))
+    return Web3.keccak(
+        b"\x19\x01" + HexBytes(domain_separator) + struct_hash
+    ).hex()
+
+
 def get_erc20_data(key: str) -> dict:
     # Get current working directory path (like linux or unix path).
     cwd: str = os.path.dirname(sys.modules[__package__].__file__)
@@ -163,13 +211,10 @@ def decode_transaction_raw(transaction_raw: str) -> dict:
     {'fee': ..., 'type': '...', 'address': '...', 'transaction': {...}, 'unsigned_datas': [...], 'signatures': [...], 'network': '...'}
     """
 
-    if not is_transaction_raw(transaction_raw=transaction_raw):
+    loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+    if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
         raise TransactionRawError("Invalid Ethereum transaction raw.")
 
-    transaction_raw = clean_transaction_raw(transaction_raw)
-    decoded_transaction_raw = b64decode(transaction_raw.encode())
-    loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
     return dict(
         fee=loaded_transaction_raw["fee"],
         transaction=loaded_transaction_raw["transaction"],
@@ -200,13 +245,10 @@ def submit_transaction_raw(transaction_raw: str, provider: str = config["provide
     """
 
     # Check parameter instances
-    if not is_transaction_raw(transaction_raw=transaction_raw):
+    loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+    if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
         raise TransactionRawError("Invalid Ethereum transaction raw.")
 
-    transaction_raw = clean_transaction_raw(transaction_raw)
-    decoded_transaction_raw = b64decode(transaction_raw.encode())
-    loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
     if not loaded_transaction_raw["type"] in [
         "ethereum_normal_signed", "ethereum_erc20_normal_signed",
         "ethereum_fund_signed", "ethereum_erc20_fund_signed",
@@ -1,13 +1,19 @@
 #!/usr/bin/env python3
 
 from hdwallet import HDWallet
+from ...crypto import HDWallet as Secp256k1HDWallet
 from hdwallet.cryptocurrencies import EthereumMainnet
 from web3.types import Wei
+from web3 import Web3
+from functools import partial
 from typing import (
-    Optional, Union, Tuple
+    Optional, Union, Tuple, List, Dict
 )
 
-from ...utils import is_mnemonic
+from ...crypto import derive_public_keys
+from ...utils import (
+    is_mnemonic, sha256, _derive_range, _scan_addresses
+)
 from ...exceptions import (
     NetworkError, UnitError
 )
@@ -16,13 +22,36 @@ from .utils import (
     is_network, amount_unit_converter
 )
 from .rpc import (
-    get_balance, get_erc20_balance
+    get_balance, get_erc20_balance, get_transaction_count
 )
 
 # Default derivation path
 DEFAULT_PATH: str = config["path"]
 
 
+def _derive_addresses(public_key: str, chain_code: str, start: int, count: int) -> List[dict]:
+    # Address records of account change node children, address is keccak of the uncompressed key
+    addresses: List[dict] = []
+    for index, uncompressed in enumerate(derive_public_keys(
+        public_key=public_key, chain_code=chain_code, start=start, count=count, compressed=False
+    ), start):
+        if uncompressed is None:
+            continue
+        addresses.append(dict(
+            index=index, address=Web3.toChecksumAddress(Web3.keccak(bytes.fromhex(uncompressed[2:]))[-20:]),
+            public_key=("03" if int(uncompressed[-2:], 16) & 1 else "02") + uncompressed[2:66]
+        ))
+    return addresses
+
+
+def _address_activity(network: str, provider: str, token: Optional[str], record: dict) -> dict:
+    # Used flag and balance of one address record, used when it has sent a transaction or has a balance
+    balance: int = get_balance(address=record["address"], network=network, provider=provider, token=token)
+    return dict(used=(balance > 0 or get_transaction_count(
+        address=record["address"], network=network, provider=provider, token=token
+    ) > 0), balance=balance)
+
+
 class Wallet(HDWallet):
     """
     Ethereum Wallet class.
@@ -50,9 +79,11 @@ class Wallet(HDWallet):
                                "choose only 'mainnet', 'ropsten', 'kovan', 'rinkeby' or 'testnet' networks.")
 
         self._network, self._provider, self._token = network, provider, token
-        self._hdwallet: HDWallet = HDWallet(
+        self._hdwallet: HDWallet = Secp256k1HDWallet(
             cryptocurrency=EthereumMainnet, use_default_path=False
         )
+        # Account change node public key and chain code per root key, account and change
+        self._account_nodes: Dict[Tuple[str, int, bool], Tuple[str, str]] = {}
 
     def from_entropy(self, entropy: str, language: str = "english", passphrase: Optional[str] = None) -> "Wallet":
         """
@@ -262,6 +293,100 @@ class Wallet(HDWallet):
         self._hdwallet.clean_derivation()
         return self
 
+    def derive_range(self, account: int = 0, change: bool = False, start: int = 0, count: int = 1,
+                     workers: Optional[int] = None) -> List[dict]:
+        """
+        Derive a range of Ethereum wallet addresses.
+
+        :param account: Ethereum derivation account, defaults to ``0``.
+        :type account: int
+        :param change: Ethereum derivation change, defaults to ``False``.
+        :type change: bool
+        :param start: First address index, defaults to ``0``.
+        :type start: int
+        :param count: Number of addresses, defaults to ``1``.
+        :type count: int
+        :param workers: Number of worker processes, defaults to CPU count (``1`` derives in this process).
+        :type workers: int
+
+        :returns: list -- Ethereum address records of index, address and public key.
+
+        >>> from swap.providers.ethereum.wallet import Wallet
+        >>> wallet: Wallet = Wallet(network="testnet")
+        >>> wallet.from_entropy(entropy="ed0802d701a033776811601dd6c5c4a9")
+        >>> wallet.derive_range(account=0, change=False, start=0, count=2)
+        [{'index': 0, 'address': '0x69e04fe16c9A6A83076B3c2dc4b4Bc21b5d9A20C', 'public_key': '03e270f9d51cad2977c0a28182b9320bb5edc3c70e6d84ff5837f8d407ed9d676d'}, {'index': 1, 'address': '0xd77E0d2Eef905cfB39c3C4b952Ed278d58f96E1f', 'public_key': '0361fa197b84d1739b5f2a2529cdcee2e97db15253bf5e90f3eb61f8c98dacb3ea'}]
+
+        .. note::
+            The account change node is derived once from the root key and cached, addresses are derived
+            from its public key. Ranges over 1000 addresses are split across ``workers`` processes.
+            A watch-only wallet from an account xpublic key (like of ``m/44'/60'/0'``, use ``strict=False``)
+            derives from it as the account node, only account ``0``, other depths raise ``ValueError``.
+        """
+
+        root_xprivate_key: Optional[str] = self._hdwallet.root_xprivate_key()
+        root_xpublic_key: Optional[str] = self._hdwallet.root_xpublic_key()
+        if root_xprivate_key is None and root_xpublic_key is None:
+            raise ValueError("Ethereum wallet has no root key, initialize wallet first.")
+        if root_xprivate_key is None and int(self._hdwallet.root_xpublic_key(encoded=False)[8:10], 16) != 3:
+            # Serialized depth byte, after the four version bytes
+            raise ValueError(f"Invalid Ethereum '{root_xpublic_key}' xpublic key, "
+                             f"choose only account xpublic key of depth 3 like of m/44'/60'/0' path.")
+        if root_xprivate_key is None and account != 0:
+            raise ValueError(f"Invalid Ethereum '{account}' account, wallet from xpublic key has only account 0.")
+
+        # Cached by the root key hash, the root xprivate key itself is not kept in the cache
+        key: Tuple[str, int, bool] = (sha256(root_xprivate_key or root_xpublic_key), account, change)
+        if key not in self._account_nodes:
+            if root_xprivate_key is not None:
+                account_node: HDWallet = Secp256k1HDWallet(cryptocurrency=EthereumMainnet).from_xprivate_key(
+                    xprivate_key=root_xprivate_key
+                ).from_path(
+                    path=config["bip44_path"].format(
+                        account=account, change=(1 if change else 0), address=0
+                    ).rsplit("/", 1)[0]
+                )
+            else:
+                # Hardened account path needs the private key, the xpublic key is the account node itself
+                account_node: HDWallet = Secp256k1HDWallet(cryptocurrency=EthereumMainnet).from_xpublic_key(
+                    xpublic_key=root_xpublic_key, strict=False
+                ).from_path(path=f"m/{1 if change else 0}")
+            self._account_nodes[key] = (account_node.compressed(), account_node.chain_code())
+
+        public_key, chain_code = self._account_nodes[key]
+        return _derive_range(
+            derive=partial(_derive_addresses, public_key, chain_code), start=start, count=count, workers=workers
+        )
+
+    def scan(self, account: int = 0, gap: int = 20, workers: Optional[int] = None) -> dict:
+        """
+        Scan Ethereum account receive and change addresses (BIP44 account discovery).
+
+        :param account: Ethereum derivation account, defaults to ``0``.
+        :type account: int
+        :param gap: Number of consecutive unused addresses that ends a chain, defaults to ``20``.
+        :type gap: int
+        :param workers: Number of concurrent requests, defaults to ``gap`` (at most ``32``).
+        :type workers: int
+
+        :returns: dict -- Ethereum account balance (Wei), used addresses and next unused receive and change indexes.
+
+        >>> from swap.providers.ethereum.wallet import Wallet
+        >>> wallet: Wallet = Wallet(network="testnet")
+        >>> wallet.from_entropy(entropy="ed0802d701a033776811601dd6c5c4a9")
+        >>> wallet.scan(account=0, gap=20)
+        {'balance': 99937915760000000000, 'utxos': [], 'addresses': [{'index': 0, 'address': '0x69e04fe16c9A6A83076B3c2dc4b4Bc21b5d9A20C', 'public_key': '03e270f9d51cad2977c0a28182b9320bb5edc3c70e6d84ff5837f8d407ed9d676d', 'change': False, 'balance': 99937915760000000000}], 'receive_index': 1, 'change_index': 0}
+
+        .. note::
+            Addresses are derived with ``derive_range`` and queried ``gap`` at a time, an address is used
+            when it has sent a transaction or has a balance. Each chain stops after ``gap`` consecutive unused addresses.
+        """
+
+        return _scan_addresses(
+            derive=partial(self.derive_range, account), activity=partial(_address_activity, self._network, self._provider, self._token),
+            gap=gap, workers=workers
+        )
+
     def strength(self) -> Optional[int]:
         """
         Get Ethereum wallet strength.
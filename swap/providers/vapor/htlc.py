@@ -4,6 +4,9 @@ from pybytom.script import (
     get_script_hash, get_p2wsh_program, get_p2wsh_address
 )
 from pybytom.script.builder import Builder
+from pybytom.libs.segwit import (
+    bech32_encode, convertbits
+)
 from pybytom.wallet.tools import (
     get_address, get_program
 )
@@ -12,6 +15,8 @@ from pybytom.script.opcode import (
 )
 from equity import Equity
 from ctypes import c_int64
+from functools import lru_cache
+from hashlib import sha3_256
 from typing import (
     Optional, List, Union
 )
@@ -32,6 +37,18 @@ from .utils import (
 )
 
 
+# Precompiled HTLC program suffix, the DEPTH opcode, the HTLC script binary push and the
+# FALSE CHECKPREDICATE opcodes that follow the endblock, public keys and secret hash pushes.
+_HTLC_PROGRAM_SUFFIX: bytes = bytes(
+    Builder().add_op(OP_DEPTH).add_bytes(bytes.fromhex(config["htlc_script_binary"]))
+    .add_op(OP_FALSE).add_op(OP_CHECKPREDICATE).digest()
+)
+# Bech32 human readable parts of the P2WSH contract addresses by network
+_HRP: dict = {
+    "mainnet": "vp", "solonet": "sp", "testnet": "tp"
+}
+
+
 class HTLC:
     """
     Vapor Hash Time Lock Contract (HTLC).
@@ -82,46 +99,24 @@ class HTLC:
         """
 
         # Checking parameters instances
-        if len(secret_hash) != 64:
-            raise ValueError("Invalid secret hash, length must be 64")
-        if len(recipient_public_key) != 64:
-            raise ValueError("Invalid Vapor recipient public key, length must be 64")
-        if len(sender_public_key) != 64:
-            raise ValueError("Invalid Vapor sender public key, length must be 64")
+        _check_agreements(
+            secret_hash=secret_hash, recipient_public_key=recipient_public_key, sender_public_key=sender_public_key
+        )
 
         if use_script:
-
-            # Get current working directory path (like linux or unix path).
-            cwd: str = os.path.dirname(sys.modules[__package__].__file__)
-
-            with open(f"{cwd}/contracts/htlc.equity", "r", encoding="utf-8") as htlc_equity_file:
-                htlc_script: str = "".join(htlc_equity_file.readlines()[-14:])
-                htlc_equity_file.close()
-
-            htlc_agreement: List[str, int] = [
-                secret_hash,
-                recipient_public_key,
-                sender_public_key,
-                endblock
-            ]
-            # Compile HTLC by script
-            self._script = Equity(config[self._network]["vapor-core"]) \
-                .compile_source(htlc_script, htlc_agreement)
+            # Compile HTLC by script, cached by agreements
+            self._script = dict(_compile_htlc_script(
+                url=config[self._network]["vapor-core"], secret_hash=secret_hash,
+                recipient_public_key=recipient_public_key, sender_public_key=sender_public_key, endblock=endblock
+            ))
         else:
             # Compile HTLC by script binary
-            builder: Builder = Builder()
-            builder.add_int(endblock)
-            builder.add_bytes(bytes.fromhex(sender_public_key))
-            builder.add_bytes(bytes.fromhex(recipient_public_key))
-            builder.add_bytes(bytes.fromhex(secret_hash))
-            builder.add_op(OP_DEPTH)
-            builder.add_bytes(bytes.fromhex(config["htlc_script_binary"]))
-            builder.add_op(OP_FALSE)
-            builder.add_op(OP_CHECKPREDICATE)
-
             sequence: str = bytes(c_int64(endblock)).rstrip(b'\x00').hex()
             self._script = dict(
-                program=builder.hex_digest(),
+                program=_build_htlc_program(
+                    secret_hash=secret_hash, recipient_public_key=recipient_public_key,
+                    sender_public_key=sender_public_key, endblock=endblock
+                ).hex(),
                 opcodes=f"0x{sequence} 0x{sender_public_key} 0x{recipient_public_key} "
                         f"0x{secret_hash} DEPTH 0x{config['htlc_script_binary']} FALSE CHECKPREDICATE"
             )
@@ -130,15 +125,11 @@ class HTLC:
             "secret_hash": secret_hash,
             "recipient": {
                 "public_key": recipient_public_key,
-                "address": get_address(
-                    program=get_program(public_key=recipient_public_key), network=self._network, vapor=True
-                )
+                "address": _get_address(public_key=recipient_public_key, network=self._network)
             },
             "sender": {
                 "public_key": sender_public_key,
-                "address": get_address(
-                    program=get_program(public_key=sender_public_key), network=self._network, vapor=True
-                )
+                "address": _get_address(public_key=sender_public_key, network=self._network)
             },
             "endblock": endblock
         }
@@ -294,3 +285,91 @@ class HTLC:
             asset=(str(asset.ID) if isinstance(asset, AssetNamespace) else asset),
             limit=limit
         )
+
+
+def build_many(htlcs: List[dict], network: str = config["network"]) -> List[dict]:
+    """
+    Build many Vapor Hash Time Lock Contracts (HTLC's) from the precompiled HTLC program.
+
+    :param htlcs: Vapor HTLC agreements, dicts of secret_hash, recipient_public_key, sender_public_key and endblock.
+    :type htlcs: list
+    :param network: Vapor network, defaults to ``mainnet``.
+    :type network: str
+
+    :returns: list -- Vapor HTLC bytecode, hash and contract address dicts.
+
+    >>> from swap.providers.vapor.htlc import build_many
+    >>> from swap.utils import sha256
+    >>> build_many(htlcs=[dict(secret_hash=sha256("Hello Meheret!"), recipient_public_key="3e0a377ae4afa031d4551599d9bb7d5b27f4736d77f78cac4d476f0ffba5ae3e", sender_public_key="fe6b3fd4458291b19605d92837ae1060cc0237e68022b2eb9faf01a118226212", endblock=120723497)], network="mainnet")
+    [{'bytecode': '042918320720fe6b3fd4458291b19605d92837ae1060cc0237e68022b2eb9faf01a118226212203e0a377ae4afa031d4551599d9bb7d5b27f4736d77f78cac4d476f0ffba5ae3e203a26da82ead15a80533a02696656b14b5dbfd84eb14790f2e1be5e9e45820eeb741f547a6416000000557aa888537a7cae7cac631f000000537acd9f6972ae7cac00c0', 'hash': '34a3db50301b941b8ed43dcfdbd3381df1b739fa64ab77e4264f703a45e0be31', 'contract_address': 'vp1qxj3ak5psrw2phrk58h8ah5ecrhcmww06vj4h0epxfacr530qhccs4pczgc'}]
+
+    .. note::
+        Same HTLC's as ``HTLC.build_htlc`` without ``use_script``, for deriving many contract addresses at once,
+        the contract addresses are encoded without decoding them back for verification.
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Vapor '{network}' network",
+                           "choose only 'mainnet', 'solonet' or 'testnet' networks.")
+
+    contracts: List[dict] = []
+    for htlc in htlcs:
+        _check_agreements(
+            secret_hash=htlc["secret_hash"], recipient_public_key=htlc["recipient_public_key"],
+            sender_public_key=htlc["sender_public_key"]
+        )
+        bytecode: bytes = _build_htlc_program(
+            secret_hash=htlc["secret_hash"], recipient_public_key=htlc["recipient_public_key"],
+            sender_public_key=htlc["sender_public_key"], endblock=htlc["endblock"]
+        )
+        script_hash: bytes = sha3_256(bytecode).digest()
+        contracts.append(dict(
+            bytecode=bytecode.hex(), hash=script_hash.hex(),
+            contract_address=bech32_encode(_HRP[network], [0] + convertbits(script_hash, 8, 5))
+        ))
+    return contracts
+
+
+def _check_agreements(secret_hash: str, recipient_public_key: str, sender_public_key: str) -> None:
+    if len(secret_hash) != 64:
+        raise ValueError("Invalid secret hash, length must be 64")
+    if len(recipient_public_key) != 64:
+        raise ValueError("Invalid Vapor recipient public key, length must be 64")
+    if len(sender_public_key) != 64:
+        raise ValueError("Invalid Vapor sender public key, length must be 64")
+
+
+def _build_htlc_program(secret_hash: str, recipient_public_key: str, sender_public_key: str, endblock: int) -> bytes:
+    # Endblock, sender and recipient public keys and secret hash pushes before the constant suffix
+    return b"".join([
+        bytes(Builder().add_int(endblock).digest()),
+        b"\x20", bytes.fromhex(sender_public_key),
+        b"\x20", bytes.fromhex(recipient_public_key),
+        b"\x20", bytes.fromhex(secret_hash),
+        _HTLC_PROGRAM_SUFFIX
+    ])
+
+
+@lru_cache(maxsize=4096)
+def _get_address(public_key: str, network: str) -> str:
+    return get_address(program=get_program(public_key=public_key), network=network, vapor=True)
+
+
+@lru_cache(maxsize=256)
+def _compile_htlc_script(url: str, secret_hash: str, recipient_public_key: str,
+                         sender_public_key: str, endblock: int) -> dict:
+
+    # Get current working directory path (like linux or unix path).
+    cwd: str = os.path.dirname(sys.modules[__package__].__file__)
+
+    with open(f"{cwd}/contracts/htlc.equity", "r", encoding="utf-8") as htlc_equity_file:
+        htlc_script: str = "".join(htlc_equity_file.readlines()[-14:])
+        htlc_equity_file.close()
+
+    htlc_agreement: List[str, int] = [
+        secret_hash,
+        recipient_public_key,
+        sender_public_key,
+        endblock
+    ]
+    return Equity(url).compile_source(htlc_script, htlc_agreement)
@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 
+from pybytom.wallet.tools import (
+    get_program, get_address, indexes_to_path
+)
+from decimal import Decimal
 from typing import (
-    Optional, Union
+    Optional, Union, List, Dict
 )
 
 import requests
@@ -13,10 +17,55 @@ from ...exceptions import (
 from ..config import vapor as config
 from .assets import AssetNamespace
 from .utils import (
-    is_network, is_address, amount_unit_converter, get_address_type
+    is_network, is_address, amount_unit_converter, get_address_type,
+    address_to_program, build_local_transaction, assemble_raw
 )
 
 
+def _core(endpoint: str, data: dict, network: str, headers: dict, timeout: int):
+    url = f"{config[network]['vapor-core']}/{endpoint}"
+    response = requests.post(
+        url=url, data=json.dumps(data), headers=headers, timeout=timeout
+    )
+    response_json = response.json()
+    if response_json["status"] == "fail":
+        raise APIError(response_json["msg"], response_json["code"])
+    return response_json["data"]
+
+
+def _core_utxos(network: str, headers: dict, timeout: int, program: Optional[str] = None,
+                output_id: Optional[str] = None) -> List[dict]:
+    # Vapor core wallet unspent outputs, with public key and path of their account keys
+    unspent_outputs: list = _core("list-unspent-outputs", (
+        dict(id=output_id, smart_contract=True) if output_id else dict(smart_contract=program.startswith("0020"))
+    ), network=network, headers=headers, timeout=timeout) or []
+    public_keys: Dict[str, dict] = {}
+    utxos: List[dict] = []
+    for unspent_output in unspent_outputs:
+        if program and unspent_output["program"] != program:
+            continue
+        utxo: dict = dict(
+            hash=unspent_output["id"], asset=unspent_output["asset_id"], amount=int(unspent_output["amount"]),
+            source_id=unspent_output["source_id"], source_position=int(unspent_output["source_pos"]),
+            program=unspent_output["program"]
+        )
+        if unspent_output.get("account_id") and not unspent_output["program"].startswith("0020"):
+            if unspent_output["account_id"] not in public_keys:
+                public_keys[unspent_output["account_id"]] = {
+                    get_program(public_key=pubkey_info["pubkey"]): pubkey_info for pubkey_info in _core(
+                        "list-pubkeys", dict(account_id=unspent_output["account_id"]),
+                        network=network, headers=headers, timeout=timeout
+                    )["pubkey_infos"]
+                }
+            pubkey_info: Optional[dict] = public_keys[unspent_output["account_id"]].get(unspent_output["program"])
+            if pubkey_info:
+                utxo.update(
+                    public_key=pubkey_info["pubkey"], path=indexes_to_path(indexes=pubkey_info["derivation_path"])
+                )
+        utxos.append(utxo)
+    return utxos
+
+
 def get_balance(address: str, asset: Union[str, AssetNamespace] = config["asset"], network: str = config["network"],
                 headers: dict = config["headers"], timeout: int = config["timeout"]) -> int:
     """
@@ -47,6 +96,11 @@ def get_balance(address: str, asset: Union[str, AssetNamespace] = config["asset"
         raise NetworkError(f"Invalid Vapor '{network}' network",
                            "choose only 'mainnet', 'solonet' or 'testnet' networks.")
 
+    if config[network]["backend"] == "vapor-core":
+        return sum(utxo["amount"] for utxo in _core_utxos(
+            network=network, headers=headers, timeout=timeout, program=address_to_program(address=address)
+        ) if utxo["asset"] == (str(asset.ID) if isinstance(asset, AssetNamespace) else asset))
+
     url = f"{config[network]['blockmeta']}/address/{address}"
     response = requests.get(
         url=url, headers=headers, timeout=timeout
@@ -94,6 +148,12 @@ def get_utxos(program: str, asset: Union[str, AssetNamespace] = config["asset"],
         raise NetworkError(f"Invalid Vapor '{network}' network",
                            "choose only 'mainnet' or 'testnet' networks.")
 
+    if config[network]["backend"] == "vapor-core":
+        utxos: List[dict] = [utxo for utxo in _core_utxos(
+            network=network, headers=headers, timeout=timeout, program=program
+        ) if utxo["asset"] == (str(asset.ID) if isinstance(asset, AssetNamespace) else asset)]
+        return sorted(utxos, key=lambda utxo: utxo[by], reverse=(order == "desc"))[:limit]
+
     url = f"{config[network]['blockcenter']}/q/utxos"
     data = dict(filter=dict(
         script=program, asset=(str(asset.ID) if isinstance(asset, AssetNamespace) else asset)
@@ -141,6 +201,14 @@ def estimate_transaction_fee(address: str, amount: int, asset: Union[str, AssetN
     if not is_address(address=address, network=network):
         raise AddressError(f"Invalid Vapor '{address}' {network} address.")
 
+    if config[network]["backend"] == "vapor-core":
+        return build_local_transaction(
+            address=address, utxos=_core_utxos(
+                network=network, headers=headers, timeout=timeout, program=address_to_program(address=address)
+            ), recipients={address: amount}, network=network,
+            asset=(str(asset.ID) if isinstance(asset, AssetNamespace) else asset)
+        )["tx"]["fee"]
+
     url = f"{config[network]['blockcenter']}/merchant/estimate-tx-fee"
     data = dict(
         asset_amounts={
@@ -228,6 +296,33 @@ def build_transaction(address: str, transaction: dict, network: str = config["ne
         raise NetworkError(f"Invalid Vapor '{network}' network",
                            "choose only 'mainnet', 'solonet' or 'testnet' networks.")
 
+    if config[network]["backend"] == "vapor-core":
+        # Translate blockcenter actions and build locally with Vapor core wallet UTXO's
+        utxos: List[dict] = []
+        for action in transaction["inputs"]:
+            if action["type"] == "spend_utxo":
+                utxos += _core_utxos(
+                    network=network, headers=headers, timeout=timeout, output_id=action["output_id"]
+                )
+            elif action["type"] == "spend_wallet" and not any(utxo["program"] == address_to_program(
+                address=address
+            ) for utxo in utxos):
+                utxos += _core_utxos(
+                    network=network, headers=headers, timeout=timeout, program=address_to_program(address=address)
+                )
+        recipients: Dict[str, int] = {}
+        for action in transaction["outputs"]:
+            _address: str = action["address"] if action["type"] == "control_address" else get_address(
+                program=action["control_program"], network=network, vapor=True
+            )
+            recipients[_address] = recipients.get(_address, 0) + int(
+                Decimal(action["amount"]) * config["units"]["NEU"]
+            )
+        return build_local_transaction(
+            address=address, utxos=utxos, recipients=recipients, asset=transaction["outputs"][0]["asset"],
+            fee=int(Decimal(str(transaction["fee"])) * config["units"]["NEU"]), network=network
+        )
+
     url = f"{config[network]['blockcenter']}/merchant/build-advanced-tx"
     params = dict(address=address)
     response = requests.post(
@@ -271,6 +366,9 @@ def get_transaction(transaction_hash: str, network: str = config["network"],
         raise NetworkError(f"Invalid Vapor '{network}' network",
                            "choose only 'mainnet', 'solonet' or 'testnet' networks.")
 
+    if config[network]["backend"] == "vapor-core":
+        return _core("get-transaction", dict(tx_id=transaction_hash), network=network, headers=headers, timeout=timeout)
+
     url = f"{config[network]['blockmeta']}/tx/hash/{transaction_hash}"
     response = requests.get(
         url=url, headers=headers, timeout=timeout
@@ -305,6 +403,11 @@ def get_current_block_height(plus: int = 0, network: str = config["network"],
         raise NetworkError(f"Invalid Vapor '{network}' network",
                            "choose only 'mainnet', 'solonet' or 'testnet' networks.")
 
+    if config[network]["backend"] == "vapor-core":
+        return int(_core(
+            "get-block-count", dict(), network=network, headers=headers, timeout=timeout
+        )["block_count"]) + plus
+
     url = f"{config[network]['blockmeta']}/block"
     response = requests.get(
         url=url, headers=headers, timeout=timeout
@@ -404,6 +507,11 @@ def submit_raw(address: str, raw: str, signatures: list, network: str = config["
         raise NetworkError(f"Invalid Vapor '{network}' network",
                            "choose only 'mainnet', 'solonet' or 'testnet' networks.")
 
+    if config[network]["backend"] == "vapor-core":
+        return _core("submit-transaction", dict(
+            raw_transaction=assemble_raw(raw=raw, signatures=signatures)
+        ), network=network, headers=headers, timeout=timeout)["tx_id"]
+
     url = f"{config[network]['blockcenter']}/merchant/submit-payment"
     data = dict(raw_transaction=raw, signatures=signatures)
     params = dict(address=address)
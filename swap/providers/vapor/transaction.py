@@ -7,14 +7,11 @@ from pybytom.transaction.actions import (
 from pybytom.wallet.tools import (
     indexes_to_path, get_program, get_address
 )
-from base64 import b64encode
 from typing import (
     Optional, Union, List
 )
 
-import json
-
-from ...utils import clean_transaction_raw
+from ...utils import encode_transaction_raw
 from ...exceptions import (
     AddressError, BalanceError, NetworkError, UnitError
 )
@@ -28,7 +25,7 @@ from .solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
 )
 from .utils import (
-    amount_unit_converter, is_network, is_address
+    amount_unit_converter, is_network, is_address, sign_unsigned_datas, build_local_transaction
 )
 
 
@@ -255,7 +252,7 @@ class NormalTransaction(Transaction):
         super().__init__(network)
 
     def build_transaction(self, address: str, recipients: dict, asset: Union[str, AssetNamespace] = config["asset"],
-                          unit: str = config["unit"]) -> "NormalTransaction":
+                          unit: str = config["unit"], utxos: Optional[List[dict]] = None) -> "NormalTransaction":
         """
         Build Vapor normal transaction.
 
@@ -267,6 +264,8 @@ class NormalTransaction(Transaction):
         :type asset: str, vapor.assets.AssetNamespace
         :param unit: Vapor unit, default to ``NEU``.
         :type unit: str
+        :param utxos: Vapor sender UTXO's to build transaction locally, defaults to ``None``.
+        :type utxos: list
 
         :returns: NormalTransaction -- Vapor normal transaction instance.
 
@@ -293,6 +292,18 @@ class NormalTransaction(Transaction):
             )
         )
 
+        # Build transaction locally from sender UTXO's
+        if utxos is not None:
+            self._transaction = build_local_transaction(
+                address=self._address, utxos=utxos, recipients={
+                    _address: (_amount if unit == "NEU" else amount_unit_converter(
+                        amount=_amount, unit_from=f"{unit}2NEU"
+                    )) for _address, _amount in recipients.items()
+                }, asset=self._asset, network=self._network
+            )
+            self._fee, self._type = self._transaction["tx"]["fee"], "vapor_normal_unsigned"
+            return self
+
         amount: int = get_balance(self._address, self._asset)
         if amount < self._amount:
             raise BalanceError(
@@ -365,31 +376,23 @@ class NormalTransaction(Transaction):
 
         # Setting sender wallet
         wallet, path, indexes = solver.solve()
-        # Clean derivation indexes/path
-        wallet.clean_derivation()
-        # Signing normal transaction
-        for unsigned in self.unsigned_datas(detail=True):
-            signed_data = []
-            unsigned_datas = unsigned["datas"]
-            if unsigned["path"]:
-                wallet.from_path(unsigned["path"])
-            elif path:
-                wallet.from_path(path)
-            elif indexes:
-                wallet.from_indexes(indexes)
-            for unsigned_data in unsigned_datas:
-                signed_data.append(wallet.sign(unsigned_data))
-            self._signatures.append(signed_data)
-            wallet.clean_derivation()
+        # Signing normal transaction, deriving each path once
+        for signed_datas in sign_unsigned_datas(
+            xprivate_key=wallet.xprivate_key(), unsigned_datas=self.unsigned_datas(), path=path, indexes=indexes
+        ):
+            self._signatures.append(signed_datas)
 
         # Set transaction type
         self._type = "vapor_normal_signed"
         return self
 
-    def transaction_raw(self) -> str:
+    def transaction_raw(self, binary: bool = False) -> str:
         """
         Get Vapor normal transaction raw.
 
+        :param binary: Encode as compact binary envelope, defaults to ``False``.
+        :type binary: bool
+
         :returns: str -- Vapor normal transaction raw.
 
         >>> from swap.providers.vapor.transaction import NormalTransaction
@@ -405,7 +408,7 @@ class NormalTransaction(Transaction):
 
         # Encode normal transaction raw
         if self._type == "vapor_normal_signed":
-            return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            return encode_transaction_raw(transaction=dict(
                 fee=self._fee,
                 address=self._address,
                 raw=self.raw(),
@@ -416,8 +419,8 @@ class NormalTransaction(Transaction):
                 signatures=self.signatures(),
                 network=self._network,
                 type=self._type
-            ))).encode()).decode())
-        return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            ), binary=binary)
+        return encode_transaction_raw(transaction=dict(
             fee=self._fee,
             address=self._address,
             raw=self.raw(),
@@ -428,7 +431,7 @@ class NormalTransaction(Transaction):
             signatures=[],
             network=self._network,
             type=self._type
-        ))).encode()).decode())
+        ), binary=binary)
 
 
 class FundTransaction(Transaction):
@@ -450,7 +453,7 @@ class FundTransaction(Transaction):
         self._contract_address: Optional[str] = None
 
     def build_transaction(self, address: str, htlc: HTLC, amount: Union[int, float], asset: Union[str, AssetNamespace] = config["asset"],
-                          unit: str = config["unit"]) -> "FundTransaction":
+                          unit: str = config["unit"], utxos: Optional[List[dict]] = None) -> "FundTransaction":
         """
         Build Vapor fund transaction.
 
@@ -464,6 +467,8 @@ class FundTransaction(Transaction):
         :type asset: str, vapor.assets.AssetNamespace
         :param unit: Vapor unit, default to ``NEU``.
         :type unit: str
+        :param utxos: Vapor sender UTXO's to build transaction locally, defaults to ``None``.
+        :type utxos: list
 
         :returns: FundTransaction -- Vapor fund transaction instance.
 
@@ -494,6 +499,16 @@ class FundTransaction(Transaction):
             )
         )
 
+        # Build transaction locally from sender UTXO's
+        if utxos is not None:
+            self._transaction = build_local_transaction(
+                address=self._address, utxos=utxos, recipients={
+                    self._contract_address: self._amount
+                }, asset=self._asset, network=self._network
+            )
+            self._fee, self._type = self._transaction["tx"]["fee"], "vapor_fund_unsigned"
+            return self
+
         amount: int = get_balance(self._address, self._asset)
         if amount < self._amount:
             raise BalanceError(
@@ -565,31 +580,23 @@ class FundTransaction(Transaction):
 
         # Setting sender wallet
         wallet, path, indexes = solver.solve()
-        # Clean derivation indexes/path
-        wallet.clean_derivation()
-        # Signing fund transaction
-        for unsigned in self.unsigned_datas(detail=True):
-            signed_data = []
-            unsigned_datas = unsigned["datas"]
-            if unsigned["path"]:
-                wallet.from_path(unsigned["path"])
-            elif path:
-                wallet.from_path(path)
-            elif indexes:
-                wallet.from_indexes(indexes)
-            for unsigned_data in unsigned_datas:
-                signed_data.append(wallet.sign(unsigned_data))
-            self._signatures.append(signed_data)
-            wallet.clean_derivation()
+        # Signing fund transaction, deriving each path once
+        for signed_datas in sign_unsigned_datas(
+            xprivate_key=wallet.xprivate_key(), unsigned_datas=self.unsigned_datas(), path=path, indexes=indexes
+        ):
+            self._signatures.append(signed_datas)
 
         # Set transaction type
         self._type = "vapor_fund_signed"
         return self
 
-    def transaction_raw(self) -> str:
+    def transaction_raw(self, binary: bool = False) -> str:
         """
         Get Vapor fund transaction raw.
 
+        :param binary: Encode as compact binary envelope, defaults to ``False``.
+        :type binary: bool
+
         :returns: str -- Vapor fund transaction raw.
 
         >>> from swap.providers.vapor.htlc import HTLC
@@ -608,7 +615,7 @@ class FundTransaction(Transaction):
 
         # Encode fund transaction raw
         if self._type == "vapor_fund_signed":
-            return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            return encode_transaction_raw(transaction=dict(
                 fee=self._fee,
                 address=self._address,
                 raw=self.raw(),
@@ -619,8 +626,8 @@ class FundTransaction(Transaction):
                 signatures=self.signatures(),
                 network=self._network,
                 type=self._type,
-            ))).encode()).decode())
-        return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            ), binary=binary)
+        return encode_transaction_raw(transaction=dict(
             fee=self._fee,
             address=self._address,
             raw=self.raw(),
@@ -631,7 +638,7 @@ class FundTransaction(Transaction):
             signatures=[],
             network=self._network,
             type=self._type,
-        ))).encode()).decode())
+        ), binary=binary)
 
 
 class WithdrawTransaction(Transaction):
@@ -655,7 +662,8 @@ class WithdrawTransaction(Transaction):
         self._htlc_utxo: Optional[dict] = None
 
     def build_transaction(self, address: str, transaction_hash: str,
-                          asset: Union[str, AssetNamespace] = config["asset"]) -> "WithdrawTransaction":
+                          asset: Union[str, AssetNamespace] = config["asset"],
+                          utxo: Optional[dict] = None) -> "WithdrawTransaction":
         """
         Build Vapor withdraw transaction.
 
@@ -665,6 +673,8 @@ class WithdrawTransaction(Transaction):
         :type transaction_hash: str
         :param asset: Vapor asset id, defaults to ``BTM``.
         :type asset: str, vapor.assets.AssetNamespace
+        :param utxo: Vapor funded HTLC UTXO to build transaction locally, defaults to ``None``.
+        :type utxo: dict
 
         :returns: WithdrawTransaction -- Vapor withdraw transaction instance.
 
@@ -683,6 +693,19 @@ class WithdrawTransaction(Transaction):
             address, (str(asset.ID) if isinstance(asset, AssetNamespace) else asset),
             config["confirmations"], transaction_hash
         )
+        # Build transaction locally from funded HTLC UTXO
+        if utxo is not None:
+            self._htlc_utxo = dict(utxo, address=get_address(
+                program=utxo.get("program", utxo.get("control_program")), network=self._network, vapor=True
+            ))
+            self._transaction = build_local_transaction(
+                address=self._address, utxos=[utxo], network=self._network
+            )
+            self._amount, self._fee, self._type = (
+                int(self._htlc_utxo["amount"]), self._transaction["tx"]["fee"], "vapor_withdraw_unsigned"
+            )
+            return self
+
         # Get transaction
         self._transaction_detail = get_transaction(
             transaction_hash=self._transaction_hash, network=self._network
@@ -751,34 +774,27 @@ class WithdrawTransaction(Transaction):
 
         # Set recipient wallet
         wallet, secret, path, indexes = solver.solve()
-        # Clean derivation indexes/path
-        wallet.clean_derivation()
-        # Sign withdraw transaction
-        for index, unsigned in enumerate(self.unsigned_datas(detail=True)):
+        witness: str = solver.witness(self._network)
+        # Sign withdraw transaction, deriving each path once
+        for signed_datas in sign_unsigned_datas(
+            xprivate_key=wallet.xprivate_key(), unsigned_datas=self.unsigned_datas(), path=path, indexes=indexes
+        ):
             signed_data = []
-            unsigned_datas = unsigned["datas"]
-            if unsigned["path"]:
-                wallet.from_path(unsigned["path"])
-            elif path:
-                wallet.from_path(path)
-            elif indexes:
-                wallet.from_indexes(indexes)
-            for unsigned_data in unsigned_datas:
-                signed_data.append(bytearray(secret.encode()).hex())
-                signed_data.append(wallet.sign(unsigned_data))
-                signed_data.append(str("00"))
-                signed_data.append(solver.witness(self._network))
+            for signature in signed_datas:
+                signed_data.extend([bytearray(secret.encode()).hex(), signature, str("00"), witness])
             self._signatures.append(signed_data)
-            wallet.clean_derivation()
 
         # Set transaction type
         self._type = "vapor_withdraw_signed"
         return self
 
-    def transaction_raw(self) -> str:
+    def transaction_raw(self, binary: bool = False) -> str:
         """
         Get Vapor withdraw transaction raw.
 
+        :param binary: Encode as compact binary envelope, defaults to ``False``.
+        :type binary: bool
+
         :returns: str -- Vapor withdraw transaction raw.
 
         >>> from swap.providers.vapor.transaction import WithdrawTransaction
@@ -794,7 +810,7 @@ class WithdrawTransaction(Transaction):
 
         # Encode withdraw transaction raw
         if self._type == "vapor_withdraw_signed":
-            return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            return encode_transaction_raw(transaction=dict(
                 fee=self._fee,
                 address=self._htlc_utxo["address"],
                 raw=self.raw(),
@@ -805,8 +821,8 @@ class WithdrawTransaction(Transaction):
                 signatures=self.signatures(),
                 network=self._network,
                 type=self._type
-            ))).encode()).decode())
-        return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            ), binary=binary)
+        return encode_transaction_raw(transaction=dict(
             fee=self._fee,
             address=self._htlc_utxo["address"],
             raw=self.raw(),
@@ -817,7 +833,7 @@ class WithdrawTransaction(Transaction):
             signatures=[],
             network=self._network,
             type=self._type
-        ))).encode()).decode())
+        ), binary=binary)
 
 
 class RefundTransaction(Transaction):
@@ -841,7 +857,8 @@ class RefundTransaction(Transaction):
         self._htlc_utxo: Optional[dict] = None
 
     def build_transaction(self, address: str, transaction_hash: str,
-                          asset: Union[str, AssetNamespace] = config["asset"]) -> "RefundTransaction":
+                          asset: Union[str, AssetNamespace] = config["asset"],
+                          utxo: Optional[dict] = None) -> "RefundTransaction":
         """
         Build Vapor refund transaction.
 
@@ -851,6 +868,8 @@ class RefundTransaction(Transaction):
         :type transaction_hash: str
         :param asset: Vapor asset id, defaults to ``BTM``.
         :type asset: str, vapor.assets.AssetNamespace
+        :param utxo: Vapor funded HTLC UTXO to build transaction locally, defaults to ``None``.
+        :type utxo: dict
 
         :returns: RefundTransaction -- Vapor refund transaction instance.
 
@@ -869,6 +888,19 @@ class RefundTransaction(Transaction):
             address, (str(asset.ID) if isinstance(asset, AssetNamespace) else asset),
             config["confirmations"], transaction_hash
         )
+        # Build transaction locally from funded HTLC UTXO
+        if utxo is not None:
+            self._htlc_utxo = dict(utxo, address=get_address(
+                program=utxo.get("program", utxo.get("control_program")), network=self._network, vapor=True
+            ))
+            self._transaction = build_local_transaction(
+                address=self._address, utxos=[utxo], network=self._network
+            )
+            self._amount, self._fee, self._type = (
+                int(self._htlc_utxo["amount"]), self._transaction["tx"]["fee"], "vapor_refund_unsigned"
+            )
+            return self
+
         # Get transaction
         self._transaction_detail = get_transaction(
             transaction_hash=self._transaction_hash, network=self._network
@@ -937,33 +969,27 @@ class RefundTransaction(Transaction):
 
         # Set recipient wallet
         wallet, path, indexes = solver.solve()
-        # Clean derivation indexes/path
-        wallet.clean_derivation()
-        # Sign withdraw transaction
-        for index, unsigned in enumerate(self.unsigned_datas(detail=True)):
+        witness: str = solver.witness(self._network)
+        # Sign refund transaction, deriving each path once
+        for signed_datas in sign_unsigned_datas(
+            xprivate_key=wallet.xprivate_key(), unsigned_datas=self.unsigned_datas(), path=path, indexes=indexes
+        ):
             signed_data = []
-            unsigned_datas = unsigned["datas"]
-            if unsigned["path"]:
-                wallet.from_path(unsigned["path"])
-            elif path:
-                wallet.from_path(path)
-            elif indexes:
-                wallet.from_indexes(indexes)
-            for unsigned_data in unsigned_datas:
-                signed_data.append(wallet.sign(unsigned_data))
-                signed_data.append(str("01"))
-                signed_data.append(solver.witness(self._network))
+            for signature in signed_datas:
+                signed_data.extend([signature, str("01"), witness])
             self._signatures.append(signed_data)
-            wallet.clean_derivation()
 
         # Set transaction type
         self._type = "vapor_refund_signed"
         return self
 
-    def transaction_raw(self) -> str:
+    def transaction_raw(self, binary: bool = False) -> str:
         """
         Get Vapor refund transaction raw.
 
+        :param binary: Encode as compact binary envelope, defaults to ``False``.
+        :type binary: bool
+
         :returns: str -- Vapor refund transaction raw.
 
         >>> from swap.providers.vapor.transaction import RefundTransaction
@@ -979,7 +1005,7 @@ class RefundTransaction(Transaction):
 
         # Encode refund transaction raw
         if self._type == "vapor_refund_signed":
-            return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            return encode_transaction_raw(transaction=dict(
                 fee=self._fee,
                 address=self._htlc_utxo["address"],
                 raw=self.raw(),
@@ -990,8 +1016,8 @@ class RefundTransaction(Transaction):
                 signatures=self.signatures(),
                 network=self._network,
                 type=self._type
-            ))).encode()).decode())
-        return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            ), binary=binary)
+        return encode_transaction_raw(transaction=dict(
             fee=self._fee,
             address=self._htlc_utxo["address"],
             hash=self.hash(),
@@ -1002,4 +1028,4 @@ class RefundTransaction(Transaction):
             signatures=[],
             network=self._network,
             type=self._type
-        ))).encode()).decode())
+        ), binary=binary)
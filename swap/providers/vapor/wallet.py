@@ -1,11 +1,17 @@
 #!/usr/bin/env python3
 
 from pybytom.wallet import Wallet as HDWallet
+from pybytom.wallet.tools import (
+    get_child_xpublic_key, get_public_key, get_program, get_address
+)
+from functools import partial
 from typing import (
-    Optional, List, Union
+    Optional, List, Union, Dict, Tuple
 )
 
-from ...utils import is_mnemonic
+from ...utils import (
+    is_mnemonic, _derive_range, _scan_addresses
+)
 from ...exceptions import (
     NetworkError, UnitError
 )
@@ -20,6 +26,29 @@ from .rpc import (
 DEFAULT_PATH: str = config["path"]
 
 
+def _derive_addresses(network: str, xpublic_key: str, start: int, count: int) -> List[dict]:
+    # Address records of account change node children
+    addresses: List[dict] = []
+    for index in range(start, start + count):
+        public_key: str = get_public_key(xpublic_key=xpublic_key, indexes=[index.to_bytes(4, "little").hex()])
+        addresses.append(dict(
+            index=index, address=get_address(
+                program=get_program(public_key=public_key), network=network, vapor=True
+            ), public_key=public_key
+        ))
+    return addresses
+
+
+def _address_activity(network: str, asset: str, limit: int, record: dict) -> dict:
+    # Used flag, balance and UTXO's of one address record, used when it has an asset balance
+    balance: int = get_balance(address=record["address"], asset=asset, network=network)
+    if balance == 0:
+        return dict(used=False, balance=0, utxos=[])
+    return dict(used=True, balance=balance, utxos=get_utxos(
+        program=get_program(public_key=record["public_key"]), asset=asset, network=network, limit=limit
+    ))
+
+
 class Wallet(HDWallet):
     """
     Vapor Wallet class.
@@ -36,6 +65,8 @@ class Wallet(HDWallet):
     def __init__(self, network: str = config["network"]):
 
         self._public_key: Optional[str] = None
+        # Account change node extended public key per root key, account and change
+        self._account_nodes: Dict[Tuple[str, int, bool], str] = {}
 
         if network == "mainnet":
             self._network: str = "mainnet"
@@ -241,6 +272,85 @@ class Wallet(HDWallet):
         self._hdwallet.clean_derivation()
         return self
 
+    def derive_range(self, account: int = 1, change: bool = False, start: int = 0, count: int = 1,
+                     workers: Optional[int] = None) -> List[dict]:
+        """
+        Derive a range of Vapor wallet addresses.
+
+        :param account: Vapor derivation account, defaults to ``1``.
+        :type account: int
+        :param change: Vapor derivation change, defaults to ``False``.
+        :type change: bool
+        :param start: First address index, defaults to ``0``.
+        :type start: int
+        :param count: Number of addresses, defaults to ``1``.
+        :type count: int
+        :param workers: Number of worker processes, defaults to CPU count (``1`` derives in this process).
+        :type workers: int
+
+        :returns: list -- Vapor address records of index, address and public key.
+
+        >>> from swap.providers.vapor.wallet import Wallet
+        >>> wallet: Wallet = Wallet(network="mainnet")
+        >>> wallet.from_entropy(entropy="ed0802d701a033776811601dd6c5c4a9")
+        >>> wallet.derive_range(account=1, change=False, start=1, count=1)
+        [{'index': 1, 'address': 'vp1qk9vj4jaezlcnjdckds4fkm8fwv5kawmqwpnpvs', 'public_key': 'fe6b3fd4458291b19605d92837ae1060cc0237e68022b2eb9faf01a118226212'}]
+
+        .. note::
+            The account change node is derived once from the root extended public key and cached,
+            addresses are derived from it. Ranges over 1000 addresses are split across ``workers`` processes.
+        """
+
+        xpublic_key: Optional[str] = self._hdwallet.xpublic_key()
+        key: Tuple[str, int, bool] = (xpublic_key, account, change)
+        if key not in self._account_nodes:
+            self._account_nodes[key] = get_child_xpublic_key(
+                xpublic_key=xpublic_key, path=config["bip44_path"].format(
+                    account=account, change=(1 if change else 0), address=0
+                ).rsplit("/", 1)[0]
+            )
+
+        return _derive_range(
+            derive=partial(_derive_addresses, self._network, self._account_nodes[key]),
+            start=start, count=count, workers=workers
+        )
+
+    def scan(self, account: int = 1, gap: int = 20, asset: Union[str, AssetNamespace] = config["asset"],
+             limit: int = 15, workers: Optional[int] = None) -> dict:
+        """
+        Scan Vapor account receive and change addresses (BIP44 account discovery).
+
+        :param account: Vapor derivation account, defaults to ``1``.
+        :type account: int
+        :param gap: Number of consecutive unused addresses that ends a chain, defaults to ``20``.
+        :type gap: int
+        :param asset: Vapor asset id, defaults to ``BTM asset``.
+        :type asset: str, vapor.assets.AssetNamespace
+        :param limit: Limit of UTXO's per address, default is 15.
+        :type limit: int
+        :param workers: Number of concurrent requests, defaults to ``gap`` (at most ``32``).
+        :type workers: int
+
+        :returns: dict -- Vapor account balance (NEU), UTXO's, used addresses and next unused receive and change indexes.
+
+        >>> from swap.providers.vapor.wallet import Wallet
+        >>> wallet: Wallet = Wallet(network="mainnet")
+        >>> wallet.from_entropy(entropy="ed0802d701a033776811601dd6c5c4a9")
+        >>> wallet.scan(account=1, gap=20)
+        {'balance': 200000000, 'utxos': [{'hash': '9843c9b9130bd87a9683f2c4e66456326beeefb2522c3352326de870c5c1329e', 'asset': 'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff', 'amount': 200000000, 'address': 'vp1qk9vj4jaezlcnjdckds4fkm8fwv5kawmqwpnpvs', 'address_index': 1, 'change': False}], 'addresses': [{'index': 1, 'address': 'vp1qk9vj4jaezlcnjdckds4fkm8fwv5kawmqwpnpvs', 'public_key': 'fe6b3fd4458291b19605d92837ae1060cc0237e68022b2eb9faf01a118226212', 'change': False, 'balance': 200000000, 'utxos': [...]}], 'receive_index': 2, 'change_index': 0}
+
+        .. note::
+            Addresses are derived with ``derive_range`` and queried ``gap`` at a time. Vapor explorers have no
+            address history, an address is used when it has an asset balance. Each chain stops after ``gap``
+            consecutive unused addresses.
+        """
+
+        return _scan_addresses(
+            derive=partial(self.derive_range, account), activity=partial(
+                _address_activity, self._network, (str(asset.ID) if isinstance(asset, AssetNamespace) else asset), limit
+            ), gap=gap, workers=workers
+        )
+
     def strength(self) -> Optional[int]:
         """
         Get Vapor wallet strength.
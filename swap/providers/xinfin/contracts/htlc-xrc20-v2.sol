@@ -0,0 +1,300 @@
+// SPDX-License-Identifier: AGPL-3.0
+
+pragma solidity ^0.8.10;
+
+import "./libs/xrc20.sol";
+
+/**
+ * @title Gas Optimized Hash Time Lock Contract (HTLC) XRC20
+ *
+ * @author Meheret Tesfaye Batu <meherett@zoho.com>
+ *
+ * Same fund, withdraw and refund interface as HTLC_XRC20, with a smaller storage footprint:
+ *
+ * - The locked contract is packed in five storage slots, endtime is uint64 and the
+ *   withdrawn/refunded flags are one status enum next to the token address.
+ * - The preimage is emitted in the log_withdraw event instead of being written to storage.
+ * - Failed checks revert with custom errors instead of revert strings.
+ * - fund_batch, withdraw_batch and refund_batch handle many locked contracts in one transaction,
+ *   consecutive withdraw and refund amounts of the same token are sent in one transfer.
+ */
+contract HTLC_XRC20_V2 {
+
+    enum Status { INVALID, FUNDED, WITHDRAWN, REFUNDED }
+
+    struct LockedContract {
+        bytes32 secret_hash;
+        address token;
+        uint64 endtime;
+        Status status;
+        address recipient;
+        address sender;
+        uint256 amount;
+    }
+
+    mapping (bytes32 => LockedContract) locked_contracts;
+
+    event log_fund (
+        bytes32 indexed locked_contract_id,
+        address token,
+        bytes32 secret_hash,
+        address indexed recipient,
+        address indexed sender,
+        uint256 endtime,
+        uint256 amount
+    );
+    event log_withdraw (
+        bytes32 indexed locked_contract_id,
+        string preimage
+    );
+    event log_refund (
+        bytes32 indexed locked_contract_id
+    );
+
+    error InvalidAmount ();
+    error InvalidEndtime ();
+    error InvalidSender ();
+    error InvalidBatch ();
+    error LockedContractExists (bytes32 locked_contract_id);
+    error LockedContractNotFunded (bytes32 locked_contract_id);
+    error SecretHashMismatch ();
+    error NotRecipient ();
+    error NotSender ();
+    error EndtimeNotPassed ();
+    error TransferFailed (address token);
+
+    /**
+     * @dev Sender sets up a new Hash Time Lock Contract (HTLC) and depositing the XRC20 token.
+     *
+     * @param token XRC20 token address.
+     * @param secret_hash A sha256 secret hash.
+     * @param recipient Recipient account of the XRC20 token.
+     * @param sender Sender account of the XRC20 token.
+     * @param endtime The timestamp that the lock expires at.
+     * @param amount XRC20 token amount, must be approved to this contract.
+     *
+     * @return locked_contract_id of the new HTLC.
+     */
+    function fund (
+        address token, bytes32 secret_hash, address recipient, address sender, uint256 endtime, uint256 amount
+    ) external returns (bytes32 locked_contract_id) {
+
+        if (msg.sender != sender)
+            revert InvalidSender();
+
+        locked_contract_id = _fund(token, secret_hash, recipient, endtime, amount);
+        _transfer_from(token, amount);
+    }
+
+    /**
+     * @dev Sender sets up many Hash Time Lock Contracts (HTLC's) in one transaction.
+     *
+     * @param tokens XRC20 token addresses.
+     * @param secret_hashes sha256 secret hashes.
+     * @param recipients Recipient accounts of the XRC20 tokens.
+     * @param sender Sender account of the XRC20 tokens.
+     * @param endtimes The timestamps that the locks expire at.
+     * @param amounts XRC20 token amounts of each HTLC, must be approved to this contract.
+     *
+     * @return locked_contract_ids of the new HTLC's.
+     */
+    function fund_batch (
+        address[] calldata tokens, bytes32[] calldata secret_hashes, address[] calldata recipients, address sender, uint256[] calldata endtimes, uint256[] calldata amounts
+    ) external returns (bytes32[] memory locked_contract_ids) {
+
+        if (msg.sender != sender)
+            revert InvalidSender();
+        if (secret_hashes.length != tokens.length || recipients.length != tokens.length || endtimes.length != tokens.length || amounts.length != tokens.length)
+            revert InvalidBatch();
+
+        uint256 total;
+        locked_contract_ids = new bytes32[](tokens.length);
+        for (uint256 index = 0; index < tokens.length; index++) {
+            locked_contract_ids[index] = _fund(tokens[index], secret_hashes[index], recipients[index], endtimes[index], amounts[index]);
+            total += amounts[index];
+            if (index + 1 == tokens.length || tokens[index + 1] != tokens[index]) {
+                _transfer_from(tokens[index], total);
+                total = 0;
+            }
+        }
+        return locked_contract_ids;
+    }
+
+    /**
+     * @dev Called by the recipient once they know the preimage (secret key) of the secret hash.
+     *
+     * @param locked_contract_id of HTLC to withdraw.
+     * @param preimage sha256(preimage) hash should equal the contract secret hash.
+     *
+     * @return bool true on success or false on failure.
+     */
+    function withdraw (bytes32 locked_contract_id, string calldata preimage) external returns (bool) {
+
+        (address token, uint256 amount) = _withdraw(locked_contract_id, preimage);
+        _transfer(token, amount);
+        return true;
+    }
+
+    /**
+     * @dev Called by the recipient to withdraw many HTLC's.
+     *
+     * @param locked_contract_ids of HTLC's to withdraw.
+     * @param preimages sha256(preimage) hashes should equal the contracts secret hashes.
+     *
+     * @return bool true on success or false on failure.
+     */
+    function withdraw_batch (bytes32[] calldata locked_contract_ids, string[] calldata preimages) external returns (bool) {
+
+        if (preimages.length != locked_contract_ids.length)
+            revert InvalidBatch();
+
+        address token;
+        uint256 total;
+        for (uint256 index = 0; index < locked_contract_ids.length; index++) {
+            (address _token, uint256 amount) = _withdraw(locked_contract_ids[index], preimages[index]);
+            if (_token != token) {
+                _transfer(token, total);
+                (token, total) = (_token, 0);
+            }
+            total += amount;
+        }
+        _transfer(token, total);
+        return true;
+    }
+
+    /**
+     * @dev Called by the sender if there was no withdraw and the time lock has expired.
+     *
+     * @param locked_contract_id of HTLC to refund.
+     *
+     * @return bool true on success or false on failure.
+     */
+    function refund (bytes32 locked_contract_id) external returns (bool) {
+
+        (address token, uint256 amount) = _refund(locked_contract_id);
+        _transfer(token, amount);
+        return true;
+    }
+
+    /**
+     * @dev Called by the sender to refund many expired HTLC's.
+     *
+     * @param locked_contract_ids of HTLC's to refund.
+     *
+     * @return bool true on success or false on failure.
+     */
+    function refund_batch (bytes32[] calldata locked_contract_ids) external returns (bool) {
+
+        address token;
+        uint256 total;
+        for (uint256 index = 0; index < locked_contract_ids.length; index++) {
+            (address _token, uint256 amount) = _refund(locked_contract_ids[index]);
+            if (_token != token) {
+                _transfer(token, total);
+                (token, total) = (_token, 0);
+            }
+            total += amount;
+        }
+        _transfer(token, total);
+        return true;
+    }
+
+    /**
+     * @dev Get HTLC contract details.
+     *
+     * @param locked_contract_id of HTLC to get details.
+     *
+     * @return id token secret_hash recipient sender endtime amount withdrawn refunded locked HTLC contract datas.
+     */
+    function get_locked_contract (bytes32 locked_contract_id) public view returns (
+        bytes32 id, address token, bytes32 secret_hash, address recipient, address sender, uint256 endtime, uint256 amount, bool withdrawn, bool refunded
+    ) {
+        LockedContract storage locked_contract = locked_contracts[locked_contract_id];
+
+        if (locked_contract.status == Status.INVALID)
+            return (0, address(0), 0, address(0), address(0), 0, 0, false, false);
+
+        return (
+            locked_contract_id,
+            locked_contract.token,
+            locked_contract.secret_hash,
+            locked_contract.recipient,
+            locked_contract.sender,
+            locked_contract.endtime,
+            locked_contract.amount,
+            locked_contract.status == Status.WITHDRAWN,
+            locked_contract.status == Status.REFUNDED
+        );
+    }
+
+    function _fund (address token, bytes32 secret_hash, address recipient, uint256 endtime, uint256 amount) internal returns (bytes32 locked_contract_id) {
+
+        if (amount == 0)
+            revert InvalidAmount();
+        if (endtime <= block.timestamp || endtime > type(uint64).max)
+            revert InvalidEndtime();
+
+        locked_contract_id = sha256(abi.encodePacked(
+            token, secret_hash, recipient, msg.sender, endtime, amount
+        ));
+
+        if (locked_contracts[locked_contract_id].status != Status.INVALID)
+            revert LockedContractExists(locked_contract_id);
+
+        locked_contracts[locked_contract_id] = LockedContract(
+            secret_hash, token, uint64(endtime), Status.FUNDED, recipient, msg.sender, amount
+        );
+
+        emit log_fund (
+            locked_contract_id, token, secret_hash, recipient, msg.sender, endtime, amount
+        );
+    }
+
+    function _withdraw (bytes32 locked_contract_id, string calldata preimage) internal returns (address token, uint256 amount) {
+
+        LockedContract storage locked_contract = locked_contracts[locked_contract_id];
+
+        if (locked_contract.status != Status.FUNDED)
+            revert LockedContractNotFunded(locked_contract_id);
+        if (locked_contract.recipient != msg.sender)
+            revert NotRecipient();
+        if (locked_contract.secret_hash != sha256(bytes(preimage)))
+            revert SecretHashMismatch();
+
+        locked_contract.status = Status.WITHDRAWN;
+
+        emit log_withdraw (
+            locked_contract_id, preimage
+        );
+        return (locked_contract.token, locked_contract.amount);
+    }
+
+    function _refund (bytes32 locked_contract_id) internal returns (address token, uint256 amount) {
+
+        LockedContract storage locked_contract = locked_contracts[locked_contract_id];
+
+        if (locked_contract.status != Status.FUNDED)
+            revert LockedContractNotFunded(locked_contract_id);
+        if (locked_contract.sender != msg.sender)
+            revert NotSender();
+        if (locked_contract.endtime > block.timestamp)
+            revert EndtimeNotPassed();
+
+        locked_contract.status = Status.REFUNDED;
+
+        emit log_refund (
+            locked_contract_id
+        );
+        return (locked_contract.token, locked_contract.amount);
+    }
+
+    function _transfer_from (address token, uint256 amount) internal {
+        if (!IXRC20(token).transferFrom(msg.sender, address(this), amount))
+            revert TransferFailed(token);
+    }
+
+    function _transfer (address token, uint256 amount) internal {
+        if (amount > 0 && !IXRC20(token).transfer(msg.sender, amount))
+            revert TransferFailed(token);
+    }
+}
@@ -3,7 +3,7 @@
 from web3 import Web3
 from web3.types import Wei
 from web3.providers import (
-    HTTPProvider, WebsocketProvider
+    HTTPProvider, WebsocketProvider, IPCProvider, BaseProvider
 )
 from web3.contract import Contract
 from web3._utils.threads import Timeout
@@ -11,12 +11,13 @@ from pyxdc.utils import decode_transaction_raw as dtr
 from hexbytes.main import HexBytes
 from eth_typing import URI
 from typing import (
-    Optional, Tuple
+    Optional, Tuple, Dict
 )
 
 import web3 as _web3
 import requests
 import json
+import time
 import sys
 import os
 
@@ -29,6 +30,98 @@ from .utils import (
 )
 
 
+# XinFin Web3 instances per provider uri, keeps connections open across calls.
+_web3s: Dict[str, Web3] = {}
+# Selected XinFin provider uri and its last health check time per network.
+_selected: Dict[str, Tuple[str, float]] = {}
+# XinFin failover Web3 instances per network and providers list.
+_failovers: Dict[Tuple[str, ...], Web3] = {}
+
+
+def _get_web3(uri: str) -> Web3:
+    if uri not in _web3s:
+        if uri.startswith("http://") or uri.startswith("https://"):
+            _provider: BaseProvider = HTTPProvider(
+                endpoint_uri=URI(uri), request_kwargs={
+                    "timeout": config["timeout"]
+                }
+            )
+        elif uri.startswith("ws://") or uri.startswith("wss://"):
+            _provider: BaseProvider = WebsocketProvider(endpoint_uri=URI(uri))
+        else:
+            _provider: BaseProvider = IPCProvider(
+                ipc_path=os.path.expanduser(uri), timeout=config["timeout"]
+            )
+        _web3s[uri] = Web3(_provider)
+    return _web3s[uri]
+
+
+def _latency(web3: Web3) -> Optional[float]:
+    start: float = time.perf_counter()
+    try:
+        web3.eth.block_number
+    except Exception:
+        return None
+    return time.perf_counter() - start
+
+
+def _select_uri(network: str, uris: list) -> str:
+    if network in _selected and _selected[network][0] in uris and \
+            (time.monotonic() - _selected[network][1]) < config["health_check_interval"]:
+        return _selected[network][0]
+    # Health check every provider, select the lowest latency one by providers order
+    latencies: Dict[str, float] = {}
+    for uri in uris:
+        latency: Optional[float] = _latency(web3=_get_web3(uri=uri))
+        if latency is not None:
+            latencies[uri] = latency
+    if not latencies:
+        _selected.pop(network, None)
+        raise APIError(f"There is no healthy XinFin provider on '{network}' network.")
+    uri: str = min(latencies, key=lambda _uri: latencies[_uri])
+    _selected[network] = (uri, time.monotonic())
+    return uri
+
+
+class _FailoverProvider(BaseProvider):
+    # Sends each request to the selected provider, a failed request drops the selection
+    # and is retried on the next healthy provider until none is left.
+
+    def __init__(self, network: str, uris: list):
+        super().__init__()
+        self.network: str = network
+        self.uris: list = uris
+
+    def make_request(self, method, params):
+        failed: list = []
+        while True:
+            uri: str = _select_uri(network=self.network, uris=[
+                _uri for _uri in self.uris if _uri not in failed
+            ])
+            try:
+                return _get_web3(uri=uri).provider.make_request(method, params)
+            except Exception:
+                failed.append(uri)
+                if _selected.get(self.network, (None,))[0] == uri:
+                    _selected.pop(self.network, None)
+
+    def isConnected(self) -> bool:
+        try:
+            _select_uri(network=self.network, uris=self.uris)
+        except APIError:
+            return False
+        return True
+
+
+def _select_web3(network: str, uris: list) -> Web3:
+    # Fails early when there is no healthy provider
+    _select_uri(network=network, uris=uris)
+    key: Tuple[str, ...] = (network, *uris)
+    if key not in _failovers:
+        _failovers[key] = Web3(_FailoverProvider(network=network, uris=uris))
+    return _failovers[key]
+
+
 def get_web3(network: str = config["network"], provider: str = config["provider"]) -> Web3:
     """
     Get XinFin Web3 instance.
@@ -43,6 +136,11 @@ def get_web3(network: str = config["network"], provider: str = config["provider"
     >>> from swap.providers.xinfin.rpc import get_web3
     >>> get_web3(network="testnet", provider="http")
     <web3.main.Web3 object at 0x000001DDECCD0640>
+
+    .. note::
+        Web3 instances are kept per provider uri, ``ipc`` connects to the co-located node IPC path and
+        ``auto`` fails over between the network providers list, selecting the healthy one with lowest latency
+        and moving to the next one as soon as a request to the selected provider fails.
     """
 
     # Check parameter instances
@@ -50,24 +148,20 @@ def get_web3(network: str = config["network"], provider: str = config["provider"
         raise NetworkError(f"Invalid XinFin '{network}' network",
                            "choose only 'mainnet', 'apothem' or 'testnet' networks.")
 
-    if provider == "http":
-        web3: Web3 = Web3(HTTPProvider(
-                endpoint_uri=URI(config[network]["http"]),
-                request_kwargs={
-                    "timeout": config["timeout"]
-                }
-            )
-        )
-        return web3
+    if provider == "auto":
+        return _select_web3(network=network, uris=config[network]["providers"])
+    elif provider == "http":
+        uri: str = config[network]["http"]
     elif provider == "websocket":
-        web3: Web3 = Web3(WebsocketProvider(
-                endpoint_uri=URI(config[network]["websocket"])
-            )
-        )
-        return web3
+        uri: str = config[network]["websocket"]
+    elif provider == "ipc":
+        if not config[network]["ipc"]:
+            raise ValueError(f"There is no XinFin IPC path on '{network}' network.")
+        uri: str = config[network]["ipc"]
     else:
         raise ValueError(f"Invalid XinFin '{provider}' provider",
-                         "choose only 'http' or 'websocket' providers.")
+                         "choose only 'http', 'websocket', 'ipc' or 'auto' providers.")
+    return _get_web3(uri=uri)
 
 
 def get_balance(address: str, network: str = config["network"], provider: str = config["provider"]) -> Wei:
@@ -99,6 +193,34 @@ def get_balance(address: str, network: str = config["network"], provider: str =
     return Wei(balance)
 
 
+def get_transaction_count(address: str, network: str = config["network"], provider: str = config["provider"]) -> int:
+    """
+    Get XinFin address transaction count (nonce).
+
+    :param address: XinFin address.
+    :type address: str
+    :param network: XinFin network, defaults to ``mainnet``.
+    :type network: str
+    :param provider: XinFin network provider, defaults to ``http``.
+    :type provider: str
+
+    :returns: int -- XinFin address sent transaction count.
+
+    >>> from swap.providers.xinfin.rpc import get_transaction_count
+    >>> get_transaction_count("xdc70c1eb09363603a3b6391deb2daa6d2561a62f52", "mainnet")
+    7
+    """
+
+    # Check parameter instances
+    if not is_address(address=address):
+        raise AddressError(f"Invalid XinFin '{address}' address.")
+
+    web3: Web3 = get_web3(network=network, provider=provider)
+    return web3.eth.get_transaction_count(
+        to_checksum_address(address=address, prefix="0x")
+    )
+
+
 def get_xrc20_balance(address: str, token_address: str, network: str = config["network"],
                       provider: str = config["provider"]) -> Tuple[int, str, str, int, str]:
     """
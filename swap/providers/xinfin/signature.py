@@ -1,15 +1,14 @@
 #!/usr/bin/env python3
 
-from base64 import b64encode, b64decode
 from eth_account.datastructures import SignedTransaction
 from web3.types import Wei
 from typing import (
-    Optional, Union
+    Optional, Union, List, Callable
 )
 
-import json
-
-from ...utils import clean_transaction_raw
+from ...utils import (
+    TransactionEnvelope, clean_transaction_raw, encode_transaction_raw, load_transaction_raw, _sign_many
+)
 from ...exceptions import (
     TransactionRawError, UnitError
 )
@@ -159,13 +158,14 @@ class Signature(Transaction):
 
         return self._type
 
-    def sign(self, transaction_raw: str, solver: Union[NormalSolver, FundSolver, WithdrawSolver, RefundSolver]) -> \
+    def sign(self, transaction_raw: Union[str, TransactionEnvelope],
+             solver: Union[NormalSolver, FundSolver, WithdrawSolver, RefundSolver]) -> \
             Union["NormalSignature", "FundSignature", "WithdrawSignature", "RefundSignature"]:
         """
         Sign XinFin unsigned transaction raw.
 
-        :param transaction_raw: XinFin unsigned transaction raw.
-        :type transaction_raw: str
+        :param transaction_raw: XinFin unsigned transaction raw or transaction envelope.
+        :type transaction_raw: str, swap.utils.TransactionEnvelope
         :param solver: XinFin solver.
         :type solver: xinfin.solver.NormalSolver, xinfin.solver.FundSolver, xinfin.solver.WithdrawSolver, xinfin.solver.RefundSolver
 
@@ -179,45 +179,42 @@ class Signature(Transaction):
         <swap.providers.xinfin.signature.FundSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Bytom unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         self._type = loaded_transaction_raw["type"]
         if loaded_transaction_raw["type"] == "xinfin_normal_unsigned":
             return NormalSignature(network=self._network, xrc20=False).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "xinfin_xrc20_normal_unsigned":
             return NormalSignature(network=self._network, xrc20=True).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "xinfin_fund_unsigned":
             return FundSignature(network=self._network, xrc20=False).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "xinfin_xrc20_fund_unsigned":
             return FundSignature(network=self._network, xrc20=True).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "xinfin_withdraw_unsigned":
             return WithdrawSignature(network=self._network, xrc20=False).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "xinfin_xrc20_withdraw_unsigned":
             return WithdrawSignature(network=self._network, xrc20=True).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "xinfin_refund_unsigned":
             return RefundSignature(network=self._network, xrc20=False).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "xinfin_xrc20_refund_unsigned":
             return RefundSignature(network=self._network, xrc20=True).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
 
     def signature(self) -> dict:
@@ -283,12 +280,12 @@ class NormalSignature(Signature):
             network=network, xrc20=xrc20, provider=provider
         )
 
-    def sign(self, transaction_raw: str, solver: NormalSolver) -> "NormalSignature":
+    def sign(self, transaction_raw: Union[str, TransactionEnvelope], solver: NormalSolver) -> "NormalSignature":
         """
         Sign XinFin unsigned normal transaction raw.
 
-        :param transaction_raw: XinFin unsigned normal transaction raw.
-        :type transaction_raw: str
+        :param transaction_raw: XinFin unsigned normal transaction raw or transaction envelope.
+        :type transaction_raw: str, swap.utils.TransactionEnvelope
         :param solver: XinFin solver.
         :type solver: xinfin.solver.NormalSolver
 
@@ -303,13 +300,10 @@ class NormalSignature(Signature):
         """
 
         # Check parameter instances
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid XinFin unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if loaded_transaction_raw["type"] not in ["xinfin_normal_unsigned", "xinfin_xrc20_normal_unsigned"]:
             raise TypeError(f"Invalid XinFin normal unsigned transaction raw type, "
                             f"you can't sign '{loaded_transaction_raw['type']}' type by using normal signature.")
@@ -339,14 +333,14 @@ class NormalSignature(Signature):
         )
         self._type = "xinfin_xrc20_normal_signed" if self._xrc20 else "xinfin_normal_signed"
 
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = encode_transaction_raw(transaction=dict(
             fee=self._fee,
             type=self._type,
             transaction=self._transaction,
             signature=self._signature,
             network=self._network,
             xrc20=self._xrc20
-        ))).encode()).decode()
+        ), binary=loaded_transaction_raw.binary)
         return self
 
 
@@ -372,12 +366,12 @@ class FundSignature(Signature):
             network=network, xrc20=xrc20, provider=provider
         )
 
-    def sign(self, transaction_raw: str, solver: FundSolver) -> "FundSignature":
+    def sign(self, transaction_raw: Union[str, TransactionEnvelope], solver: FundSolver) -> "FundSignature":
         """
         Sign XinFin unsigned fund transaction raw.
 
-        :param transaction_raw: XinFin unsigned fund transaction raw.
-        :type transaction_raw: str
+        :param transaction_raw: XinFin unsigned fund transaction raw or transaction envelope.
+        :type transaction_raw: str, swap.utils.TransactionEnvelope
         :param solver: XinFin solver.
         :type solver: xinfin.solver.FundSolver
 
@@ -392,13 +386,10 @@ class FundSignature(Signature):
         """
 
         # Check parameter instances
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid XinFin unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if loaded_transaction_raw["type"] not in ["xinfin_fund_unsigned", "xinfin_xrc20_fund_unsigned"]:
             raise TypeError(f"Invalid XinFin fund unsigned transaction raw type, "
                             f"you can't sign '{loaded_transaction_raw['type']}' type by using fund signature.")
@@ -428,14 +419,14 @@ class FundSignature(Signature):
         )
         self._type = "xinfin_xrc20_fund_signed" if self._xrc20 else "xinfin_fund_signed"
 
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = encode_transaction_raw(transaction=dict(
             fee=self._fee,
             type=self._type,
             transaction=self._transaction,
             signature=self._signature,
             network=self._network,
             xrc20=self._xrc20
-        ))).encode()).decode()
+        ), binary=loaded_transaction_raw.binary)
         return self
 
 
@@ -461,12 +452,12 @@ class WithdrawSignature(Signature):
             network=network, xrc20=xrc20, provider=provider
         )
 
-    def sign(self, transaction_raw: str, solver: WithdrawSolver) -> "WithdrawSignature":
+    def sign(self, transaction_raw: Union[str, TransactionEnvelope], solver: WithdrawSolver) -> "WithdrawSignature":
         """
         Sign XinFin unsigned withdraw transaction raw.
 
-        :param transaction_raw: XinFin unsigned withdraw transaction raw.
-        :type transaction_raw: str
+        :param transaction_raw: XinFin unsigned withdraw transaction raw or transaction envelope.
+        :type transaction_raw: str, swap.utils.TransactionEnvelope
         :param solver: XinFin withdraw solver.
         :type solver: xinfin.solver.WithdrawSolver
 
@@ -481,13 +472,10 @@ class WithdrawSignature(Signature):
         """
 
         # Check parameter instances
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid XinFin unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if loaded_transaction_raw["type"] not in ["xinfin_withdraw_unsigned", "xinfin_xrc20_withdraw_unsigned"]:
             raise TypeError(f"Invalid XinFin withdraw unsigned transaction raw type, "
                             f"you can't sign '{loaded_transaction_raw['type']}' type by using withdraw signature.")
@@ -517,14 +505,14 @@ class WithdrawSignature(Signature):
         )
         self._type = "xinfin_xrc20_withdraw_signed" if self._xrc20 else "xinfin_withdraw_signed"
 
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = encode_transaction_raw(transaction=dict(
             fee=self._fee,
             type=self._type,
             transaction=self._transaction,
             signature=self._signature,
             network=self._network,
             xrc20=self._xrc20
-        ))).encode()).decode()
+        ), binary=loaded_transaction_raw.binary)
         return self
 
 
@@ -550,12 +538,12 @@ class RefundSignature(Signature):
             network=network, xrc20=xrc20, provider=provider
         )
 
-    def sign(self, transaction_raw: str, solver: RefundSolver) -> "RefundSignature":
+    def sign(self, transaction_raw: Union[str, TransactionEnvelope], solver: RefundSolver) -> "RefundSignature":
         """
         Sign XinFin unsigned refund transaction raw.
 
-        :param transaction_raw: XinFin unsigned refund transaction raw.
-        :type transaction_raw: str
+        :param transaction_raw: XinFin unsigned refund transaction raw or transaction envelope.
+        :type transaction_raw: str, swap.utils.TransactionEnvelope
         :param solver: XinFin refund solver.
         :type solver: xinfin.solver.RefundSolver
 
@@ -570,13 +558,10 @@ class RefundSignature(Signature):
         """
 
         # Check parameter instances
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid XinFin unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if loaded_transaction_raw["type"] not in ["xinfin_refund_unsigned", "xinfin_xrc20_refund_unsigned"]:
             raise TypeError(f"Invalid XinFin refund unsigned transaction raw type, "
                             f"you can't sign '{loaded_transaction_raw['type']}' type by using refund signature.")
@@ -606,12 +591,47 @@ class RefundSignature(Signature):
         )
         self._type = "xinfin_xrc20_refund_signed" if self._xrc20 else "xinfin_refund_signed"
 
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = encode_transaction_raw(transaction=dict(
             fee=self._fee,
             type=self._type,
             transaction=self._transaction,
             signature=self._signature,
             network=self._network,
             xrc20=self._xrc20
-        ))).encode()).decode()
+        ), binary=loaded_transaction_raw.binary)
         return self
+
+
+def sign_many(transaction_raws: List[Union[str, TransactionEnvelope]], solver_factory: Callable,
+              workers: Optional[int] = None, network: str = config["network"],
+              provider: str = config["provider"]) -> List[dict]:
+    """
+    Sign many XinFin unsigned transaction raws over a process pool.
+
+    :param transaction_raws: XinFin unsigned transaction raws or transaction envelopes.
+    :type transaction_raws: list
+    :param solver_factory: Picklable callable, called once per worker, returning a XinFin solver or a callable that takes the transaction envelope and returns its solver.
+    :type solver_factory: callable
+    :param workers: Number of worker processes, defaults to CPU count (``1`` signs in this process).
+    :type workers: int
+    :param network: XinFin network, defaults to ``mainnet``.
+    :type network: str
+    :param provider: XinFin network provider, defaults to ``http``.
+    :type provider: str
+
+    :returns: list -- XinFin signed transaction raw and error per transaction raw, in input order.
+
+    >>> from functools import partial
+    >>> from swap.providers.xinfin.signature import sign_many
+    >>> from swap.providers.xinfin.solver import FundSolver
+    >>> sign_many(transaction_raws=["eyJmZWUiOiAxMzg0NDgsICJ0cmFuc2FjdGlvbiI6IHsiY2hhaW5JZCI6IDEzMzcsICJmcm9tIjogIjB4NjllMDRmZTE2YzlBNkE4MzA3NkIzYzJkYzRiNEJjMjFiNWQ5QTIwQyIsICJ2YWx1ZSI6IDMwMDAwMDAwMDAwMDAwMDAwMDAsICJub25jZSI6IDEsICJnYXMiOiAxMzg0NDgsICJnYXNQcmljZSI6IDIwMDAwMDAwMDAwLCAidG8iOiAiMHhlYUVhQzgxZGE1RTM4NkU4Q2E0RGUxZTY0ZDQwYTEwRTQ2OEE1YjQwIiwgImRhdGEiOiAiMHhmNGZkMzA2MjNhMjZkYTgyZWFkMTVhODA1MzNhMDI2OTY2NTZiMTRiNWRiZmQ4NGViMTQ3OTBmMmUxYmU1ZTllNDU4MjBlZWIwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDBkNzdlMGQyZWVmOTA1Y2ZiMzljM2M0Yjk1MmVkMjc4ZDU4Zjk2ZTFmMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwNjllMDRmZTE2YzlhNmE4MzA3NmIzYzJkYzRiNGJjMjFiNWQ5YTIwYzAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwNjBjZTRiNzIifSwgInNpZ25hdHVyZSI6IG51bGwsICJuZXR3b3JrIjogInRlc3RuZXQiLCAidHlwZSI6ICJldGhlcmV1bV9mdW5kX3Vuc2lnbmVkIn0", "meheret"], solver_factory=partial(FundSolver, xprivate_key="xprv9s21ZrQH143K3Y3pdbkbjreZQ9RVmqTLhRgf86uZyCJk2ou36YdUJt5frjwihGWmV1fQEDioiGZXWXUbHLy3kQf5xmhvhp8dZ2tfn6tgGUj"), workers=2, network="testnet")
+    [{'transaction_raw': '...', 'error': None}, {'transaction_raw': None, 'error': 'TransactionRawError: Invalid transaction raw., ...'}]
+
+    .. note::
+        One failing transaction raw doesn't fail the batch, its error is reported with ``transaction_raw`` as ``None``.
+    """
+
+    return _sign_many(
+        signature=Signature, signature_kwargs=dict(network=network, provider=provider),
+        transaction_raws=transaction_raws, solver_factory=solver_factory, workers=workers
+    )
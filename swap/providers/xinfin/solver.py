@@ -1,11 +1,39 @@
 #!/usr/bin/env python3
 
+from binascii import (
+    hexlify, unhexlify
+)
 from typing import Optional
 
+from ...crypto import (
+    KeyCache, get_key_cache
+)
 from ..config import xinfin as config
 from .wallet import Wallet
 
 
+def _wallet(network: str, xprivate_key: str, strict: bool, path: str) -> Wallet:
+    # With the shared key cache enabled, the child private key is derived once per xprivate key and path
+    key_cache: Optional[KeyCache] = get_key_cache()
+    if key_cache is None:
+        return Wallet(network=network).from_xprivate_key(
+            xprivate_key=xprivate_key, strict=strict
+        ).from_path(
+            path=path
+        )
+    return Wallet(network=network).from_private_key(
+        private_key=hexlify(key_cache.get_or_derive(
+            parts=("xinfin", network, xprivate_key, str(strict), path), derive=lambda: unhexlify(
+                Wallet(network=network).from_xprivate_key(
+                    xprivate_key=xprivate_key, strict=strict
+                ).from_path(
+                    path=path
+                ).private_key()
+            )
+        )).decode()
+    )
+
+
 class NormalSolver:
     """
     XinFin Normal solver.
@@ -47,11 +75,7 @@ class NormalSolver:
                 account=self._account, change=(1 if self._change else 0), address=self._address
             )
 
-        return Wallet(network=network).from_xprivate_key(
-            xprivate_key=self._xprivate_key
-        ).from_path(
-            path=self._path
-        )
+        return _wallet(network=network, xprivate_key=self._xprivate_key, strict=self._strict, path=self._path)
 
 
 class FundSolver:
@@ -97,11 +121,7 @@ class FundSolver:
                 account=self._account, change=(1 if self._change else 0), address=self._address
             )
 
-        return Wallet(network=network).from_xprivate_key(
-            xprivate_key=self._xprivate_key
-        ).from_path(
-            path=self._path
-        )
+        return _wallet(network=network, xprivate_key=self._xprivate_key, strict=self._strict, path=self._path)
 
 
 class WithdrawSolver:
@@ -147,11 +167,7 @@ class WithdrawSolver:
                 account=self._account, change=(1 if self._change else 0), address=self._address
             )
 
-        return Wallet(network=network).from_xprivate_key(
-            xprivate_key=self._xprivate_key
-        ).from_path(
-            path=self._path
-        )
+        return _wallet(network=network, xprivate_key=self._xprivate_key, strict=self._strict, path=self._path)
 
 
 class RefundSolver:
@@ -197,6 +213,4 @@ class RefundSolver:
                 account=self._account, change=(1 if self._change else 0), address=self._address
             )
 
-        return Wallet(network=network).from_xprivate_key(
-            xprivate_key=self._xprivate_key
-        ).from_path(path=self._path)
+        return _wallet(network=network, xprivate_key=self._xprivate_key, strict=self._strict, path=self._path)
@@ -4,12 +4,12 @@ from binascii import unhexlify
 from eth_account.datastructures import SignedTransaction
 from web3.datastructures import AttributeDict
 from web3.contract import Contract
+from web3.logs import DISCARD
 from web3 import Web3
 from web3.types import Wei
 from typing import (
-    Optional, Union
+    Optional, Union, List, Tuple, Set
 )
-from base64 import b64encode
 
 import json
 import sys
@@ -18,10 +18,14 @@ import os
 from ...exceptions import (
     AddressError, NetworkError, UnitError
 )
-from ...utils import clean_transaction_raw
+from ...utils import (
+    encode_transaction_raw, sha256
+)
 from ..config import xinfin as config
 from .wallet import Wallet
-from .htlc import HTLC
+from .htlc import (
+    HTLC, _is_released
+)
 from .rpc import (
     get_web3, get_transaction_receipt
 )
@@ -33,6 +37,29 @@ from .solver import (
 )
 
 
+def _locked_contracts(network: str, htlc_contract: Contract, transaction_hashes: List[str]) -> List[AttributeDict]:
+    # HTLC log_fund event arguments of funded transactions, a batch fund transaction has many
+    locked_contracts: List[AttributeDict] = []
+    locked_contract_ids: Set[bytes] = set()
+    # Drop duplicate transaction hashes and locked contract ids, spending one twice reverts the batch
+    for transaction_hash in dict.fromkeys(transaction_hashes):
+        transaction_receipt: AttributeDict = _AttributeDict(get_transaction_receipt(
+            transaction_hash=transaction_hash, network=network
+        )).__attribute_dict__()
+        for log_fund in htlc_contract.events.log_fund().processReceipt(transaction_receipt, errors=DISCARD):
+            if log_fund["address"] != htlc_contract.address \
+                    or log_fund["args"]["locked_contract_id"] in locked_contract_ids:
+                continue
+            locked_contract_ids.add(log_fund["args"]["locked_contract_id"])
+            # Skip already withdrawn or refunded locked contracts, spending them again reverts
+            withdrawn, refunded = htlc_contract.functions.get_locked_contract(
+                log_fund["args"]["locked_contract_id"]
+            ).call()[-2:]
+            if not withdrawn and not refunded:
+                locked_contracts.append(log_fund["args"])
+    return locked_contracts
+
+
 class Transaction:
     """
     XinFin Transaction.
@@ -43,6 +70,8 @@ class Transaction:
     :type xrc20: bool
     :param provider: XinFin network provider, defaults to ``http``.
     :type provider: str
+    :param version: HTLC contract version, ``v1`` or ``v2``, defaults to ``v1``.
+    :type version: str
 
     :returns: Transaction -- XinFin transaction instance.
 
@@ -50,15 +79,23 @@ class Transaction:
         XinFin has only three networks, ``mainnet``, ``apothem`` and ``testnet``.
     """
 
-    def __init__(self, network: str = config["network"], xrc20: bool = False, provider: str = config["provider"]):
+    def __init__(self, network: str = config["network"], xrc20: bool = False,
+                 provider: str = config["provider"], version: str = "v1"):
 
         # Check parameter instances
         if not is_network(network=network):
             raise NetworkError(f"Invalid XinFin '{network}' network",
                                "choose only 'mainnet', 'apothem' or 'testnet' networks.")
 
+        if version not in ["v1", "v2"]:
+            raise ValueError(f"Invalid XinFin HTLC '{version}' version, choose only 'v1' or 'v2' versions.")
+        if not _is_released(version=version, xrc20=xrc20):
+            raise ValueError(f"XinFin HTLC '{version}' version is not released yet, "
+                             "its precompiled contract artifact is not shipped.")
+
         self._xrc20: bool = xrc20
         self._network: str = network
+        self._version: str = version
         self.web3: Web3 = get_web3(
             network=network, provider=provider
         )
@@ -206,10 +243,13 @@ class Transaction:
 
         return self._signature
 
-    def transaction_raw(self) -> str:
+    def transaction_raw(self, binary: bool = False) -> str:
         """
         Get XinFin fund transaction raw.
 
+        :param binary: Encode as compact binary envelope, defaults to ``False``.
+        :type binary: bool
+
         :returns: str -- XinFin fund transaction raw.
 
         >>> from swap.providers.xinfin.htlc import HTLC
@@ -227,14 +267,14 @@ class Transaction:
         if not self._transaction:
             raise ValueError("Transaction is none, build transaction first.")
 
-        return clean_transaction_raw(b64encode(str(json.dumps(dict(
+        return encode_transaction_raw(transaction=dict(
             fee=self._fee,
             type=self._type,
             transaction=self._transaction,
             signature=self._signature,
             network=self._network,
             xrc20=self._xrc20
-        ))).encode()).decode())
+        ), binary=binary)
 
 
 class NormalTransaction(Transaction):
@@ -404,16 +444,17 @@ class FundTransaction(Transaction):
             network=network, xrc20=xrc20, provider=provider
         )
 
-    def build_transaction(self, address: str, htlc: HTLC, amount: Union[Wei, int, float],
+    def build_transaction(self, address: str, htlc: Union[HTLC, List[Tuple[HTLC, Union[Wei, int, float]]]],
+                          amount: Optional[Union[Wei, int, float]] = None,
                           unit: str = config["unit"]) -> "FundTransaction":
         """
         Build XinFin fund transaction.
 
-        :param htlc: XinFin HTLC instance.
-        :type htlc: xinfin.htlc.HTLC
+        :param htlc: XinFin HTLC instance or list of (HTLC, amount) pairs.
+        :type htlc: xinfin.htlc.HTLC, list
         :param address: XinFin sender address.
         :type address: str
-        :param amount: XinFin amount or XRC20 amount.
+        :param amount: XinFin amount or XRC20 amount, default to ``None``.
         :type amount: Wei, int, float
         :param unit: XinFin unit, default to ``Wei``.
         :type unit: str
@@ -428,28 +469,73 @@ class FundTransaction(Transaction):
         >>> fund_transaction: FundTransaction = FundTransaction(network="testnet")
         >>> fund_transaction.build_transaction(address="xdc2224caA2235DF8Da3D2016d2AB1137D2d548A232", htlc=htlc, amount=3, unit="XDC")
         <swap.providers.xinfin.transaction.FundTransaction object at 0x0409DAF0>
+
+        .. note::
+            To fund many HTLC's in one transaction, pass a list of (HTLC, amount) pairs as ``htlc``
+            and leave ``amount`` as ``None``. All HTLC's must be ``v2`` version on the same contract address.
         """
 
         # Check parameter instances
         if not is_address(address=address):
             raise AddressError(f"Invalid XinFin sender '{address}' address.")
-        if not isinstance(htlc, HTLC):
-            raise TypeError("Invalid XinFin HTLC instance, only takes XinFin HTLC class")
-        if to_checksum_address(address=address, prefix="xdc") != htlc.agreements["sender_address"]:
-            raise AddressError(f"Wrong XinFin sender '{address}' address",
-                               "address must be match with HTLC agreements sender address.")
         if unit not in ["XDC", "Gwei", "Wei"]:
             raise UnitError("Invalid XinFin unit, choose only 'XDC', 'Gwei' or 'Wei' units.")
 
-        _amount: Wei = Wei(
-            amount if unit == "Wei" else amount_unit_converter(amount=amount, unit_from=f"{unit}2Wei")
-        ) if not self._xrc20 else amount
+        htlcs: List[Tuple[HTLC, Union[Wei, int, float]]] = (
+            htlc if isinstance(htlc, list) else [(htlc, amount)]
+        )
+        if not htlcs:
+            raise ValueError("Invalid XinFin HTLC's, at least one HTLC is required.")
+        if isinstance(htlc, list) and amount is not None:
+            raise ValueError("Amount must be None when funding multiple HTLC's, set amount on each HTLC pair.")
+
+        amounts: List[Union[Wei, int, float]] = []
+        for _htlc, _amount in htlcs:
+            if not isinstance(_htlc, HTLC):
+                raise TypeError("Invalid XinFin HTLC instance, only takes XinFin HTLC class")
+            if to_checksum_address(address=address, prefix="xdc") != _htlc.agreements["sender_address"]:
+                raise AddressError(f"Wrong XinFin sender '{address}' address",
+                                   "address must be match with HTLC agreements sender address.")
+            if _htlc.contract_address() != htlcs[0][0].contract_address():
+                raise ValueError("Invalid XinFin HTLC's, all HTLC's must be on the same contract address.")
+            if _amount is None:
+                raise ValueError("Invalid XinFin amount, amount is required for each HTLC.")
+            amounts.append(Wei(
+                _amount if unit == "Wei" else amount_unit_converter(amount=_amount, unit_from=f"{unit}2Wei")
+            ) if not self._xrc20 else _amount)
+        htlc = htlcs[0][0]
+        _amount: Union[Wei, int, float] = sum(amounts)
 
         htlc_contract: Contract = self.web3.eth.contract(
             address=htlc.contract_address(prefix="0x"), abi=htlc.abi()
         )
 
-        if self._xrc20:
+        if len(htlcs) > 1:
+            if "fund_batch" not in [function.get("name") for function in htlc.abi()]:
+                raise ValueError("XinFin HTLC 'v1' version has no batch functions, use 'v2' version.")
+            secret_hashes: List[bytes] = [unhexlify(_htlc.agreements["secret_hash"]) for _htlc, _ in htlcs]
+            recipient_addresses: List[str] = [
+                to_checksum_address(_htlc.agreements["recipient_address"], prefix="0x") for _htlc, _ in htlcs
+            ]
+            endtimes: List[int] = [_htlc.agreements["endtime"]["timestamp"] for _htlc, _ in htlcs]
+            if self._xrc20:
+                htlc_fund_function = htlc_contract.functions.fund_batch(
+                    [to_checksum_address(_htlc.agreements["token_address"], prefix="0x") for _htlc, _ in htlcs],  # Token Addresses
+                    secret_hashes,  # Secret Hashes
+                    recipient_addresses,  # Recipient Addresses
+                    to_checksum_address(htlc.agreements["sender_address"], prefix="0x"),  # Sender Address
+                    endtimes,  # Locktime Seconds
+                    amounts  # Amounts
+                )
+            else:
+                htlc_fund_function = htlc_contract.functions.fund_batch(
+                    secret_hashes,  # Secret Hashes
+                    recipient_addresses,  # Recipient Addresses
+                    to_checksum_address(htlc.agreements["sender_address"], prefix="0x"),  # Sender Address
+                    endtimes,  # Locktime Seconds
+                    amounts  # Amounts
+                )
+        elif self._xrc20:
             htlc_fund_function = htlc_contract.functions.fund(
                 to_checksum_address(htlc.agreements["token_address"], prefix="0x"),  # Token address
                 unhexlify(htlc.agreements["secret_hash"]),  # Secret Hash
@@ -540,6 +626,8 @@ class WithdrawTransaction(Transaction):
     :type xrc20: bool
     :param provider: XinFin network provider, defaults to ``http``.
     :type provider: str
+    :param version: HTLC contract version, ``v1`` or ``v2``, defaults to ``v1``.
+    :type version: str
 
     :returns: WithdrawTransaction -- XinFin withdraw transaction instance.
 
@@ -547,22 +635,23 @@ class WithdrawTransaction(Transaction):
         Do not forget to build transaction after initialize withdraw transaction.
     """
 
-    def __init__(self, network: str = config["network"], xrc20: bool = False, provider: str = config["provider"]):
+    def __init__(self, network: str = config["network"], xrc20: bool = False,
+                 provider: str = config["provider"], version: str = "v1"):
         super().__init__(
-            network=network, xrc20=xrc20, provider=provider
+            network=network, xrc20=xrc20, provider=provider, version=version
         )
 
-    def build_transaction(self, transaction_hash: str, address: str, secret_key: str,
+    def build_transaction(self, transaction_hash: Union[str, List[str]], address: str, secret_key: Union[str, List[str]],
                           contract_address: Optional[str] = None) -> "WithdrawTransaction":
         """
         Build XinFin withdraw transaction.
 
-        :param transaction_hash: XinFin HTLC funded transaction hash.
-        :type transaction_hash: str
+        :param transaction_hash: XinFin HTLC funded transaction hash or hashes.
+        :type transaction_hash: str, list
         :param address: XinFin recipient address.
         :type address: str
-        :param secret_key: Secret password/passphrase.
-        :type secret_key: str
+        :param secret_key: Secret password/passphrase or passphrases.
+        :type secret_key: str, list
         :param contract_address: XinFin HTLC contract address, defaults to ``None``.
         :type contract_address: str
 
@@ -572,6 +661,10 @@ class WithdrawTransaction(Transaction):
         >>> withdraw_transaction: WithdrawTransaction = WithdrawTransaction(network="testnet")
         >>> withdraw_transaction.build_transaction(transaction_hash="0x0d4c93546aa3e5e476455931a63f1a97a2624e3b516e3fd8e3a582cb20aaeef9", secret_key="Hello Meheret!", address="xdcf8D43806260CFc6cC79fB408BA1897054667F81C", contract_address="xdcdE06b10c67765c8C0b9F64E0eF423b45Eb86b8e7")
         <swap.providers.xinfin.transaction.WithdrawTransaction object at 0x0409DAF0>
+
+        .. note::
+            On ``v2`` version, every locked contract of the funded transactions with this recipient address
+            and a secret hash of the secret keys is withdrawn, many of them by one ``withdraw_batch`` call.
         """
 
         # Check parameter instances
@@ -580,25 +673,53 @@ class WithdrawTransaction(Transaction):
         if contract_address and not is_address(address=contract_address):
             raise AddressError(f"Invalid XinFin HTLC contract '{contract_address}' address.")
 
+        transaction_hashes: List[str] = transaction_hash if isinstance(transaction_hash, list) else [transaction_hash]
+        secret_keys: List[str] = secret_key if isinstance(secret_key, list) else [secret_key]
+        if self._version == "v1" and (len(transaction_hashes) != 1 or len(secret_keys) != 1):
+            raise ValueError("XinFin HTLC 'v1' version has no batch functions, use 'v2' version.")
+
         htlc: HTLC = HTLC(
-            contract_address=contract_address, network=self._network, xrc20=self._xrc20
+            contract_address=contract_address, network=self._network, xrc20=self._xrc20, version=self._version
         )
         htlc_contract: Contract = self.web3.eth.contract(
             address=self.web3.toChecksumAddress(htlc.contract_address(prefix="0x")), abi=htlc.abi()
         )
 
-        transaction_receipt: AttributeDict = _AttributeDict(get_transaction_receipt(
-            transaction_hash=transaction_hash, network=self._network
-        )).__attribute_dict__()
-        log_fund: AttributeDict = htlc_contract.events.log_fund().processLog(
-            log=transaction_receipt["logs"][2 if self._xrc20 else 0]
-        )
+        if self._version == "v1":
+            transaction_receipt: AttributeDict = _AttributeDict(get_transaction_receipt(
+                transaction_hash=transaction_hashes[0], network=self._network
+            )).__attribute_dict__()
+            log_fund: AttributeDict = htlc_contract.events.log_fund().processLog(
+                log=transaction_receipt["logs"][2 if self._xrc20 else 0]
+            )
 
-        locked_contract_id: str = log_fund["args"]["locked_contract_id"]
-        htlc_fund_function = htlc_contract.functions.withdraw(
-            locked_contract_id,  # Locked Contract ID
-            secret_key  # Secret Key
-        )
+            locked_contract_id: str = log_fund["args"]["locked_contract_id"]
+            htlc_fund_function = htlc_contract.functions.withdraw(
+                locked_contract_id,  # Locked Contract ID
+                secret_keys[0]  # Secret Key
+            )
+        else:
+            # Match locked contracts of this recipient with the secret keys by secret hash
+            secret_hashes: dict = {sha256(_secret_key): _secret_key for _secret_key in secret_keys}
+            locked_contract_ids, preimages = [], []
+            for locked_contract in _locked_contracts(
+                network=self._network, htlc_contract=htlc_contract, transaction_hashes=transaction_hashes
+            ):
+                if locked_contract["recipient"] == to_checksum_address(address=address, prefix="0x") \
+                        and locked_contract["secret_hash"].hex() in secret_hashes:
+                    locked_contract_ids.append(locked_contract["locked_contract_id"])
+                    preimages.append(secret_hashes[locked_contract["secret_hash"].hex()])
+            if not locked_contract_ids:
+                raise ValueError(f"There is no XinFin HTLC locked contract of '{address}' recipient address "
+                                 f"with these secret keys on funded transactions.")
+
+            htlc_fund_function = htlc_contract.functions.withdraw(
+                locked_contract_ids[0],  # Locked Contract ID
+                preimages[0]  # Secret Key
+            ) if len(locked_contract_ids) == 1 else htlc_contract.functions.withdraw_batch(
+                locked_contract_ids,  # Locked Contract ID's
+                preimages  # Secret Keys
+            )
 
         self._fee = htlc_fund_function.estimateGas({
             "from": to_checksum_address(address=address, prefix="0x"),
@@ -670,6 +791,8 @@ class RefundTransaction(Transaction):
     :type xrc20: bool
     :param provider: XinFin network provider, defaults to ``http``.
     :type provider: str
+    :param version: HTLC contract version, ``v1`` or ``v2``, defaults to ``v1``.
+    :type version: str
 
     :returns: RefundTransaction -- XinFin refund transaction instance.
 
@@ -677,18 +800,19 @@ class RefundTransaction(Transaction):
         Do not forget to build transaction after initialize refund transaction.
     """
 
-    def __init__(self, network: str = config["network"], xrc20: bool = False, provider: str = config["provider"]):
+    def __init__(self, network: str = config["network"], xrc20: bool = False,
+                 provider: str = config["provider"], version: str = "v1"):
         super().__init__(
-            network=network, xrc20=xrc20, provider=provider
+            network=network, xrc20=xrc20, provider=provider, version=version
         )
 
-    def build_transaction(self, transaction_hash: str, address: str,
+    def build_transaction(self, transaction_hash: Union[str, List[str]], address: str,
                           contract_address: Optional[str] = None) -> "RefundTransaction":
         """
         Build XinFin refund transaction.
 
-        :param transaction_hash: XinFin HTLC funded transaction hash.
-        :type transaction_hash: str
+        :param transaction_hash: XinFin HTLC funded transaction hash or hashes.
+        :type transaction_hash: str, list
         :param address: XinFin sender address.
         :type address: str
         :param contract_address: XinFin HTLC contract address, defaults to ``None``.
@@ -700,6 +824,10 @@ class RefundTransaction(Transaction):
         >>> refund_transaction: RefundTransaction = RefundTransaction(network="testnet")
         >>> refund_transaction.build_transaction(transaction_hash="0x0d4c93546aa3e5e476455931a63f1a97a2624e3b516e3fd8e3a582cb20aaeef9", address="xdc2224caA2235DF8Da3D2016d2AB1137D2d548A232", contract_address="xdcdE06b10c67765c8C0b9F64E0eF423b45Eb86b8e7")
         <swap.providers.xinfin.transaction.RefundTransaction object at 0x0409DAF0>
+
+        .. note::
+            On ``v2`` version, every locked contract of the funded transactions with this sender address
+            is refunded, many of them by one ``refund_batch`` call.
         """
 
         # Check parameter instances
@@ -708,24 +836,44 @@ class RefundTransaction(Transaction):
         if contract_address and not is_address(address=contract_address):
             raise AddressError(f"Invalid XinFin HTLC contract '{contract_address}' address.")
 
+        transaction_hashes: List[str] = transaction_hash if isinstance(transaction_hash, list) else [transaction_hash]
+        if self._version == "v1" and len(transaction_hashes) != 1:
+            raise ValueError("XinFin HTLC 'v1' version has no batch functions, use 'v2' version.")
+
         htlc: HTLC = HTLC(
-            contract_address=contract_address, network=self._network, xrc20=self._xrc20
+            contract_address=contract_address, network=self._network, xrc20=self._xrc20, version=self._version
         )
         htlc_contract: Contract = self.web3.eth.contract(
             address=self.web3.toChecksumAddress(htlc.contract_address(prefix="0x")), abi=htlc.abi()
         )
 
-        transaction_receipt: AttributeDict = _AttributeDict(get_transaction_receipt(
-            transaction_hash=transaction_hash, network=self._network
-        )).__attribute_dict__()
-        log_fund: AttributeDict = htlc_contract.events.log_fund().processLog(
-            log=transaction_receipt["logs"][2 if self._xrc20 else 0]
-        )
+        if self._version == "v1":
+            transaction_receipt: AttributeDict = _AttributeDict(get_transaction_receipt(
+                transaction_hash=transaction_hashes[0], network=self._network
+            )).__attribute_dict__()
+            log_fund: AttributeDict = htlc_contract.events.log_fund().processLog(
+                log=transaction_receipt["logs"][2 if self._xrc20 else 0]
+            )
 
-        locked_contract_id: str = log_fund["args"]["locked_contract_id"]
-        htlc_refund_function = htlc_contract.functions.refund(
-            locked_contract_id  # Locked Contract ID
-        )
+            locked_contract_id: str = log_fund["args"]["locked_contract_id"]
+            htlc_refund_function = htlc_contract.functions.refund(
+                locked_contract_id  # Locked Contract ID
+            )
+        else:
+            locked_contract_ids: List[bytes] = [
+                locked_contract["locked_contract_id"] for locked_contract in _locked_contracts(
+                    network=self._network, htlc_contract=htlc_contract, transaction_hashes=transaction_hashes
+                ) if locked_contract["sender"] == to_checksum_address(address=address, prefix="0x")
+            ]
+            if not locked_contract_ids:
+                raise ValueError(f"There is no XinFin HTLC locked contract of '{address}' sender address "
+                                 f"on funded transactions.")
+
+            htlc_refund_function = htlc_contract.functions.refund(
+                locked_contract_ids[0]  # Locked Contract ID
+            ) if len(locked_contract_ids) == 1 else htlc_contract.functions.refund_batch(
+                locked_contract_ids  # Locked Contract ID's
+            )
 
         self._fee = htlc_refund_function.estimateGas({
             "from": to_checksum_address(address=address, prefix="0x"),
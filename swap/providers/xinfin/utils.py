@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 
-from base64 import b64decode
 from datetime import datetime
 from pyxdc.utils import (
     is_address as _is_address,
@@ -17,7 +16,9 @@ import json
 import sys
 import os
 
-from ...utils import clean_transaction_raw
+from ...utils import (
+    TransactionEnvelope, load_transaction_raw
+)
 from ...exceptions import (
     AddressError, UnitError, TransactionRawError
 )
@@ -113,12 +114,12 @@ def to_checksum_address(address: str, prefix: str = "xdc") -> Union[str, Checksu
         if prefix == "0x" else _to_checksum_address(address=address, prefix=prefix)
 
 
-def is_transaction_raw(transaction_raw: str) -> bool:
+def is_transaction_raw(transaction_raw: Union[str, TransactionEnvelope]) -> bool:
     """
     Check XinFin transaction raw.
 
-    :param transaction_raw: XinFin transaction raw.
-    :type transaction_raw: str
+    :param transaction_raw: XinFin transaction raw or transaction envelope.
+    :type transaction_raw: str, swap.utils.TransactionEnvelope
 
     :returns: bool -- XinFin valid/invalid transaction raw.
 
@@ -129,13 +130,11 @@ def is_transaction_raw(transaction_raw: str) -> bool:
     """
 
     # Check parameter instances
-    if not isinstance(transaction_raw, str):
+    if not isinstance(transaction_raw, (str, TransactionEnvelope)):
         raise TypeError(f"Transaction raw must be str, not '{type(transaction_raw)}' type.")
 
     try:
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
+        loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
         return loaded_transaction_raw["type"] in [
             "xinfin_normal_unsigned", "xinfin_normal_signed", "xinfin_xrc20_normal_unsigned", "xinfin_xrc20_normal_signed",
             "xinfin_fund_unsigned", "xinfin_fund_signed", "xinfin_xrc20_fund_unsigned", "xinfin_xrc20_fund_signed",
@@ -170,13 +169,10 @@ def decode_transaction_raw(transaction_raw: str) -> dict:
     {'fee': ..., 'type': '...', 'address': '...', 'transaction': {...}, 'unsigned_datas': [...], 'signatures': [...], 'network': '...'}
     """
 
-    if not is_transaction_raw(transaction_raw=transaction_raw):
+    loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+    if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
         raise TransactionRawError("Invalid XinFin transaction raw.")
 
-    transaction_raw = clean_transaction_raw(transaction_raw)
-    decoded_transaction_raw = b64decode(transaction_raw.encode())
-    loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
     return dict(
         fee=loaded_transaction_raw["fee"],
         transaction=loaded_transaction_raw["transaction"],
@@ -204,13 +200,10 @@ def submit_transaction_raw(transaction_raw: str, provider: str = config["provide
     """
 
     # Check parameter instances
-    if not is_transaction_raw(transaction_raw=transaction_raw):
+    loaded_transaction_raw = load_transaction_raw(transaction_raw=transaction_raw)
+    if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
         raise TransactionRawError("Invalid XinFin transaction raw.")
 
-    transaction_raw = clean_transaction_raw(transaction_raw)
-    decoded_transaction_raw = b64decode(transaction_raw.encode())
-    loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
     if not loaded_transaction_raw["type"] in [
         "xinfin_normal_signed", "xinfin_xrc20_normal_signed",
         "xinfin_fund_signed", "xinfin_xrc20_fund_signed",
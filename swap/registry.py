@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Optional, Union, Iterable, Iterator, List, Tuple
+)
+
+import importlib
+import threading
+import sqlite3
+import json
+
+# HTLC registry chains.
+CHAINS: List[str] = ["bitcoin", "bytom", "ethereum", "vapor", "xinfin"]
+
+# HTLC registry SQLite schema, the endtime is the expiration timestamp of Bitcoin, Ethereum
+# and XinFin HTLC's and the expiration block height (endblock) of Bytom and Vapor HTLC's.
+# Ethereum and XinFin HTLC's with the same secret hash on one shared contract differ by locked contract id.
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS htlcs (
+    chain TEXT NOT NULL,
+    network TEXT NOT NULL,
+    contract_address TEXT NOT NULL,
+    secret_hash TEXT NOT NULL,
+    sender TEXT NOT NULL,
+    recipient TEXT NOT NULL,
+    endtime INTEGER NOT NULL,
+    locked_contract_id TEXT,
+    bytecode TEXT,
+    agreements TEXT,
+    options TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS htlcs_key ON htlcs (
+    contract_address, secret_hash, chain, network, COALESCE(locked_contract_id, '')
+);
+CREATE INDEX IF NOT EXISTS htlcs_secret_hash ON htlcs (secret_hash);
+CREATE INDEX IF NOT EXISTS htlcs_sender ON htlcs (sender);
+CREATE INDEX IF NOT EXISTS htlcs_recipient ON htlcs (recipient);
+CREATE INDEX IF NOT EXISTS htlcs_endtime ON htlcs (chain, network, endtime);
+CREATE INDEX IF NOT EXISTS htlcs_locked_contract_id ON htlcs (locked_contract_id);
+PRAGMA user_version = 1;
+"""
+
+# Rebuilds version 0 tables, keyed by primary key without the locked contract id, on the current schema.
+MIGRATION: str = """
+BEGIN;
+CREATE TABLE htlcs_v0 AS SELECT * FROM htlcs;
+DROP TABLE htlcs;
+""" + SCHEMA + """
+INSERT INTO htlcs SELECT * FROM htlcs_v0;
+DROP TABLE htlcs_v0;
+COMMIT;
+"""
+
+# HTLC record columns, in schema order.
+COLUMNS: List[str] = [
+    "chain", "network", "contract_address", "secret_hash", "sender", "recipient", "endtime",
+    "locked_contract_id", "bytecode", "agreements", "options"
+]
+
+
+def _get_chain(htlc) -> str:
+    # Provider HTLC classes live in swap.providers.<chain>.htlc modules
+    modules: List[str] = type(htlc).__module__.split(".")
+    if len(modules) != 4 or modules[:2] != ["swap", "providers"] or modules[2] not in CHAINS:
+        raise TypeError(f"Invalid HTLC '{type(htlc)}' type, choose only swap provider HTLC instances or dicts.")
+    return modules[2]
+
+
+def _htlc_to_record(htlc, locked_contract_id: Optional[str] = None) -> dict:
+
+    chain: str = _get_chain(htlc=htlc)
+    if htlc.agreements is None:
+        raise ValueError("HTLC agreements are None, first build HTLC.")
+
+    agreements: dict = htlc.agreements
+    if chain in ["bytom", "vapor"]:
+        return dict(
+            chain=chain, network=htlc._network, contract_address=htlc.contract_address(),
+            secret_hash=agreements["secret_hash"], sender=agreements["sender"]["address"],
+            recipient=agreements["recipient"]["address"], endtime=agreements["endblock"],
+            locked_contract_id=None, bytecode=htlc.bytecode(), agreements=agreements, options={}
+        )
+    elif chain == "bitcoin":
+        return dict(
+            chain=chain, network=htlc._network, contract_address=htlc.contract_address(),
+            secret_hash=agreements["secret_hash"], sender=agreements["sender_address"],
+            recipient=agreements["recipient_address"], endtime=agreements["endtime"]["timestamp"],
+            locked_contract_id=None, bytecode=htlc.bytecode(), agreements=agreements,
+            options=dict(segwit=htlc.segwit)
+        )
+    # Ethereum and XinFin HTLC's share one deployed contract address, the locked contract id is from the fund log
+    return dict(
+        chain=chain, network=htlc._network, contract_address=htlc.contract_address(),
+        secret_hash=agreements["secret_hash"], sender=agreements["sender_address"],
+        recipient=agreements["recipient_address"], endtime=agreements["endtime"]["timestamp"],
+        locked_contract_id=locked_contract_id, bytecode=None, agreements=agreements,
+        options=dict(token="token_address" in agreements, version=htlc._version)
+    )
+
+
+def _dict_to_record(htlc: dict) -> dict:
+
+    missing: List[str] = [column for column in COLUMNS[:7] if htlc.get(column) is None]
+    if missing:
+        raise ValueError(f"Invalid HTLC record, missing {', '.join(missing)} values.")
+    if htlc["chain"] not in CHAINS:
+        raise ValueError(f"Invalid HTLC '{htlc['chain']}' chain, choose only {', '.join(CHAINS)} chains.")
+    return {column: htlc.get(column) for column in COLUMNS}
+
+
+class HTLCRegistry:
+    """
+    Hash Time Lock Contract (HTLC) registry, a local SQLite index of HTLC's of all providers.
+
+    :param database: SQLite database path, defaults to ``:memory:``.
+    :type database: str
+
+    :returns: HTLCRegistry -- HTLC registry instance.
+
+    >>> from swap.registry import HTLCRegistry
+    >>> HTLCRegistry(database="htlcs.sqlite")
+    <swap.registry.HTLCRegistry object at 0x040DA268>
+
+    .. note::
+        HTLC's are indexed by contract address, secret hash, sender, recipient and endtime (endblock for
+        Bytom and Vapor), so watchers and refund schedulers can resolve the HTLC of an incoming UTXO or
+        fund log without rebuilding it. Ethereum and XinFin HTLC's also keep their locked contract id.
+        A HTLC is unique by contract address, secret hash, chain, network and locked contract id, so
+        Ethereum and XinFin locks with the same secret hash on a shared contract are kept apart.
+    """
+
+    def __init__(self, database: str = ":memory:"):
+
+        self._lock: threading.Lock = threading.Lock()
+        self._connection: sqlite3.Connection = sqlite3.connect(database, check_same_thread=False)
+        with self._lock, self._connection:
+            if self._connection.execute("PRAGMA user_version").fetchone()[0] == 0 and self._connection.execute(
+                "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = 'htlcs'"
+            ).fetchone()[0]:
+                self._connection.executescript(MIGRATION)
+            else:
+                self._connection.executescript(SCHEMA)
+
+    def __enter__(self) -> "HTLCRegistry":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM htlcs").fetchone()[0]
+
+    def close(self) -> None:
+        """
+        Close SQLite database connection.
+
+        :returns: None.
+        """
+
+        self._connection.close()
+
+    def add(self, htlc, locked_contract_id: Optional[str] = None) -> dict:
+        """
+        Add HTLC to the registry, an existing HTLC of the same contract address and secret hash is replaced.
+
+        :param htlc: Provider HTLC instance with agreements or HTLC record dict.
+        :type htlc: bitcoin.htlc.HTLC, bytom.htlc.HTLC, ethereum.htlc.HTLC, vapor.htlc.HTLC, xinfin.htlc.HTLC, dict
+        :param locked_contract_id: Ethereum or XinFin locked contract id, defaults to ``None``.
+        :type locked_contract_id: str
+
+        :returns: dict -- HTLC record.
+
+        >>> from swap.registry import HTLCRegistry
+        >>> from swap.providers.bitcoin.htlc import HTLC
+        >>> from swap.utils import sha256
+        >>> htlc_registry: HTLCRegistry = HTLCRegistry()
+        >>> htlc_registry.add(htlc=HTLC(network="testnet").build_htlc(sha256("Hello Meheret!"), "mgS3WMHp9nvdUPeDJxr5iCF2P5HuFZSR3V", "n1wgm6kkzMcNfAtJmes8YhpvtDzdNhDY5a", 1624687630))["contract_address"]
+        "2NBYr6gvh4ujsRwKKjDrrRr2vGonazzX6Z6"
+        """
+
+        return self.add_many(htlcs=[(htlc, locked_contract_id)])[0]
+
+    def add_many(self, htlcs: Iterable[Union[object, dict, Tuple[object, Optional[str]]]]) -> List[dict]:
+        """
+        Add many HTLC's to the registry in one transaction.
+
+        :param htlcs: Provider HTLC instances, HTLC record dicts or (HTLC, locked contract id) pairs.
+        :type htlcs: list
+
+        :returns: list -- HTLC records.
+
+        >>> from swap.registry import HTLCRegistry
+        >>> from swap.providers.bitcoin.htlc import build_many
+        >>> from swap.utils import sha256
+        >>> htlc_registry: HTLCRegistry = HTLCRegistry()
+        >>> htlc_registry.add_many(htlcs=[dict(chain="bitcoin", network="testnet", secret_hash=sha256("Hello Meheret!"), sender="n1wgm6kkzMcNfAtJmes8YhpvtDzdNhDY5a", recipient="mgS3WMHp9nvdUPeDJxr5iCF2P5HuFZSR3V", endtime=1624687630, **contract) for contract in build_many(htlcs=[dict(secret_hash=sha256("Hello Meheret!"), recipient_address="mgS3WMHp9nvdUPeDJxr5iCF2P5HuFZSR3V", sender_address="n1wgm6kkzMcNfAtJmes8YhpvtDzdNhDY5a", endtime=1624687630)], network="testnet")])[0]["contract_address"]
+        "2NBYr6gvh4ujsRwKKjDrrRr2vGonazzX6Z6"
+
+        .. note::
+            HTLC record dicts need chain, network, contract address, secret hash, sender, recipient and endtime
+            values, the ``hash`` value of ``build_many`` contracts is ignored.
+        """
+
+        records: List[dict] = []
+        for htlc in htlcs:
+            htlc, locked_contract_id = htlc if isinstance(htlc, tuple) else (htlc, None)
+            records.append(
+                _dict_to_record(htlc=htlc) if isinstance(htlc, dict) else
+                _htlc_to_record(htlc=htlc, locked_contract_id=locked_contract_id)
+            )
+
+        with self._lock, self._connection:
+            self._connection.executemany(
+                f"INSERT OR REPLACE INTO htlcs ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})", [
+                    tuple(
+                        json.dumps(record[column]) if column in ["agreements", "options"] and
+                        record[column] is not None else record[column] for column in COLUMNS
+                    ) for record in records
+                ]
+            )
+        return records
+
+    def find(self, chain: Optional[str] = None, network: Optional[str] = None,
+             contract_address: Optional[str] = None, secret_hash: Optional[str] = None,
+             sender: Optional[str] = None, recipient: Optional[str] = None,
+             locked_contract_id: Optional[str] = None, expires_before: Optional[int] = None,
+             expires_after: Optional[int] = None, size: int = 1000) -> Iterator[dict]:
+        """
+        Find HTLC's of the registry, streamed in batches.
+
+        :param chain: HTLC chain, like ``bitcoin`` or ``ethereum``, defaults to ``None``.
+        :type chain: str
+        :param network: HTLC network, defaults to ``None``.
+        :type network: str
+        :param contract_address: HTLC contract address, defaults to ``None``.
+        :type contract_address: str
+        :param secret_hash: HTLC secret hash, defaults to ``None``.
+        :type secret_hash: str
+        :param sender: HTLC sender address, defaults to ``None``.
+        :type sender: str
+        :param recipient: HTLC recipient address, defaults to ``None``.
+        :type recipient: str
+        :param locked_contract_id: Ethereum or XinFin locked contract id, defaults to ``None``.
+        :type locked_contract_id: str
+        :param expires_before: HTLC's with endtime (or endblock) before or at, defaults to ``None``.
+        :type expires_before: int
+        :param expires_after: HTLC's with endtime (or endblock) after, defaults to ``None``.
+        :type expires_after: int
+        :param size: Number of HTLC records fetched at once, defaults to ``1000``.
+        :type size: int
+
+        :returns: generator -- HTLC records.
+
+        >>> from swap.registry import HTLCRegistry
+        >>> htlc_registry: HTLCRegistry = HTLCRegistry(database="htlcs.sqlite")
+        >>> [htlc["contract_address"] for htlc in htlc_registry.find(chain="bitcoin", network="testnet", expires_before=1624687630)]
+        ["2NBYr6gvh4ujsRwKKjDrrRr2vGonazzX6Z6"]
+
+        .. note::
+            Each filter is answered by an index. Expiry queries are in endtime order, endtimes are only
+            comparable in one chain and network.
+        """
+
+        filters: List[Tuple[str, object]] = [
+            (f"{column} = ?", value) for column, value in [
+                ("chain", chain), ("network", network), ("contract_address", contract_address),
+                ("secret_hash", secret_hash), ("sender", sender), ("recipient", recipient),
+                ("locked_contract_id", locked_contract_id)
+            ] if value is not None
+        ] + [
+            (condition, value) for condition, value in [
+                ("endtime <= ?", expires_before), ("endtime > ?", expires_after)
+            ] if value is not None
+        ]
+
+        query: str = f"SELECT {', '.join(COLUMNS)} FROM htlcs" + (
+            f" WHERE {' AND '.join(condition for condition, _ in filters)}" if filters else ""
+        ) + (" ORDER BY endtime" if expires_before is not None or expires_after is not None else "")
+        with self._lock:
+            cursor: sqlite3.Cursor = self._connection.execute(query, [value for _, value in filters])
+        while True:
+            with self._lock:
+                rows: List[tuple] = cursor.fetchmany(size)
+            if not rows:
+                break
+            for row in rows:
+                record: dict = dict(zip(COLUMNS, row))
+                for column in ["agreements", "options"]:
+                    if record[column] is not None:
+                        record[column] = json.loads(record[column])
+                yield record
+
+    def get(self, **filters) -> Optional[dict]:
+        """
+        Get the first HTLC of the registry, with the same filters as ``find``.
+
+        :returns: dict -- HTLC record, ``None`` if not found.
+
+        >>> from swap.registry import HTLCRegistry
+        >>> htlc_registry: HTLCRegistry = HTLCRegistry(database="htlcs.sqlite")
+        >>> htlc_registry.get(contract_address="2NBYr6gvh4ujsRwKKjDrrRr2vGonazzX6Z6")["endtime"]
+        1624687630
+        """
+
+        return next(self.find(size=1, **filters), None)
+
+    def remove(self, contract_address: str, secret_hash: Optional[str] = None,
+               locked_contract_id: Optional[str] = None) -> int:
+        """
+        Remove HTLC's of the registry, like withdrawn or refunded HTLC's.
+
+        :param contract_address: HTLC contract address.
+        :type contract_address: str
+        :param secret_hash: HTLC secret hash, required for Ethereum and XinFin shared contracts, defaults to ``None``.
+        :type secret_hash: str
+        :param locked_contract_id: Ethereum or XinFin locked contract id, defaults to ``None``.
+        :type locked_contract_id: str
+
+        :returns: int -- Number of removed HTLC's.
+
+        >>> from swap.registry import HTLCRegistry
+        >>> htlc_registry: HTLCRegistry = HTLCRegistry(database="htlcs.sqlite")
+        >>> htlc_registry.remove(contract_address="2NBYr6gvh4ujsRwKKjDrrRr2vGonazzX6Z6")
+        1
+        """
+
+        filters: List[Tuple[str, object]] = [
+            (f"{column} = ?", value) for column, value in [
+                ("contract_address", contract_address), ("secret_hash", secret_hash),
+                ("locked_contract_id", locked_contract_id)
+            ] if value is not None
+        ]
+        with self._lock, self._connection:
+            return self._connection.execute(
+                f"DELETE FROM htlcs WHERE {' AND '.join(condition for condition, _ in filters)}",
+                [value for _, value in filters]
+            ).rowcount
+
+    @staticmethod
+    def htlc(record: dict):
+        """
+        Load provider HTLC instance of a HTLC record.
+
+        :param record: HTLC record.
+        :type record: dict
+
+        :returns: HTLC -- Provider HTLC instance.
+
+        >>> from swap.registry import HTLCRegistry
+        >>> htlc_registry: HTLCRegistry = HTLCRegistry(database="htlcs.sqlite")
+        >>> htlc_registry.htlc(record=htlc_registry.get(contract_address="2NBYr6gvh4ujsRwKKjDrrRr2vGonazzX6Z6"))
+        <swap.providers.bitcoin.htlc.HTLC object at 0x0409DAF0>
+
+        .. note::
+            Bitcoin, Bytom and Vapor HTLC's are loaded from bytecode, Ethereum and XinFin HTLC's from the
+            contract address. Agreements are restored when the record has them.
+        """
+
+        module = importlib.import_module(f"swap.providers.{record['chain']}.htlc")
+        options: dict = record.get("options") or {}
+        if record["chain"] in ["ethereum", "xinfin"]:
+            htlc = module.HTLC(**{
+                "contract_address": record["contract_address"], "network": record["network"],
+                ("erc20" if record["chain"] == "ethereum" else "xrc20"): options.get("token", False),
+                "version": options.get("version", "v1")
+            })
+        elif record["chain"] == "bitcoin":
+            htlc = module.HTLC(network=record["network"]).from_bytecode(
+                bytecode=record["bytecode"], segwit=options.get("segwit", False)
+            )
+        else:
+            htlc = module.HTLC(network=record["network"]).from_bytecode(bytecode=record["bytecode"])
+        htlc.agreements = record.get("agreements")
+        return htlc
@@ -2,22 +2,51 @@
 
 from types import SimpleNamespace
 from mnemonic.mnemonic import Mnemonic
+from base64 import (
+    b64encode, b64decode
+)
 from datetime import datetime
 from binascii import (
     hexlify, unhexlify
 )
 from random import choice
+from concurrent.futures import (
+    ProcessPoolExecutor, ThreadPoolExecutor
+)
 from typing import (
-    Optional, Union
+    Optional, Union, Callable, List, Dict, Set
 )
 
 import unicodedata
 import string
+import struct
+import json
 import os
 import hashlib
 
+from .exceptions import TransactionRawError
+
 # Alphabet and digits.
 letters: str = string.ascii_letters + string.digits
+# Lowercase hex digits.
+hex_digits: frozenset = frozenset(string.hexdigits.lower())
+
+# Mnemonic languages, in language detection order.
+LANGUAGES: List[str] = [
+    "english", "french", "italian", "chinese_simplified", "chinese_traditional", "japanese", "korean", "spanish"
+]
+
+# Mnemonic instances per language and wordlist indexes per language of each word, built once per process.
+_mnemonics: Dict[str, Mnemonic] = {}
+_word_indexes: Optional[Dict[str, Dict[str, int]]] = None
+
+# Binary transaction raw envelope magic and version.
+ENVELOPE_MAGIC: bytes = b"SWP"
+ENVELOPE_VERSION: int = 1
+# Binary transaction raw envelope value tags.
+(
+    _NONE, _FALSE, _TRUE, _INTEGER, _FLOAT, _STRING, _HEX, _PREFIXED_HEX, _LIST, _DICT
+) = range(10)
 
 
 class NestedNamespace(SimpleNamespace):
@@ -86,8 +115,7 @@ def generate_mnemonic(language: str = "english", strength: int = 128) -> str:
     "sceptre capter séquence girafe absolu relatif fleur zoologie muscle sirop saboter parure"
     """
 
-    if language and language not in ["english", "french", "italian", "japanese",
-                                     "chinese_simplified", "chinese_traditional", "korean", "spanish"]:
+    if language and language not in LANGUAGES:
         raise ValueError("invalid language, use only this options english, french, "
                          "italian, spanish, chinese_simplified, chinese_traditional, japanese or korean languages.")
     if strength not in [128, 160, 192, 224, 256]:
@@ -97,7 +125,7 @@ def generate_mnemonic(language: str = "english", strength: int = 128) -> str:
             % strength
         )
 
-    return Mnemonic(language=language).generate(strength=strength)
+    return _get_mnemonic(language=language).generate(strength=strength)
 
 
 def get_current_timestamp(plus: int = 0) -> int:
@@ -135,6 +163,58 @@ def is_entropy(entropy: str) -> bool:
     return len(unhexlify(entropy)) in [16, 20, 24, 28, 32]
 
 
+def _get_mnemonic(language: str) -> Mnemonic:
+    # Cached Mnemonic instance, the wordlist is read from disk once per language
+    if language not in _mnemonics:
+        _mnemonics[language] = Mnemonic(language=language)
+    return _mnemonics[language]
+
+
+def _get_word_indexes() -> Dict[str, Dict[str, int]]:
+    # Built in a local dict and published by one assignment, other threads never see a partial index
+    global _word_indexes
+    if _word_indexes is None:
+        word_indexes: Dict[str, Dict[str, int]] = {}
+        for language in LANGUAGES:
+            for index, word in enumerate(_get_mnemonic(language=language).wordlist):
+                word_indexes.setdefault(unicodedata.normalize("NFKD", word), {})[language] = index
+        _word_indexes = word_indexes
+    return _word_indexes
+
+
+def _mnemonic_entropy(words: List[str], language: str) -> Optional[bytes]:
+    # Entropy of mnemonic words in one language, or None for unknown words or a checksum mismatch
+    if len(words) not in [12, 15, 18, 21, 24]:
+        return None
+    word_indexes: Dict[str, Dict[str, int]] = _get_word_indexes()
+    number: int = 0
+    for word in words:
+        if language not in word_indexes.get(word, {}):
+            return None
+        number = (number << 11) | word_indexes[word][language]
+    checksum_length: int = len(words) // 3
+    entropy: bytes = (number >> checksum_length).to_bytes(checksum_length * 4, "big")
+    if hashlib.sha256(entropy).digest()[0] >> (8 - checksum_length) != number & ((1 << checksum_length) - 1):
+        return None
+    return entropy
+
+
+def _mnemonic_language(mnemonic: str) -> Optional[str]:
+    # Language of NFKD normalized mnemonic words, or None for invalid mnemonic words
+    words: List[str] = mnemonic.split(" ")
+    word_indexes: Dict[str, Dict[str, int]] = _get_word_indexes()
+    candidates: Set[str] = set(LANGUAGES)
+    for word in words:
+        # Words shared by wordlists (e.g. Chinese) leave many candidates, unique words narrow to one
+        candidates &= word_indexes.get(word, {}).keys()
+        if len(candidates) <= 1:
+            break
+    for language in LANGUAGES:
+        if language in candidates and _mnemonic_entropy(words=words, language=language) is not None:
+            return language
+    return None
+
+
 def is_mnemonic(mnemonic: str, language: Optional[str] = None) -> bool:
     """
     Check mnemonic words.
@@ -147,26 +227,23 @@ def is_mnemonic(mnemonic: str, language: Optional[str] = None) -> bool:
     :returns: bool -- Mnemonic valid/invalid.
 
     >>> from swap.utils import is_mnemonic
-    >>> is_mnemonic(mnemonic="sceptre capter séquence girafe absolu relatif fleur zoologie muscle sirop saboter parure")
+    >>> is_mnemonic(mnemonic="sceptre capter séquence girafe absolu relatif fleur zoologie muscle sirop saboter parure")
     True
+
+    .. note::
+        Words are looked up in one index of all wordlists, without language it is detected from the first
+        words and only that language checksum is validated.
     """
 
-    if language and language not in ["english", "french", "italian", "japanese",
-                                     "chinese_simplified", "chinese_traditional", "korean", "spanish"]:
+    if language and language not in LANGUAGES:
         raise ValueError("invalid language, use only this options english, french, "
                          "italian, spanish, chinese_simplified, chinese_traditional, japanese or korean languages.")
     try:
         mnemonic = unicodedata.normalize("NFKD", mnemonic)
         if language is None:
-            for _language in ["english", "french", "italian",
-                              "chinese_simplified", "chinese_traditional", "japanese", "korean", "spanish"]:
-                valid = False
-                if Mnemonic(language=_language).check(mnemonic=mnemonic) is True:
-                    valid = True
-                    break
-            return valid
+            return _mnemonic_language(mnemonic=mnemonic) is not None
         else:
-            return Mnemonic(language=language).check(mnemonic=mnemonic)
+            return _mnemonic_entropy(words=mnemonic.split(" "), language=language) is not None
     except:
         return False
 
@@ -247,16 +324,12 @@ def get_mnemonic_language(mnemonic: str) -> str:
     "french"
     """
 
-    if not is_mnemonic(mnemonic=mnemonic):
+    try:
+        language: Optional[str] = _mnemonic_language(mnemonic=unicodedata.normalize("NFKD", mnemonic))
+    except:
+        language = None
+    if language is None:
         raise ValueError("Invalid mnemonic words.")
-
-    language = None
-    mnemonic = unicodedata.normalize("NFKD", mnemonic)
-    for _language in ["english", "french", "italian",
-                      "chinese_simplified", "chinese_traditional", "japanese", "korean", "spanish"]:
-        if Mnemonic(language=_language).check(mnemonic=mnemonic) is True:
-            language = _language
-            break
     return language
 
 
@@ -279,12 +352,11 @@ def entropy_to_mnemonic(entropy: str, language: str = "english") -> str:
     if not is_entropy(entropy=entropy):
         raise ValueError("Invalid entropy hex string.")
 
-    if language and language not in ["english", "french", "italian", "japanese",
-                                     "chinese_simplified", "chinese_traditional", "korean", "spanish"]:
+    if language and language not in LANGUAGES:
         raise ValueError("Invalid language, use only this options english, french, "
                          "italian, spanish, chinese_simplified, chinese_traditional, japanese or korean languages.")
 
-    return Mnemonic(language=language).to_mnemonic(unhexlify(entropy))
+    return _get_mnemonic(language=language).to_mnemonic(unhexlify(entropy))
 
 
 def mnemonic_to_entropy(mnemonic: str, language: Optional[str] = None) -> str:
@@ -303,12 +375,14 @@ def mnemonic_to_entropy(mnemonic: str, language: Optional[str] = None) -> str:
     "ee535b143b0d9d1f87546f9df0d06b1a"
     """
 
-    if not is_mnemonic(mnemonic=mnemonic, language=language):
+    if language is None:
+        language = get_mnemonic_language(mnemonic=mnemonic)
+    elif not is_mnemonic(mnemonic=mnemonic, language=language):
         raise ValueError("Invalid mnemonic words.")
 
-    mnemonic = unicodedata.normalize("NFKD", mnemonic)
-    language = language if language else get_mnemonic_language(mnemonic=mnemonic)
-    return Mnemonic(language=language).to_entropy(mnemonic).hex()
+    return _mnemonic_entropy(
+        words=unicodedata.normalize("NFKD", mnemonic).split(" "), language=language
+    ).hex()
 
 
 def sha256(data: Union[str, bytes]) -> str:
@@ -357,3 +431,302 @@ def clean_transaction_raw(transaction_raw: str) -> str:
     "eyJmZWUiOiAxMDAwMDAwMCwgImFkZHJlc3MiOiAiYm0xcTluZHlseDAyc3lmd2Q3bnBlaGZ4ejRsZGRoenFzdmUyZnU2dmM3IiwgInJhdyI6ICIwNzAxMDAwMjAxNWYwMTVkODJlNjVmOTY0ZDNjMzUzMjU0OGRmZGU5Mzg0NjJmNTY2Yzk1ZDNjOTBlNmEzYTE4MmEwYjNiZGFlNDZhYTc5MGZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmY4MDg2ZjIwMzAxMDExNjAwMTQyY2RhNGY5OWVhODExMmU2ZmE2MWNkZDI2MTU3ZWQ2ZGM0MDgzMzJhMjIwMTIwOTFmZjdmNTI1ZmY0MDg3NGM0ZjQ3ZjBjYWI0MmU0NmUzYmY1M2FkYWQ1OWFkZWY5NTU4YWQxYjY0NDhmMjJlMjAxNWYwMTVkMDcwZDBlYjIyZDMyYjgyZDNkMmYzZmM0YmFmYjdhODVmNTIyOWY3ZmQ4OTA0MmQyZmYzMjU3Mzc1ZTQzZDNlYmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmOGY1Zjc0ZjAxMDExNjAwMTQyY2RhNGY5OWVhODExMmU2ZmE2MWNkZDI2MTU3ZWQ2ZGM0MDgzMzJhMjIwMTIwOTFmZjdmNTI1ZmY0MDg3NGM0ZjQ3ZjBjYWI0MmU0NmUzYmY1M2FkYWQ1OWFkZWY5NTU4YWQxYjY0NDhmMjJlMjAyMDE0NmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmY5MDRlMDEyMjAwMjA0ZjhmMGU4OGQwYTQ0YjNkODg0YjA3YjZkZDQ1MzY1MThmZmNiYjU5NmE5MWNhMGU2YjJmMzdlOTY0NjNiYmZjMDAwMTNjZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmQ4YjhmODUyMDExNjAwMTQyY2RhNGY5OWVhODExMmU2ZmE2MWNkZDI2MTU3ZWQ2ZGM0MDgzMzJhMDAiLCAiaGFzaCI6ICI1MGIzMzZhYjZlMDU1ZDlkNGQ2NWE5ZjIyOTViNTMyNzBhYmQzODE2YzIzYmE0Yzk1NDg0MWYzOTlhYTc3MmQ1IiwgInVuc2lnbmVkX2RhdGFzIjogW3siZGF0YXMiOiBbImY3ZDNhYTE4YjI5NWNkYTZmMmIxMTMyYzQyMzE5MzNjYzkyZjNiYWNhNzA1OTc0YzVkZTM3OGY5YjY5NWYwZTIiXSwgInB1YmxpY19rZXkiOiAiOTFmZjdmNTI1ZmY0MDg3NGM0ZjQ3ZjBjYWI0MmU0NmUzYmY1M2FkYWQ1OWFkZWY5NTU4YWQxYjY0NDhmMjJlMiIsICJuZXR3b3JrIjogIm1haW5uZXQiLCAicGF0aCI6ICJtLzQ0LzE1My8xLzAvMSJ9LCB7ImRhdGFzIjogWyJjYTYxNWJhMmM3MjllNDYzZmJmNzlhMTE0MTkxNzYyNjFiMWJmNmJlNDQ4MTMzMzVkMmIyNTZlOGE3YmJjZWVlIl0sICJwdWJsaWNfa2V5IjogIjkxZmY3ZjUyNWZmNDA4NzRjNGY0N2YwY2FiNDJlNDZlM2JmNTNhZGFkNTlhZGVmOTU1OGFkMWI2NDQ4ZjIyZTIiLCAibmV0d29yayI6ICJtYWlubmV0IiwgInBhdGgiOiAibS80NC8xNTMvMS8wLzEifV0sICJzaWduYXR1cmVzIjogW10sICJuZXR3b3JrIjogIm1haW5uZXQiLCAidHlwZSI6ICJieXRvbV9mdW5kX3Vuc2lnbmVkIn0="
     """
     return str(transaction_raw + "=" * (-len(transaction_raw) % 4))
+
+
+class TransactionEnvelope(dict):
+    """
+    Parsed transaction raw envelope.
+
+    :param transaction: Transaction raw fields.
+    :type transaction: dict
+    :param binary: Decoded from compact binary envelope, defaults to ``False``.
+    :type binary: bool
+
+    :returns: TransactionEnvelope -- Transaction envelope instance.
+
+    .. note::
+        Transaction envelope is a dict, decode transaction raw once with :func:`load_transaction_raw`
+        and pass it down the signing chain instead of the transaction raw string.
+    """
+
+    def __init__(self, transaction: dict, binary: bool = False):
+        super().__init__(transaction)
+        self.binary: bool = binary
+
+    def encode(self) -> str:
+        """
+        Encode transaction envelope back to transaction raw, in its original format.
+
+        :returns: str -- Transaction raw.
+        """
+
+        return encode_transaction_raw(transaction=dict(self), binary=self.binary)
+
+
+def _write_varint(buffer: bytearray, number: int) -> None:
+    while number > 0x7f:
+        buffer.append((number & 0x7f) | 0x80)
+        number >>= 7
+    buffer.append(number)
+
+
+def _read_varint(data: bytes, offset: int) -> tuple:
+    number, shift = 0, 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        number |= (byte & 0x7f) << shift
+        if not byte & 0x80:
+            return number, offset
+        shift += 7
+
+
+def _is_hex(value: str) -> bool:
+    return len(value) % 2 == 0 and hex_digits.issuperset(value)
+
+
+def _pack_value(buffer: bytearray, value) -> None:
+    if value is None:
+        buffer.append(_NONE)
+    elif isinstance(value, bool):
+        buffer.append(_TRUE if value else _FALSE)
+    elif isinstance(value, int):
+        buffer.append(_INTEGER)
+        _write_varint(buffer, (value << 1) if value >= 0 else ((-value << 1) - 1))
+    elif isinstance(value, float):
+        buffer.append(_FLOAT)
+        buffer += struct.pack(">d", value)
+    elif isinstance(value, str):
+        if value and _is_hex(value):
+            data, tag = bytes.fromhex(value), _HEX
+        elif value.startswith("0x") and _is_hex(value[2:]):
+            data, tag = bytes.fromhex(value[2:]), _PREFIXED_HEX
+        else:
+            data, tag = value.encode(), _STRING
+        buffer.append(tag)
+        _write_varint(buffer, len(data))
+        buffer += data
+    elif isinstance(value, (list, tuple)):
+        buffer.append(_LIST)
+        _write_varint(buffer, len(value))
+        for item in value:
+            _pack_value(buffer, item)
+    elif isinstance(value, dict):
+        buffer.append(_DICT)
+        _write_varint(buffer, len(value))
+        for key, item in value.items():
+            key = str(key).encode()
+            _write_varint(buffer, len(key))
+            buffer += key
+            _pack_value(buffer, item)
+    else:
+        raise TypeError(f"Can't pack '{type(value).__name__}' type into binary transaction raw.")
+
+
+def _unpack_value(data: bytes, offset: int) -> tuple:
+    tag = data[offset]
+    offset += 1
+    if tag == _NONE:
+        return None, offset
+    elif tag in (_FALSE, _TRUE):
+        return tag == _TRUE, offset
+    elif tag == _INTEGER:
+        number, offset = _read_varint(data, offset)
+        return ((number >> 1) if not number & 1 else -((number + 1) >> 1)), offset
+    elif tag == _FLOAT:
+        return struct.unpack_from(">d", data, offset)[0], offset + 8
+    elif tag in (_STRING, _HEX, _PREFIXED_HEX):
+        length, offset = _read_varint(data, offset)
+        value = data[offset:offset + length]
+        if len(value) != length:
+            raise ValueError("Truncated binary transaction raw.")
+        if tag == _STRING:
+            return value.decode(), offset + length
+        return ("0x" if tag == _PREFIXED_HEX else "") + value.hex(), offset + length
+    elif tag == _LIST:
+        count, offset = _read_varint(data, offset)
+        items: list = []
+        for _ in range(count):
+            item, offset = _unpack_value(data, offset)
+            items.append(item)
+        return items, offset
+    elif tag == _DICT:
+        count, offset = _read_varint(data, offset)
+        items: dict = {}
+        for _ in range(count):
+            length, offset = _read_varint(data, offset)
+            key = data[offset:offset + length].decode()
+            items[key], offset = _unpack_value(data, offset + length)
+        return items, offset
+    raise ValueError(f"Unknown binary transaction raw '{tag}' tag.")
+
+
+def encode_transaction_raw(transaction: dict, binary: bool = False) -> str:
+    """
+    Encode transaction raw.
+
+    :param transaction: Transaction raw fields.
+    :type transaction: dict
+    :param binary: Encode as compact binary envelope, defaults to ``False``.
+    :type binary: bool
+    :returns: str -- Transaction raw.
+
+    >>> from swap.utils import encode_transaction_raw
+    >>> encode_transaction_raw(transaction=dict(fee=576, raw="0200000001", network="testnet", type="bitcoin_refund_signed"), binary=True)
+    "U1dQAQkEA2ZlZQOACQNyYXcGBQIAAAABB25ldHdvcmsFB3Rlc3RuZXQEdHlwZQUVYml0Y29pbl9yZWZ1bmRfc2lnbmVk"
+
+    .. note::
+        Legacy transaction raw is base64 of JSON, binary envelope is base64 of ``SWP`` magic, version byte and
+        length-prefixed fields where hex strings are stored as raw bytes.
+    """
+
+    if not binary:
+        return clean_transaction_raw(b64encode(json.dumps(transaction).encode()).decode())
+    buffer: bytearray = bytearray(ENVELOPE_MAGIC)
+    buffer.append(ENVELOPE_VERSION)
+    _pack_value(buffer, transaction)
+    return clean_transaction_raw(b64encode(bytes(buffer)).decode())
+
+
+def load_transaction_raw(transaction_raw: Union[str, TransactionEnvelope]) -> TransactionEnvelope:
+    """
+    Load transaction raw, auto-detect legacy or binary envelope.
+
+    :param transaction_raw: Any transaction raw or transaction envelope.
+    :type transaction_raw: str, swap.utils.TransactionEnvelope
+    :returns: TransactionEnvelope -- Transaction envelope instance.
+
+    >>> from swap.utils import load_transaction_raw
+    >>> load_transaction_raw(transaction_raw="U1dQAQkEA2ZlZQOACQNyYXcGBQIAAAABB25ldHdvcmsFB3Rlc3RuZXQEdHlwZQUVYml0Y29pbl9yZWZ1bmRfc2lnbmVk")
+    {'fee': 576, 'raw': '0200000001', 'network': 'testnet', 'type': 'bitcoin_refund_signed'}
+    """
+
+    if isinstance(transaction_raw, TransactionEnvelope):
+        return transaction_raw
+    if not isinstance(transaction_raw, str):
+        raise TypeError(f"Transaction raw must be str, not '{type(transaction_raw)}' type.")
+
+    try:
+        decoded_transaction_raw: bytes = b64decode(clean_transaction_raw(transaction_raw).encode())
+        if decoded_transaction_raw[:len(ENVELOPE_MAGIC)] == ENVELOPE_MAGIC:
+            if decoded_transaction_raw[len(ENVELOPE_MAGIC)] != ENVELOPE_VERSION:
+                raise ValueError(f"Unsupported binary transaction raw "
+                                 f"'{decoded_transaction_raw[len(ENVELOPE_MAGIC)]}' version.")
+            transaction, offset = _unpack_value(decoded_transaction_raw, len(ENVELOPE_MAGIC) + 1)
+            if not isinstance(transaction, dict) or offset != len(decoded_transaction_raw):
+                raise ValueError("Invalid binary transaction raw fields.")
+            return TransactionEnvelope(transaction=transaction, binary=True)
+        transaction = json.loads(decoded_transaction_raw.decode())
+        if not isinstance(transaction, dict):
+            raise ValueError("Invalid transaction raw fields.")
+        return TransactionEnvelope(transaction=transaction, binary=False)
+    except (ValueError, IndexError, UnicodeDecodeError, struct.error) as exception:
+        raise TransactionRawError("Invalid transaction raw.", str(exception))
+
+
+# Per worker process signing state, set once by the pool initializer.
+_sign_many_state: dict = {}
+
+
+def _sign_many_initializer(signature: type, signature_kwargs: dict, solver_factory: Callable) -> None:
+    _sign_many_state.update(
+        signature=signature, signature_kwargs=signature_kwargs, solver=solver_factory()
+    )
+
+
+def _sign_many_worker(transaction_raw: Union[str, TransactionEnvelope]) -> dict:
+    try:
+        loaded_transaction_raw: TransactionEnvelope = load_transaction_raw(transaction_raw=transaction_raw)
+        solver = _sign_many_state["solver"]
+        # Solver factory can return one solver or a callable that picks the solver per transaction raw
+        if callable(solver):
+            solver = solver(loaded_transaction_raw)
+        signature = _sign_many_state["signature"](**_sign_many_state["signature_kwargs"]).sign(
+            transaction_raw=loaded_transaction_raw, solver=solver
+        )
+        if signature is None:
+            raise TransactionRawError(f"Can't sign '{loaded_transaction_raw.get('type')}' transaction raw type.")
+        return dict(transaction_raw=signature.transaction_raw(), error=None)
+    except Exception as exception:
+        return dict(transaction_raw=None, error=f"{type(exception).__name__}: {exception}")
+
+
+def _sign_many(signature: type, signature_kwargs: dict, transaction_raws: List[Union[str, TransactionEnvelope]],
+               solver_factory: Callable, workers: Optional[int] = None) -> List[dict]:
+    if workers is not None and workers < 1:
+        raise ValueError(f"Invalid workers '{workers}', workers must be greater than zero.")
+    if not transaction_raws:
+        return []
+
+    workers = min(workers or os.cpu_count() or 1, len(transaction_raws))
+    if workers == 1:
+        _sign_many_initializer(
+            signature=signature, signature_kwargs=signature_kwargs, solver_factory=solver_factory
+        )
+        try:
+            return [_sign_many_worker(transaction_raw) for transaction_raw in transaction_raws]
+        finally:
+            _sign_many_state.clear()
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_sign_many_initializer,
+        initargs=(signature, signature_kwargs, solver_factory)
+    ) as executor:
+        return list(executor.map(
+            _sign_many_worker, transaction_raws, chunksize=max(1, len(transaction_raws) // (workers * 4))
+        ))
+
+
+def _derive_range(derive: Callable, start: int, count: int, workers: Optional[int] = None,
+                  chunk_size: int = 1000) -> List[dict]:
+    if start < 0 or count < 0:
+        raise ValueError(f"Invalid '{start}' start or '{count}' count, must be zero or greater.")
+    if workers is not None and workers < 1:
+        raise ValueError(f"Invalid workers '{workers}', workers must be greater than zero.")
+
+    # Split the range into chunks, derive(start, count) returns the records of one chunk
+    chunks: List[tuple] = [
+        (index, min(chunk_size, start + count - index)) for index in range(start, start + count, chunk_size)
+    ]
+    workers = min(workers or os.cpu_count() or 1, len(chunks) or 1)
+    if workers == 1:
+        return [record for chunk in chunks for record in derive(*chunk)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return [
+            record for records in executor.map(derive, *zip(*chunks)) for record in records
+        ]
+
+
+def _scan_addresses(derive: Callable, activity: Callable, gap: int = 20, workers: Optional[int] = None) -> dict:
+    if gap < 1:
+        raise ValueError(f"Invalid gap '{gap}', gap must be greater than zero.")
+    if workers is not None and workers < 1:
+        raise ValueError(f"Invalid workers '{workers}', workers must be greater than zero.")
+
+    # Walk receive and change chains, derive(change, start, count) returns address records
+    # and activity(record) returns its used flag, balance and utxos, queried gap at a time.
+    scan: dict = dict(balance=0, utxos=[], addresses=[], receive_index=0, change_index=0)
+    with ThreadPoolExecutor(max_workers=(workers or min(32, gap))) as executor:
+        for change in [False, True]:
+            start, empty = 0, 0
+            while empty < gap:
+                count: int = gap - empty
+                records: List[dict] = derive(change, start, count)
+                for record, _activity in zip(records, executor.map(activity, records)):
+                    if not _activity["used"]:
+                        empty += 1
+                        continue
+                    empty = 0
+                    address: dict = dict(record, change=change, balance=_activity["balance"])
+                    if "utxos" in _activity:
+                        address["utxos"] = _activity["utxos"]
+                        scan["utxos"].extend(
+                            dict(utxo, address=record["address"], address_index=record["index"], change=change)
+                            for utxo in _activity["utxos"]
+                        )
+                    scan["balance"] += _activity["balance"]
+                    scan["addresses"].append(address)
+                    scan["change_index" if change else "receive_index"] = record["index"] + 1
+                start += count
+    return scan
@@ -15,6 +15,7 @@ def test_swap_cli(cli_tester):
     assert cli_tester.invoke(cli_main, ["ethereum"]).exit_code == 0
     assert cli_tester.invoke(cli_main, ["vapor"]).exit_code == 0
     assert cli_tester.invoke(cli_main, ["xinfin"]).exit_code == 0
+    assert cli_tester.invoke(cli_main, ["compile-contracts", "--help"]).exit_code == 0
 
     version = cli_tester.invoke(cli_main, ["--version"])
     assert version.exit_code == 0
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+import threading
+import hashlib
+import socket
+import pytest
+import json
+import os
+
+from btcpy.setup import setup
+
+from swap.exceptions import (
+    APIError, AddressError, NetworkError
+)
+from swap.providers.bitcoin.electrum import (
+    ElectrumClient, get_scripthash
+)
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "..", "..", "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+
+def electrum_server(notification: dict):
+    # Local Electrum server, answers batches and pushes one notification after subscribe
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+
+    def serve():
+        connection, _address = server.accept()
+        buffer = b""
+        while True:
+            data = connection.recv(65536)
+            if not data:
+                break
+            buffer += data
+            while b"\n" in buffer:
+                line, buffer = buffer.split(b"\n", 1)
+                message = json.loads(line)
+                responses = []
+                for request in (message if isinstance(message, list) else [message]):
+                    if request["method"] == "blockchain.scripthash.get_balance":
+                        responses.append(dict(id=request["id"], result=dict(confirmed=10000, unconfirmed=0)))
+                    elif request["method"] == "blockchain.scripthash.subscribe":
+                        responses.append(dict(id=request["id"], result=None))
+                    else:
+                        responses.append(dict(id=request["id"], error=dict(code=-32601, message="unknown method")))
+                # Answer in reversed order, client must match them by id
+                responses = responses[::-1]
+                connection.sendall(json.dumps(responses if isinstance(message, list) else responses[0]).encode() + b"\n")
+                if any(request["method"] == "blockchain.scripthash.subscribe"
+                       for request in (message if isinstance(message, list) else [message])):
+                    connection.sendall(json.dumps(notification).encode() + b"\n")
+        connection.close()
+        server.close()
+
+    threading.Thread(target=serve, daemon=True).start()
+    return server.getsockname()[1]
+
+
+def test_bitcoin_electrum_scripthash():
+
+    # Both networks are decoded explicitly, whatever the btcpy network setup is
+    for network in ["mainnet", _["bitcoin"]["network"]]:
+        setup(network, strict=True, force=True)
+        assert get_scripthash(address="1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa", network="mainnet") == \
+            "8b01df4e368ea28f8dc0423bcf7a4923e3a12d307c875e47a0cfbf90b5c39161"
+        assert get_scripthash(
+            address=_["bitcoin"]["htlc"]["contract_address"], network=_["bitcoin"]["network"]
+        ) == hashlib.sha256(bytes.fromhex(_["bitcoin"]["htlc"]["hash"])).digest()[::-1].hex()
+        assert get_scripthash(
+            address=_["bitcoin"]["htlc"]["segwit"]["contract_address"], network=_["bitcoin"]["network"]
+        ) == hashlib.sha256(bytes.fromhex(_["bitcoin"]["htlc"]["segwit"]["hash"])).digest()[::-1].hex()
+
+    with pytest.raises(AddressError, match=r"Invalid Bitcoin '1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa' testnet address"):
+        get_scripthash(address="1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa", network="testnet")
+    with pytest.raises(NetworkError, match=r"Invalid Bitcoin 'solana' network"):
+        get_scripthash(address="1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa", network="solana")
+
+
+def test_bitcoin_electrum_client():
+
+    scripthash = get_scripthash(address=_["bitcoin"]["htlc"]["contract_address"], network=_["bitcoin"]["network"])
+    port = electrum_server(notification=dict(
+        jsonrpc="2.0", method="blockchain.scripthash.subscribe", params=[scripthash, "status"]
+    ))
+    notifications, notified = [], threading.Event()
+
+    def callback(_scripthash, status):
+        # Requests from a callback are answered, callbacks are not called on the reader thread
+        notifications.append((_scripthash, status, electrum.request("blockchain.scripthash.get_balance", _scripthash)))
+        notified.set()
+
+    with ElectrumClient(host="127.0.0.1", port=port, use_ssl=False, timeout=10) as electrum:
+        assert electrum.batch(calls=[]) == []
+        assert electrum.request("blockchain.scripthash.get_balance", scripthash) == dict(confirmed=10000, unconfirmed=0)
+        assert electrum.batch(calls=[
+            ("blockchain.scripthash.get_balance", [scripthash]), ("blockchain.scripthash.subscribe", [scripthash])
+        ]) == [dict(confirmed=10000, unconfirmed=0), None]
+
+        with pytest.raises(APIError, match=r"unknown method"):
+            electrum.request("blockchain.meheret")
+
+        assert electrum.subscribe(
+            addresses=[_["bitcoin"]["htlc"]["contract_address"]], callback=callback, network=_["bitcoin"]["network"]
+        ) == {
+            _["bitcoin"]["htlc"]["contract_address"]: None
+        }
+        assert notified.wait(10)
+        assert notifications[-1] == (scripthash, "status", dict(confirmed=10000, unconfirmed=0))
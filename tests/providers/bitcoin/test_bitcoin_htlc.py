@@ -1,9 +1,17 @@
 #!/usr/bin/env python3
 
+from btcpy.structs.transaction import Locktime
+
+import pytest
 import json
 import os
 
-from swap.providers.bitcoin.htlc import HTLC
+from swap.exceptions import (
+    AddressError, NetworkError
+)
+from swap.providers.bitcoin.htlc import (
+    HTLC, build_many
+)
 
 # Test Values
 base_path = os.path.dirname(__file__)
@@ -49,3 +57,88 @@ def test_bitcoin_htlc():
     assert htlc.opcode() == _["bitcoin"]["htlc"]["opcode"]
     assert htlc.hash() == _["bitcoin"]["htlc"]["hash"]
     assert htlc.contract_address() == _["bitcoin"]["htlc"]["contract_address"]
+
+
+def test_bitcoin_segwit_htlc():
+
+    htlc = HTLC(network=_["bitcoin"]["network"]).build_htlc(
+        secret_hash=_["bitcoin"]["htlc"]["secret"]["hash"],
+        recipient_address=_["bitcoin"]["wallet"]["recipient"]["address"],
+        sender_address=_["bitcoin"]["wallet"]["sender"]["address"],
+        endtime=_["bitcoin"]["htlc"]["endtime"],
+        segwit=True
+    )
+
+    assert htlc.segwit
+    assert htlc.bytecode() == _["bitcoin"]["htlc"]["bytecode"]
+    assert htlc.opcode() == _["bitcoin"]["htlc"]["opcode"]
+    assert htlc.hash() == _["bitcoin"]["htlc"]["segwit"]["hash"]
+    assert htlc.contract_address() == _["bitcoin"]["htlc"]["segwit"]["contract_address"]
+
+    htlc = HTLC(network=_["bitcoin"]["network"]).from_bytecode(
+        bytecode=_["bitcoin"]["htlc"]["bytecode"], segwit=True
+    )
+
+    assert htlc.hash() == _["bitcoin"]["htlc"]["segwit"]["hash"]
+    assert htlc.contract_address() == _["bitcoin"]["htlc"]["segwit"]["contract_address"]
+
+    htlc = HTLC(network=_["bitcoin"]["network"]).from_opcode(
+        opcode=_["bitcoin"]["htlc"]["opcode"], segwit=True
+    )
+
+    assert htlc.hash() == _["bitcoin"]["htlc"]["segwit"]["hash"]
+    assert htlc.contract_address() == _["bitcoin"]["htlc"]["segwit"]["contract_address"]
+    assert HTLC(network="mainnet").from_opcode(
+        opcode=_["bitcoin"]["htlc"]["opcode"], segwit=True
+    ).contract_address().startswith("bc1q")
+
+
+def test_bitcoin_htlc_build_many():
+
+    agreements = dict(
+        secret_hash=_["bitcoin"]["htlc"]["secret"]["hash"],
+        recipient_address=_["bitcoin"]["wallet"]["recipient"]["address"],
+        sender_address=_["bitcoin"]["wallet"]["sender"]["address"],
+        endtime=_["bitcoin"]["htlc"]["endtime"]
+    )
+
+    assert build_many(htlcs=[agreements], network=_["bitcoin"]["network"]) == [dict(
+        bytecode=_["bitcoin"]["htlc"]["bytecode"],
+        hash=_["bitcoin"]["htlc"]["hash"],
+        contract_address=_["bitcoin"]["htlc"]["contract_address"]
+    )]
+    assert build_many(htlcs=[agreements], network=_["bitcoin"]["network"], segwit=True) == [dict(
+        bytecode=_["bitcoin"]["htlc"]["bytecode"],
+        hash=_["bitcoin"]["htlc"]["segwit"]["hash"],
+        contract_address=_["bitcoin"]["htlc"]["segwit"]["contract_address"]
+    )]
+
+    # Same HTLC's as compiling the opcode script, small and large endtimes included
+    for endtime in [1, 16, 17, 128, 500000, 2147483648]:
+        contract = build_many(htlcs=[dict(agreements, endtime=endtime)], network=_["bitcoin"]["network"])[0]
+        htlc = HTLC(network=_["bitcoin"]["network"]).from_opcode(
+            opcode=_["bitcoin"]["htlc"]["opcode"].replace(
+                "d3a1e060", Locktime(n=endtime).for_script().hexlify()[2:] or "OP_0"
+            )
+        )
+        assert contract["bytecode"] == htlc.bytecode()
+        assert contract["hash"] == htlc.hash()
+        assert contract["contract_address"] == htlc.contract_address()
+        assert HTLC(network=_["bitcoin"]["network"]).build_htlc(
+            **dict(agreements, endtime=endtime)
+        ).bytecode() == htlc.bytecode()
+
+    assert build_many(htlcs=[], network=_["bitcoin"]["network"]) == []
+    with pytest.raises(NetworkError, match=r"Invalid Bitcoin 'solonet' network"):
+        build_many(htlcs=[agreements], network="solonet")
+    with pytest.raises(ValueError, match=r"Invalid secret hash, length must be 64"):
+        build_many(htlcs=[dict(agreements, secret_hash="meheret")], network=_["bitcoin"]["network"])
+    with pytest.raises(AddressError, match=r"Invalid Bitcoin recipient '.*' mainnet address"):
+        build_many(htlcs=[agreements], network="mainnet")
+    with pytest.raises(AddressError, match=r"Invalid Bitcoin sender '.*' testnet address"):
+        build_many(htlcs=[dict(agreements, sender_address="tb1qmeheret")], network=_["bitcoin"]["network"])
+    # P2WSH addresses have a 32-byte hash, the HTLC script takes only 20-byte public key hashes
+    with pytest.raises(AddressError, match=r"Invalid Bitcoin recipient '.*' testnet address"):
+        build_many(htlcs=[dict(
+            agreements, recipient_address=_["bitcoin"]["htlc"]["segwit"]["contract_address"]
+        )], network=_["bitcoin"]["network"])
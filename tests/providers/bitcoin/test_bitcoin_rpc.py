@@ -6,9 +6,13 @@ import json
 import os
 
 from swap.exceptions import APIError
+from swap.providers.config import bitcoin as config
 from swap.providers.bitcoin.rpc import (
-    decode_raw, submit_raw
+    decode_raw, submit_raw, find_p2sh_utxo, normalize_transaction, bitcoind_request, bitcoind_batch,
+    get_transaction_count
 )
+from swap.providers.bitcoin.wallet import Wallet
+from swap.providers.bitcoin.watch import WatchOnlyWallet
 
 # Test Values
 base_path = os.path.dirname(__file__)
@@ -25,3 +29,71 @@ def test_bitcoin_rpc():
     # (REQ_ERROR) 16: mandatory-script-verify-flag-failed (Operation not valid with the current stack size)
     with pytest.raises((APIError, requests.exceptions.ConnectionError)):
         submit_raw(raw=_["bitcoin"]["fund"]["unsigned"]["raw"], network=_["bitcoin"]["network"])
+
+
+def test_bitcoin_rpc_find_p2sh_utxo():
+
+    transaction = {
+        "outputs": [
+            {"value": 1000, "script": "a914971894c58d85981c16c2059d422bcde0b156d04487", "script_type": "pay-to-script-hash"},
+            {"value": 2000, "script": _["bitcoin"]["htlc"]["hash"], "script_type": "pay-to-script-hash"},
+            {"value": 3000, "script": "76a9146bce65e58a50b97989930e9a4ff1ac1a77515ef188ac", "script_type": "pay-to-pubkey-hash"}
+        ]
+    }
+
+    assert find_p2sh_utxo(transaction=transaction)["position"] == 0
+    assert find_p2sh_utxo(transaction=transaction, script=_["bitcoin"]["htlc"]["hash"]) == dict(
+        position=1, **transaction["outputs"][1]
+    )
+    assert find_p2sh_utxo(transaction=transaction, script="76a9146bce65e58a50b97989930e9a4ff1ac1a77515ef188ac") is None
+
+
+def test_bitcoin_rpc_bitcoind():
+
+    transaction = normalize_transaction(transaction=decode_raw(
+        raw=_["bitcoin"]["fund"]["signed"]["raw"], network=_["bitcoin"]["network"]
+    ))
+    assert transaction["hash"] == _["bitcoin"]["fund"]["signed"]["hash"]
+    assert transaction["confirmations"] == 0
+    assert transaction["vin_sz"] == 1 and transaction["vout_sz"] == 2
+    assert find_p2sh_utxo(transaction=transaction, script=_["bitcoin"]["htlc"]["hash"]) == dict(
+        position=0, value=1_000_000,
+        script=_["bitcoin"]["htlc"]["hash"], addresses=[_["bitcoin"]["htlc"]["contract_address"]],
+        script_type="pay-to-script-hash"
+    )
+    assert transaction["outputs"][1]["script_type"] == "pay-to-pubkey-hash"
+
+    assert bitcoind_batch(calls=[], network=_["bitcoin"]["network"]) == []
+
+    # No bitcoind is running on the default url
+    previous = config[_["bitcoin"]["network"]]["bitcoind"]["url"]
+    config[_["bitcoin"]["network"]]["bitcoind"]["url"] = "http://127.0.0.1:1"
+    try:
+        with pytest.raises((APIError, requests.exceptions.ConnectionError)):
+            bitcoind_request(method="getblockcount", network=_["bitcoin"]["network"])
+        with pytest.raises((APIError, requests.exceptions.ConnectionError)):
+            submit_raw(raw=_["bitcoin"]["fund"]["signed"]["raw"], network=_["bitcoin"]["network"], endpoint="bitcoind")
+    finally:
+        config[_["bitcoin"]["network"]]["bitcoind"]["url"] = previous
+
+
+def test_bitcoin_rpc_bitcoind_history(tmp_path, monkeypatch):
+
+    # Bitcoind without a watch-only wallet, scantxoutset has no address history
+    monkeypatch.setitem(config[_["bitcoin"]["network"]], "backend", "bitcoind")
+    monkeypatch.setitem(config[_["bitcoin"]["network"]]["bitcoind"], "wallet", None)
+
+    wallet = Wallet(network=_["bitcoin"]["network"])
+    wallet.from_entropy(entropy=_["bitcoin"]["wallet"]["sender"]["entropy"])
+    xpublic_key = wallet.from_path(path="m/44'/0'/0'").xpublic_key()
+    wallet.clean_derivation()
+
+    with pytest.raises(APIError, match=r"Bitcoind backend has no address history without a watch-only wallet"):
+        get_transaction_count(address=_["bitcoin"]["wallet"]["sender"]["address"], network=_["bitcoin"]["network"])
+    with pytest.raises(APIError, match=r"Bitcoind backend has no address history without a watch-only wallet"):
+        wallet.scan(gap=3)
+    with WatchOnlyWallet(
+        xpublic_key=xpublic_key, network=_["bitcoin"]["network"], database=str(tmp_path / "watch.sqlite")
+    ) as watch_only_wallet:
+        with pytest.raises(APIError, match=r"Bitcoind backend has no address history without a watch-only wallet"):
+            watch_only_wallet.sync(gap=3)
@@ -2,9 +2,10 @@
 
 import json
 import os
+from functools import partial
 
 from swap.providers.bitcoin.signature import (
-    Signature, NormalSignature, FundSignature, WithdrawSignature, RefundSignature
+    Signature, NormalSignature, FundSignature, WithdrawSignature, RefundSignature, sign_many
 )
 from swap.providers.bitcoin.solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
@@ -185,3 +186,39 @@ def test_bitcoin_refund_signature():
     assert refund_signature.transaction_raw() == clean_transaction_raw(
         transaction_raw=_["bitcoin"]["refund"]["signed"]["transaction_raw"]
     )
+
+
+def test_bitcoin_sign_many():
+
+    fund_solver_factory = partial(
+        FundSolver,
+        xprivate_key=_["bitcoin"]["wallet"]["sender"]["root_xprivate_key"],
+        path=_["bitcoin"]["wallet"]["sender"]["derivation"]["path"],
+        account=_["bitcoin"]["wallet"]["sender"]["derivation"]["account"],
+        change=_["bitcoin"]["wallet"]["sender"]["derivation"]["change"],
+        address=_["bitcoin"]["wallet"]["sender"]["derivation"]["address"]
+    )
+
+    for workers in [1, 2]:
+        signed = sign_many(
+            transaction_raws=[
+                _["bitcoin"]["fund"]["unsigned"]["transaction_raw"],
+                "meheret",
+                _["bitcoin"]["withdraw"]["unsigned"]["transaction_raw"]
+            ],
+            solver_factory=fund_solver_factory,
+            workers=workers,
+            network=_["bitcoin"]["network"]
+        )
+
+        assert len(signed) == 3
+        assert signed[0]["error"] is None
+        assert signed[0]["transaction_raw"] == clean_transaction_raw(
+            transaction_raw=_["bitcoin"]["fund"]["signed"]["transaction_raw"]
+        )
+        assert signed[1]["transaction_raw"] is None
+        assert signed[1]["error"].startswith("TransactionRawError: Invalid transaction raw.")
+        assert signed[2]["transaction_raw"] is None
+        assert signed[2]["error"] == "TypeError: Solver must be Bitcoin WithdrawSolver, not FundSolver type."
+
+    assert sign_many(transaction_raws=[], solver_factory=fund_solver_factory) == []
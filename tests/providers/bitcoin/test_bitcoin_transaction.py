@@ -1,15 +1,36 @@
 #!/usr/bin/env python3
 
+import pytest
 import json
 import os
 
+from btcpy.structs.transaction import MutableTransaction, TxOut
+from btcpy.structs.script import (
+    Script, P2shScript
+)
+from btcpy.structs.sig import (
+    P2shSolver, Sighash
+)
+from binascii import unhexlify
+
 from swap.providers.bitcoin.htlc import HTLC
 from swap.providers.bitcoin.transaction import (
-    NormalTransaction, FundTransaction, WithdrawTransaction, RefundTransaction
+    NormalTransaction, FundTransaction, WithdrawTransaction, RefundTransaction,
+    SweepTransaction, build_sweep_transactions
 )
 from swap.providers.bitcoin.solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
 )
+from swap.providers.bitcoin.signature import (
+    NormalSignature, WithdrawSignature, SweepSignature
+)
+from swap.providers.bitcoin.wallet import Wallet
+from swap.providers.bitcoin.utils import (
+    get_address_hash, fee_calculator, _build_outputs, _build_solvers
+)
+from swap.providers.bitcoin import transaction
+from swap.exceptions import AddressError
+from swap.crypto import get_backend
 from swap.utils import clean_transaction_raw
 
 # Test Values
@@ -108,6 +129,32 @@ def test_bitcoin_fund_transaction():
     )
 
 
+def test_bitcoin_batch_fund_transaction():
+
+    htlc = HTLC(network=_["bitcoin"]["network"]).build_htlc(
+        secret_hash=_["bitcoin"]["htlc"]["secret"]["hash"],
+        recipient_address=_["bitcoin"]["wallet"]["recipient"]["address"],
+        sender_address=_["bitcoin"]["wallet"]["sender"]["address"],
+        endtime=_["bitcoin"]["htlc"]["endtime"]
+    )
+
+    with pytest.raises(ValueError, match="at least one HTLC"):
+        FundTransaction(network=_["bitcoin"]["network"]).build_transaction(
+            address=_["bitcoin"]["wallet"]["sender"]["address"], htlc=[], unit=_["bitcoin"]["unit"]
+        )
+    with pytest.raises(ValueError, match="Amount must be None"):
+        FundTransaction(network=_["bitcoin"]["network"]).build_transaction(
+            address=_["bitcoin"]["wallet"]["sender"]["address"], htlc=[(htlc, _["bitcoin"]["amount"])],
+            amount=_["bitcoin"]["amount"], unit=_["bitcoin"]["unit"]
+        )
+    with pytest.raises(ValueError, match="Duplicate Bitcoin HTLC"):
+        FundTransaction(network=_["bitcoin"]["network"]).build_transaction(
+            address=_["bitcoin"]["wallet"]["sender"]["address"],
+            htlc=[(htlc, _["bitcoin"]["amount"]), (htlc, _["bitcoin"]["amount"])],
+            unit=_["bitcoin"]["unit"]
+        )
+
+
 def test_bitcoin_withdraw_transaction():
 
     unsigned_withdraw_transaction = WithdrawTransaction(network=_["bitcoin"]["network"])
@@ -186,3 +233,363 @@ def test_bitcoin_refund_transaction():
     assert signed_refund_transaction.transaction_raw() == clean_transaction_raw(
         transaction_raw=_["bitcoin"]["refund"]["signed"]["transaction_raw"]
     )
+
+
+def test_bitcoin_sweep_transaction():
+
+    htlc = HTLC(network=_["bitcoin"]["network"]).build_htlc(
+        secret_hash=_["bitcoin"]["htlc"]["secret"]["hash"],
+        recipient_address=_["bitcoin"]["wallet"]["recipient"]["address"],
+        sender_address=_["bitcoin"]["wallet"]["sender"]["address"],
+        endtime=_["bitcoin"]["htlc"]["endtime"]
+    )
+
+    with pytest.raises(ValueError, match="at least one HTLC"):
+        SweepTransaction(network=_["bitcoin"]["network"]).build_transaction(
+            address=_["bitcoin"]["wallet"]["sender"]["address"], htlcs=[]
+        )
+    with pytest.raises(ValueError, match="at least one HTLC"):
+        build_sweep_transactions(
+            address=_["bitcoin"]["wallet"]["sender"]["address"], htlcs=[], network=_["bitcoin"]["network"]
+        )
+    with pytest.raises(ValueError, match="can't fit a single Bitcoin HTLC input"):
+        build_sweep_transactions(
+            address=_["bitcoin"]["wallet"]["sender"]["address"],
+            htlcs=[(_["bitcoin"]["transaction_hash"], htlc.bytecode())],
+            network=_["bitcoin"]["network"], max_size=100
+        )
+    with pytest.raises(ValueError, match="build transaction first"):
+        SweepTransaction(network=_["bitcoin"]["network"]).sign(solver=[])
+
+
+def test_bitcoin_legacy_sweep_transaction(monkeypatch):
+
+    htlc = HTLC(network=_["bitcoin"]["network"]).build_htlc(
+        secret_hash=_["bitcoin"]["htlc"]["secret"]["hash"],
+        recipient_address=_["bitcoin"]["wallet"]["recipient"]["address"],
+        sender_address=_["bitcoin"]["wallet"]["sender"]["address"],
+        endtime=_["bitcoin"]["htlc"]["endtime"]
+    )
+
+    # Funded transaction detail, two P2SH HTLC outputs and the P2PKH return output
+    transaction_detail = dict(outputs=[
+        dict(value=10000, script=_["bitcoin"]["htlc"]["hash"], script_type="pay-to-script-hash"),
+        dict(value=20000, script=_["bitcoin"]["htlc"]["hash"], script_type="pay-to-script-hash"),
+        dict(value=70000, script=get_address_hash(
+            address=_["bitcoin"]["wallet"]["sender"]["address"], script=True
+        ).hexlify(), script_type="pay-to-pubkey-hash")
+    ])
+    monkeypatch.setattr(transaction, "get_transactions", lambda transaction_hashes, network: [
+        transaction_detail for _transaction_hash in transaction_hashes
+    ])
+
+    refund_solver = RefundSolver(
+        xprivate_key=_["bitcoin"]["wallet"]["sender"]["root_xprivate_key"],
+        bytecode=htlc.bytecode(),
+        endtime=_["bitcoin"]["htlc"]["endtime"],
+        path=_["bitcoin"]["wallet"]["sender"]["derivation"]["path"]
+    )
+
+    sweep_transaction = SweepTransaction(network=_["bitcoin"]["network"]).build_transaction(
+        address=_["bitcoin"]["wallet"]["sender"]["address"], htlcs=[
+            ((_["bitcoin"]["transaction_hash"], 0), htlc.bytecode()),
+            ((_["bitcoin"]["transaction_hash"], 1), htlc.bytecode())
+        ]
+    )
+    # Legacy spends of P2SH HTLC's are not discounted
+    assert sweep_transaction.fee() == fee_calculator(2, 1)
+    assert sweep_transaction.type() == "bitcoin_sweep_unsigned"
+    unsigned_transaction_raw, unsigned_raw = sweep_transaction.transaction_raw(), sweep_transaction.raw()
+    assert [(vin["txid"], vin["vout"]) for vin in sweep_transaction.json()["vin"]] == [
+        (_["bitcoin"]["transaction_hash"], 0), (_["bitcoin"]["transaction_hash"], 1)
+    ]
+    assert sweep_transaction.json()["vout"][0]["value"] == f"{(30000 - fee_calculator(2, 1)) / 100_000_000:.8f}"
+    assert sweep_transaction.json()["vout"][0]["scriptPubKey"]["hex"] == get_address_hash(
+        address=_["bitcoin"]["wallet"]["sender"]["address"], script=True
+    ).hexlify()
+    assert sweep_transaction.json()["locktime"] == _["bitcoin"]["htlc"]["endtime"]
+
+    sweep_transaction.sign(solver=[refund_solver, refund_solver])
+    assert sweep_transaction.type() == "bitcoin_sweep_signed"
+    assert sweep_transaction.raw().startswith("0200000002")
+    assert sweep_transaction.raw() == MutableTransaction.unhexlify(unsigned_raw).spend(
+        txouts=[TxOut(value=value, n=n, script_pubkey=P2shScript.unhexlify(_["bitcoin"]["htlc"]["hash"]))
+                for n, value in enumerate([10000, 20000])],
+        solvers=[P2shSolver(
+            redeem_script=refund_solver.witness(network=_["bitcoin"]["network"]),
+            redeem_script_solver=refund_solver.solve(network=_["bitcoin"]["network"])
+        )] * 2
+    ).hexlify()
+    for vin in sweep_transaction.json()["vin"]:
+        assert vin["scriptSig"]["hex"].endswith(htlc.bytecode())
+        assert "txinwitness" not in vin
+    assert SweepSignature(network=_["bitcoin"]["network"]).sign(
+        transaction_raw=unsigned_transaction_raw, solver=[refund_solver, refund_solver]
+    ).raw() == sweep_transaction.raw()
+
+    with pytest.raises(ValueError, match="2 solvers are required one per HTLC"):
+        SweepTransaction(network=_["bitcoin"]["network"]).build_transaction(
+            address=_["bitcoin"]["wallet"]["sender"]["address"], htlcs=[
+                ((_["bitcoin"]["transaction_hash"], 0), htlc.bytecode()),
+                ((_["bitcoin"]["transaction_hash"], 1), htlc.bytecode())
+            ]
+        ).sign(solver=[refund_solver])
+    with pytest.raises(ValueError, match="Duplicate Bitcoin HTLC"):
+        SweepTransaction(network=_["bitcoin"]["network"]).build_transaction(
+            address=_["bitcoin"]["wallet"]["sender"]["address"], htlcs=[
+                ((_["bitcoin"]["transaction_hash"], 0), htlc.bytecode()),
+                ((_["bitcoin"]["transaction_hash"], 0), htlc.bytecode())
+            ]
+        )
+
+
+def test_bitcoin_build_sweep_transactions(monkeypatch):
+
+    htlc = HTLC(network=_["bitcoin"]["network"]).build_htlc(
+        secret_hash=_["bitcoin"]["htlc"]["secret"]["hash"],
+        recipient_address=_["bitcoin"]["wallet"]["recipient"]["address"],
+        sender_address=_["bitcoin"]["wallet"]["sender"]["address"],
+        endtime=_["bitcoin"]["htlc"]["endtime"]
+    )
+
+    # Funded transaction detail with five P2SH HTLC outputs
+    transaction_detail = dict(outputs=[
+        dict(value=10000 * (index + 1), script=_["bitcoin"]["htlc"]["hash"], script_type="pay-to-script-hash")
+        for index in range(5)
+    ])
+    monkeypatch.setattr(transaction, "get_transactions", lambda transaction_hashes, network: [
+        transaction_detail for _transaction_hash in transaction_hashes
+    ])
+
+    htlcs = [((_["bitcoin"]["transaction_hash"], index), htlc.bytecode()) for index in range(5)]
+    input_size = 36 + 4 + 3 + 74 + 34 + 76 + 1 + 3 + (len(htlc.bytecode()) // 2)
+    # Fits only two HTLC inputs per sweep transaction
+    sweep_transactions = build_sweep_transactions(
+        address=_["bitcoin"]["wallet"]["sender"]["address"], htlcs=htlcs,
+        network=_["bitcoin"]["network"], max_size=(4 + 3 + 1 + 34 + 4) + (input_size * 2)
+    )
+    assert len(sweep_transactions) == 3
+    assert [len(sweep_transaction.json()["vin"]) for sweep_transaction in sweep_transactions] == [2, 2, 1]
+    assert [vin["vout"] for sweep_transaction in sweep_transactions
+            for vin in sweep_transaction.json()["vin"]] == [0, 1, 2, 3, 4]
+    assert [sweep_transaction.fee() for sweep_transaction in sweep_transactions] == [
+        fee_calculator(2, 1), fee_calculator(2, 1), fee_calculator(1, 1)
+    ]
+    assert [sweep_transaction.json()["vout"][0]["value"] for sweep_transaction in sweep_transactions] == [
+        f"{(amount - fee) / 100_000_000:.8f}" for amount, fee in [
+            (30000, fee_calculator(2, 1)), (70000, fee_calculator(2, 1)), (50000, fee_calculator(1, 1))
+        ]
+    ]
+
+    # Each split sweep transaction stays under the max size once signed
+    refund_solver = RefundSolver(
+        xprivate_key=_["bitcoin"]["wallet"]["sender"]["root_xprivate_key"],
+        bytecode=htlc.bytecode(),
+        endtime=_["bitcoin"]["htlc"]["endtime"],
+        path=_["bitcoin"]["wallet"]["sender"]["derivation"]["path"]
+    )
+    for sweep_transaction in sweep_transactions:
+        sweep_transaction.sign(solver=[refund_solver] * len(sweep_transaction.json()["vin"]))
+        assert len(sweep_transaction.raw()) // 2 <= (4 + 3 + 1 + 34 + 4) + (input_size * 2)
+
+    # Default max size keeps all HTLC's in one sweep transaction
+    assert len(build_sweep_transactions(
+        address=_["bitcoin"]["wallet"]["sender"]["address"], htlcs=htlcs, network=_["bitcoin"]["network"]
+    )) == 1
+
+
+def test_bitcoin_segwit_htlc_transaction(monkeypatch):
+
+    htlc = HTLC(network=_["bitcoin"]["network"]).build_htlc(
+        secret_hash=_["bitcoin"]["htlc"]["secret"]["hash"],
+        recipient_address=_["bitcoin"]["wallet"]["recipient"]["address"],
+        sender_address=_["bitcoin"]["wallet"]["sender"]["address"],
+        endtime=_["bitcoin"]["htlc"]["endtime"],
+        segwit=True
+    )
+
+    fund_transaction = FundTransaction(network=_["bitcoin"]["network"]).build_transaction(
+        address=_["bitcoin"]["wallet"]["sender"]["address"], htlc=htlc, amount=10000, unit="Satoshi",
+        utxos=[dict(
+            tx_hash=_["bitcoin"]["transaction_hash"], tx_output_n=1, value=100000,
+            script=get_address_hash(address=_["bitcoin"]["wallet"]["sender"]["address"], script=True).hexlify()
+        )]
+    )
+    assert fund_transaction.json()["vout"][0]["scriptPubKey"]["hex"] == _["bitcoin"]["htlc"]["segwit"]["hash"]
+    assert fund_transaction.json()["vout"][0]["scriptPubKey"]["address"] == \
+        _["bitcoin"]["htlc"]["segwit"]["contract_address"]
+
+    # Funded transaction detail, the P2WSH HTLC output and the P2PKH return output
+    transaction_detail = dict(outputs=[
+        dict(value=10000, script=_["bitcoin"]["htlc"]["segwit"]["hash"], script_type="pay-to-witness-script-hash"),
+        dict(value=fund_transaction.json()["vout"][1]["value"], script=fund_transaction.json()["vout"][1]["scriptPubKey"]["hex"],
+             script_type="pay-to-pubkey-hash")
+    ])
+    monkeypatch.setattr(transaction, "get_transaction", lambda transaction_hash, network: transaction_detail)
+    monkeypatch.setattr(transaction, "get_transactions", lambda transaction_hashes, network: [
+        transaction_detail for _transaction_hash in transaction_hashes
+    ])
+
+    withdraw_solver = WithdrawSolver(
+        xprivate_key=_["bitcoin"]["wallet"]["recipient"]["root_xprivate_key"],
+        secret_key=_["bitcoin"]["htlc"]["secret"]["key"],
+        bytecode=htlc.bytecode(),
+        path=_["bitcoin"]["wallet"]["recipient"]["derivation"]["path"]
+    )
+    refund_solver = RefundSolver(
+        xprivate_key=_["bitcoin"]["wallet"]["sender"]["root_xprivate_key"],
+        bytecode=htlc.bytecode(),
+        endtime=_["bitcoin"]["htlc"]["endtime"],
+        path=_["bitcoin"]["wallet"]["sender"]["derivation"]["path"]
+    )
+
+    withdraw_transaction = WithdrawTransaction(network=_["bitcoin"]["network"]).build_transaction(
+        address=_["bitcoin"]["wallet"]["recipient"]["address"], transaction_hash=fund_transaction.hash(),
+        bytecode=htlc.bytecode()
+    )
+    # Witness spend is discounted and the signature doesn't change the transaction hash
+    assert withdraw_transaction.fee() == 398
+    unsigned_transaction_raw, unsigned_hash = withdraw_transaction.transaction_raw(), withdraw_transaction.hash()
+    withdraw_transaction.sign(solver=withdraw_solver)
+    assert withdraw_transaction.type() == "bitcoin_withdraw_signed"
+    assert withdraw_transaction.hash() == unsigned_hash
+    assert withdraw_transaction.raw().startswith("020000000001")
+    assert withdraw_transaction.json()["vin"][0]["scriptSig"]["hex"] == ""
+    assert withdraw_transaction.json()["vin"][0]["txinwitness"][-1] == htlc.bytecode()
+    assert WithdrawSignature(network=_["bitcoin"]["network"]).sign(
+        transaction_raw=unsigned_transaction_raw, solver=withdraw_solver
+    ).raw() == withdraw_transaction.raw()
+
+    refund_transaction = RefundTransaction(network=_["bitcoin"]["network"]).build_transaction(
+        address=_["bitcoin"]["wallet"]["sender"]["address"], transaction_hash=fund_transaction.hash()
+    )
+    assert refund_transaction.fee() == 398
+    assert refund_transaction.sign(solver=refund_solver).json()["locktime"] == _["bitcoin"]["htlc"]["endtime"]
+    assert refund_transaction.json()["vin"][0]["txinwitness"][-1] == htlc.bytecode()
+
+    sweep_transaction = SweepTransaction(network=_["bitcoin"]["network"]).build_transaction(
+        address=_["bitcoin"]["wallet"]["sender"]["address"], htlcs=[(fund_transaction.hash(), htlc.bytecode())]
+    )
+    unsigned_transaction_raw = sweep_transaction.transaction_raw()
+    assert sweep_transaction.fee() == 398
+    assert sweep_transaction.sign(solver=[refund_solver]).raw() == SweepSignature(network=_["bitcoin"]["network"]).sign(
+        transaction_raw=unsigned_transaction_raw, solver=[refund_solver]
+    ).raw()
+    with pytest.raises(ValueError, match="Wrong Bitcoin solver"):
+        SweepTransaction(network=_["bitcoin"]["network"]).build_transaction(
+            address=_["bitcoin"]["wallet"]["sender"]["address"], htlcs=[(fund_transaction.hash(), htlc.bytecode())]
+        ).sign(solver=[RefundSolver(
+            xprivate_key=_["bitcoin"]["wallet"]["sender"]["root_xprivate_key"],
+            bytecode=_["bitcoin"]["htlc"]["bytecode"].replace("d3a1e060", "d4a1e060"),
+            endtime=_["bitcoin"]["htlc"]["endtime"] + 256,
+            path=_["bitcoin"]["wallet"]["sender"]["derivation"]["path"]
+        )])
+
+
+def test_bitcoin_segwit_normal_transaction():
+
+    normal_solver = NormalSolver(
+        xprivate_key=_["bitcoin"]["wallet"]["sender"]["root_xprivate_key"],
+        path=_["bitcoin"]["wallet"]["sender"]["derivation"]["path"]
+    )
+
+    for address_type, unsigned_hash in [("p2wpkh", True), ("p2wpkh-in-p2sh", False)]:
+        wallet = Wallet(network=_["bitcoin"]["network"], address_type=address_type)
+        wallet.from_xprivate_key(xprivate_key=_["bitcoin"]["wallet"]["sender"]["root_xprivate_key"])
+        wallet.from_path(path=_["bitcoin"]["wallet"]["sender"]["derivation"]["path"])
+
+        script = get_address_hash(address=wallet.address(), script=True).hexlify()
+        utxos = [dict(tx_hash=(str(index) * 64), tx_output_n=index, value=10000, script=script) for index in range(1, 4)]
+        unsigned_normal_transaction = NormalTransaction(network=_["bitcoin"]["network"]).build_transaction(
+            address=wallet.address(), recipients={_["bitcoin"]["wallet"]["recipient"]["address"]: 25000}, utxos=utxos
+        )
+        # Segwit inputs are smaller than P2PKH inputs
+        assert unsigned_normal_transaction.fee() == fee_calculator(3, 1, address_type=address_type)
+        assert unsigned_normal_transaction.fee() < fee_calculator(3, 1)
+
+        unsigned_transaction_raw, unsigned_raw, _hash = (
+            unsigned_normal_transaction.transaction_raw(), unsigned_normal_transaction.raw(),
+            unsigned_normal_transaction.hash()
+        )
+        signed_normal_transaction = unsigned_normal_transaction.sign(solver=normal_solver)
+        assert signed_normal_transaction.raw().startswith("020000000001")
+        assert (signed_normal_transaction.hash() == _hash) is unsigned_hash
+        assert all(len(_input["txinwitness"]) == 2 for _input in signed_normal_transaction.json()["vin"])
+        assert NormalSignature(network=_["bitcoin"]["network"]).sign(
+            transaction_raw=unsigned_transaction_raw, solver=normal_solver
+        ).raw() == signed_normal_transaction.raw()
+
+        # Cached BIP143 digests sign the same as btcpy segwit spend
+        assert MutableTransaction.unhexlify(unsigned_raw).spend(
+            txouts=_build_outputs(utxos=utxos), solvers=_build_solvers(
+                solver=normal_solver.solve(network=_["bitcoin"]["network"]), scripts=[script for _utxo in utxos]
+            )
+        ).hexlify() == signed_normal_transaction.raw()
+
+
+def test_bitcoin_p2sh_p2wpkh_sender_htlc_refund(monkeypatch):
+
+    wallet = Wallet(network=_["bitcoin"]["network"], address_type="p2wpkh-in-p2sh")
+    wallet.from_xprivate_key(xprivate_key=_["bitcoin"]["wallet"]["sender"]["root_xprivate_key"])
+    wallet.from_path(path=_["bitcoin"]["wallet"]["sender"]["derivation"]["path"])
+
+    # P2SH address hash is the redeem script hash, the HTLC refund branch could never be signed
+    with pytest.raises(AddressError, match=r"Invalid Bitcoin sender '.*' testnet address, choose only public key hash"):
+        HTLC(network=_["bitcoin"]["network"]).build_htlc(
+            secret_hash=_["bitcoin"]["htlc"]["secret"]["hash"],
+            recipient_address=_["bitcoin"]["wallet"]["recipient"]["address"],
+            sender_address=wallet.address(), endtime=_["bitcoin"]["htlc"]["endtime"]
+        )
+
+    htlc = HTLC(network=_["bitcoin"]["network"]).build_htlc(
+        secret_hash=_["bitcoin"]["htlc"]["secret"]["hash"],
+        recipient_address=_["bitcoin"]["wallet"]["recipient"]["address"],
+        sender_address=_["bitcoin"]["wallet"]["sender"]["address"], endtime=_["bitcoin"]["htlc"]["endtime"]
+    )
+    assert htlc.bytecode().endswith("b17576a914" + wallet.hash() + "88ac68")
+
+    # The P2SH-P2WPKH address of the HTLC sender public key hash funds the HTLC
+    fund_transaction = FundTransaction(network=_["bitcoin"]["network"]).build_transaction(
+        address=wallet.address(), htlc=htlc, amount=10000, unit="Satoshi", utxos=[dict(
+            tx_hash=_["bitcoin"]["transaction_hash"], tx_output_n=1, value=100000,
+            script=get_address_hash(address=wallet.address(), script=True).hexlify()
+        )]
+    )
+    fund_transaction.sign(solver=FundSolver(
+        xprivate_key=_["bitcoin"]["wallet"]["sender"]["root_xprivate_key"],
+        path=_["bitcoin"]["wallet"]["sender"]["derivation"]["path"]
+    ))
+    assert fund_transaction.json()["vout"][0]["scriptPubKey"]["hex"] == htlc.hash()
+    with pytest.raises(AddressError, match=r"Wrong Bitcoin sender"):
+        FundTransaction(network=_["bitcoin"]["network"]).build_transaction(
+            address=Wallet(network=_["bitcoin"]["network"], address_type="p2wpkh-in-p2sh").from_xprivate_key(
+                xprivate_key=_["bitcoin"]["wallet"]["recipient"]["root_xprivate_key"]
+            ).from_path(path=_["bitcoin"]["wallet"]["recipient"]["derivation"]["path"]).address(),
+            htlc=htlc, amount=10000, unit="Satoshi", utxos=[]
+        )
+
+    transaction_detail = dict(outputs=[
+        dict(value=round(float(output["value"]) * 100_000_000), script=output["scriptPubKey"]["hex"],
+             script_type="pay-to-script-hash") for output in fund_transaction.json()["vout"]
+    ])
+    monkeypatch.setattr(transaction, "get_transaction", lambda transaction_hash, network: transaction_detail)
+
+    refund_transaction = RefundTransaction(network=_["bitcoin"]["network"]).build_transaction(
+        address=wallet.address(), transaction_hash=fund_transaction.hash(), bytecode=htlc.bytecode()
+    )
+    refund_transaction.sign(solver=RefundSolver(
+        xprivate_key=_["bitcoin"]["wallet"]["sender"]["root_xprivate_key"],
+        bytecode=htlc.bytecode(), endtime=_["bitcoin"]["htlc"]["endtime"],
+        path=_["bitcoin"]["wallet"]["sender"]["derivation"]["path"]
+    ))
+    # Refund branch signature by the wallet key, whose hash the HTLC commits to, pays back the P2SH-P2WPKH address
+    signature, public_key, branch, redeem_script = \
+        refund_transaction._transaction.ins[0].script_sig.decompile().split()
+    assert (public_key, branch, redeem_script) == (wallet.public_key(), "OP_0", htlc.bytecode())
+    assert get_backend().verify(
+        public_key=unhexlify(public_key), signature=unhexlify(signature)[:-1],
+        digest=bytes(refund_transaction._transaction.get_digest(0, Script.unhexlify(redeem_script), Sighash("ALL")))
+    )
+    assert refund_transaction.json()["locktime"] == _["bitcoin"]["htlc"]["endtime"]
+    assert refund_transaction.json()["vout"][0]["scriptPubKey"]["hex"] == \
+        get_address_hash(address=wallet.address(), script=True).hexlify()
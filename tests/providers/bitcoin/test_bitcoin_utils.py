@@ -7,8 +7,8 @@ import os
 
 from swap.exceptions import APIError
 from swap.providers.bitcoin.utils import (
-    is_network, is_address, is_transaction_raw, get_address_type,
-    decode_transaction_raw, submit_transaction_raw
+    is_network, is_address, is_transaction_raw, get_address_type, get_address_hash,
+    fee_calculator, decode_transaction_raw, submit_transaction_raw
 )
 
 # Test Values
@@ -39,6 +39,25 @@ def test_bitcoin_utils():
     assert get_address_type(address=_["bitcoin"]["wallet"]["recipient"]["address"]) == "p2pkh"
     assert get_address_type(address=_["bitcoin"]["htlc"]["contract_address"]) == "p2sh"
 
+    assert is_address(address=_["bitcoin"]["htlc"]["segwit"]["contract_address"])
+    assert not is_address(address=_["bitcoin"]["htlc"]["segwit"]["contract_address"], network="mainnet")
+    assert is_address(
+        address=_["bitcoin"]["htlc"]["segwit"]["contract_address"], network=_["bitcoin"]["network"], address_type="p2wsh"
+    )
+    assert get_address_type(address=_["bitcoin"]["htlc"]["segwit"]["contract_address"]) == "p2wsh"
+    assert get_address_hash(
+        address=_["bitcoin"]["htlc"]["segwit"]["contract_address"], script=True
+    ).hexlify() == _["bitcoin"]["htlc"]["segwit"]["hash"]
+
+    assert fee_calculator(transaction_input=1, transaction_output=1) == 576
+    assert fee_calculator(transaction_input=1, transaction_output=1, witness_input=1) == 398
+    with pytest.raises(ValueError, match="Invalid witness input numbers"):
+        fee_calculator(transaction_input=1, transaction_output=1, witness_input=2)
+    assert fee_calculator(transaction_input=2, transaction_output=9, address_type="p2wpkh") == 1356
+    assert fee_calculator(transaction_input=2, transaction_output=9, address_type="p2wpkh-in-p2sh") == 1496
+    with pytest.raises(TypeError, match=r"choose only 'p2pkh', 'p2wpkh' or 'p2wpkh-in-p2sh' types"):
+        fee_calculator(transaction_input=1, transaction_output=1, address_type="p2wsh")
+
     assert decode_transaction_raw(transaction_raw=_["bitcoin"]["fund"]["unsigned"]["transaction_raw"]) == \
         {
             "fee": _["bitcoin"]["fund"]["unsigned"]["fee"],
@@ -1,9 +1,16 @@
 #!/usr/bin/env python3
 
+import pytest
 import json
 import os
 
+from hdwallet.cryptocurrencies import BitcoinTestnet
+
+from swap.crypto import HDWallet
+from swap.exceptions import AddressError
+from swap.providers.bitcoin import wallet as wallet_module
 from swap.providers.bitcoin.wallet import Wallet
+from swap.providers.bitcoin.utils import is_address
 
 # Test Values
 base_path = os.path.dirname(__file__)
@@ -191,3 +198,95 @@ def test_bitcoin_wallet_from_private_key():
 
     # assert isinstance(wallet.balance(), int)
     # assert isinstance(wallet.utxos(), list)
+
+
+def test_bitcoin_wallet_derive_range():
+
+    wallet = Wallet(network=_["bitcoin"]["network"])
+
+    wallet.from_entropy(
+        entropy=_["bitcoin"]["wallet"]["sender"]["entropy"],
+        language=_["bitcoin"]["wallet"]["sender"]["language"],
+        passphrase=_["bitcoin"]["wallet"]["sender"]["passphrase"]
+    )
+
+    addresses = wallet.derive_range(account=0, change=False, start=0, count=3)
+    assert [address["index"] for address in addresses] == [0, 1, 2]
+    assert wallet.derive_range(account=0, change=False, start=1, count=2) == addresses[1:]
+    assert wallet.derive_range(account=0, change=False, start=0, count=0) == []
+
+    for account, change, address in [(0, False, 2), (1, True, 5)]:
+        wallet.clean_derivation()
+        wallet.from_path(path=f"m/44'/0'/{account}'/{1 if change else 0}/{address}")
+        assert wallet.derive_range(account=account, change=change, start=address, count=1) == [dict(
+            index=address, address=wallet.address(), public_key=wallet.public_key()
+        )]
+
+def test_bitcoin_wallet_derive_range_xpublic_key(monkeypatch):
+
+    wallet = Wallet(network=_["bitcoin"]["network"])
+    wallet.from_xprivate_key(xprivate_key=_["bitcoin"]["wallet"]["sender"]["root_xprivate_key"])
+    wallet.from_path(path="m/44'/0'/0'")
+    account_xpublic_key = wallet.xpublic_key()
+
+    wallet = Wallet(network=_["bitcoin"]["network"])
+    wallet.from_xprivate_key(xprivate_key=_["bitcoin"]["wallet"]["sender"]["root_xprivate_key"])
+    watch_only_wallet = Wallet(network=_["bitcoin"]["network"])
+    watch_only_wallet.from_xpublic_key(xpublic_key=account_xpublic_key, strict=False)
+
+    for change in [False, True]:
+        assert watch_only_wallet.derive_range(change=change, start=2, count=3) == \
+            wallet.derive_range(change=change, start=2, count=3)
+    # Account nodes are cached by the root key hash, not by the root xprivate key
+    assert all(
+        _["bitcoin"]["wallet"]["sender"]["root_xprivate_key"] not in key and account_xpublic_key not in key
+        for key in list(wallet._account_nodes) + list(watch_only_wallet._account_nodes)
+    )
+
+    used_address = wallet.derive_range(change=False, start=1, count=1)[0]["address"]
+    monkeypatch.setattr(wallet_module, "_address_activity", lambda network, limit, record: (
+        dict(used=True, balance=5, utxos=[]) if record["address"] == used_address else dict(used=False, balance=0, utxos=[])
+    ))
+    scan = watch_only_wallet.scan(gap=3)
+    assert (scan["balance"], scan["receive_index"], scan["change_index"]) == (5, 2, 0)
+    assert [address["address"] for address in scan["addresses"]] == [used_address]
+
+    with pytest.raises(ValueError, match=r"wallet from xpublic key has only account 0"):
+        watch_only_wallet.derive_range(account=1)
+
+    # Root and address xpublic keys are not account nodes
+    for xpublic_key in [
+        wallet.root_xpublic_key(), wallet.clean_derivation().from_path(path="m/44'/0'/0'/0").xpublic_key()
+    ]:
+        watch_only_wallet = Wallet(network=_["bitcoin"]["network"])
+        watch_only_wallet.from_xpublic_key(xpublic_key=xpublic_key, strict=False)
+        with pytest.raises(ValueError, match=r"choose only account xpublic key of depth 3"):
+            watch_only_wallet.derive_range()
+
+
+def test_bitcoin_wallet_address_type():
+
+    hdwallet = HDWallet(cryptocurrency=BitcoinTestnet).from_xprivate_key(
+        xprivate_key=_["bitcoin"]["wallet"]["sender"]["root_xprivate_key"]
+    ).from_path(path=_["bitcoin"]["wallet"]["sender"]["derivation"]["path"])
+
+    for address_type, address in [
+        ("p2pkh", _["bitcoin"]["wallet"]["sender"]["address"]),
+        ("p2wpkh", hdwallet.p2wpkh_address()),
+        ("p2wpkh-in-p2sh", hdwallet.p2wpkh_in_p2sh_address())
+    ]:
+        wallet = Wallet(network=_["bitcoin"]["network"], address_type=address_type)
+        wallet.from_xprivate_key(xprivate_key=_["bitcoin"]["wallet"]["sender"]["root_xprivate_key"])
+        wallet.from_path(path=_["bitcoin"]["wallet"]["sender"]["derivation"]["path"])
+
+        assert wallet.address() == address
+        assert is_address(address=wallet.address(), network=_["bitcoin"]["network"])
+
+        wallet.clean_derivation()
+        wallet.from_path(path="m/44'/0'/0'/0/1")
+        assert wallet.derive_range(start=1, count=1) == [dict(
+            index=1, address=wallet.address(), public_key=wallet.public_key()
+        )]
+
+    with pytest.raises(AddressError, match="Invalid Bitcoin 'p2wsh' address type"):
+        Wallet(network=_["bitcoin"]["network"], address_type="p2wsh")
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+
+import pytest
+import json
+import os
+
+from swap.providers.bitcoin.wallet import Wallet
+from swap.providers.bitcoin.watch import WatchOnlyWallet
+from swap.providers.bitcoin.transaction import NormalTransaction
+from swap.providers.bitcoin.utils import get_address_hash
+from swap.providers.bitcoin import watch
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "..", "..", "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+
+def test_bitcoin_watch_only_wallet(tmp_path, monkeypatch):
+
+    wallet = Wallet(network=_["bitcoin"]["network"])
+    wallet.from_entropy(entropy=_["bitcoin"]["wallet"]["sender"]["entropy"])
+    receive, change = wallet.derive_range(count=2), wallet.derive_range(change=True, count=1)
+    xpublic_key = wallet.from_path(path="m/44'/0'/0'").xpublic_key()
+
+    def utxo(tx_hash, value, block_height, address):
+        return dict(
+            tx_hash=tx_hash * 64, tx_output_n=0, value=value, block_height=block_height,
+            script=get_address_hash(address=address, script=True).hexlify()
+        )
+
+    # Receive 0 and change 0 are used, change 0 UTXO is unconfirmed
+    network = {
+        receive[0]["address"]: (1, [utxo("a", 100000, 1900000, receive[0]["address"])]),
+        change[0]["address"]: (1, [utxo("b", 5000, 0, change[0]["address"])])
+    }
+    requests = []
+
+    def get_transaction_count(address, network):
+        return network_state(address)[0]
+
+    def get_utxos(address, network, limit):
+        requests.append(address)
+        return network_state(address)[1]
+
+    def network_state(address):
+        return network.get(address, (0, []))
+
+    monkeypatch.setattr(watch, "get_transaction_count", get_transaction_count)
+    monkeypatch.setattr(watch, "get_utxos", get_utxos)
+
+    database = str(tmp_path / "watch.sqlite")
+    with WatchOnlyWallet(xpublic_key=xpublic_key, network=_["bitcoin"]["network"], database=database) as watch_only_wallet:
+        assert watch_only_wallet.derive_range(count=2) == receive
+        assert watch_only_wallet.derive_range(change=True, count=1) == change
+
+        assert watch_only_wallet.sync(gap=3, workers=2) == dict(
+            balance=105000, receive_index=1, change_index=1,
+            updated=sorted([receive[0]["address"], change[0]["address"]])
+        )
+        assert len(watch_only_wallet.addresses()) == 8
+        assert [address["address"] for address in watch_only_wallet.addresses(used=True)] == \
+            [receive[0]["address"], change[0]["address"]]
+        assert len(watch_only_wallet.addresses(change=True, used=False)) == 3
+        assert watch_only_wallet.balance(unit="BTC") == 0.00105
+        assert watch_only_wallet.balance(address=change[0]["address"]) == 5000
+        assert [_utxo["value"] for _utxo in watch_only_wallet.utxos()] == [100000, 5000]
+        assert watch_only_wallet.utxos(limit=1)[0]["confirmed"]
+
+        # Unchanged confirmed addresses are not fetched again, unconfirmed UTXO's are
+        requests.clear()
+        assert watch_only_wallet.sync(gap=3)["updated"] == [change[0]["address"]]
+        assert requests == [change[0]["address"]]
+
+        # Receive 0 UTXO is spent to receive 1
+        network[receive[0]["address"]] = (2, [])
+        network[receive[1]["address"]] = (1, [utxo("c", 90000, 1900001, receive[1]["address"])])
+        network[change[0]["address"]] = (1, [utxo("b", 5000, 1900001, change[0]["address"])])
+        scan = watch_only_wallet.sync(gap=3)
+        assert (scan["balance"], scan["receive_index"], scan["change_index"]) == (95000, 2, 1)
+        assert len(watch_only_wallet.addresses()) == 9
+
+        requests.clear()
+        assert watch_only_wallet.sync(gap=3)["updated"] == []
+        assert requests == []
+
+        normal_transaction = NormalTransaction(network=_["bitcoin"]["network"])
+        normal_transaction.build_transaction(
+            address=receive[1]["address"], recipients={receive[0]["address"]: 10000},
+            utxos=watch_only_wallet.utxos(address=receive[1]["address"])
+        )
+        assert normal_transaction.fee() == 576
+        assert requests == []
+
+    # Local UTXO set persists in the database
+    with WatchOnlyWallet(xpublic_key=xpublic_key, network=_["bitcoin"]["network"], database=database) as watch_only_wallet:
+        assert watch_only_wallet.balance() == 95000
+        assert watch_only_wallet.utxos(address=receive[1]["address"])[0]["tx_hash"] == "c" * 64
+
+    with pytest.raises(ValueError, match=r"tracks another xpublic key or network"):
+        WatchOnlyWallet(
+            xpublic_key=wallet.clean_derivation().from_path(path="m/44'/0'/1'").xpublic_key(),
+            network=_["bitcoin"]["network"], database=database
+        )
+    with pytest.raises(ValueError, match=r"Invalid Bitcoin 'tpub.*' xpublic key"):
+        WatchOnlyWallet(xpublic_key=xpublic_key, network="mainnet")
+    with pytest.raises(ValueError, match=r"Invalid Bitcoin 'meheret' xpublic key"):
+        WatchOnlyWallet(xpublic_key="meheret", network=_["bitcoin"]["network"])
+    with pytest.raises(ValueError, match=r"choose only account xpublic key of depth 3"):
+        WatchOnlyWallet(xpublic_key=wallet.clean_derivation().root_xpublic_key(), network=_["bitcoin"]["network"])
@@ -1,9 +1,15 @@
 #!/usr/bin/env python3
 
+import pytest
 import json
 import os
 
-from swap.providers.bytom.htlc import HTLC
+from swap.exceptions import NetworkError
+from swap.providers.config import bytom as config
+from swap.providers.bytom.htlc import (
+    HTLC, build_many
+)
+from swap.providers.bytom import htlc
 
 # Test Values
 base_path = os.path.dirname(__file__)
@@ -36,3 +42,72 @@ def test_bytom_htlc():
     assert htlc.opcode() is None
     assert htlc.hash() == _["bytom"]["htlc"]["hash"]
     assert htlc.contract_address() == _["bytom"]["htlc"]["contract_address"]
+
+
+def test_bytom_htlc_build_many():
+
+    agreements = dict(
+        secret_hash=_["bytom"]["htlc"]["secret"]["hash"],
+        recipient_public_key=_["bytom"]["wallet"]["recipient"]["public_key"],
+        sender_public_key=_["bytom"]["wallet"]["sender"]["public_key"],
+        endblock=_["bytom"]["htlc"]["endblock"]
+    )
+
+    assert build_many(htlcs=[agreements], network=_["bytom"]["network"]) == [dict(
+        bytecode=_["bytom"]["htlc"]["bytecode"],
+        hash=_["bytom"]["htlc"]["hash"],
+        contract_address=_["bytom"]["htlc"]["contract_address"]
+    )]
+    for network in ["mainnet", "solonet", "testnet"]:
+        for endblock in [1, 16, 17, 128, 2147483648]:
+            htlc = HTLC(network=network).build_htlc(**dict(agreements, endblock=endblock))
+            assert build_many(htlcs=[dict(agreements, endblock=endblock)], network=network) == [dict(
+                bytecode=htlc.bytecode(), hash=htlc.hash(), contract_address=htlc.contract_address()
+            )]
+
+    assert build_many(htlcs=[], network=_["bytom"]["network"]) == []
+    with pytest.raises(NetworkError, match=r"Invalid Bytom 'regtest' network"):
+        build_many(htlcs=[agreements], network="regtest")
+    with pytest.raises(ValueError, match=r"Invalid secret hash, length must be 64"):
+        build_many(htlcs=[dict(agreements, secret_hash="meheret")], network=_["bytom"]["network"])
+    with pytest.raises(ValueError, match=r"Invalid Bytom recipient public key, length must be 64"):
+        build_many(htlcs=[dict(agreements, recipient_public_key="meheret")], network=_["bytom"]["network"])
+    with pytest.raises(ValueError, match=r"Invalid Bytom sender public key, length must be 64"):
+        build_many(htlcs=[dict(agreements, sender_public_key="meheret")], network=_["bytom"]["network"])
+
+
+def test_bytom_htlc_use_script(monkeypatch):
+
+    compiled = []
+
+    class Equity:
+
+        def __init__(self, url):
+            self.url = url
+
+        def compile_source(self, source, args):
+            compiled.append((self.url, args))
+            return dict(program=_["bytom"]["htlc"]["bytecode"], name="HTLC")
+
+    monkeypatch.setattr(htlc, "Equity", Equity)
+
+    # Equity compilation is cached by the HTLC agreements
+    for _index in range(3):
+        assert HTLC(network=_["bytom"]["network"]).build_htlc(
+            secret_hash=_["bytom"]["htlc"]["secret"]["hash"],
+            recipient_public_key=_["bytom"]["wallet"]["recipient"]["public_key"],
+            sender_public_key=_["bytom"]["wallet"]["sender"]["public_key"],
+            endblock=7, use_script=True
+        ).bytecode() == _["bytom"]["htlc"]["bytecode"]
+    assert compiled == [(config[_["bytom"]["network"]]["bytom-core"], [
+        _["bytom"]["htlc"]["secret"]["hash"], _["bytom"]["wallet"]["recipient"]["public_key"],
+        _["bytom"]["wallet"]["sender"]["public_key"], 7
+    ])]
+
+    HTLC(network=_["bytom"]["network"]).build_htlc(
+        secret_hash=_["bytom"]["htlc"]["secret"]["hash"],
+        recipient_public_key=_["bytom"]["wallet"]["recipient"]["public_key"],
+        sender_public_key=_["bytom"]["wallet"]["sender"]["public_key"],
+        endblock=8, use_script=True
+    )
+    assert len(compiled) == 2
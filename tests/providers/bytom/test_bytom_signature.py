@@ -2,9 +2,10 @@
 
 import json
 import os
+from functools import partial
 
 from swap.providers.bytom.signature import (
-    Signature, NormalSignature, FundSignature, WithdrawSignature, RefundSignature
+    Signature, NormalSignature, FundSignature, WithdrawSignature, RefundSignature, sign_many
 )
 from swap.providers.bytom.solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
@@ -184,3 +185,39 @@ def test_bytom_refund_signature():
     assert refund_signature.transaction_raw() == clean_transaction_raw(
         transaction_raw=_["bytom"]["refund"]["signed"]["transaction_raw"]
     )
+
+
+def test_bytom_sign_many():
+
+    fund_solver_factory = partial(
+        FundSolver,
+        xprivate_key=_["bytom"]["wallet"]["sender"]["xprivate_key"],
+        path=_["bytom"]["wallet"]["sender"]["derivation"]["path"],
+        account=_["bytom"]["wallet"]["sender"]["derivation"]["account"],
+        change=_["bytom"]["wallet"]["sender"]["derivation"]["change"],
+        address=_["bytom"]["wallet"]["sender"]["derivation"]["address"]
+    )
+
+    for workers in [1, 2]:
+        signed = sign_many(
+            transaction_raws=[
+                _["bytom"]["fund"]["unsigned"]["transaction_raw"],
+                "meheret",
+                _["bytom"]["withdraw"]["unsigned"]["transaction_raw"]
+            ],
+            solver_factory=fund_solver_factory,
+            workers=workers,
+            network=_["bytom"]["network"]
+        )
+
+        assert len(signed) == 3
+        assert signed[0]["error"] is None
+        assert signed[0]["transaction_raw"] == clean_transaction_raw(
+            transaction_raw=_["bytom"]["fund"]["signed"]["transaction_raw"]
+        )
+        assert signed[1]["transaction_raw"] is None
+        assert signed[1]["error"].startswith("TransactionRawError: Invalid transaction raw.")
+        assert signed[2]["transaction_raw"] is None
+        assert signed[2]["error"] == "TypeError: Solver must be Bytom WithdrawSolver, not FundSolver type."
+
+    assert sign_many(transaction_raws=[], solver_factory=fund_solver_factory) == []
@@ -1,9 +1,15 @@
 #!/usr/bin/env python3
 
+from functools import partial
+
 import json
+import pytest
 import os
 
-from swap.providers.bytom.wallet import Wallet
+from swap.providers.bytom.wallet import (
+    Wallet, _derive_addresses
+)
+from swap.utils import _derive_range
 
 # Test Values
 base_path = os.path.dirname(__file__)
@@ -181,3 +187,41 @@ def test_bytom_wallet_from_private_key():
 
     # assert isinstance(wallet.balance(), int)
     # assert isinstance(wallet.utxos(), list)
+
+
+def test_bytom_wallet_derive_range():
+
+    wallet = Wallet(network=_["bytom"]["network"])
+
+    wallet.from_entropy(
+        entropy=_["bytom"]["wallet"]["sender"]["entropy"],
+        language=_["bytom"]["wallet"]["sender"]["language"],
+        passphrase=_["bytom"]["wallet"]["sender"]["passphrase"]
+    )
+
+    assert wallet.derive_range(
+        account=_["bytom"]["wallet"]["sender"]["derivation"]["account"],
+        change=_["bytom"]["wallet"]["sender"]["derivation"]["change"],
+        start=_["bytom"]["wallet"]["sender"]["derivation"]["address"], count=1
+    ) == [dict(
+        index=_["bytom"]["wallet"]["sender"]["derivation"]["address"],
+        address=_["bytom"]["wallet"]["sender"]["address"],
+        public_key=_["bytom"]["wallet"]["sender"]["public_key"]
+    )]
+
+    addresses = wallet.derive_range(account=0, change=True, start=0, count=5)
+    assert [address["index"] for address in addresses] == [0, 1, 2, 3, 4]
+    assert wallet.derive_range(account=0, change=True, start=3, count=2) == addresses[3:]
+
+    wallet.from_path(path="m/44/153/0/1/4")
+    assert addresses[4] == dict(index=4, address=wallet.address(), public_key=wallet.public_key())
+
+    assert _derive_range(
+        derive=partial(_derive_addresses, _["bytom"]["network"], wallet._account_nodes[(wallet.xpublic_key(), 0, True)]),
+        start=0, count=5, workers=2, chunk_size=2
+    ) == addresses
+
+    with pytest.raises(ValueError, match=r"Invalid '-1' start or '1' count"):
+        wallet.derive_range(start=-1, count=1)
+    with pytest.raises(ValueError, match=r"Invalid workers '0'"):
+        wallet.derive_range(count=1, workers=0)
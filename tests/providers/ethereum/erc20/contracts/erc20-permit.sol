@@ -0,0 +1,76 @@
+// SPDX-License-Identifier: AGPL-3.0
+
+pragma solidity ^0.8.10;
+
+/**
+ * @title Mintable ERC20 token with EIP-2612 permit, only for HTLC tests.
+ */
+contract ERC20_PERMIT {
+
+    string public name;
+    string public symbol;
+    uint8 public constant decimals = 18;
+    uint256 public totalSupply;
+
+    mapping (address => uint256) public balanceOf;
+    mapping (address => mapping (address => uint256)) public allowance;
+    mapping (address => uint256) public nonces;
+
+    bytes32 public constant PERMIT_TYPEHASH = keccak256(
+        "Permit(address owner,address spender,uint256 value,uint256 nonce,uint256 deadline)"
+    );
+    bytes32 public immutable DOMAIN_SEPARATOR;
+
+    event Transfer (address indexed from, address indexed to, uint256 value);
+    event Approval (address indexed owner, address indexed spender, uint256 value);
+
+    constructor (string memory name_, string memory symbol_) {
+        name = name_;
+        symbol = symbol_;
+        DOMAIN_SEPARATOR = keccak256(abi.encode(
+            keccak256("EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)"),
+            keccak256(bytes(name_)), keccak256(bytes("1")), block.chainid, address(this)
+        ));
+    }
+
+    function mint (address to, uint256 value) external {
+        totalSupply += value;
+        balanceOf[to] += value;
+        emit Transfer(address(0), to, value);
+    }
+
+    function approve (address spender, uint256 value) external returns (bool) {
+        allowance[msg.sender][spender] = value;
+        emit Approval(msg.sender, spender, value);
+        return true;
+    }
+
+    function transfer (address to, uint256 value) external returns (bool) {
+        _transfer(msg.sender, to, value);
+        return true;
+    }
+
+    function transferFrom (address from, address to, uint256 value) external returns (bool) {
+        allowance[from][msg.sender] -= value;
+        _transfer(from, to, value);
+        return true;
+    }
+
+    function permit (address owner, address spender, uint256 value, uint256 deadline, uint8 v, bytes32 r, bytes32 s) external {
+        require(deadline >= block.timestamp, "ERC20_PERMIT: expired deadline");
+        bytes32 digest = keccak256(abi.encodePacked(
+            "\x19\x01", DOMAIN_SEPARATOR,
+            keccak256(abi.encode(PERMIT_TYPEHASH, owner, spender, value, nonces[owner]++, deadline))
+        ));
+        address signer = ecrecover(digest, v, r, s);
+        require(signer != address(0) && signer == owner, "ERC20_PERMIT: invalid signature");
+        allowance[owner][spender] = value;
+        emit Approval(owner, spender, value);
+    }
+
+    function _transfer (address from, address to, uint256 value) internal {
+        balanceOf[from] -= value;
+        balanceOf[to] += value;
+        emit Transfer(from, to, value);
+    }
+}
@@ -2,6 +2,7 @@
 
 import json
 import os
+import pytest
 
 from swap.providers.ethereum.htlc import HTLC
 from swap.providers.ethereum.transaction import (
@@ -10,7 +11,13 @@ from swap.providers.ethereum.transaction import (
 from swap.providers.ethereum.solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
 )
-from swap.utils import get_current_timestamp
+from swap.utils import (
+    get_current_timestamp, sha256
+)
+
+from ..test_ethereum_transaction import (
+    _eth_tester_web3, _deploy_htlc, _send_transaction
+)
 
 # Test Values
 base_path = os.path.dirname(__file__)
@@ -179,3 +186,69 @@ def test_ethereum_erc20_refund_transaction():
     assert isinstance(signed_erc20_refund_transaction.json(), dict)
     assert isinstance(signed_erc20_refund_transaction.signature(), dict)
     assert isinstance(signed_erc20_refund_transaction.transaction_raw(), str)
+
+
+def test_ethereum_erc20_permit_fund_transaction(monkeypatch):
+
+    ethereum_tester, web3 = _eth_tester_web3(monkeypatch=monkeypatch)
+    htlc = _deploy_htlc(web3=web3, erc20=True)
+    solcx = pytest.importorskip("solcx")
+    from swap.compiler import compile_contract
+    try:
+        erc20_permit = compile_contract(
+            source_file=os.path.join(base_path, "contracts", "erc20-permit.sol"), contract_name="ERC20_PERMIT"
+        )
+    except solcx.exceptions.SolcNotInstalled as exception:
+        pytest.skip(f"ERC20 permit token is not compiled, {exception}")
+
+    token_address = web3.eth.wait_for_transaction_receipt(
+        web3.eth.contract(abi=erc20_permit["abi"], bytecode=erc20_permit["bin"]).constructor(
+            "Permit Token", "PERMIT"
+        ).transact({"from": web3.eth.accounts[0]})
+    )["contractAddress"]
+    token_contract = web3.eth.contract(address=token_address, abi=erc20_permit["abi"])
+    web3.eth.wait_for_transaction_receipt(token_contract.functions.mint(
+        _["ethereum"]["wallet"]["sender"]["address"], 10_000
+    ).transact({"from": web3.eth.accounts[0]}))
+
+    erc20_htlc = HTLC(
+        contract_address=htlc.contract_address(), network=_["ethereum"]["network"], erc20=True, version="v2"
+    ).build_htlc(
+        secret_hash=sha256("Hello Meheret!"),
+        recipient_address=_["ethereum"]["wallet"]["recipient"]["address"],
+        sender_address=_["ethereum"]["wallet"]["sender"]["address"],
+        endtime=web3.eth.get_block("latest")["timestamp"] + 3600,
+        token_address=token_address
+    )
+
+    # No approve transaction, the permit signature sets the allowance inside fund_with_permit
+    assert token_contract.functions.allowance(
+        _["ethereum"]["wallet"]["sender"]["address"], htlc.contract_address()
+    ).call() == 0
+    erc20_fund_transaction = FundTransaction(network=_["ethereum"]["network"], erc20=True).build_transaction(
+        address=_["ethereum"]["wallet"]["sender"]["address"], htlc=erc20_htlc, amount=2_500,
+        permit_solver=FundSolver(
+            xprivate_key=_["ethereum"]["wallet"]["sender"]["root_xprivate_key"],
+            path=_["ethereum"]["wallet"]["sender"]["derivation"]["path"]
+        )
+    )
+    assert erc20_fund_transaction.json()["data"].startswith(web3.keccak(
+        text="fund_with_permit(address,bytes32,address,address,uint256,uint256,uint256,uint8,bytes32,bytes32)"
+    )[:4].hex())
+    fund_receipt = _send_transaction(
+        web3=web3, transaction=erc20_fund_transaction, solver=FundSolver, wallet="sender"
+    )
+
+    log_funds = web3.eth.contract(address=htlc.contract_address(), abi=htlc.abi()).events.log_fund().processReceipt(
+        fund_receipt
+    )
+    assert [(log_fund["args"]["token"], log_fund["args"]["amount"]) for log_fund in log_funds] == [
+        (token_address, 2_500)
+    ]
+    assert token_contract.functions.balanceOf(htlc.contract_address()).call() == 2_500
+    assert token_contract.functions.balanceOf(_["ethereum"]["wallet"]["sender"]["address"]).call() == 7_500
+    # The permitted allowance is spent by transferFrom and the permit nonce is used
+    assert token_contract.functions.allowance(
+        _["ethereum"]["wallet"]["sender"]["address"], htlc.contract_address()
+    ).call() == 0
+    assert token_contract.functions.nonces(_["ethereum"]["wallet"]["sender"]["address"]).call() == 1
@@ -2,8 +2,13 @@
 
 import json
 import os
+import pytest
 
+from swap.providers.ethereum import htlc as htlc_module
 from swap.providers.ethereum.htlc import HTLC
+from swap.providers.ethereum.transaction import (
+    FundTransaction, WithdrawTransaction, RefundTransaction
+)
 
 # Test Values
 base_path = os.path.dirname(__file__)
@@ -34,3 +39,55 @@ def test_ethereum_htlc():
     assert htlc.agreements["sender_address"] == _["ethereum"]["htlc"]["agreements"]["sender_address"]
     # assert htlc.agreements["endtime"]["datetime"] == _["ethereum"]["htlc"]["agreements"]["endtime"]["datetime"]
     assert htlc.agreements["endtime"]["timestamp"] == _["ethereum"]["htlc"]["agreements"]["endtime"]["timestamp"]
+
+
+def test_ethereum_htlc_version():
+
+    with pytest.raises(ValueError, match=r"Invalid Ethereum HTLC 'v3' version, .*"):
+        HTLC(network=_["ethereum"]["network"], version="v3")
+    with pytest.raises(ValueError, match=r"Invalid Ethereum HTLC 'v3' version, .*"):
+        WithdrawTransaction(network=_["ethereum"]["network"], version="v3")
+
+
+def test_ethereum_htlc_v2_unreleased(monkeypatch, tmp_path):
+
+    # No shipped v2 artifacts, like the package without precompiled v2 contracts
+    monkeypatch.setattr(htlc_module, "__file__", str(tmp_path / "htlc.py"))
+    with pytest.raises(ValueError, match=r"Ethereum HTLC 'v2' version is not released yet, .*"):
+        HTLC(network=_["ethereum"]["network"], version="v2")
+    with pytest.raises(ValueError, match=r"Ethereum HTLC 'v2' version is not released yet, .*"):
+        HTLC(network=_["ethereum"]["network"], erc20=True, version="v2")
+    with pytest.raises(ValueError, match=r"Ethereum HTLC 'v2' version is not released yet, .*"):
+        WithdrawTransaction(network=_["ethereum"]["network"], version="v2")
+
+
+def test_ethereum_htlc_batch():
+
+    htlc = HTLC(
+        contract_address=_["ethereum"]["htlc"]["contract_address"], network=_["ethereum"]["network"]
+    ).build_htlc(
+        secret_hash=_["ethereum"]["htlc"]["secret"]["hash"],
+        recipient_address=_["ethereum"]["wallet"]["recipient"]["address"],
+        sender_address=_["ethereum"]["wallet"]["sender"]["address"],
+        endtime=_["ethereum"]["htlc"]["endtime"]
+    )
+
+    with pytest.raises(ValueError, match=r"Ethereum HTLC 'v1' version has no batch functions, .*"):
+        FundTransaction(network=_["ethereum"]["network"]).build_transaction(
+            address=_["ethereum"]["wallet"]["sender"]["address"], htlc=[(htlc, 1), (htlc, 2)]
+        )
+    with pytest.raises(ValueError, match=r"Amount must be None when funding multiple HTLC's, .*"):
+        FundTransaction(network=_["ethereum"]["network"]).build_transaction(
+            address=_["ethereum"]["wallet"]["sender"]["address"], htlc=[(htlc, 1)], amount=1
+        )
+    with pytest.raises(ValueError, match=r"Ethereum HTLC 'v1' version has no batch functions, .*"):
+        WithdrawTransaction(network=_["ethereum"]["network"]).build_transaction(
+            transaction_hash=[_["ethereum"]["transaction_hash"]] * 2,
+            address=_["ethereum"]["wallet"]["recipient"]["address"],
+            secret_key=_["ethereum"]["htlc"]["secret"]["key"]
+        )
+    with pytest.raises(ValueError, match=r"Ethereum HTLC 'v1' version has no batch functions, .*"):
+        RefundTransaction(network=_["ethereum"]["network"]).build_transaction(
+            transaction_hash=[_["ethereum"]["transaction_hash"]] * 2,
+            address=_["ethereum"]["wallet"]["sender"]["address"]
+        )
@@ -1,11 +1,19 @@
 #!/usr/bin/env python3
 
+from http.server import (
+    HTTPServer, BaseHTTPRequestHandler
+)
+
+import threading
 import pytest
 import json
 import os
 
+from swap.exceptions import APIError
+from swap.providers.config import ethereum as config
+from swap.providers.ethereum import rpc
 from swap.providers.ethereum.rpc import (
-    decode_raw, submit_raw
+    decode_raw, submit_raw, get_web3
 )
 
 # Test Values
@@ -16,6 +24,33 @@ _ = json.loads(values.read())
 values.close()
 
 
+def rpc_server(fail: bool):
+    # Local JSON-RPC provider, answers the health check and fails other requests when fail is set
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            requests.append(request["method"])
+            if fail and request["method"] != "eth_blockNumber":
+                self.send_response(500)
+                self.end_headers()
+                return
+            body = json.dumps(dict(jsonrpc="2.0", id=request["id"], result="0x1")).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}", requests
+
+
 def test_ethereum_rpc():
 
     assert decode_raw(
@@ -28,3 +63,60 @@ def test_ethereum_rpc():
             raw=_["xinfin"]["fund"]["signed"]["raw"],
             network=_["ethereum"]["network"]
         )
+
+
+def test_ethereum_rpc_get_web3():
+
+    # Web3 instances are kept per provider uri
+    assert get_web3(network="testnet", provider="http") is get_web3(network="testnet", provider="http")
+    assert get_web3(network="testnet", provider="http") is not get_web3(network="testnet", provider="websocket")
+
+    with pytest.raises(ValueError, match=r"There is no Ethereum IPC path on 'testnet' network."):
+        get_web3(network="testnet", provider="ipc")
+    with pytest.raises(ValueError, match=r"Invalid Ethereum 'meheret' provider"):
+        get_web3(network="testnet", provider="meheret")
+
+    providers = config["testnet"]["providers"]
+    config["testnet"]["providers"] = ["/tmp/swap-meheret.ipc", "http://127.0.0.1:1"]
+    try:
+        with pytest.raises(APIError, match=r"There is no healthy Ethereum provider on 'testnet' network."):
+            get_web3(network="testnet", provider="auto")
+    finally:
+        config["testnet"]["providers"] = providers
+
+
+def test_ethereum_rpc_failover(monkeypatch):
+
+    failing_server, failing_uri, failing_requests = rpc_server(fail=True)
+    healthy_server, healthy_uri, healthy_requests = rpc_server(fail=False)
+    # Failing provider passes the health check with the lowest latency and is selected first
+    monkeypatch.setattr(rpc, "_latency", lambda web3: (
+        0.1 if web3.provider.endpoint_uri == failing_uri else 0.2
+    ))
+    monkeypatch.setitem(config["testnet"], "providers", [failing_uri, healthy_uri])
+    monkeypatch.setattr(rpc, "_selected", {})
+    try:
+        web3 = get_web3(network="testnet", provider="auto")
+        assert rpc._selected["testnet"][0] == failing_uri
+
+        # Failed request drops the cached selection and is retried on the next provider
+        assert web3.eth.chain_id == 1
+        assert failing_requests == ["eth_chainId"]
+        assert healthy_requests == ["eth_chainId"]
+        assert rpc._selected["testnet"][0] == healthy_uri
+
+        # Next requests go to the newly selected provider only
+        assert web3.eth.gas_price == 1
+        assert failing_requests == ["eth_chainId"]
+        assert healthy_requests == ["eth_chainId", "eth_gasPrice"]
+        assert get_web3(network="testnet", provider="auto") is web3
+
+        # Every provider failing raises once there is no healthy one left
+        healthy_server.shutdown()
+        healthy_server.server_close()
+        with pytest.raises(APIError, match=r"There is no healthy Ethereum provider on 'testnet' network."):
+            web3.eth.gas_price
+        assert failing_requests == ["eth_chainId", "eth_gasPrice"]
+    finally:
+        failing_server.shutdown()
+        failing_server.server_close()
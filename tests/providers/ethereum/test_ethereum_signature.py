@@ -2,9 +2,10 @@
 
 import json
 import os
+from functools import partial
 
 from swap.providers.ethereum.signature import (
-    Signature, NormalSignature, FundSignature, WithdrawSignature, RefundSignature
+    Signature, NormalSignature, FundSignature, WithdrawSignature, RefundSignature, sign_many
 )
 from swap.providers.ethereum.solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
@@ -181,3 +182,39 @@ def test_ethereum_refund_signature():
     assert refund_signature.transaction_raw() == clean_transaction_raw(
         transaction_raw=_["ethereum"]["refund"]["signed"]["transaction_raw"]
     )
+
+
+def test_ethereum_sign_many():
+
+    fund_solver_factory = partial(
+        FundSolver,
+        xprivate_key=_["ethereum"]["wallet"]["sender"]["root_xprivate_key"],
+        path=_["ethereum"]["wallet"]["sender"]["derivation"]["path"],
+        account=_["ethereum"]["wallet"]["sender"]["derivation"]["account"],
+        change=_["ethereum"]["wallet"]["sender"]["derivation"]["change"],
+        address=_["ethereum"]["wallet"]["sender"]["derivation"]["address"]
+    )
+
+    for workers in [1, 2]:
+        signed = sign_many(
+            transaction_raws=[
+                _["ethereum"]["fund"]["unsigned"]["transaction_raw"],
+                "meheret",
+                _["ethereum"]["withdraw"]["unsigned"]["transaction_raw"]
+            ],
+            solver_factory=fund_solver_factory,
+            workers=workers,
+            network=_["ethereum"]["network"]
+        )
+
+        assert len(signed) == 3
+        assert signed[0]["error"] is None
+        assert signed[0]["transaction_raw"] == clean_transaction_raw(
+            transaction_raw=_["ethereum"]["fund"]["signed"]["transaction_raw"]
+        )
+        assert signed[1]["transaction_raw"] is None
+        assert signed[1]["error"].startswith("TransactionRawError: Invalid transaction raw.")
+        assert signed[2]["transaction_raw"] is None
+        assert signed[2]["error"] == "TypeError: Solver must be Ethereum WithdrawSolver, not 'FundSolver' type."
+
+    assert sign_many(transaction_raws=[], solver_factory=fund_solver_factory) == []
@@ -4,10 +4,12 @@ import pytest
 import json
 import os
 
-from swap.exceptions import TransactionRawError
+from swap.exceptions import (
+    TransactionRawError, AddressError
+)
 from swap.providers.ethereum.utils import (
     is_network, is_address, is_transaction_raw, get_erc20_data,
-    decode_transaction_raw, submit_transaction_raw
+    decode_transaction_raw, submit_transaction_raw, get_permit_hash
 )
 
 # Test Values
@@ -46,3 +48,72 @@ def test_ethereum_utils():
     # Wrong Ethereum transaction raw must be signed, not unsigned transaction raw.
     with pytest.raises(TransactionRawError):
         submit_transaction_raw(transaction_raw=_["ethereum"]["fund"]["unsigned"]["transaction_raw"])
+
+
+def test_ethereum_utils_permit_hash():
+
+    # EIP-712 hash of Permit(owner, spender, 25, 0, 1624687630) on "Meheret Token" version "1", chain id 3
+    assert get_permit_hash(
+        domain_separator="0xa9d4dda5e981ed5d43141828071f56563b795e7c11af56e694b599e697460be3",
+        owner="0x69e04fe16c9A6A83076B3c2dc4b4Bc21b5d9A20C",
+        spender="0x0cc7C744f96729B7f60B12B36A4B9504191CD458",
+        value=25, nonce=0, deadline=1624687630
+    ) == "0x89d1a6beda2b3ae247945ef50590c5ea275c825198b36cf171ee9a75b8ab1d46"
+
+    with pytest.raises(AddressError, match=r"Invalid Ethereum owner 'unknown' address."):
+        get_permit_hash(
+            domain_separator="0xa9d4dda5e981ed5d43141828071f56563b795e7c11af56e694b599e697460be3",
+            owner="unknown", spender="0x0cc7C744f96729B7f60B12B36A4B9504191CD458",
+            value=25, nonce=0, deadline=1624687630
+        )
+
+
+def test_ethereum_utils_permit_signature():
+
+    # EIP-2612 permit of "Permit Token" version "1", chain id 1337, signed by the owner private key
+    from eth_account import Account
+    from eth_account.messages import encode_structured_data
+
+    permit = {
+        "types": {
+            "EIP712Domain": [
+                {"name": "name", "type": "string"}, {"name": "version", "type": "string"},
+                {"name": "chainId", "type": "uint256"}, {"name": "verifyingContract", "type": "address"}
+            ],
+            "Permit": [
+                {"name": "owner", "type": "address"}, {"name": "spender", "type": "address"},
+                {"name": "value", "type": "uint256"}, {"name": "nonce", "type": "uint256"},
+                {"name": "deadline", "type": "uint256"}
+            ]
+        },
+        "primaryType": "Permit",
+        "domain": {
+            "name": "Permit Token", "version": "1", "chainId": 1337,
+            "verifyingContract": "0xF2E246BB76DF876Cef8b38ae84130F4F55De395b"
+        },
+        "message": {
+            "owner": "0x2c7536E3605D9C16a7a3D7b1898e529396a65c23",
+            "spender": "0x0cc7C744f96729B7f60B12B36A4B9504191CD458",
+            "value": 10000, "nonce": 0, "deadline": 1700000000
+        }
+    }
+    domain_separator = "0x1637f52629e790aa973bcd722ece966bc7aabecd10d0c5384e34fd9c2bf10a12"
+    permit_hash = "0x2adc84de84aa91ccf6047170d5b7c254e2d7ab9b13b380474691956fce292f26"
+    v, r, s = (
+        28,
+        0x1277783eea4e75dfa5b7c2353b99594229fe896b74b66d52bc4d5e4e12cf1b2b,
+        0x24be3436a08eba7b3a2723e678f37d550d9f127268c5b6c3c7e631b75719e352
+    )
+
+    assert "0x" + encode_structured_data(permit).header.hex() == domain_separator
+    assert get_permit_hash(
+        domain_separator=domain_separator, **permit["message"]
+    ) == permit_hash
+    private_key = "0x4c0883a69102937d6231471b5dbb6204fe5129617082792ae468d01a3f362318"
+    signed_permit = Account.sign_message(encode_structured_data(permit), private_key)
+    assert signed_permit.messageHash.hex() == permit_hash
+    assert (signed_permit.v, signed_permit.r, signed_permit.s) == (v, r, s)
+    # Fund transaction permit signs the permit hash directly
+    signed_permit = Account.signHash(permit_hash, private_key)
+    assert (signed_permit.v, signed_permit.r, signed_permit.s) == (v, r, s)
+    assert Account.recoverHash(permit_hash, vrs=(v, r, s)) == permit["message"]["owner"]
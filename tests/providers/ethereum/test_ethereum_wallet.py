@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 
+import pytest
 import json
 import os
 
+from swap.providers.ethereum import wallet as wallet_module
 from swap.providers.ethereum.wallet import Wallet
 
 # Test Values
@@ -186,3 +188,67 @@ def test_ethereum_wallet_from_private_key():
     assert wallet.address() == _["ethereum"]["wallet"]["sender"]["address"]
 
     # assert isinstance(wallet.balance(), int)
+
+
+def test_ethereum_wallet_derive_range():
+
+    wallet = Wallet(network=_["ethereum"]["network"])
+
+    wallet.from_entropy(
+        entropy=_["ethereum"]["wallet"]["sender"]["entropy"],
+        language=_["ethereum"]["wallet"]["sender"]["language"],
+        passphrase=_["ethereum"]["wallet"]["sender"]["passphrase"]
+    )
+
+    addresses = wallet.derive_range(account=0, change=False, start=0, count=3)
+    assert [address["index"] for address in addresses] == [0, 1, 2]
+    assert wallet.derive_range(account=0, change=False, start=1, count=2) == addresses[1:]
+    assert wallet.derive_range(account=0, change=False, start=0, count=0) == []
+
+    for account, change, address in [(0, False, 2), (1, True, 5)]:
+        wallet.clean_derivation()
+        wallet.from_path(path=f"m/44'/60'/{account}'/{1 if change else 0}/{address}")
+        assert wallet.derive_range(account=account, change=change, start=address, count=1) == [dict(
+            index=address, address=wallet.address(), public_key=wallet.public_key()
+        )]
+
+def test_ethereum_wallet_derive_range_xpublic_key(monkeypatch):
+
+    wallet = Wallet(network=_["ethereum"]["network"])
+    wallet.from_xprivate_key(xprivate_key=_["ethereum"]["wallet"]["sender"]["root_xprivate_key"])
+    wallet.from_path(path="m/44'/60'/0'")
+    account_xpublic_key = wallet.xpublic_key()
+
+    wallet = Wallet(network=_["ethereum"]["network"])
+    wallet.from_xprivate_key(xprivate_key=_["ethereum"]["wallet"]["sender"]["root_xprivate_key"])
+    watch_only_wallet = Wallet(network=_["ethereum"]["network"])
+    watch_only_wallet.from_xpublic_key(xpublic_key=account_xpublic_key, strict=False)
+
+    for change in [False, True]:
+        assert watch_only_wallet.derive_range(change=change, start=2, count=3) == \
+            wallet.derive_range(change=change, start=2, count=3)
+    # Account nodes are cached by the root key hash, not by the root xprivate key
+    assert all(
+        _["ethereum"]["wallet"]["sender"]["root_xprivate_key"] not in key and account_xpublic_key not in key
+        for key in list(wallet._account_nodes) + list(watch_only_wallet._account_nodes)
+    )
+
+    used_address = wallet.derive_range(change=False, start=1, count=1)[0]["address"]
+    monkeypatch.setattr(wallet_module, "_address_activity", lambda network, provider, token, record: (
+        dict(used=True, balance=5) if record["address"] == used_address else dict(used=False, balance=0)
+    ))
+    scan = watch_only_wallet.scan(gap=3)
+    assert (scan["balance"], scan["receive_index"], scan["change_index"]) == (5, 2, 0)
+    assert [address["address"] for address in scan["addresses"]] == [used_address]
+
+    with pytest.raises(ValueError, match=r"wallet from xpublic key has only account 0"):
+        watch_only_wallet.derive_range(account=1)
+
+    # Root and address xpublic keys are not account nodes
+    for xpublic_key in [
+        wallet.root_xpublic_key(), wallet.clean_derivation().from_path(path="m/44'/60'/0'/0").xpublic_key()
+    ]:
+        watch_only_wallet = Wallet(network=_["ethereum"]["network"])
+        watch_only_wallet.from_xpublic_key(xpublic_key=xpublic_key, strict=False)
+        with pytest.raises(ValueError, match=r"choose only account xpublic key of depth 3"):
+            watch_only_wallet.derive_range()
@@ -13,10 +13,26 @@ def test_config():
     assert bitcoin["mainnet"]["smartbit"] == "https://api.smartbit.com.au/v1/blockchain"
     assert bitcoin["mainnet"]["blockcypher"]["url"] == "https://api.blockcypher.com/v1/btc/main"
     assert bitcoin["mainnet"]["blockcypher"]["token"] == "c6ef693d3c024088810e6fac2a1494ee"
+    assert bitcoin["mainnet"]["bitcoind"]["url"] == "http://localhost:8332"
+    assert bitcoin["mainnet"]["bitcoind"]["username"] is None
+    assert bitcoin["mainnet"]["bitcoind"]["password"] is None
+    assert bitcoin["mainnet"]["bitcoind"]["wallet"] is None
+    assert bitcoin["mainnet"]["electrum"]["host"] == "electrum.blockstream.info"
+    assert bitcoin["mainnet"]["electrum"]["port"] == 50002
+    assert bitcoin["mainnet"]["electrum"]["ssl"] is True
+    assert bitcoin["mainnet"]["backend"] == "blockcypher"
     assert bitcoin["testnet"]["blockchain"] == "https://testnet.blockchain.info"
     assert bitcoin["testnet"]["smartbit"] == "https://testnet-api.smartbit.com.au/v1/blockchain"
     assert bitcoin["testnet"]["blockcypher"]["url"] == "https://api.blockcypher.com/v1/btc/test3"
     assert bitcoin["testnet"]["blockcypher"]["token"] == "c6ef693d3c024088810e6fac2a1494ee"
+    assert bitcoin["testnet"]["bitcoind"]["url"] == "http://localhost:18332"
+    assert bitcoin["testnet"]["bitcoind"]["username"] is None
+    assert bitcoin["testnet"]["bitcoind"]["password"] is None
+    assert bitcoin["testnet"]["bitcoind"]["wallet"] is None
+    assert bitcoin["testnet"]["electrum"]["host"] == "electrum.blockstream.info"
+    assert bitcoin["testnet"]["electrum"]["port"] == 60002
+    assert bitcoin["testnet"]["electrum"]["ssl"] is True
+    assert bitcoin["testnet"]["backend"] == "blockcypher"
     assert bitcoin["path"] == "m/44'/0'/0'/0/0"
     assert bitcoin["bip44_path"] == "m/44'/0'/{account}'/{change}/{address}"
     assert bitcoin["locktime"] == 0
@@ -35,12 +51,15 @@ def test_config():
     assert bytom["mainnet"]["bytom-core"] == "http://localhost:9888"
     assert bytom["mainnet"]["blockmeta"] == "https://classic.blockmeta.com/api/v3"
     assert bytom["mainnet"]["blockcenter"] == "https://ex.movapi.com/bytom/v3"
+    assert bytom["mainnet"]["backend"] == "blockcenter"
     assert bytom["solonet"]["bytom-core"] == "http://localhost:9888"
     assert bytom["solonet"]["blockmeta"] is None
     assert bytom["solonet"]["blockcenter"] is None
+    assert bytom["solonet"]["backend"] == "bytom-core"
     assert bytom["testnet"]["bytom-core"] == "http://localhost:9888"
     assert bytom["testnet"]["blockmeta"] is None
     assert bytom["testnet"]["blockcenter"] is None
+    assert bytom["testnet"]["backend"] == "bytom-core"
     assert bytom["path"] == "m/44/153/1/0/1"
     assert bytom["bip44_path"] == "m/44/153/{account}/{change}/{address}"
     assert bytom["indexes"] == ["2c000000", "99000000", "01000000", "00000000", "01000000"]
@@ -63,34 +82,63 @@ def test_config():
     assert ethereum["mainnet"]["infura"]["http"] == "https://mainnet.infura.io/v3"
     assert ethereum["mainnet"]["infura"]["websocket"] == "wss://mainnet.infura.io/ws/v3"
     assert ethereum["mainnet"]["infura"]["token"] == "4414fea5f7454211956b1627621450b4"
+    assert ethereum["mainnet"]["ipc"] == "~/.ethereum/geth.ipc"
+    assert ethereum["mainnet"]["providers"] == [
+        "~/.ethereum/geth.ipc", "http://localhost:8545", "https://mainnet.infura.io/v3/{token}"
+    ]
     assert ethereum["mainnet"]["contract_addresses"]["htlc"] is None
     assert ethereum["mainnet"]["contract_addresses"]["htlc_erc20"] is None
+    assert ethereum["mainnet"]["contract_addresses"]["htlc_v2"] is None
+    assert ethereum["mainnet"]["contract_addresses"]["htlc_erc20_v2"] is None
     assert ethereum["ropsten"]["infura"]["http"] == "https://ropsten.infura.io/v3"
     assert ethereum["ropsten"]["infura"]["websocket"] == "wss://ropsten.infura.io/ws/v3"
     assert ethereum["ropsten"]["infura"]["token"] == "4414fea5f7454211956b1627621450b4"
+    assert ethereum["ropsten"]["ipc"] == "~/.ethereum/ropsten/geth.ipc"
+    assert ethereum["ropsten"]["providers"] == [
+        "~/.ethereum/ropsten/geth.ipc", "http://localhost:8545", "https://ropsten.infura.io/v3/{token}"
+    ]
     assert ethereum["ropsten"]["contract_addresses"]["htlc"] == "0x0cc7C744f96729B7f60B12B36A4B9504191CD458"
     assert ethereum["ropsten"]["contract_addresses"]["htlc_erc20"] == "0x761c47A8dc8178d55aE14b661abf26cc0B599bc6"
+    assert ethereum["ropsten"]["contract_addresses"]["htlc_v2"] is None
+    assert ethereum["ropsten"]["contract_addresses"]["htlc_erc20_v2"] is None
     assert ethereum["kovan"]["infura"]["http"] == "https://kovan.infura.io/v3"
     assert ethereum["kovan"]["infura"]["websocket"] == "wss://kovan.infura.io/ws/v3"
     assert ethereum["kovan"]["infura"]["token"] == "4414fea5f7454211956b1627621450b4"
+    assert ethereum["kovan"]["ipc"] == "~/.ethereum/kovan/geth.ipc"
+    assert ethereum["kovan"]["providers"] == [
+        "~/.ethereum/kovan/geth.ipc", "http://localhost:8545", "https://kovan.infura.io/v3/{token}"
+    ]
     assert ethereum["kovan"]["contract_addresses"]["htlc"] == "0xf3c7CD43F2f87958E708E00780EBDf87292Ad37E"
     assert ethereum["kovan"]["contract_addresses"]["htlc_erc20"] == "0x32a05649778bc96958bF804835C9e8eC9678e283"
+    assert ethereum["kovan"]["contract_addresses"]["htlc_v2"] is None
+    assert ethereum["kovan"]["contract_addresses"]["htlc_erc20_v2"] is None
     assert ethereum["rinkeby"]["infura"]["http"] == "https://rinkeby.infura.io/v3"
     assert ethereum["rinkeby"]["infura"]["websocket"] == "wss://rinkeby.infura.io/ws/v3"
     assert ethereum["rinkeby"]["infura"]["token"] == "4414fea5f7454211956b1627621450b4"
+    assert ethereum["rinkeby"]["ipc"] == "~/.ethereum/rinkeby/geth.ipc"
+    assert ethereum["rinkeby"]["providers"] == [
+        "~/.ethereum/rinkeby/geth.ipc", "http://localhost:8545", "https://rinkeby.infura.io/v3/{token}"
+    ]
     assert ethereum["rinkeby"]["contract_addresses"]["htlc"] == "0xB00370e1F88C86Ef6Fc81B380E0c7fC1dcbceD17"
     assert ethereum["rinkeby"]["contract_addresses"]["htlc_erc20"] == "0xe0d3155c9DC0ADdCDA71E7ef15c689AeCC8Dfc28"
+    assert ethereum["rinkeby"]["contract_addresses"]["htlc_v2"] is None
+    assert ethereum["rinkeby"]["contract_addresses"]["htlc_erc20_v2"] is None
     assert ethereum["testnet"]["ganache-cli"]["http"] == "http://localhost:8545"
     assert ethereum["testnet"]["ganache-cli"]["websocket"] == "wss://localhost:8545"
     assert ethereum["testnet"]["ganache-cli"]["token"] is None
+    assert ethereum["testnet"]["ipc"] is None
+    assert ethereum["testnet"]["providers"] == ["http://localhost:8545"]
     assert ethereum["testnet"]["contract_addresses"]["htlc"] is None
     assert ethereum["testnet"]["contract_addresses"]["htlc_erc20"] is None
+    assert ethereum["testnet"]["contract_addresses"]["htlc_v2"] is None
+    assert ethereum["testnet"]["contract_addresses"]["htlc_erc20_v2"] is None
     assert ethereum["path"] == "m/44'/60'/0'/0/0"
     assert ethereum["bip44_path"] == "m/44'/60'/{account}'/{change}/{address}"
     assert ethereum["units"]["Ether"] == 1
     assert ethereum["units"]["Gwei"] == 1_000_000_000
     assert ethereum["units"]["Wei"] == 1_000_000_000_000_000_000
     assert ethereum["provider"] == "http"
+    assert ethereum["health_check_interval"] == 30
     assert ethereum["network"] == "mainnet"
     assert ethereum["unit"] == "Wei"
     assert ethereum["timeout"] == 60
@@ -102,12 +150,15 @@ def test_config():
     assert vapor["mainnet"]["vapor-core"] == "http://localhost:9889"
     assert vapor["mainnet"]["blockmeta"] == "https://vapor.blockmeta.com/api/v1"
     assert vapor["mainnet"]["blockcenter"] == "https://ex.movapi.com/vapor/v3"
+    assert vapor["mainnet"]["backend"] == "blockcenter"
     assert vapor["solonet"]["vapor-core"] == "http://localhost:9889"
     assert vapor["solonet"]["blockmeta"] is None
     assert vapor["solonet"]["blockcenter"] is None
+    assert vapor["solonet"]["backend"] == "vapor-core"
     assert vapor["testnet"]["vapor-core"] == "http://localhost:9889"
     assert vapor["testnet"]["blockmeta"] is None
     assert vapor["testnet"]["blockcenter"] is None
+    assert vapor["testnet"]["backend"] == "vapor-core"
     assert vapor["path"] == "m/44/153/1/0/1"
     assert vapor["bip44_path"] == "m/44/153/{account}/{change}/{address}"
     assert vapor["indexes"] == ["2c000000", "99000000", "01000000", "00000000", "01000000"]
@@ -129,22 +180,37 @@ def test_config():
     assert isinstance(xinfin, dict)
     assert xinfin["mainnet"]["http"] == "https://rpc.xinfin.network"
     assert xinfin["mainnet"]["websocket"] == "wss://ws.xinfin.network"
+    assert xinfin["mainnet"]["ipc"] == "~/.XDC/XDC.ipc"
+    assert xinfin["mainnet"]["providers"] == ["~/.XDC/XDC.ipc", "http://localhost:8545", "https://rpc.xinfin.network"]
     assert xinfin["mainnet"]["contract_addresses"]["htlc"] == "xdc1C2F24F4E2427aD43df9c20521B88C78A32Bafb2"
     assert xinfin["mainnet"]["contract_addresses"]["htlc_xrc20"] == "xdcC8E8De7999D74bdD71e1cDC00025867F34c50b89"
+    assert xinfin["mainnet"]["contract_addresses"]["htlc_v2"] is None
+    assert xinfin["mainnet"]["contract_addresses"]["htlc_xrc20_v2"] is None
     assert xinfin["apothem"]["http"] == "https://rpc.apothem.network"
     assert xinfin["apothem"]["websocket"] == "wss://ws.apothem.network"
+    assert xinfin["apothem"]["ipc"] == "~/.XDC/apothem/XDC.ipc"
+    assert xinfin["apothem"]["providers"] == [
+        "~/.XDC/apothem/XDC.ipc", "http://localhost:8545", "https://rpc.apothem.network"
+    ]
     assert xinfin["apothem"]["contract_addresses"]["htlc"] == "xdc959c04329fa6B45d0250A2315673e4F952218BdE"
     assert xinfin["apothem"]["contract_addresses"]["htlc_xrc20"] == "xdc4C909fdd6c30f5B4c4d48938C161637B2767d714"
+    assert xinfin["apothem"]["contract_addresses"]["htlc_v2"] is None
+    assert xinfin["apothem"]["contract_addresses"]["htlc_xrc20_v2"] is None
     assert xinfin["testnet"]["http"] == "http://localhost:8545"
     assert xinfin["testnet"]["websocket"] == "wss://localhost:8545"
+    assert xinfin["testnet"]["ipc"] is None
+    assert xinfin["testnet"]["providers"] == ["http://localhost:8545"]
     assert xinfin["testnet"]["contract_addresses"]["htlc"] is None
     assert xinfin["testnet"]["contract_addresses"]["htlc_xrc20"] is None
+    assert xinfin["testnet"]["contract_addresses"]["htlc_v2"] is None
+    assert xinfin["testnet"]["contract_addresses"]["htlc_xrc20_v2"] is None
     assert xinfin["path"] == "m/44'/550'/0'/0/0"
     assert xinfin["bip44_path"] == "m/44'/550'/{account}'/{change}/{address}"
     assert xinfin["units"]["XDC"] == 1
     assert xinfin["units"]["Gwei"] == 1_000_000_000
     assert xinfin["units"]["Wei"] == 1_000_000_000_000_000_000
     assert xinfin["provider"] == "http"
+    assert xinfin["health_check_interval"] == 30
     assert xinfin["network"] == "mainnet"
     assert xinfin["unit"] == "Wei"
     assert xinfin["timeout"] == 60
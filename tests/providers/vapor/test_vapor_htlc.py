@@ -1,9 +1,15 @@
 #!/usr/bin/env python3
 
+import pytest
 import json
 import os
 
-from swap.providers.vapor.htlc import HTLC
+from swap.exceptions import NetworkError
+from swap.providers.config import vapor as config
+from swap.providers.vapor.htlc import (
+    HTLC, build_many
+)
+from swap.providers.vapor import htlc
 
 # Test Values
 base_path = os.path.dirname(__file__)
@@ -38,3 +44,72 @@ def test_vapor_htlc():
 
     assert isinstance(htlc.balance(), int)
     assert isinstance(htlc.utxos(), list)
+
+
+def test_vapor_htlc_build_many():
+
+    agreements = dict(
+        secret_hash=_["vapor"]["htlc"]["secret"]["hash"],
+        recipient_public_key=_["vapor"]["wallet"]["recipient"]["public_key"],
+        sender_public_key=_["vapor"]["wallet"]["sender"]["public_key"],
+        endblock=_["vapor"]["htlc"]["endblock"]
+    )
+
+    assert build_many(htlcs=[agreements], network=_["vapor"]["network"]) == [dict(
+        bytecode=_["vapor"]["htlc"]["bytecode"],
+        hash=_["vapor"]["htlc"]["hash"],
+        contract_address=_["vapor"]["htlc"]["contract_address"]
+    )]
+    for network in ["mainnet", "solonet", "testnet"]:
+        for endblock in [1, 16, 17, 128, 2147483648]:
+            htlc = HTLC(network=network).build_htlc(**dict(agreements, endblock=endblock))
+            assert build_many(htlcs=[dict(agreements, endblock=endblock)], network=network) == [dict(
+                bytecode=htlc.bytecode(), hash=htlc.hash(), contract_address=htlc.contract_address()
+            )]
+
+    assert build_many(htlcs=[], network=_["vapor"]["network"]) == []
+    with pytest.raises(NetworkError, match=r"Invalid Vapor 'regtest' network"):
+        build_many(htlcs=[agreements], network="regtest")
+    with pytest.raises(ValueError, match=r"Invalid secret hash, length must be 64"):
+        build_many(htlcs=[dict(agreements, secret_hash="meheret")], network=_["vapor"]["network"])
+    with pytest.raises(ValueError, match=r"Invalid Vapor recipient public key, length must be 64"):
+        build_many(htlcs=[dict(agreements, recipient_public_key="meheret")], network=_["vapor"]["network"])
+    with pytest.raises(ValueError, match=r"Invalid Vapor sender public key, length must be 64"):
+        build_many(htlcs=[dict(agreements, sender_public_key="meheret")], network=_["vapor"]["network"])
+
+
+def test_vapor_htlc_use_script(monkeypatch):
+
+    compiled = []
+
+    class Equity:
+
+        def __init__(self, url):
+            self.url = url
+
+        def compile_source(self, source, args):
+            compiled.append((self.url, args))
+            return dict(program=_["vapor"]["htlc"]["bytecode"], name="HTLC")
+
+    monkeypatch.setattr(htlc, "Equity", Equity)
+
+    # Equity compilation is cached by the HTLC agreements
+    for _index in range(3):
+        assert HTLC(network=_["vapor"]["network"]).build_htlc(
+            secret_hash=_["vapor"]["htlc"]["secret"]["hash"],
+            recipient_public_key=_["vapor"]["wallet"]["recipient"]["public_key"],
+            sender_public_key=_["vapor"]["wallet"]["sender"]["public_key"],
+            endblock=7, use_script=True
+        ).bytecode() == _["vapor"]["htlc"]["bytecode"]
+    assert compiled == [(config[_["vapor"]["network"]]["vapor-core"], [
+        _["vapor"]["htlc"]["secret"]["hash"], _["vapor"]["wallet"]["recipient"]["public_key"],
+        _["vapor"]["wallet"]["sender"]["public_key"], 7
+    ])]
+
+    HTLC(network=_["vapor"]["network"]).build_htlc(
+        secret_hash=_["vapor"]["htlc"]["secret"]["hash"],
+        recipient_public_key=_["vapor"]["wallet"]["recipient"]["public_key"],
+        sender_public_key=_["vapor"]["wallet"]["sender"]["public_key"],
+        endblock=8, use_script=True
+    )
+    assert len(compiled) == 2
@@ -1,15 +1,19 @@
 #!/usr/bin/env python3
 
 from requests.exceptions import ConnectionError
+from pybytom.wallet import Wallet
 
 import pytest
 import json
 import os
 
-from swap.exceptions import APIError
+from swap.exceptions import (
+    APIError, AddressError, BalanceError
+)
 from swap.providers.vapor.utils import (
     is_network, is_address, is_transaction_raw, get_address_type,
-    decode_transaction_raw, submit_transaction_raw
+    decode_transaction_raw, submit_transaction_raw, sign_unsigned_datas, build_local_transaction,
+    address_to_program, assemble_raw
 )
 
 # Test Values
@@ -56,3 +60,146 @@ def test_vapor_utils():
     # (600) finalize tx fail
     with pytest.raises(APIError):
         submit_transaction_raw(transaction_raw=_["vapor"]["fund"]["unsigned"]["transaction_raw"])
+
+
+def test_vapor_utils_sign_unsigned_datas():
+
+    assert sign_unsigned_datas(
+        xprivate_key=_["vapor"]["wallet"]["sender"]["xprivate_key"],
+        unsigned_datas=_["vapor"]["fund"]["unsigned"]["unsigned_datas"]
+    ) == _["vapor"]["fund"]["signed"]["signatures"]
+
+    unsigned_datas = [
+        dict(datas=["8de317bdd49d2bec3c8e5804010aeebcdafb4a5637ef3dd9fd43aae09d074e1a"], path="m/44/153/1/0/1"),
+        dict(datas=["33e8da8ce8ef13fb4938a374aea3664e4cd2cd00fdd9d298593bdbd872d66b88"], path=None),
+        dict(datas=[
+            "75e87c7933b4dc4a87e06fed323e8425e54a494ff80dc7f8c4552cdb0a6bc74a",
+            "f42a2b6e15585b88da8b34237c7a6fd83af12ee6971813d66cf794a63ebcc16f"
+        ], path="m/44/153/1/0/2"),
+        dict(datas=["1246b84985e1ab5f83f4ec2bdf271114666fd3d9e24d12981a3c861b9ed523c6"], path="m/44/153/1/0/1")
+    ]
+    wallet = Wallet(network=_["vapor"]["network"]).from_xprivate_key(
+        xprivate_key=_["vapor"]["wallet"]["sender"]["xprivate_key"]
+    )
+    for path, indexes, default_path in [
+        (_["vapor"]["wallet"]["sender"]["derivation"]["path"], None, _["vapor"]["wallet"]["sender"]["derivation"]["path"]),
+        (None, _["vapor"]["wallet"]["sender"]["derivation"]["indexes"], _["vapor"]["wallet"]["sender"]["derivation"]["path"]),
+        (None, None, None)
+    ]:
+        signatures = []
+        for unsigned in unsigned_datas:
+            wallet.clean_derivation()
+            if unsigned["path"] or default_path:
+                wallet.from_path(path=(unsigned["path"] or default_path))
+            signatures.append([wallet.sign(message=data) for data in unsigned["datas"]])
+
+        assert sign_unsigned_datas(
+            xprivate_key=_["vapor"]["wallet"]["sender"]["xprivate_key"],
+            unsigned_datas=unsigned_datas, path=path, indexes=indexes
+        ) == signatures
+
+    assert sign_unsigned_datas(xprivate_key=_["vapor"]["wallet"]["sender"]["xprivate_key"], unsigned_datas=[]) == []
+
+
+def test_vapor_utils_build_local_transaction():
+
+    htlc_utxo = dict(
+        source_id="c009a2dbf09f4e6274370fb62381cb9ad50d1497cee7d9fe24eaa87e684d3cba",
+        source_position=0, amount=10000000, asset=_["vapor"]["asset"],
+        program="0020e5d1b347f8efeaa4618aec822fa3555736ebe0e71eebee7e8016704c622fbcaf"
+    )
+    wallet_utxo = dict(
+        source_id="c009a2dbf09f4e6274370fb62381cb9ad50d1497cee7d9fe24eaa87e684d3cba",
+        source_position=1, amount=108653000, asset=_["vapor"]["asset"],
+        program=_["vapor"]["wallet"]["sender"]["program"],
+        public_key=_["vapor"]["wallet"]["sender"]["public_key"],
+        path=_["vapor"]["wallet"]["sender"]["derivation"]["path"]
+    )
+
+    withdraw_transaction = build_local_transaction(
+        address=_["vapor"]["wallet"]["recipient"]["address"], utxos=[htlc_utxo], network=_["vapor"]["network"]
+    )
+    assert withdraw_transaction["tx"] == dict(
+        hash=_["vapor"]["withdraw"]["unsigned"]["hash"], fee=_["vapor"]["withdraw"]["unsigned"]["fee"]
+    )
+    assert withdraw_transaction["raw_transaction"] == _["vapor"]["withdraw"]["unsigned"]["raw"]
+    assert withdraw_transaction["signing_instructions"] == [dict(
+        derivation_path=None, sign_data=_["vapor"]["withdraw"]["unsigned"]["unsigned_datas"][0]["datas"], pubkey=None
+    )]
+
+    normal_transaction = build_local_transaction(
+        address=_["vapor"]["wallet"]["sender"]["address"], utxos=[wallet_utxo],
+        recipients={_["vapor"]["wallet"]["recipient"]["address"]: 0}, network=_["vapor"]["network"]
+    )
+    assert normal_transaction["tx"]["hash"] == _["vapor"]["normal"]["unsigned"]["hash"]
+    assert normal_transaction["raw_transaction"] == _["vapor"]["normal"]["unsigned"]["raw"]
+    assert normal_transaction["signing_instructions"] == [dict(
+        derivation_path=_["vapor"]["wallet"]["sender"]["derivation"]["indexes"],
+        sign_data=_["vapor"]["normal"]["unsigned"]["unsigned_datas"][0]["datas"],
+        pubkey=_["vapor"]["wallet"]["sender"]["public_key"]
+    )]
+
+    # Largest UTXO's first, only until amount and fee are covered
+    small_utxos = [
+        dict(wallet_utxo, source_position=position, amount=amount) for position, amount in [(2, 100000), (3, 50000000)]
+    ]
+    fund_transaction = build_local_transaction(
+        address=_["vapor"]["wallet"]["sender"]["address"], utxos=(small_utxos + [wallet_utxo]),
+        recipients={_["vapor"]["htlc"]["contract_address"]: (108653000 + 10000000)}, network=_["vapor"]["network"]
+    )
+    assert len(fund_transaction["signing_instructions"]) == 2
+    assert [utxo["amount"] for utxo in fund_transaction["utxos"]] == [
+        (108653000 + 10000000), (50000000 - 10000000 - fund_transaction["tx"]["fee"])
+    ]
+
+    # Funded HTLC UTXO can be spent without blockcenter
+    assert build_local_transaction(
+        address=_["vapor"]["wallet"]["recipient"]["address"], utxos=[fund_transaction["utxos"][0]],
+        network=_["vapor"]["network"]
+    )["utxos"][0]["source_id"] != fund_transaction["utxos"][0]["source_id"]
+
+    with pytest.raises(ValueError, match="Invalid Vapor UTXO, 'source_id' key is required."):
+        build_local_transaction(
+            address=_["vapor"]["wallet"]["recipient"]["address"], utxos=[dict(amount=10000000)]
+        )
+    with pytest.raises(ValueError, match=r"Invalid Vapor UTXO, .* hash doesn't match with its source."):
+        build_local_transaction(
+            address=_["vapor"]["wallet"]["recipient"]["address"], utxos=[dict(htlc_utxo, hash=("0" * 64))]
+        )
+    with pytest.raises(BalanceError, match="Insufficient spend UTXO's"):
+        build_local_transaction(
+            address=_["vapor"]["wallet"]["sender"]["address"], utxos=[wallet_utxo],
+            recipients={_["vapor"]["wallet"]["recipient"]["address"]: 108653000}
+        )
+    with pytest.raises(AddressError, match=r"Invalid Vapor recipients .* address."):
+        build_local_transaction(
+            address=_["vapor"]["wallet"]["sender"]["address"], utxos=[wallet_utxo], recipients={"meheret": 0}
+        )
+
+
+def test_vapor_utils_assemble_raw():
+
+    assert address_to_program(
+        address=_["vapor"]["wallet"]["sender"]["address"]
+    ) == _["vapor"]["wallet"]["sender"]["program"]
+    assert address_to_program(
+        address=_["vapor"]["htlc"]["contract_address"]
+    ) == "0020" + _["vapor"]["htlc"]["hash"]
+
+    for transaction in ["normal", "fund", "withdraw", "refund"]:
+        signed = _["vapor"][transaction]["signed"]
+        assembled_raw = assemble_raw(raw=signed["raw"], signatures=signed["signatures"])
+        assert assembled_raw.startswith(signed["raw"][:12])
+        assert assembled_raw.endswith(signed["raw"][-64:])
+        for signed_datas in signed["signatures"]:
+            for signed_data in signed_datas:
+                assert signed_data in assembled_raw
+        # Re-assembling without signatures keeps the witness arguments
+        assert assemble_raw(
+            raw=assembled_raw, signatures=[[] for _signatures in signed["signatures"]]
+        ) == assembled_raw
+
+    with pytest.raises(AddressError, match=r"Invalid Vapor 'meheret' address."):
+        address_to_program(address="meheret")
+    with pytest.raises(ValueError, match=r"Invalid Vapor signatures, transaction raw has 1 inputs, not 2."):
+        assemble_raw(raw=_["vapor"]["normal"]["signed"]["raw"], signatures=[[], []])
@@ -2,8 +2,13 @@
 
 import json
 import os
+import pytest
 
+from swap.providers.xinfin import htlc as htlc_module
 from swap.providers.xinfin.htlc import HTLC
+from swap.providers.xinfin.transaction import (
+    FundTransaction, WithdrawTransaction, RefundTransaction
+)
 
 # Test Values
 base_path = os.path.dirname(__file__)
@@ -34,3 +39,46 @@ def test_xinfin_htlc():
     assert htlc.agreements["sender_address"] == _["xinfin"]["htlc"]["agreements"]["sender_address"]
     # assert htlc.agreements["endtime"]["datetime"] == _["xinfin"]["htlc"]["agreements"]["endtime"]["datetime"]
     assert htlc.agreements["endtime"]["timestamp"] == _["xinfin"]["htlc"]["agreements"]["endtime"]["timestamp"]
+
+
+def test_xinfin_htlc_v2_unreleased(monkeypatch, tmp_path):
+
+    # No shipped v2 artifacts, like the package without precompiled v2 contracts
+    monkeypatch.setattr(htlc_module, "__file__", str(tmp_path / "htlc.py"))
+    with pytest.raises(ValueError, match=r"XinFin HTLC 'v2' version is not released yet, .*"):
+        HTLC(network=_["xinfin"]["network"], version="v2")
+    with pytest.raises(ValueError, match=r"XinFin HTLC 'v2' version is not released yet, .*"):
+        HTLC(network=_["xinfin"]["network"], xrc20=True, version="v2")
+    with pytest.raises(ValueError, match=r"XinFin HTLC 'v2' version is not released yet, .*"):
+        RefundTransaction(network=_["xinfin"]["network"], version="v2")
+
+
+def test_xinfin_htlc_batch():
+
+    with pytest.raises(ValueError, match=r"Invalid XinFin HTLC 'v3' version, .*"):
+        HTLC(network=_["xinfin"]["network"], version="v3")
+
+    htlc = HTLC(
+        contract_address=_["xinfin"]["htlc"]["contract_address"], network=_["xinfin"]["network"]
+    ).build_htlc(
+        secret_hash=_["xinfin"]["htlc"]["secret"]["hash"],
+        recipient_address=_["xinfin"]["wallet"]["recipient"]["address"],
+        sender_address=_["xinfin"]["wallet"]["sender"]["address"],
+        endtime=_["xinfin"]["htlc"]["endtime"]
+    )
+
+    with pytest.raises(ValueError, match=r"XinFin HTLC 'v1' version has no batch functions, .*"):
+        FundTransaction(network=_["xinfin"]["network"]).build_transaction(
+            address=_["xinfin"]["wallet"]["sender"]["address"], htlc=[(htlc, 1), (htlc, 2)]
+        )
+    with pytest.raises(ValueError, match=r"XinFin HTLC 'v1' version has no batch functions, .*"):
+        WithdrawTransaction(network=_["xinfin"]["network"]).build_transaction(
+            transaction_hash=[_["xinfin"]["transaction_hash"]] * 2,
+            address=_["xinfin"]["wallet"]["recipient"]["address"],
+            secret_key=_["xinfin"]["htlc"]["secret"]["key"]
+        )
+    with pytest.raises(ValueError, match=r"XinFin HTLC 'v1' version has no batch functions, .*"):
+        RefundTransaction(network=_["xinfin"]["network"]).build_transaction(
+            transaction_hash=[_["xinfin"]["transaction_hash"]] * 2,
+            address=_["xinfin"]["wallet"]["sender"]["address"]
+        )
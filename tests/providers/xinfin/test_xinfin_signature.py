@@ -2,9 +2,10 @@
 
 import json
 import os
+from functools import partial
 
 from swap.providers.xinfin.signature import (
-    Signature, NormalSignature, FundSignature, WithdrawSignature, RefundSignature
+    Signature, NormalSignature, FundSignature, WithdrawSignature, RefundSignature, sign_many
 )
 from swap.providers.xinfin.solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
@@ -181,3 +182,39 @@ def test_xinfin_refund_signature():
     assert refund_signature.transaction_raw() == clean_transaction_raw(
         transaction_raw=_["xinfin"]["refund"]["signed"]["transaction_raw"]
     )
+
+
+def test_xinfin_sign_many():
+
+    fund_solver_factory = partial(
+        FundSolver,
+        xprivate_key=_["xinfin"]["wallet"]["sender"]["root_xprivate_key"],
+        path=_["xinfin"]["wallet"]["sender"]["derivation"]["path"],
+        account=_["xinfin"]["wallet"]["sender"]["derivation"]["account"],
+        change=_["xinfin"]["wallet"]["sender"]["derivation"]["change"],
+        address=_["xinfin"]["wallet"]["sender"]["derivation"]["address"]
+    )
+
+    for workers in [1, 2]:
+        signed = sign_many(
+            transaction_raws=[
+                _["xinfin"]["fund"]["unsigned"]["transaction_raw"],
+                "meheret",
+                _["xinfin"]["withdraw"]["unsigned"]["transaction_raw"]
+            ],
+            solver_factory=fund_solver_factory,
+            workers=workers,
+            network=_["xinfin"]["network"]
+        )
+
+        assert len(signed) == 3
+        assert signed[0]["error"] is None
+        assert signed[0]["transaction_raw"] == clean_transaction_raw(
+            transaction_raw=_["xinfin"]["fund"]["signed"]["transaction_raw"]
+        )
+        assert signed[1]["transaction_raw"] is None
+        assert signed[1]["error"].startswith("TransactionRawError: Invalid transaction raw.")
+        assert signed[2]["transaction_raw"] is None
+        assert signed[2]["error"] == "TypeError: Solver must be XinFin WithdrawSolver, not 'FundSolver' type."
+
+    assert sign_many(transaction_raws=[], solver_factory=fund_solver_factory) == []
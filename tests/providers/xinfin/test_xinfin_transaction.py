@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 
+from types import SimpleNamespace
+
 import json
 import os
+import pytest
 
 from swap.providers.xinfin.htlc import HTLC
 from swap.providers.xinfin.transaction import (
@@ -10,7 +13,14 @@ from swap.providers.xinfin.transaction import (
 from swap.providers.xinfin.solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
 )
-from swap.utils import get_current_timestamp
+from swap.providers.xinfin import (
+    htlc as htlc_module, transaction as transaction_module, rpc as rpc_module
+)
+from swap.providers.xinfin.transaction import _locked_contracts
+from swap.providers.xinfin.utils import to_checksum_address
+from swap.utils import (
+    get_current_timestamp, sha256
+)
 
 # Test Values
 base_path = os.path.dirname(__file__)
@@ -178,3 +188,155 @@ def test_xinfin_refund_transaction():
     assert isinstance(signed_refund_transaction.json(), dict)
     assert isinstance(signed_refund_transaction.signature(), dict)
     assert isinstance(signed_refund_transaction.transaction_raw(), str)
+
+
+def _eth_tester_web3(monkeypatch):
+    # In-memory py-evm chain in place of the XinFin node
+    import eth_tester
+    from web3 import Web3, EthereumTesterProvider
+
+    ethereum_tester = eth_tester.EthereumTester(eth_tester.PyEVMBackend())
+    web3 = Web3(EthereumTesterProvider(ethereum_tester))
+    monkeypatch.setattr(htlc_module, "get_web3", lambda **kwargs: web3)
+    monkeypatch.setattr(transaction_module, "get_web3", lambda **kwargs: web3)
+    monkeypatch.setattr(rpc_module, "get_web3", lambda **kwargs: web3)
+    for wallet in ["sender", "recipient"]:
+        web3.eth.send_transaction({
+            "from": web3.eth.accounts[0],
+            "to": to_checksum_address(address=_["xinfin"]["wallet"][wallet]["address"], prefix="0x"),
+            "value": Web3.toWei(10, "ether")
+        })
+    return ethereum_tester, web3
+
+
+def _deploy_htlc(web3, xrc20=False, version="v2"):
+    try:
+        htlc = HTLC(network=_["xinfin"]["network"], xrc20=xrc20, version=version)
+    except ValueError as exception:
+        pytest.skip(str(exception))
+    contract_address = web3.eth.wait_for_transaction_receipt(
+        web3.eth.contract(abi=htlc.abi(), bytecode=htlc.bytecode()).constructor().transact({
+            "from": web3.eth.accounts[0]
+        })
+    )["contractAddress"]
+    return HTLC(contract_address=contract_address, network=_["xinfin"]["network"], xrc20=xrc20, version=version)
+
+
+def _send_transaction(web3, transaction, solver, wallet):
+    transaction.sign(solver=solver(
+        xprivate_key=_["xinfin"]["wallet"][wallet]["root_xprivate_key"],
+        path=_["xinfin"]["wallet"][wallet]["derivation"]["path"]
+    ))
+    transaction_receipt = web3.eth.wait_for_transaction_receipt(
+        web3.eth.send_raw_transaction(transaction.signature()["rawTransaction"])
+    )
+    assert transaction_receipt["status"] == 1
+    return transaction_receipt
+
+
+def test_xinfin_v2_batch_transactions(monkeypatch):
+
+    ethereum_tester, web3 = _eth_tester_web3(monkeypatch=monkeypatch)
+    htlc = _deploy_htlc(web3=web3)
+    htlc_contract = web3.eth.contract(address=htlc.contract_address(prefix="0x"), abi=htlc.abi())
+    functions = [function.get("name") for function in htlc.abi()]
+    assert all(function in functions for function in ["fund_batch", "withdraw_batch", "refund_batch"])
+    recipient_address = to_checksum_address(address=_["xinfin"]["wallet"]["recipient"]["address"], prefix="0x")
+
+    endtime = web3.eth.get_block("latest")["timestamp"] + 3600
+    secret_keys = [f"Hello Meheret {index}!" for index in range(3)]
+    htlcs = [
+        (HTLC(contract_address=htlc.contract_address(), network=_["xinfin"]["network"], version="v2").build_htlc(
+            secret_hash=sha256(secret_key),
+            recipient_address=_["xinfin"]["wallet"]["recipient"]["address"],
+            sender_address=_["xinfin"]["wallet"]["sender"]["address"],
+            endtime=endtime
+        ), 1_000 * (index + 1)) for index, secret_key in enumerate(secret_keys)
+    ]
+
+    fund_transaction = FundTransaction(network=_["xinfin"]["network"]).build_transaction(
+        address=_["xinfin"]["wallet"]["sender"]["address"], htlc=htlcs, unit="Wei"
+    )
+    fund_receipt = _send_transaction(web3=web3, transaction=fund_transaction, solver=FundSolver, wallet="sender")
+    transaction_hash = fund_receipt["transactionHash"].hex()
+    assert web3.eth.get_balance(htlc.contract_address(prefix="0x")) == 6_000
+
+    log_funds = htlc_contract.events.log_fund().processReceipt(fund_receipt)
+    assert [(log_fund["args"]["secret_hash"].hex(), log_fund["args"]["amount"]) for log_fund in log_funds] == [
+        (sha256(secret_key), 1_000 * (index + 1)) for index, secret_key in enumerate(secret_keys)
+    ]
+    locked_contracts = _locked_contracts(
+        network=_["xinfin"]["network"], htlc_contract=htlc_contract, transaction_hashes=[transaction_hash]
+    )
+    assert [locked_contract["locked_contract_id"] for locked_contract in locked_contracts] == [
+        log_fund["args"]["locked_contract_id"] for log_fund in log_funds
+    ]
+
+    recipient_balance = web3.eth.get_balance(recipient_address)
+    withdraw_transaction = WithdrawTransaction(network=_["xinfin"]["network"], version="v2").build_transaction(
+        transaction_hash=[transaction_hash], address=_["xinfin"]["wallet"]["recipient"]["address"],
+        secret_key=secret_keys[:2], contract_address=htlc.contract_address()
+    )
+    withdraw_receipt = _send_transaction(
+        web3=web3, transaction=withdraw_transaction, solver=WithdrawSolver, wallet="recipient"
+    )
+    assert [
+        log_withdraw["args"]["preimage"] for log_withdraw in htlc_contract.events.log_withdraw().processReceipt(withdraw_receipt)
+    ] == secret_keys[:2]
+    assert web3.eth.get_balance(recipient_address) == recipient_balance + 3_000 - (
+        withdraw_receipt["gasUsed"] * web3.eth.get_transaction(withdraw_receipt["transactionHash"])["gasPrice"]
+    )
+
+    # Withdrawn locked contracts are skipped, only the third one is left to refund
+    locked_contracts = _locked_contracts(
+        network=_["xinfin"]["network"], htlc_contract=htlc_contract, transaction_hashes=[transaction_hash]
+    )
+    assert [locked_contract["locked_contract_id"] for locked_contract in locked_contracts] == [
+        log_funds[2]["args"]["locked_contract_id"]
+    ]
+
+    ethereum_tester.time_travel(endtime + 1)
+    refund_transaction = RefundTransaction(network=_["xinfin"]["network"], version="v2").build_transaction(
+        transaction_hash=[transaction_hash], address=_["xinfin"]["wallet"]["sender"]["address"],
+        contract_address=htlc.contract_address()
+    )
+    refund_receipt = _send_transaction(web3=web3, transaction=refund_transaction, solver=RefundSolver, wallet="sender")
+    assert [
+        log_refund["args"]["locked_contract_id"] for log_refund in htlc_contract.events.log_refund().processReceipt(refund_receipt)
+    ] == [log_funds[2]["args"]["locked_contract_id"]]
+    assert web3.eth.get_balance(htlc.contract_address(prefix="0x")) == 0
+    assert _locked_contracts(
+        network=_["xinfin"]["network"], htlc_contract=htlc_contract, transaction_hashes=[transaction_hash]
+    ) == []
+
+
+def test_xinfin_locked_contracts_duplicates(monkeypatch):
+
+    # Batch fund "0xa" and fund "0xb" receipts, "0xb" logs an already seen locked contract id too
+    logs = {
+        "a": [b"\x01", b"\x02"], "b": [b"\x02", b"\x03"]
+    }
+    calls = []
+    monkeypatch.setattr(transaction_module, "get_transaction_receipt", lambda transaction_hash, network: {
+        "id": transaction_hash[2:]
+    })
+
+    def get_locked_contract(locked_contract_id):
+        calls.append(locked_contract_id)
+        return SimpleNamespace(call=lambda: [False, False])
+
+    htlc_contract = SimpleNamespace(
+        address="htlc", functions=SimpleNamespace(get_locked_contract=get_locked_contract),
+        events=SimpleNamespace(log_fund=lambda: SimpleNamespace(processReceipt=lambda receipt, errors: [
+            dict(address="htlc", args=dict(locked_contract_id=locked_contract_id))
+            for locked_contract_id in logs[receipt["id"][-1:]]
+        ]))
+    )
+
+    locked_contracts = _locked_contracts(
+        network=_["xinfin"]["network"], htlc_contract=htlc_contract, transaction_hashes=["0xa", "0xa", "0xb"]
+    )
+    assert [locked_contract["locked_contract_id"] for locked_contract in locked_contracts] == [
+        b"\x01", b"\x02", b"\x03"
+    ]
+    assert calls == [b"\x01", b"\x02", b"\x03"]
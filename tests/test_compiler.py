@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import pytest
+
+from swap.compiler import (
+    SOLC_VERSION, OUTPUT_VALUES, get_cache_directory, get_cache_key, compile_contract, write_artifact
+)
+
+HTLC_SOL: str = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), "..", "swap", "providers", "ethereum", "contracts", "htlc.sol"
+))
+HTLC_JSON: str = HTLC_SOL.replace(".sol", ".json")
+
+
+def test_compiler_cache_directory(monkeypatch):
+
+    monkeypatch.setenv("SWAP_SOLC_CACHE", "/tmp/swap-solc")
+    assert get_cache_directory() == "/tmp/swap-solc"
+    monkeypatch.delenv("SWAP_SOLC_CACHE")
+    monkeypatch.setenv("XDG_CACHE_HOME", "/tmp/cache")
+    assert get_cache_directory() == os.path.join("/tmp/cache", "swap", "solc")
+
+
+def test_compiler_cache_key(tmp_path):
+
+    key = get_cache_key(source_file=HTLC_SOL)
+    assert key == "dfadaad12bdad30f6169a5ead2323b55508b646b5db07c2f32bfee8239fdc821"
+    assert key == get_cache_key(source_file=HTLC_SOL, solc_version=SOLC_VERSION, output_values=OUTPUT_VALUES[::-1])
+    assert key != get_cache_key(source_file=HTLC_SOL, solc_version="0.8.11")
+    assert key != get_cache_key(source_file=HTLC_SOL, output_values=["abi", "bin"])
+
+    # Same contents on another path have the same key, any imported file change gives a new key
+    (tmp_path / "libs").mkdir()
+    (tmp_path / "libs" / "erc20.sol").write_text("// ERC20")
+    (tmp_path / "htlc.sol").write_text(open(HTLC_SOL).read())
+    assert get_cache_key(source_file=str(tmp_path / "htlc.sol")) == key
+    (tmp_path / "htlc-erc20.sol").write_text('import "./libs/erc20.sol";\n')
+    erc20_key = get_cache_key(source_file=str(tmp_path / "htlc-erc20.sol"))
+    (tmp_path / "libs" / "erc20.sol").write_text("// ERC20 v2")
+    assert get_cache_key(source_file=str(tmp_path / "htlc-erc20.sol")) != erc20_key
+
+
+def test_compiler_compile_contract(tmp_path):
+
+    artifact = json.loads(open(HTLC_JSON).read())["htlc.sol:HTLC"]
+    cache_file = tmp_path / f"{get_cache_key(source_file=HTLC_SOL)}.json"
+    cache_file.write_text(json.dumps(dict(HTLC=artifact)))
+
+    # Warm cache hit never runs the Solidity compiler
+    assert compile_contract(source_file=HTLC_SOL, contract_name="HTLC", cache_directory=str(tmp_path)) == artifact
+    cache_file.unlink()
+    assert compile_contract(source_file=HTLC_SOL, contract_name="HTLC", cache_directory=str(tmp_path)) == artifact
+
+    with pytest.raises(ValueError, match=r"Invalid 'HTLC_ERC20' contract name, .*"):
+        compile_contract(source_file=HTLC_SOL, contract_name="HTLC_ERC20", cache_directory=str(tmp_path))
+
+
+def test_compiler_write_artifact(tmp_path):
+
+    artifact = json.loads(open(HTLC_JSON).read())["htlc.sol:HTLC"]
+    (tmp_path / "htlc.sol").write_text(open(HTLC_SOL).read())
+
+    # Written artifact has the shipped precompiled artifact format
+    json_file = write_artifact(source_file=str(tmp_path / "htlc.sol"), contract_name="HTLC", artifact=dict(
+        metadata="meheret", **artifact
+    ))
+    assert json_file == str(tmp_path / "htlc.json")
+    assert open(json_file).read() == open(HTLC_JSON).read()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+
+from hdwallet.cryptocurrencies import (
+    BitcoinMainnet, BitcoinTestnet, EthereumMainnet
+)
+from hdwallet.exceptions import DerivationError
+from hdwallet import HDWallet as StockHDWallet
+
+import json
+import time
+import os
+import pytest
+
+from swap.crypto import (
+    Backend, ECDSABackend, CoincurveBackend, HDWallet, get_backend, set_backend, derive_public_keys,
+    KeyCache, enable_key_cache, disable_key_cache, get_key_cache, cached_key
+)
+from swap.providers.bitcoin.solver import NormalSolver
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+PRIVATE_KEY: bytes = bytes.fromhex("da47c2f450a4f9d538d86d600d55149afd39d6672fdd1f30c68ad5be21cadad8")
+DIGEST: bytes = bytes.fromhex("6bc3b581f3dea1963f9257ec2a0195969babee3704e6ba7cd2ec535140b9816f")
+PUBLIC_KEY: str = "02b31bdddc215175dd3e5858ad58077dc8e57c588b2c1a91e3055d0af11f41f791"
+UNCOMPRESSED_PUBLIC_KEY: str = "04b31bdddc215175dd3e5858ad58077dc8e57c588b2c1a91e3055d0af11f41f791" \
+                               "d82f4fcc1a3c263cfe4ebd742fda55ccfc2c0f559ed65aa9a01b316aec6de2f2"
+SIGNATURE: str = "3045022100d9c18dcd8895e7fdfa2db3e833cec62bad13fa5e7f6c309815c6256f9ca57e3a" \
+                 "022027e46f6d662876d64514e18b58ea8ad12c1a9b3032b25415177016a45bc4a126"
+TWEAKED_PUBLIC_KEY: str = "03c17996a96ff52d94fa34830a18010080dbc3111f0a55404fde95b864f83cabef"
+
+
+def backends():
+    try:
+        return [ECDSABackend(), CoincurveBackend()]
+    except ImportError:
+        return [ECDSABackend()]
+
+
+@pytest.mark.parametrize("backend", backends(), ids=lambda backend: backend.name)
+def test_crypto_backend(backend):
+
+    assert backend.public_key(private_key=PRIVATE_KEY).hex() == PUBLIC_KEY
+    assert backend.public_key(private_key=PRIVATE_KEY, compressed=False).hex() == UNCOMPRESSED_PUBLIC_KEY
+    assert backend.public_key_add(public_key=bytes.fromhex(PUBLIC_KEY), tweak=DIGEST).hex() == TWEAKED_PUBLIC_KEY
+    assert backend.public_key_add(
+        public_key=bytes.fromhex(UNCOMPRESSED_PUBLIC_KEY), tweak=DIGEST
+    ).hex() == TWEAKED_PUBLIC_KEY
+    assert backend.sign(private_key=PRIVATE_KEY, digest=DIGEST).hex() == SIGNATURE
+
+    assert backend.verify(public_key=bytes.fromhex(PUBLIC_KEY), digest=DIGEST, signature=bytes.fromhex(SIGNATURE))
+    assert backend.verify(
+        public_key=bytes.fromhex(UNCOMPRESSED_PUBLIC_KEY), digest=DIGEST, signature=bytes.fromhex(SIGNATURE)
+    )
+    assert not backend.verify(public_key=bytes.fromhex(PUBLIC_KEY), digest=bytes(32), signature=bytes.fromhex(SIGNATURE))
+    assert not backend.verify(
+        public_key=bytes.fromhex(TWEAKED_PUBLIC_KEY), digest=DIGEST, signature=bytes.fromhex(SIGNATURE)
+    )
+    assert not backend.verify(public_key=bytes.fromhex(PUBLIC_KEY), digest=DIGEST, signature=b"meheret")
+
+    # High-S signature of the same digest
+    r_length = bytes.fromhex(SIGNATURE)[3]
+    r = int.from_bytes(bytes.fromhex(SIGNATURE)[4:4 + r_length], "big")
+    s = int.from_bytes(bytes.fromhex(SIGNATURE)[6 + r_length:], "big")
+    high_s = (0xfffffffffffffffffffffffffffffffebaaedce6af48a03bbfd25e8cd0364141 - s).to_bytes(32, "big")
+    r = r.to_bytes(33, "big")
+    high_s_signature = bytes([0x30, 4 + len(r) + len(high_s), 0x02, len(r)]) + r + bytes([0x02, len(high_s)]) + high_s
+    assert not backend.verify(public_key=bytes.fromhex(PUBLIC_KEY), digest=DIGEST, signature=high_s_signature)
+
+
+@pytest.mark.parametrize("backend", backends(), ids=lambda backend: backend.name)
+def test_crypto_hdwallet(backend):
+
+    previous = get_backend()
+    set_backend(backend=backend)
+    try:
+        for sender in ["sender", "recipient"]:
+            hdwallet = HDWallet(cryptocurrency=BitcoinTestnet, use_default_path=False)
+            hdwallet.from_xprivate_key(xprivate_key=_["bitcoin"]["wallet"][sender]["root_xprivate_key"])
+            hdwallet.from_path(path=_["bitcoin"]["wallet"][sender]["derivation"]["path"])
+
+            assert hdwallet.xprivate_key() == _["bitcoin"]["wallet"][sender]["xprivate_key"]
+            assert hdwallet.xpublic_key() == _["bitcoin"]["wallet"][sender]["xpublic_key"]
+            assert hdwallet.private_key() == _["bitcoin"]["wallet"][sender]["private_key"]
+            assert hdwallet.public_key() == _["bitcoin"]["wallet"][sender]["public_key"]
+            assert hdwallet.uncompressed() == _["bitcoin"]["wallet"][sender]["uncompressed"]
+            assert hdwallet.p2pkh_address() == _["bitcoin"]["wallet"][sender]["address"]
+            assert hdwallet.wif() == _["bitcoin"]["wallet"][sender]["wif"]
+            assert hdwallet.finger_print() == _["bitcoin"]["wallet"][sender]["finger_print"]
+    finally:
+        set_backend(backend=previous)
+
+
+@pytest.mark.parametrize("backend", backends(), ids=lambda backend: backend.name)
+def test_crypto_hdwallet_equivalence(backend):
+
+    # Overridden hdwallet internals must derive the same wallets as stock hdwallet
+    previous = get_backend()
+    set_backend(backend=backend)
+    try:
+        for cryptocurrency, entropy, passphrase, path in [
+            (BitcoinMainnet, "ed0802d701a033776811601dd6c5c4a9", None, "m/44'/0'/0'/0/0"),
+            (BitcoinTestnet, "00000000000000000000000000000000", "meheret", "m/44'/1'/2'/1/7"),
+            (BitcoinTestnet, "ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff", None, "m/0/2147483647'/1"),
+            (EthereumMainnet, "50f002376c81c96e430b48f1fe71df57", None, "m/44'/60'/0'/0/3")
+        ]:
+            hdwallet = HDWallet(cryptocurrency=cryptocurrency, use_default_path=False)
+            stock_hdwallet = StockHDWallet(cryptocurrency=cryptocurrency, use_default_path=False)
+            hdwallet.from_entropy(entropy=entropy, passphrase=passphrase)
+            stock_hdwallet.from_entropy(entropy=entropy, passphrase=passphrase)
+            assert hdwallet.from_path(path=path).dumps() == stock_hdwallet.from_path(path=path).dumps()
+
+            # Public derivation from the account xpublic key, stock hdwallet can't load it with ecdsa 0.13
+            account_path, address_path = path.rsplit("'", 1)
+            xpublic_key = hdwallet.clean_derivation().from_path(path=f"{account_path}'").xpublic_key()
+            hdwallet = HDWallet(cryptocurrency=cryptocurrency, use_default_path=False)
+            dumps = hdwallet.from_xpublic_key(xpublic_key=xpublic_key, strict=False).from_path(
+                path=f"m{address_path}"
+            ).dumps()
+            stock_dumps = stock_hdwallet.dumps()
+            for key in ["xpublic_key", "uncompressed", "compressed", "chain_code", "finger_print", "hash", "addresses"]:
+                assert dumps[key] == stock_dumps[key]
+    finally:
+        set_backend(backend=previous)
+
+
+@pytest.mark.parametrize("backend", backends(), ids=lambda backend: backend.name)
+def test_crypto_derive_public_keys(backend):
+
+    previous = get_backend()
+    set_backend(backend=backend)
+    try:
+        hdwallet = HDWallet(cryptocurrency=BitcoinTestnet, use_default_path=False)
+        hdwallet.from_xprivate_key(xprivate_key=_["bitcoin"]["wallet"]["sender"]["root_xprivate_key"])
+        hdwallet.from_path(path="m/44'/1'/0'/0")
+        public_key, chain_code = hdwallet.compressed(), hdwallet.chain_code()
+
+        assert derive_public_keys(public_key=public_key, chain_code=chain_code, start=0, count=1) == [
+            _["bitcoin"]["wallet"]["sender"]["public_key"]
+        ]
+        assert derive_public_keys(public_key=public_key, chain_code=chain_code, start=0, count=1, compressed=False) == [
+            "04" + _["bitcoin"]["wallet"]["sender"]["uncompressed"]
+        ]
+        child_public_keys = derive_public_keys(public_key=public_key, chain_code=chain_code, start=0, count=3)
+        assert len(child_public_keys) == 3
+        assert derive_public_keys(public_key=public_key, chain_code=chain_code, start=2, count=1) == child_public_keys[2:]
+
+        with pytest.raises(DerivationError, match=r"Invalid child index range, .*"):
+            derive_public_keys(public_key=public_key, chain_code=chain_code, start=0x7fffffff, count=2)
+    finally:
+        set_backend(backend=previous)
+
+
+def test_crypto_set_backend():
+
+    previous = get_backend()
+    try:
+        assert isinstance(set_backend(backend="ecdsa"), ECDSABackend)
+        assert isinstance(get_backend(), ECDSABackend)
+
+        with pytest.raises(ValueError, match=r"Invalid 'meheret' secp256k1 backend, .*"):
+            set_backend(backend="meheret")
+        with pytest.raises(TypeError, match="Backend must be str or Backend, not int type."):
+            set_backend(backend=1)
+
+        class SignOnlyBackend(Backend):
+            def sign(self, private_key: bytes, digest: bytes) -> bytes:
+                return ECDSABackend().sign(private_key=private_key, digest=digest)
+
+        # Incomplete backend fails on instantiation, not on first use
+        with pytest.raises(TypeError, match="Can't instantiate abstract class SignOnlyBackend"):
+            SignOnlyBackend()
+        with pytest.raises(TypeError, match="Can't instantiate abstract class Backend"):
+            Backend()
+    finally:
+        set_backend(backend=previous)
+
+
+def test_crypto_key_cache():
+
+    key_cache = KeyCache(ttl=60, max_entries=2)
+    derived = []
+
+    def derive(value):
+        derived.append(value)
+        return value
+
+    assert key_cache.get_or_derive(parts=("meheret", "m/0"), derive=lambda: derive(b"\x01" * 32)) == b"\x01" * 32
+    assert key_cache.get_or_derive(parts=("meheret", "m/0"), derive=lambda: derive(b"\x02" * 32)) == b"\x01" * 32
+    assert derived == [b"\x01" * 32] and len(key_cache) == 1
+    # Secrets are not stored, entries are keyed by a salted hash
+    assert all(b"meheret" not in key for key in key_cache._entries)
+
+    zeroed = key_cache._entries[key_cache._key(parts=("meheret", "m/0"))][1]
+    key_cache.put(parts=("meheret", "m/1"), value=b"\x03" * 32)
+    assert key_cache.get(parts=("meheret", "m/0")) == b"\x01" * 32
+    # Least recently used m/1 entry is evicted and zeroed
+    evicted = key_cache._entries[key_cache._key(parts=("meheret", "m/1"))][1]
+    key_cache.put(parts=("meheret", "m/2"), value=b"\x04" * 32)
+    assert key_cache.get(parts=("meheret", "m/1")) is None and evicted == bytearray(32)
+    assert len(key_cache) == 2
+
+    key_cache.clear()
+    assert len(key_cache) == 0 and zeroed == bytearray(32)
+
+    expiring_cache = KeyCache(ttl=0.05)
+    expiring_cache.put(parts=("meheret",), value=b"\x05" * 32)
+    assert expiring_cache.get(parts=("meheret",)) == b"\x05" * 32
+    time.sleep(0.1)
+    assert expiring_cache.get(parts=("meheret",)) is None
+
+    with pytest.raises(ValueError, match=r"Invalid ttl '0'"):
+        KeyCache(ttl=0)
+    with pytest.raises(ValueError, match=r"Invalid max entries '0'"):
+        KeyCache(max_entries=0)
+
+
+def test_crypto_shared_key_cache():
+
+    disable_key_cache()
+    try:
+        assert get_key_cache() is None
+        assert cached_key(parts=("meheret",), derive=lambda: b"\x01") == b"\x01"
+        assert cached_key(parts=("meheret",), derive=lambda: b"\x02") == b"\x02"
+
+        key_cache = enable_key_cache(ttl=60, max_entries=8)
+        assert get_key_cache() is key_cache
+        assert cached_key(parts=("meheret",), derive=lambda: b"\x01") == b"\x01"
+        assert cached_key(parts=("meheret",), derive=lambda: b"\x02") == b"\x01"
+
+        # BIP39 seed and solver child private key are cached and match the uncached values
+        for attempt in range(2):
+            hdwallet = HDWallet(cryptocurrency=BitcoinTestnet, use_default_path=False)
+            hdwallet.from_mnemonic(mnemonic=_["bitcoin"]["wallet"]["sender"]["mnemonic"])
+            assert hdwallet.seed() == _["bitcoin"]["wallet"]["sender"]["seed"]
+            assert hdwallet.entropy() == _["bitcoin"]["wallet"]["sender"]["entropy"]
+            assert hdwallet.root_xprivate_key() == _["bitcoin"]["wallet"]["sender"]["root_xprivate_key"]
+
+            assert NormalSolver(
+                xprivate_key=_["bitcoin"]["wallet"]["sender"]["root_xprivate_key"],
+                path=_["bitcoin"]["wallet"]["sender"]["derivation"]["path"]
+            ).solve(network=_["bitcoin"]["network"]).privk.hexlify() == _["bitcoin"]["wallet"]["sender"]["private_key"]
+        assert len(key_cache) == 3
+
+        disable_key_cache()
+        assert get_key_cache() is None and len(key_cache) == 0
+    finally:
+        disable_key_cache()
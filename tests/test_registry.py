@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+
+import pytest
+import sqlite3
+import json
+import os
+
+from swap.registry import HTLCRegistry
+from swap.providers.bitcoin.htlc import (
+    HTLC as BitcoinHTLC, build_many
+)
+from swap.providers.bytom.htlc import HTLC as BytomHTLC
+from swap.providers.vapor.htlc import HTLC as VaporHTLC
+from swap.providers.ethereum.htlc import HTLC as EthereumHTLC
+from swap.providers.xinfin.htlc import HTLC as XinFinHTLC
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+
+def test_registry(tmp_path):
+
+    secret_hash = _["bitcoin"]["htlc"]["secret"]["hash"]
+    bitcoin_htlc = BitcoinHTLC(network=_["bitcoin"]["network"]).build_htlc(
+        secret_hash=secret_hash,
+        recipient_address=_["bitcoin"]["wallet"]["recipient"]["address"],
+        sender_address=_["bitcoin"]["wallet"]["sender"]["address"],
+        endtime=_["bitcoin"]["htlc"]["endtime"], segwit=True
+    )
+    bytom_htlc = BytomHTLC(network=_["bytom"]["network"]).build_htlc(
+        secret_hash=secret_hash,
+        recipient_public_key=_["bytom"]["wallet"]["recipient"]["public_key"],
+        sender_public_key=_["bytom"]["wallet"]["sender"]["public_key"],
+        endblock=_["bytom"]["htlc"]["endblock"]
+    )
+    vapor_htlc = VaporHTLC(network=_["vapor"]["network"]).build_htlc(
+        secret_hash=secret_hash,
+        recipient_public_key=_["vapor"]["wallet"]["recipient"]["public_key"],
+        sender_public_key=_["vapor"]["wallet"]["sender"]["public_key"],
+        endblock=_["vapor"]["htlc"]["endblock"]
+    )
+    ethereum_htlc = EthereumHTLC(network=_["ethereum"]["network"]).build_htlc(
+        secret_hash=secret_hash,
+        recipient_address=_["ethereum"]["wallet"]["recipient"]["address"],
+        sender_address=_["ethereum"]["wallet"]["sender"]["address"],
+        endtime=_["bitcoin"]["htlc"]["endtime"]
+    )
+    xinfin_htlc = XinFinHTLC(network=_["xinfin"]["network"]).build_htlc(
+        secret_hash=secret_hash,
+        recipient_address=_["xinfin"]["wallet"]["recipient"]["address"],
+        sender_address=_["xinfin"]["wallet"]["sender"]["address"],
+        endtime=_["bitcoin"]["htlc"]["endtime"]
+    )
+
+    database = str(tmp_path / "htlcs.sqlite")
+    with HTLCRegistry(database=database) as htlc_registry:
+        records = htlc_registry.add_many(htlcs=[
+            bitcoin_htlc, bytom_htlc, vapor_htlc, xinfin_htlc, (ethereum_htlc, "ab" * 32)
+        ])
+        assert [record["chain"] for record in records] == ["bitcoin", "bytom", "vapor", "xinfin", "ethereum"]
+        assert len(htlc_registry) == 5
+
+        record = htlc_registry.get(contract_address=bitcoin_htlc.contract_address())
+        assert record == dict(
+            chain="bitcoin", network=_["bitcoin"]["network"],
+            contract_address=_["bitcoin"]["htlc"]["segwit"]["contract_address"], secret_hash=secret_hash,
+            sender=_["bitcoin"]["wallet"]["sender"]["address"],
+            recipient=_["bitcoin"]["wallet"]["recipient"]["address"], endtime=_["bitcoin"]["htlc"]["endtime"],
+            locked_contract_id=None, bytecode=_["bitcoin"]["htlc"]["bytecode"],
+            agreements=bitcoin_htlc.agreements, options=dict(segwit=True)
+        )
+        htlc = htlc_registry.htlc(record=record)
+        assert isinstance(htlc, BitcoinHTLC) and htlc.segwit
+        assert htlc.hash() == _["bitcoin"]["htlc"]["segwit"]["hash"]
+        assert htlc.agreements == bitcoin_htlc.agreements
+
+        record = htlc_registry.get(contract_address=_["bytom"]["htlc"]["contract_address"])
+        assert (record["sender"], record["endtime"]) == (
+            _["bytom"]["htlc"]["agreements"]["sender"]["address"], _["bytom"]["htlc"]["endblock"]
+        )
+        assert htlc_registry.htlc(record=record).hash() == _["bytom"]["htlc"]["hash"]
+        assert htlc_registry.htlc(
+            record=htlc_registry.get(chain="vapor", recipient=vapor_htlc.agreements["recipient"]["address"])
+        ).contract_address() == _["vapor"]["htlc"]["contract_address"]
+
+        # Ethereum fund logs are resolved by locked contract id
+        record = htlc_registry.get(locked_contract_id="ab" * 32)
+        assert (record["chain"], record["contract_address"], record["options"]) == (
+            "ethereum", ethereum_htlc.contract_address(), dict(token=False, version="v1")
+        )
+        htlc = htlc_registry.htlc(record=record)
+        assert isinstance(htlc, EthereumHTLC) and htlc.contract_address() == ethereum_htlc.contract_address()
+        assert htlc_registry.htlc(
+            record=htlc_registry.get(sender=xinfin_htlc.agreements["sender_address"])
+        ).contract_address() == xinfin_htlc.contract_address()
+
+        assert [record["chain"] for record in htlc_registry.find(secret_hash=secret_hash, size=2)] == \
+            ["bitcoin", "bytom", "vapor", "xinfin", "ethereum"]
+        assert list(htlc_registry.find(secret_hash="ff" * 32)) == []
+        assert htlc_registry.get(contract_address="meheret") is None
+
+    with pytest.raises(TypeError, match=r"choose only swap provider HTLC instances or dicts"):
+        HTLCRegistry().add(htlc=object())
+    with pytest.raises(ValueError, match=r"HTLC agreements are None, first build HTLC"):
+        HTLCRegistry().add(htlc=BitcoinHTLC(network=_["bitcoin"]["network"]).from_bytecode(
+            bytecode=_["bitcoin"]["htlc"]["bytecode"]
+        ))
+    with pytest.raises(ValueError, match=r"missing sender, recipient values"):
+        HTLCRegistry().add(htlc=dict(
+            chain="bitcoin", network="testnet", contract_address="meheret", secret_hash=secret_hash, endtime=1
+        ))
+    with pytest.raises(ValueError, match=r"Invalid HTLC 'solana' chain"):
+        HTLCRegistry().add(htlc=dict(
+            chain="solana", network="testnet", contract_address="meheret", secret_hash=secret_hash,
+            sender="meheret", recipient="meheret", endtime=1
+        ))
+
+    # Registry persists in the database
+    with HTLCRegistry(database=database) as htlc_registry:
+        assert len(htlc_registry) == 5
+        assert htlc_registry.remove(contract_address=ethereum_htlc.contract_address(), secret_hash=secret_hash) == 1
+        assert htlc_registry.get(chain="ethereum") is None
+
+
+def test_registry_bulk():
+
+    agreements = [
+        dict(
+            secret_hash=_["bitcoin"]["htlc"]["secret"]["hash"][:-4] + f"{index:04x}",
+            recipient_address=_["bitcoin"]["wallet"]["recipient"]["address"],
+            sender_address=_["bitcoin"]["wallet"]["sender"]["address"],
+            endtime=_["bitcoin"]["htlc"]["endtime"] + (index * 60)
+        ) for index in range(500)
+    ]
+    contracts = build_many(htlcs=agreements, network=_["bitcoin"]["network"])
+
+    with HTLCRegistry() as htlc_registry:
+        htlc_registry.add_many(htlcs=[
+            dict(
+                chain="bitcoin", network=_["bitcoin"]["network"], secret_hash=agreement["secret_hash"],
+                sender=agreement["sender_address"], recipient=agreement["recipient_address"],
+                endtime=agreement["endtime"], **contract
+            ) for agreement, contract in zip(agreements, contracts)
+        ])
+        assert len(htlc_registry) == 500
+
+        # Incoming UTXO's are resolved by contract address
+        record = htlc_registry.get(contract_address=contracts[250]["contract_address"])
+        assert (record["secret_hash"], record["bytecode"]) == (agreements[250]["secret_hash"], contracts[250]["bytecode"])
+        assert htlc_registry.htlc(record=record).contract_address() == contracts[250]["contract_address"]
+
+        # Refund schedulers stream expired HTLC's in endtime order
+        expired = htlc_registry.find(
+            chain="bitcoin", network=_["bitcoin"]["network"],
+            expires_before=agreements[99]["endtime"], size=10
+        )
+        assert next(expired)["contract_address"] == contracts[0]["contract_address"]
+        assert [record["endtime"] for record in expired] == [agreement["endtime"] for agreement in agreements[1:100]]
+        assert len(list(htlc_registry.find(expires_after=agreements[99]["endtime"]))) == 400
+        assert len(list(htlc_registry.find(sender=_["bitcoin"]["wallet"]["sender"]["address"]))) == 500
+
+        # Same contract address and secret hash is replaced
+        htlc_registry.add(htlc=dict(
+            chain="bitcoin", network=_["bitcoin"]["network"], secret_hash=agreements[0]["secret_hash"],
+            sender="meheret", recipient="meheret", endtime=1, contract_address=contracts[0]["contract_address"]
+        ))
+        assert len(htlc_registry) == 500
+        assert htlc_registry.get(contract_address=contracts[0]["contract_address"])["sender"] == "meheret"
+
+
+def test_registry_locked_contract_ids(tmp_path):
+
+    secret_hash = _["ethereum"]["htlc"]["secret"]["hash"]
+    ethereum_htlc = EthereumHTLC(network=_["ethereum"]["network"]).build_htlc(
+        secret_hash=secret_hash,
+        recipient_address=_["ethereum"]["wallet"]["recipient"]["address"],
+        sender_address=_["ethereum"]["wallet"]["sender"]["address"],
+        endtime=_["bitcoin"]["htlc"]["endtime"]
+    )
+
+    with HTLCRegistry() as htlc_registry:
+        # Two locks with one secret hash on the shared contract are kept apart by locked contract id
+        htlc_registry.add_many(htlcs=[(ethereum_htlc, "ab" * 32), (ethereum_htlc, "cd" * 32)])
+        assert len(htlc_registry) == 2
+        assert [record["locked_contract_id"] for record in htlc_registry.find(secret_hash=secret_hash)] == [
+            "ab" * 32, "cd" * 32
+        ]
+
+        # The same locked contract id is replaced
+        htlc_registry.add(htlc=dict(
+            chain="ethereum", network=_["ethereum"]["network"], contract_address=ethereum_htlc.contract_address(),
+            secret_hash=secret_hash, sender="meheret", recipient="meheret", endtime=1, locked_contract_id="ab" * 32
+        ))
+        assert len(htlc_registry) == 2
+        assert htlc_registry.get(locked_contract_id="ab" * 32)["sender"] == "meheret"
+
+        assert htlc_registry.remove(
+            contract_address=ethereum_htlc.contract_address(), secret_hash=secret_hash, locked_contract_id="ab" * 32
+        ) == 1
+        assert [record["locked_contract_id"] for record in htlc_registry.find(secret_hash=secret_hash)] == ["cd" * 32]
+
+    # Version 0 registries, keyed without the locked contract id, are migrated
+    database = str(tmp_path / "htlcs.sqlite")
+    connection = sqlite3.connect(database)
+    with connection:
+        connection.executescript("""
+            CREATE TABLE htlcs (
+                chain TEXT NOT NULL, network TEXT NOT NULL, contract_address TEXT NOT NULL,
+                secret_hash TEXT NOT NULL, sender TEXT NOT NULL, recipient TEXT NOT NULL,
+                endtime INTEGER NOT NULL, locked_contract_id TEXT, bytecode TEXT, agreements TEXT, options TEXT,
+                PRIMARY KEY (contract_address, secret_hash, chain, network)
+            );
+            INSERT INTO htlcs VALUES ('ethereum', 'testnet', 'meheret', 'ff', 'meheret', 'meheret', 1, 'ab', NULL, NULL, NULL);
+        """)
+    connection.close()
+    with HTLCRegistry(database=database) as htlc_registry:
+        htlc_registry.add(htlc=dict(
+            chain="ethereum", network="testnet", contract_address="meheret", secret_hash="ff",
+            sender="meheret", recipient="meheret", endtime=1, locked_contract_id="cd"
+        ))
+        assert [record["locked_contract_id"] for record in htlc_registry.find(secret_hash="ff")] == ["ab", "cd"]
+        assert htlc_registry.get(expires_before=1)["contract_address"] == "meheret"
+    with HTLCRegistry(database=database) as htlc_registry:
+        assert len(htlc_registry) == 2
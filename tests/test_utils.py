@@ -2,9 +2,13 @@
 
 from swap.utils import (
     generate_passphrase, generate_entropy, generate_mnemonic,
-    is_mnemonic, get_mnemonic_language, sha256, double_sha256
+    is_mnemonic, get_mnemonic_language, sha256, double_sha256, entropy_to_mnemonic, mnemonic_to_entropy,
+    encode_transaction_raw, load_transaction_raw, TransactionEnvelope, _scan_addresses
 )
+from swap.exceptions import TransactionRawError
+from concurrent.futures import ThreadPoolExecutor
 
+import swap.utils
 import pytest
 
 
@@ -55,3 +59,106 @@ def test_swap_utils():
 
     assert double_sha256("meherett".encode()) == \
         "2803bf9ed1e5874825350b1b0753a96c00a99236b686bde337404453b11d3288"
+
+
+def test_swap_utils_mnemonic():
+
+    entropy = "ee535b143b0d9d1f87546f9df0d06b1a"
+    for language in ["english", "french", "italian", "chinese_simplified",
+                     "chinese_traditional", "japanese", "korean", "spanish"]:
+        mnemonic = entropy_to_mnemonic(entropy=entropy, language=language)
+        assert is_mnemonic(mnemonic=mnemonic)
+        assert is_mnemonic(mnemonic=mnemonic, language=language)
+        assert get_mnemonic_language(mnemonic=mnemonic) == language
+        assert mnemonic_to_entropy(mnemonic=mnemonic) == entropy
+        assert mnemonic_to_entropy(mnemonic=mnemonic, language=language) == entropy
+
+    # Chinese wordlists share words, the simplified words are detected before the traditional ones
+    assert get_mnemonic_language(mnemonic="斑 臣 柳 顾 剪 壁 期 君 软 夏 资 往") == "chinese_simplified"
+    assert get_mnemonic_language(mnemonic="斑 臣 柳 顧 剪 壁 期 君 軟 夏 資 往") == "chinese_traditional"
+
+    assert not is_mnemonic(mnemonic="abandon " * 12)
+    assert not is_mnemonic(mnemonic="abandon " * 11 + "abandon")
+    assert is_mnemonic(mnemonic="abandon " * 11 + "about")
+    assert not is_mnemonic(mnemonic="abandon " * 11 + "about", language="french")
+    assert not is_mnemonic(mnemonic=" ".join(MNEMONIC.split(" ")[:-1] + MNEMONIC.split(" ")[:1]))
+
+    with pytest.raises(ValueError, match="Invalid mnemonic words."):
+        get_mnemonic_language(mnemonic="meheret tesfaye batu")
+    with pytest.raises(ValueError, match="Invalid mnemonic words."):
+        mnemonic_to_entropy(mnemonic="abandon " * 11 + "about", language="italian")
+
+
+def test_swap_utils_mnemonic_threads(monkeypatch):
+
+    # Concurrent first calls see either no index or the whole index, never a partial one
+    monkeypatch.setattr(swap.utils, "_word_indexes", None)
+    mnemonics = [entropy_to_mnemonic(entropy=f"{index:032x}", language="spanish") for index in range(16)]
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        assert list(executor.map(get_mnemonic_language, mnemonics)) == ["spanish"] * 16
+    assert swap.utils._get_word_indexes()["abandon"]["english"] == 0
+
+
+def test_swap_utils_transaction_raw():
+
+    transaction: dict = dict(
+        fee=576, raw="0200000001", outputs=[dict(value=100000, tx_output_n=0, script="a914c8c7")],
+        data="0xf4fd3062", address="0x69e04fe16c9A6A83076B3c2dc4b4Bc21b5d9A20C", signature=None,
+        erc20=False, amount=-1.5, network="testnet", type="bitcoin_fund_unsigned"
+    )
+
+    legacy_transaction_raw: str = encode_transaction_raw(transaction=transaction)
+    binary_transaction_raw: str = encode_transaction_raw(transaction=transaction, binary=True)
+    assert legacy_transaction_raw.startswith("eyJ")
+    assert len(binary_transaction_raw) < len(legacy_transaction_raw)
+
+    legacy_envelope: TransactionEnvelope = load_transaction_raw(transaction_raw=legacy_transaction_raw)
+    binary_envelope: TransactionEnvelope = load_transaction_raw(transaction_raw=binary_transaction_raw)
+    assert legacy_envelope == binary_envelope == transaction
+    assert not legacy_envelope.binary and binary_envelope.binary
+    assert load_transaction_raw(transaction_raw=binary_envelope) is binary_envelope
+    assert binary_envelope.encode() == binary_transaction_raw
+    assert legacy_envelope.encode() == legacy_transaction_raw
+
+    with pytest.raises(TransactionRawError, match="Invalid transaction raw."):
+        load_transaction_raw(transaction_raw="meheret")
+    with pytest.raises(TypeError, match="Transaction raw must be str"):
+        load_transaction_raw(transaction_raw=1234)
+
+
+def test_swap_utils_scan_addresses():
+
+    used = {(False, 0): 1000, (False, 3): 0, (False, 25): 5000, (True, 1): 200}
+    queried = []
+
+    def derive(change, start, count):
+        return [dict(index=index, address=f"{int(change)}/{index}") for index in range(start, start + count)]
+
+    def activity(record):
+        queried.append(record["address"])
+        key = (record["address"].startswith("1"), record["index"])
+        if key not in used:
+            return dict(used=False, balance=0, utxos=[])
+        return dict(used=True, balance=used[key], utxos=([dict(amount=used[key])] if used[key] else []))
+
+    scan = _scan_addresses(derive=derive, activity=activity, gap=20, workers=4)
+
+    # Index 25 is after 20 unused receive addresses, so it is not discovered
+    assert scan["balance"] == 1200
+    assert [(address["change"], address["index"]) for address in scan["addresses"]] == [
+        (False, 0), (False, 3), (True, 1)
+    ]
+    assert scan["receive_index"] == 4 and scan["change_index"] == 2
+    assert scan["utxos"] == [
+        dict(amount=1000, address="0/0", address_index=0, change=False),
+        dict(amount=200, address="1/1", address_index=1, change=True)
+    ]
+    assert sorted(queried) == sorted([f"0/{index}" for index in range(24)] + [f"1/{index}" for index in range(22)])
+
+    assert _scan_addresses(derive=derive, activity=lambda record: dict(used=False, balance=0), gap=1) == dict(
+        balance=0, utxos=[], addresses=[], receive_index=0, change_index=0
+    )
+    with pytest.raises(ValueError, match=r"Invalid gap '0'"):
+        _scan_addresses(derive=derive, activity=activity, gap=0)
+    with pytest.raises(ValueError, match=r"Invalid workers '0'"):
+        _scan_addresses(derive=derive, activity=activity, workers=0)